@@ -15,4 +15,15 @@ __all__ = [
     "AuthenticationError",
     "ConfigurationError",
     "__version__",
+    "AsyncDataPortalClient",
 ]
+
+
+def __getattr__(name: str):
+    # The async client pulls in the optional httpx dependency, so only import
+    # it when it is actually requested.
+    if name == "AsyncDataPortalClient":
+        from .async_client import AsyncDataPortalClient
+
+        return AsyncDataPortalClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
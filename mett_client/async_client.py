@@ -0,0 +1,829 @@
+"""Asyncio counterpart of :class:`~mett_client.client.DataPortalClient`.
+
+The async client reuses the generated SDK for request serialization and
+response deserialization, so results have exactly the same types as the
+synchronous client, but performs the HTTP exchange on an ``httpx`` async
+transport. Install the optional dependency with ``pip install mett[async]``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import inspect
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+from urllib.parse import urlsplit
+
+from mett_dataportal_sdk.exceptions import ApiException
+from urllib3.exceptions import InvalidHeader
+
+from . import models
+from .client import DataPortalClient, PaginatedResult
+from .config import Config, get_config
+from .exceptions import APIError, AuthenticationError
+from .request_utils import parse_tsv_response
+from .transport import ClientStats, backoff_delay, build_rate_limiter, build_retry
+from .utils import normalize_params, normalize_species_entry
+
+if TYPE_CHECKING:
+    from mett_dataportal_sdk import ApiClient as SDKApiClient
+
+    from .models import (
+        DrugMIC,
+        DrugMetabolism,
+        Gene,
+        Genome,
+        PPIInteraction,
+        Species,
+    )
+
+try:
+    import httpx  # type: ignore[import]
+except ModuleNotFoundError:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_MAX_PER_HOST = 10
+
+
+class _BufferedResponse:
+    """Adapts an ``httpx.Response`` to the interface the SDK deserializer reads."""
+
+    def __init__(self, response: "httpx.Response") -> None:
+        self.status = response.status_code
+        self.reason = response.reason_phrase
+        self.data = response.content
+        self._headers = response.headers
+
+    def read(self) -> bytes:
+        return self.data
+
+    def getheaders(self) -> Mapping[str, str]:
+        return self._headers
+
+    def getheader(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        return self._headers.get(name, default)
+
+
+class AsyncDataPortalClient:
+    """Asyncio client mirroring the public methods of ``DataPortalClient``.
+
+    Connections are pooled by ``httpx`` (``max_connections`` and
+    ``max_keepalive_connections``) and the number of concurrent requests per
+    host is capped by ``max_per_host``. Retries, backoff, ``Retry-After``,
+    the ``rate_limit`` token bucket and ``validate=False`` raw mode follow the
+    same ``Config`` settings as the sync client. Use it as an async context
+    manager or call :meth:`aclose` when done.
+    """
+
+    def __init__(
+        self,
+        *,
+        config: Config | None = None,
+        base_url: str | None = None,
+        jwt_token: str | None = None,
+        timeout: int | None = None,
+        verify_ssl: bool | None = None,
+        user_agent: str | None = None,
+        validate: bool | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        max_per_host: int = DEFAULT_MAX_PER_HOST,
+        http_client: "httpx.AsyncClient | None" = None,
+    ) -> None:
+        if httpx is None:
+            raise ImportError(
+                "AsyncDataPortalClient requires httpx; "
+                "install it with `pip install mett[async]`"
+            )
+        self.config = config or get_config()
+        if base_url:
+            self.config.base_url = base_url.rstrip("/")
+        if jwt_token:
+            self.config.jwt_token = jwt_token
+        if timeout is not None:
+            self.config.timeout = timeout
+        if verify_ssl is not None:
+            self.config.verify_ssl = verify_ssl
+        if user_agent:
+            self.config.user_agent = user_agent
+        if validate is not None:
+            self.config.validate = validate
+
+        # The generated SDK (only used to serialize requests and deserialize
+        # responses) is imported and built on first use, as in the sync client.
+        self._sdk_client_instance: Optional[SDKApiClient] = None
+        self._apis: Dict[str, Any] = {}
+
+        self.stats = ClientStats()
+        self.rate_limiter = build_rate_limiter(self.config)
+        self._retry = build_retry(self.config, self.stats)
+        self._max_per_host = max_per_host
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self._http = http_client or self._build_http_client(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+
+    async def __aenter__(self) -> "AsyncDataPortalClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._http.aclose()
+
+    # ------------------------------------------------------------------
+    # Core API Methods
+    # ------------------------------------------------------------------
+    async def list_species(self, *, format: str = "json") -> List[Species]:
+        """List all species. Supports format='json' (default) or format='tsv'."""
+        payload = await self._request_json("/api/species/", params={"format": format})
+        if isinstance(payload, dict):
+            raw_items = payload.get("data") or []
+        elif isinstance(payload, list):
+            raw_items = payload
+        else:
+            raise APIError("Unexpected response for /api/species/")
+
+        return [normalize_species_entry(item) for item in raw_items]
+
+    async def list_genomes(
+        self, *, format: str = "json", **params: Any
+    ) -> PaginatedResult[Genome]:
+        """List all genomes. Supports format='json' (default) or format='tsv'."""
+        if format == "tsv":
+            return await self._request_tsv_paginated(
+                "/api/genomes/", params=params, model=models.Genome
+            )
+        response = await self._call_api(
+            "GenomesApi",
+            "dataportal_api_core_genome_endpoints_get_all_genomes",
+            "GenomePaginatedResponseSchema",
+            params=params,
+        )
+        return DataPortalClient._to_paginated(response, self.config.keep_raw)
+
+    async def species_genomes(
+        self, species_acronym: str, **params: Any
+    ) -> PaginatedResult[Genome]:
+        response = await self._call_api(
+            "SpeciesApi",
+            "dataportal_api_core_species_endpoints_get_genomes_by_species",
+            "GenomePaginatedResponseSchema",
+            params=params,
+            species_acronym=species_acronym,
+        )
+        return DataPortalClient._to_paginated(response, self.config.keep_raw)
+
+    async def search_genomes(
+        self, *, format: str = "json", **params: Any
+    ) -> PaginatedResult[Genome]:
+        """Search genomes. Supports format='json' (default) or format='tsv'."""
+        if format == "tsv":
+            return await self._request_tsv_paginated(
+                "/api/genomes/search", params=params, model=models.Genome
+            )
+        json_params = (params or {}).copy()
+        json_params["format"] = "json"
+        payload = await self._request_json("/api/genomes/search", params=json_params)
+        if isinstance(payload, dict):
+            data = payload.get("data", [])
+            pagination = DataPortalClient._pagination(payload.get("pagination"))
+            raw = payload
+        else:
+            data = payload if isinstance(payload, list) else []
+            pagination = None
+            raw = {"data": data}
+        if not self.config.validate:
+            return PaginatedResult(items=list(data), pagination=pagination, raw=raw)
+        items = [
+            models.Genome(**item) if isinstance(item, dict) else item for item in data
+        ]
+        return PaginatedResult(items=items, pagination=pagination, raw=raw)
+
+    async def get_genome_genes(
+        self, isolate_name: str, **params: Any
+    ) -> PaginatedResult[Gene]:
+        response = await self._call_api(
+            "GenomesApi",
+            "dataportal_api_core_genome_endpoints_get_genes_by_genome",
+            "GenePaginatedResponseSchema",
+            params=params,
+            isolate_name=isolate_name,
+        )
+        return DataPortalClient._to_paginated(response, self.config.keep_raw)
+
+    async def search_genes(self, **params: Any) -> PaginatedResult[Gene]:
+        response = await self._call_api(
+            "GenesApi",
+            "dataportal_api_core_gene_endpoints_search_genes_by_string",
+            "GenePaginatedResponseSchema",
+            params=params,
+        )
+        return DataPortalClient._to_paginated(response, self.config.keep_raw)
+
+    async def search_genes_advanced(self, **params: Any) -> PaginatedResult[Gene]:
+        response = await self._call_api(
+            "GenesApi",
+            "dataportal_api_core_gene_endpoints_search_genes_by_multiple_genomes_and_species_and_string",
+            "GenePaginatedResponseSchema",
+            params=params,
+        )
+        return DataPortalClient._to_paginated(response, self.config.keep_raw)
+
+    async def get_gene(self, locus_tag: str) -> Gene:
+        return await self._call_api(
+            "GenesApi",
+            "dataportal_api_core_gene_endpoints_get_gene_by_locus_tag",
+            "SuccessResponseSchema",
+            locus_tag=locus_tag,
+        )
+
+    def iter_genomes(
+        self, *, max_workers: int | None = None, **params: Any
+    ) -> AsyncIterator[Genome]:
+        """Yield every genome from ``list_genomes``, fetching pages lazily."""
+        return self._iter_items(self.list_genomes, params, max_workers=max_workers)
+
+    def iter_species_genomes(
+        self, species_acronym: str, *, max_workers: int | None = None, **params: Any
+    ) -> AsyncIterator[Genome]:
+        """Yield every genome of a species, fetching pages lazily."""
+        return self._iter_items(
+            self.species_genomes,
+            params,
+            max_workers=max_workers,
+            species_acronym=species_acronym,
+        )
+
+    def iter_search_genomes(
+        self, *, max_workers: int | None = None, **params: Any
+    ) -> AsyncIterator[Genome]:
+        """Yield every genome matching a search, fetching pages lazily."""
+        return self._iter_items(self.search_genomes, params, max_workers=max_workers)
+
+    def iter_genome_genes(
+        self, isolate_name: str, *, max_workers: int | None = None, **params: Any
+    ) -> AsyncIterator[Gene]:
+        """Yield every gene of a genome, fetching pages lazily."""
+        return self._iter_items(
+            self.get_genome_genes,
+            params,
+            max_workers=max_workers,
+            isolate_name=isolate_name,
+        )
+
+    def iter_search_genes(
+        self, *, max_workers: int | None = None, **params: Any
+    ) -> AsyncIterator[Gene]:
+        """Yield every gene matching a search, fetching pages lazily."""
+        return self._iter_items(self.search_genes, params, max_workers=max_workers)
+
+    def iter_search_genes_advanced(
+        self, *, max_workers: int | None = None, **params: Any
+    ) -> AsyncIterator[Gene]:
+        """Yield every gene matching an advanced search, fetching pages lazily."""
+        return self._iter_items(
+            self.search_genes_advanced, params, max_workers=max_workers
+        )
+
+    # ------------------------------------------------------------------
+    # Experimental API Methods
+    # ------------------------------------------------------------------
+    async def search_drug_mic(
+        self, *, format: str = "json", **params: Any
+    ) -> PaginatedResult[DrugMIC]:
+        """Search drug MIC data. Supports format='json' (default) or format='tsv'."""
+        if format == "tsv":
+            return await self._request_tsv_paginated(
+                "/api/drugs/mic/search", params=params, model=models.DrugMIC
+            )
+        response = await self._call_api(
+            "DrugsApi",
+            "dataportal_api_experimental_drug_endpoints_search_drug_mic",
+            "PaginatedResponseSchema",
+            params=params,
+        )
+        return DataPortalClient._to_paginated(response, self.config.keep_raw)
+
+    async def search_drug_metabolism(
+        self, **params: Any
+    ) -> PaginatedResult[DrugMetabolism]:
+        response = await self._call_api(
+            "DrugsApi",
+            "dataportal_api_experimental_drug_endpoints_search_drug_metabolism",
+            "PaginatedResponseSchema",
+            params=params,
+        )
+        return DataPortalClient._to_paginated(response, self.config.keep_raw)
+
+    async def get_strain_drug_mic(
+        self, isolate_name: str, **params: Any
+    ) -> PaginatedResult[DrugMIC]:
+        response = await self._call_api(
+            "GenomesApi",
+            "dataportal_api_experimental_drug_endpoints_get_strain_drug_mic",
+            "PaginatedStrainDrugMICResponseSchema",
+            params=params,
+            isolate_name=isolate_name,
+        )
+        return DataPortalClient._to_paginated(response, self.config.keep_raw)
+
+    async def get_strain_drug_metabolism(
+        self, isolate_name: str, **params: Any
+    ) -> PaginatedResult[DrugMetabolism]:
+        response = await self._call_api(
+            "GenomesApi",
+            "dataportal_api_experimental_drug_endpoints_get_strain_drug_metabolism",
+            "PaginatedStrainDrugMetabolismResponseSchema",
+            params=params,
+            isolate_name=isolate_name,
+        )
+        return DataPortalClient._to_paginated(response, self.config.keep_raw)
+
+    async def get_strain_drug_data(self, isolate_name: str) -> Dict[str, Any]:
+        response = await self._call_api(
+            "GenomesApi",
+            "dataportal_api_experimental_drug_endpoints_get_strain_drug_data",
+            "StrainDrugDataResponseSchema",
+            isolate_name=isolate_name,
+        )
+        return DataPortalClient._as_dict(response)
+
+    async def search_proteomics(self, **params: Any) -> Dict[str, Any]:
+        response = await self._call_api(
+            "ProteomicsApi",
+            "dataportal_api_experimental_proteomics_endpoints_search_proteomics",
+            "SuccessResponseSchema",
+            params=params,
+        )
+        return DataPortalClient._as_dict(response)
+
+    async def search_essentiality(self, **params: Any) -> Dict[str, Any]:
+        response = await self._call_api(
+            "EssentialityApi",
+            "dataportal_api_experimental_essentiality_endpoints_search_essentiality",
+            "SuccessResponseSchema",
+            params=params,
+        )
+        return DataPortalClient._as_dict(response)
+
+    async def search_fitness(self, **params: Any) -> Dict[str, Any]:
+        response = await self._call_api(
+            "FitnessApi",
+            "dataportal_api_experimental_fitness_endpoints_search_fitness",
+            "SuccessResponseSchema",
+            params=params,
+        )
+        return DataPortalClient._as_dict(response)
+
+    async def search_mutant_growth(self, **params: Any) -> Dict[str, Any]:
+        response = await self._call_api(
+            "MutantGrowthApi",
+            "dataportal_api_experimental_mutant_growth_endpoints_search_mutant_growth",
+            "SuccessResponseSchema",
+            params=params,
+        )
+        return DataPortalClient._as_dict(response)
+
+    async def search_reactions(self, **params: Any) -> Dict[str, Any]:
+        response = await self._call_api(
+            "ReactionsApi",
+            "dataportal_api_experimental_reactions_endpoints_search_reactions",
+            "SuccessResponseSchema",
+            params=params,
+        )
+        return DataPortalClient._as_dict(response)
+
+    def iter_search_drug_mic(
+        self, *, max_workers: int | None = None, **params: Any
+    ) -> AsyncIterator[DrugMIC]:
+        """Yield every drug MIC record matching a search, fetching pages lazily."""
+        return self._iter_items(self.search_drug_mic, params, max_workers=max_workers)
+
+    def iter_search_drug_metabolism(
+        self, *, max_workers: int | None = None, **params: Any
+    ) -> AsyncIterator[DrugMetabolism]:
+        """Yield every drug metabolism record matching a search."""
+        return self._iter_items(
+            self.search_drug_metabolism, params, max_workers=max_workers
+        )
+
+    def iter_strain_drug_mic(
+        self, isolate_name: str, *, max_workers: int | None = None, **params: Any
+    ) -> AsyncIterator[DrugMIC]:
+        """Yield every drug MIC record of a strain, fetching pages lazily."""
+        return self._iter_items(
+            self.get_strain_drug_mic,
+            params,
+            max_workers=max_workers,
+            isolate_name=isolate_name,
+        )
+
+    def iter_strain_drug_metabolism(
+        self, isolate_name: str, *, max_workers: int | None = None, **params: Any
+    ) -> AsyncIterator[DrugMetabolism]:
+        """Yield every drug metabolism record of a strain, fetching pages lazily."""
+        return self._iter_items(
+            self.get_strain_drug_metabolism,
+            params,
+            max_workers=max_workers,
+            isolate_name=isolate_name,
+        )
+
+    # ------------------------------------------------------------------
+    # Interactions API Methods
+    # ------------------------------------------------------------------
+    async def search_ttp(self, **params: Any) -> Dict[str, Any]:
+        response = await self._call_api(
+            "PooledTTPInteractionsApi",
+            "dataportal_api_interactions_ttp_endpoints_search_interactions",
+            "PaginatedResponseSchema",
+            params=params,
+        )
+        return DataPortalClient._as_dict(response)
+
+    async def get_ttp_gene_interactions(
+        self, locus_tag: str, **params: Any
+    ) -> Dict[str, Any]:
+        response = await self._call_api(
+            "PooledTTPInteractionsApi",
+            "dataportal_api_interactions_ttp_endpoints_get_gene_interactions",
+            "SuccessResponseSchema",
+            params=params,
+            locus_tag=locus_tag,
+        )
+        return DataPortalClient._as_dict(response)
+
+    async def get_ttp_compound_interactions(
+        self, compound: str, **params: Any
+    ) -> Dict[str, Any]:
+        response = await self._call_api(
+            "PooledTTPInteractionsApi",
+            "dataportal_api_interactions_ttp_endpoints_get_compound_interactions",
+            "SuccessResponseSchema",
+            params=params,
+            compound=compound,
+        )
+        return DataPortalClient._as_dict(response)
+
+    async def search_ppi(self, **params: Any) -> Dict[str, Any]:
+        response = await self._search_ppi_response(params)
+        return DataPortalClient._as_dict(response)
+
+    async def search_ppi_page(self, **params: Any) -> PaginatedResult[PPIInteraction]:
+        """Fetch one page of PPI interactions as a ``PaginatedResult``."""
+        response = await self._search_ppi_response(params)
+        return DataPortalClient._to_paginated(response, self.config.keep_raw)
+
+    def iter_ppi(
+        self, *, max_workers: int | None = None, **params: Any
+    ) -> AsyncIterator[PPIInteraction]:
+        """Yield every PPI interaction matching a search, fetching pages lazily."""
+        return self._iter_items(self.search_ppi_page, params, max_workers=max_workers)
+
+    async def get_ppi_neighbors(self, **params: Any) -> Dict[str, Any]:
+        response = await self._call_api(
+            "ProteinProteinInteractionsApi",
+            "dataportal_api_interactions_ppi_endpoints_get_all_protein_neighbors",
+            "PPIAllNeighborsResponseSchema",
+            params=params,
+        )
+        return DataPortalClient._as_dict(response)
+
+    # ------------------------------------------------------------------
+    # Raw API Access
+    # ------------------------------------------------------------------
+    async def raw_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Union[Dict[str, Any], Sequence[Tuple[str, Any]]]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        data: Optional[Union[str, bytes]] = None,
+        json_body: Optional[Any] = None,
+        format: Optional[str] = None,
+    ) -> "httpx.Response":
+        """Low-level helper for issuing arbitrary API requests."""
+
+        if json_body is not None and data is not None:
+            raise ValueError("Provide only one of json_body or data")
+
+        request_headers = dict(headers or {})
+        if format == "tsv":
+            request_headers.setdefault("Accept", "text/tab-separated-values")
+        elif format == "json" or format is None:
+            request_headers.setdefault("Accept", "application/json")
+
+        response = await self._send(
+            method,
+            self._url(path),
+            params=params,
+            headers=request_headers,
+            content=None if json_body is not None else data,
+            json=json_body,
+        )
+        if response.is_error:
+            raise APIError(
+                response.text or f"HTTP {response.status_code}",
+                status_code=response.status_code,
+            )
+        return response
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _build_http_client(
+        self, *, max_connections: int, max_keepalive_connections: int
+    ) -> "httpx.AsyncClient":
+        headers = {
+            "Accept": "application/json",
+            "User-Agent": self.config.user_agent,
+        }
+        token = self.config.jwt_token
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        return httpx.AsyncClient(
+            headers=headers,
+            timeout=float(self.config.timeout),
+            verify=self.config.verify_ssl,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+        )
+
+    @property
+    def _sdk_client(self) -> SDKApiClient:
+        if self._sdk_client_instance is None:
+            from mett_dataportal_sdk.api_client import ApiClient
+            from mett_dataportal_sdk.configuration import Configuration
+
+            configuration = Configuration(host=self.config.base_url.rstrip("/"))
+            configuration.verify_ssl = self.config.verify_ssl
+            if self.config.jwt_token:
+                configuration.access_token = self.config.jwt_token
+            sdk_client = ApiClient(configuration=configuration)
+            sdk_client.user_agent = self.config.user_agent
+            self._sdk_client_instance = sdk_client
+        return self._sdk_client_instance
+
+    def _api(self, name: str) -> Any:
+        """Return the (cached) generated API class ``name``, importing it lazily."""
+        api = self._apis.get(name)
+        if api is None:
+            api_cls = getattr(importlib.import_module("mett_dataportal_sdk.api"), name)
+            api = self._apis[name] = api_cls(self._sdk_client)
+        return api
+
+    def _url(self, path: str) -> str:
+        if path.startswith("http://") or path.startswith("https://"):
+            return path
+        normalized = path if path.startswith("/") else f"/{path}"
+        return f"{self.config.base_url.rstrip('/')}{normalized}"
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        limit = self._host_limits.get(host)
+        if limit is None:
+            limit = self._host_limits[host] = asyncio.Semaphore(self._max_per_host)
+        return limit
+
+    async def _send(self, method: str, url: str, **kwargs: Any) -> "httpx.Response":
+        """Send one request, retrying and rate limiting like the sync transport.
+
+        Connection errors are retried for every method; read errors and the
+        statuses in ``config.retry_statuses`` only for idempotent methods.
+        Each retry sleeps ``Retry-After`` (when respected) or the capped,
+        jittered exponential backoff of :func:`~mett_client.transport.backoff_delay`.
+        """
+        method = method.upper()
+        allowed = self._retry.allowed_methods
+        idempotent = allowed is None or method in allowed
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            async with self._host_limit(url):
+                try:
+                    response = await self._http.request(method, url, **kwargs)
+                except httpx.TransportError as exc:
+                    retryable = idempotent or isinstance(
+                        exc, (httpx.ConnectError, httpx.ConnectTimeout)
+                    )
+                    if not retryable or attempt >= self.config.retries:
+                        raise APIError(f"Request failed: {exc}") from exc
+                    response = None
+                except httpx.HTTPError as exc:
+                    raise APIError(f"Request failed: {exc}") from exc
+            if response is not None:
+                retry_after = response.headers.get("Retry-After")
+                if attempt >= self.config.retries or not self._retry.is_retry(
+                    method, response.status_code, retry_after is not None
+                ):
+                    return response
+            attempt += 1
+            self.stats.record_retry()
+            await asyncio.sleep(self._retry_delay(attempt, response))
+
+    def _retry_delay(self, attempt: int, response: "httpx.Response | None") -> float:
+        header = response.headers.get("Retry-After") if response is not None else None
+        if header and self.config.retry_respect_retry_after:
+            try:
+                return self._retry.parse_retry_after(header)
+            except InvalidHeader:
+                pass
+        return backoff_delay(
+            attempt,
+            self.config.retry_backoff,
+            self.config.retry_backoff_max,
+            self.config.retry_jitter,
+        )
+
+    async def _call_api(
+        self,
+        api_name: str,
+        operation: str,
+        response_type: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Serialize via the SDK, send asynchronously, deserialize via the SDK."""
+        normalized_params = normalize_params(params or {})
+        normalized_params.update(kwargs)
+
+        api = self._api(api_name)
+        bound = inspect.signature(getattr(api, operation)).bind(**normalized_params)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        arguments.pop("_request_timeout", None)
+        method, url, headers, body, _ = getattr(api, f"_{operation}_serialize")(
+            **arguments
+        )
+
+        response = await self._send(method, url, headers=headers, json=body)
+        if not self.config.validate:
+            # Raw mode: hand back the decoded JSON without building models.
+            if response.is_error:
+                raise DataPortalClient._api_error(
+                    response.status_code, response.text or None, response.reason_phrase
+                )
+            if not response.content:
+                return None
+            try:
+                return response.json()
+            except ValueError as exc:
+                raise APIError(
+                    f"Invalid JSON response: {exc}", status_code=response.status_code
+                ) from exc
+        try:
+            return self._sdk_client.response_deserialize(
+                response_data=_BufferedResponse(response),
+                response_types_map={"200": response_type},
+            ).data
+        except ApiException as exc:
+            raise DataPortalClient._api_error(exc.status, exc.body, exc.reason) from exc
+
+    async def _search_ppi_response(self, params: Dict[str, Any]) -> Any:
+        return await self._call_api(
+            "ProteinProteinInteractionsApi",
+            "dataportal_api_interactions_ppi_endpoints_search_ppi_interactions",
+            "PPISearchResponseSchema",
+            params=params,
+        )
+
+    async def _get(self, endpoint: str, params: Dict[str, Any]) -> "httpx.Response":
+        accept = (
+            "text/tab-separated-values"
+            if params.get("format") == "tsv"
+            else "application/json"
+        )
+        response = await self._send(
+            "GET", self._url(endpoint), params=params, headers={"Accept": accept}
+        )
+        if response.status_code in {401, 403}:
+            raise AuthenticationError(
+                "Authentication failed", status_code=response.status_code
+            )
+        if response.is_error:
+            raise APIError(
+                f"Request failed: HTTP {response.status_code}",
+                status_code=response.status_code,
+            )
+        return response
+
+    async def _request_json(
+        self, endpoint: str, *, params: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        params = dict(params or {})
+        response = await self._get(endpoint, params)
+        try:
+            if params.get("format") == "tsv":
+                return parse_tsv_response(response.text)
+            return response.json()
+        except ValueError as exc:
+            raise APIError(f"Failed to parse response: {exc}") from exc
+
+    async def _request_tsv_paginated(
+        self,
+        endpoint: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        model: Type[T] | None = None,
+    ) -> PaginatedResult[T]:
+        tsv_params = (params or {}).copy()
+        tsv_params["format"] = "tsv"
+        rows = await self._request_json(endpoint, params=tsv_params)
+        items: List[T]
+        if model is None or not self.config.validate:
+            items = rows
+        else:
+            items = [model(**row) for row in rows]
+        return PaginatedResult(
+            items=items,
+            pagination=None,
+            raw_factory=lambda: {"data": rows},
+            keep_raw=self.config.keep_raw,
+        )
+
+    async def _iter_pages(
+        self,
+        fetch: Callable[..., Awaitable[PaginatedResult[T]]],
+        params: Dict[str, Any],
+        *,
+        max_workers: int | None = None,
+        **fixed: Any,
+    ) -> AsyncIterator[PaginatedResult[T]]:
+        """Async counterpart of ``DataPortalClient._iter_pages``."""
+        page_params = dict(params)
+        page = int(page_params.pop("page", None) or 1)
+
+        def _fetch(number: int) -> Awaitable[PaginatedResult[T]]:
+            return fetch(**fixed, page=number, **page_params)
+
+        result = await _fetch(page)
+        yield result
+        pagination = result.pagination
+        if pagination is None or not pagination.has_next:
+            return
+
+        if not max_workers or max_workers <= 1:
+            while pagination is not None and pagination.has_next:
+                page += 1
+                result = await _fetch(page)
+                yield result
+                pagination = result.pagination
+            return
+
+        last_page = pagination.num_pages
+        next_page = page + 1
+        pending: List[asyncio.Task[PaginatedResult[T]]] = []
+        try:
+            while next_page <= last_page or pending:
+                while next_page <= last_page and len(pending) < max_workers:
+                    pending.append(asyncio.ensure_future(_fetch(next_page)))
+                    next_page += 1
+                yield await pending.pop(0)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _iter_items(
+        self,
+        fetch: Callable[..., Awaitable[PaginatedResult[T]]],
+        params: Dict[str, Any],
+        *,
+        max_workers: int | None = None,
+        **fixed: Any,
+    ) -> AsyncIterator[T]:
+        async for result in self._iter_pages(
+            fetch, params, max_workers=max_workers, **fixed
+        ):
+            for item in result.items:
+                yield item
+
+
+__all__ = ["AsyncDataPortalClient"]
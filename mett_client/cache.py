@@ -0,0 +1,378 @@
+"""Opt-in persistent HTTP response cache for the METT Data Portal client."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from urllib.parse import parse_qsl, urlsplit, urlunsplit
+
+import requests  # type: ignore[import]
+from requests.structures import CaseInsensitiveDict  # type: ignore[import]
+
+from .config import Config
+
+REFERENCE_DATA_TTL = 24 * 60 * 60
+
+# Reference data that changes rarely enough to cache even when the global
+# default TTL is zero. Keys are API paths relative to the base URL and match
+# exactly; a trailing ``*`` turns a key into a prefix (longest prefix wins).
+DEFAULT_ENDPOINT_TTLS: Dict[str, int] = {
+    "/api/species/": REFERENCE_DATA_TTL,
+    "/api/genomes/type-strains": REFERENCE_DATA_TTL,
+    "/api/ppi/scores/available": REFERENCE_DATA_TTL,
+    "/api/ttp/metadata": REFERENCE_DATA_TTL,
+}
+
+# Hop-by-hop or encoding headers that no longer describe the stored body.
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+Params = Optional[Union[Mapping[str, Any], Sequence[Tuple[str, Any]]]]
+
+T = TypeVar("T")
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body plus the metadata needed to serve or revalidate it."""
+
+    url: str
+    status: int
+    headers: Dict[str, str]
+    stored_at: float
+    ttl: int
+    body: bytes
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() - self.stored_at < self.ttl
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get("ETag") or self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get("Last-Modified") or self.headers.get("last-modified")
+
+    def to_response(self) -> requests.Response:
+        response = requests.Response()
+        response.status_code = self.status
+        response.reason = "OK"
+        response.url = self.url
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response._content = self.body
+        response.from_cache = True  # type: ignore[attr-defined]
+        return response
+
+
+class ResponseCache:
+    """File-backed response store with per-endpoint TTLs and LRU size eviction.
+
+    Each entry is a ``<key>.body`` file next to a ``<key>.json`` metadata
+    file. The body's modification time doubles as the last-access time, so
+    eviction removes the least recently used entries once the total size
+    exceeds ``max_bytes``. ``base_path`` is the path part of the API base URL;
+    it is stripped before request paths are matched against ``endpoint_ttls``.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        max_bytes: int,
+        default_ttl: int = 0,
+        endpoint_ttls: Optional[Mapping[str, int]] = None,
+        base_path: str = "",
+    ) -> None:
+        self.directory = Path(directory).expanduser()
+        self.base_path = base_path.rstrip("/")
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.endpoint_ttls = dict(DEFAULT_ENDPOINT_TTLS)
+        self.endpoint_ttls.update(endpoint_ttls or {})
+
+    @classmethod
+    def from_config(cls, config: Config) -> "ResponseCache":
+        return cls(
+            Path(config.cache_dir),
+            max_bytes=config.cache_max_size,
+            default_ttl=config.cache_ttl,
+            endpoint_ttls=config.cache_ttls,
+            base_path=urlsplit(config.base_url).path,
+        )
+
+    @staticmethod
+    def key(method: str, url: str, params: Params = None, accept: str = "") -> str:
+        """Hash method, URL, normalized query parameters and Accept header."""
+        parts = urlsplit(url)
+        query: List[Tuple[str, str]] = parse_qsl(parts.query, keep_blank_values=True)
+        items = params.items() if isinstance(params, Mapping) else params or []
+        for name, value in items:
+            if value is None:
+                continue
+            values = value if isinstance(value, (list, tuple)) else [value]
+            for item in values:
+                if isinstance(item, bool):
+                    item = str(item).lower()
+                query.append((str(name), str(item)))
+        base = urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, "", ""))
+        canonical = json.dumps([method.upper(), base, sorted(query), accept])
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def ttl_for(self, url: str) -> int:
+        path = urlsplit(url).path
+        if self.base_path and path.startswith(self.base_path + "/"):
+            path = path[len(self.base_path) :]
+        if path in self.endpoint_ttls:
+            return self.endpoint_ttls[path]
+        matches = [
+            pattern
+            for pattern in self.endpoint_ttls
+            if pattern.endswith("*") and path.startswith(pattern[:-1])
+        ]
+        if not matches:
+            return self.default_ttl
+        return self.endpoint_ttls[max(matches, key=len)]
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        meta_path, body_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text())
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        self._touch(body_path)
+        return CacheEntry(body=body, **meta)
+
+    def put(self, key: str, response: requests.Response, ttl: int) -> None:
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower() not in _DROPPED_HEADERS
+        }
+        meta = {
+            "url": response.url,
+            "status": response.status_code,
+            "headers": headers,
+            "stored_at": time.time(),
+            "ttl": ttl,
+        }
+        meta_path, body_path = self._paths(key)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._atomic_write(body_path, response.content)
+            self._atomic_write(meta_path, json.dumps(meta).encode("utf-8"))
+        except OSError:
+            return
+        self.evict()
+
+    def revalidated(self, key: str, entry: CacheEntry) -> None:
+        """Restart an entry's TTL after the server answered 304 Not Modified."""
+        meta_path, _ = self._paths(key)
+        meta = {
+            "url": entry.url,
+            "status": entry.status,
+            "headers": entry.headers,
+            "stored_at": time.time(),
+            "ttl": entry.ttl,
+        }
+        try:
+            self._atomic_write(meta_path, json.dumps(meta).encode("utf-8"))
+        except OSError:
+            pass
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the cache fits ``max_bytes``."""
+        entries = []
+        total = 0
+        for body_path in self.directory.glob("*.body"):
+            try:
+                stat = body_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, body_path))
+            total += stat.st_size
+        entries.sort()
+        for _, size, body_path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(body_path.stem)
+            total -= size
+
+    def clear(self) -> None:
+        for body_path in self.directory.glob("*.body"):
+            self._remove(body_path.stem)
+
+    def _paths(self, key: str) -> Tuple[Path, Path]:
+        return self.directory / f"{key}.json", self.directory / f"{key}.body"
+
+    def _remove(self, key: str) -> None:
+        for path in self._paths(key):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _atomic_write(self, path: Path, data: bytes) -> None:
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+
+class CachedSession(requests.Session):
+    """``requests.Session`` that serves GET requests from a ``ResponseCache``.
+
+    Fresh entries are returned without touching the network. Stale entries are
+    revalidated with ``If-None-Match``/``If-Modified-Since`` when the server
+    supplied an ETag or Last-Modified header. With ``refresh=True`` every
+    request goes to the server and the cache is only written to. Streaming
+    requests bypass the cache.
+    """
+
+    def __init__(self, cache: ResponseCache, *, refresh: bool = False) -> None:
+        super().__init__()
+        self.cache = cache
+        self.refresh = refresh
+
+    def request(  # type: ignore[override]
+        self,
+        method: str,
+        url: str,
+        params: Params = None,
+        headers: Optional[Mapping[str, str]] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        if method.upper() != "GET" or kwargs.get("stream"):
+            return super().request(
+                method, url, params=params, headers=headers, **kwargs
+            )
+
+        ttl = self.cache.ttl_for(url)
+        if ttl <= 0:
+            return super().request(
+                method, url, params=params, headers=headers, **kwargs
+            )
+
+        request_headers = dict(headers or {})
+        accept = request_headers.get("Accept") or self.headers.get("Accept", "")
+        key = self.cache.key(method, url, params, accept)
+
+        entry = self.cache.get(key)
+        if entry is not None and entry.fresh and not self.refresh:
+            return entry.to_response()
+        if entry is not None:
+            if entry.etag:
+                request_headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request_headers["If-Modified-Since"] = entry.last_modified
+
+        response = super().request(
+            method, url, params=params, headers=request_headers, **kwargs
+        )
+        if response.status_code == 304 and entry is not None:
+            self.cache.revalidated(key, entry)
+            return entry.to_response()
+        if response.status_code == 200:
+            self.cache.put(key, response, ttl)
+        return response
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """Thread-safe in-memory LRU mapping with an optional per-entry TTL.
+
+    ``ttl`` of zero keeps entries until they are evicted by size.
+    """
+
+    def __init__(self, maxsize: int, ttl: float = 0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], T]) -> T:
+        """Return the cached value for ``key`` or call ``loader`` and store it.
+
+        The loader runs outside the lock, so two threads missing on the same
+        key may both load it; the last result wins.
+        """
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None and (not self.ttl or now - item[0] < self.ttl):
+                self._data.move_to_end(key)
+                self._hits += 1
+                return item[1]
+            self._misses += 1
+        value = loader()
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._data))
+
+
+__all__ = [
+    "CacheEntry",
+    "CacheInfo",
+    "CachedSession",
+    "DEFAULT_ENDPOINT_TTLS",
+    "LRUCache",
+    "ResponseCache",
+]
@@ -0,0 +1,233 @@
+"""Batch CLI: run many API requests from a manifest in one process."""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Set
+from urllib.parse import parse_qsl
+
+import typer  # type: ignore[import]
+
+from ..client import DataPortalClient
+from ..exceptions import APIError
+from .utils import ensure_client
+
+batch_app = typer.Typer(help="Run many requests from a manifest")
+
+DEFAULT_CONCURRENCY = 8
+
+
+def read_manifest(path: Path, manifest_format: Optional[str] = None) -> Iterator[Dict]:
+    """Yield one entry per manifest line, numbered from 1.
+
+    JSONL lines are objects with ``method`` (default ``GET``), ``path`` and
+    optional ``params``/``json``/``id``. TSV manifests have a header row with
+    ``path`` and optional ``method``, ``params`` (a query string) and ``id``
+    columns. Lines that cannot be parsed yield an entry with an ``error``.
+    """
+    if manifest_format is None:
+        manifest_format = "tsv" if path.suffix.lower() == ".tsv" else "jsonl"
+    stream = sys.stdin if str(path) == "-" else path.open(encoding="utf-8")
+    try:
+        header: Optional[List[str]] = None
+        for line_no, line in enumerate(stream, start=1):
+            line = line.rstrip("\r\n")
+            if not line.strip() or line.startswith("#"):
+                continue
+            if manifest_format == "tsv":
+                if header is None:
+                    header = line.split("\t")
+                    continue
+                entry: Dict[str, Any] = dict(zip(header, line.split("\t")))
+                entry["params"] = _query_params(entry.get("params") or "")
+            else:
+                try:
+                    entry = json.loads(line)
+                except ValueError as exc:
+                    yield {"line": line_no, "error": f"Invalid JSON: {exc}"}
+                    continue
+                if not isinstance(entry, dict):
+                    yield {"line": line_no, "error": "Manifest line is not an object"}
+                    continue
+            path_value = entry.get("path")
+            if not path_value:
+                yield {"line": line_no, "error": "Missing 'path'"}
+                continue
+            if not isinstance(path_value, str):
+                yield {"line": line_no, "error": "'path' must be a string"}
+                continue
+            entry["line"] = line_no
+            yield entry
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def _query_params(query: str) -> Dict[str, Any]:
+    """Parse a query string, keeping repeated keys as lists of values."""
+    params: Dict[str, Any] = {}
+    for name, value in parse_qsl(query):
+        if name not in params:
+            params[name] = value
+        elif isinstance(params[name], list):
+            params[name].append(value)
+        else:
+            params[name] = [params[name], value]
+    return params
+
+
+def execute_entry(client: DataPortalClient, entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one manifest entry and return its result or error record."""
+    record: Dict[str, Any] = {"line": entry["line"]}
+    if "id" in entry:
+        record["id"] = entry["id"]
+    if "error" in entry:
+        record.update(error=entry["error"], status=None, elapsed_ms=0.0)
+        return record
+
+    method = str(entry.get("method") or "GET").upper()
+    record.update(method=method, path=entry["path"])
+    started = time.perf_counter()
+    try:
+        response = client.raw_request(
+            method,
+            entry["path"],
+            params=entry.get("params") or None,
+            json_body=entry.get("json"),
+        )
+    except APIError as exc:
+        record.update(error=str(exc), status=exc.status_code)
+    except Exception as exc:
+        # One malformed entry must not abort the rest of the manifest.
+        record.update(error=f"{type(exc).__name__}: {exc}", status=None)
+    else:
+        record["status"] = response.status_code
+        try:
+            record["data"] = response.json()
+        except ValueError:
+            record["data"] = response.text
+    record["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 3)
+    return record
+
+
+def run_batch(
+    client: DataPortalClient,
+    entries: Iterable[Dict[str, Any]],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    ordered: bool = True,
+) -> Iterator[Dict[str, Any]]:
+    """Execute entries over ``concurrency`` threads, yielding result records.
+
+    At most ``concurrency`` requests are in flight, so huge manifests are
+    streamed rather than loaded. With ``ordered=True`` records come back in
+    manifest order; otherwise as soon as each request completes.
+    """
+    entries = iter(entries)
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        pending: Deque[Future] = deque()
+        running: Set[Future] = set()
+
+        def submit_next() -> bool:
+            entry = next(entries, None)
+            if entry is None:
+                return False
+            future = pool.submit(execute_entry, client, entry)
+            if ordered:
+                pending.append(future)
+            running.add(future)
+            return True
+
+        while len(running) < concurrency and submit_next():
+            pass
+        while running:
+            if ordered:
+                future = pending.popleft()
+                record = future.result()
+                running.discard(future)
+                yield record
+                submit_next()
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                running.discard(future)
+                yield future.result()
+                submit_next()
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+@batch_app.command("run")
+def batch_run(
+    ctx: typer.Context,
+    manifest: Path = typer.Argument(..., help="JSONL or TSV manifest ('-' = stdin)"),
+    manifest_format: Optional[str] = typer.Option(
+        None, "--manifest-format", help="jsonl|tsv (default: from file extension)"
+    ),
+    concurrency: int = typer.Option(
+        DEFAULT_CONCURRENCY, "--concurrency", "-c", help="Requests in flight"
+    ),
+    order: str = typer.Option(
+        "input", "--order", help="Emit results in input or completion order"
+    ),
+    output: Optional[Path] = typer.Option(
+        None, "--output", "-o", help="Write JSONL results here instead of stdout"
+    ),
+) -> None:
+    """Run every request in MANIFEST and write one JSON result per line."""
+    if order not in {"input", "completion"}:
+        raise typer.BadParameter("--order must be 'input' or 'completion'")
+    if manifest_format not in {None, "jsonl", "tsv"}:
+        raise typer.BadParameter("--manifest-format must be 'jsonl' or 'tsv'")
+    if str(manifest) != "-" and not manifest.is_file():
+        raise typer.BadParameter(f"{manifest} is not a file", param_hint="'MANIFEST'")
+
+    client = ensure_client(ctx)
+    client.ensure_pool_size(concurrency)
+
+    sink = output.open("w", encoding="utf-8") if output else sys.stdout
+    latencies: List[float] = []
+    errors = 0
+    started = time.perf_counter()
+    try:
+        records = run_batch(
+            client,
+            read_manifest(manifest, manifest_format),
+            concurrency=concurrency,
+            ordered=order == "input",
+        )
+        for record in records:
+            if "error" in record:
+                errors += 1
+            else:
+                latencies.append(record["elapsed_ms"])
+            sink.write(json.dumps(record, default=str))
+            sink.write("\n")
+            sink.flush()
+    finally:
+        if output:
+            sink.close()
+
+    elapsed = time.perf_counter() - started
+    total = len(latencies) + errors
+    typer.echo(
+        f"requests={total} ok={len(latencies)} errors={errors} "
+        f"elapsed={elapsed:.2f}s throughput={total / elapsed if elapsed else 0:.1f}/s "
+        f"latency_ms p50={_percentile(latencies, 0.5):.1f} "
+        f"p95={_percentile(latencies, 0.95):.1f} "
+        f"max={max(latencies, default=0.0):.1f}",
+        err=True,
+    )
+    if errors:
+        raise typer.Exit(code=1)
@@ -2,11 +2,24 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import List, Optional
 
 import typer  # type: ignore[import]
 
-from ..utils import comma_join, ensure_client, handle_raw_response, merge_params
+from ...client import DEFAULT_GENE_WORKERS
+from ..output import _normalize_row, print_full_table, print_tsv
+from ..utils import (
+    JSON_OUTPUT_FORMATS,
+    api_format,
+    comma_join,
+    ensure_client,
+    handle_raw_response,
+    merge_params,
+    print_all_rows,
+    print_json_payload,
+    read_lines,
+)
 
 genes_app = typer.Typer(help="Gene endpoints")
 
@@ -29,7 +42,9 @@ def genes_list(
             "sort_order": sort_order,
         }
     )
-    response = client.raw_request("GET", "/api/genes/", params=params, format=format)
+    response = client.raw_request(
+        "GET", "/api/genes/", params=params, format=api_format(format)
+    )
     handle_raw_response(response, format, title="Genes")
 
 
@@ -54,7 +69,7 @@ def genes_search(
         }
     )
     response = client.raw_request(
-        "GET", "/api/genes/search", params=params, format=format
+        "GET", "/api/genes/search", params=params, format=api_format(format)
     )
     handle_raw_response(response, format, title="Gene search")
 
@@ -76,6 +91,12 @@ def genes_search_advanced(
     sort_field: Optional[str] = typer.Option(None, "--sort-field"),
     sort_order: Optional[str] = typer.Option(None, "--sort-order"),
     format: Optional[str] = typer.Option(None, "--format", "-f"),
+    all_pages: bool = typer.Option(
+        False, "--all", help="Follow pagination and stream every page"
+    ),
+    max_workers: Optional[int] = typer.Option(
+        None, "--max-workers", help="Prefetch pages concurrently (with --all)"
+    ),
 ) -> None:
     client = ensure_client(ctx)
     params = merge_params(
@@ -95,8 +116,12 @@ def genes_search_advanced(
             "sort_order": sort_order,
         }
     )
+    if all_pages:
+        rows = client.iter_search_genes_advanced(max_workers=max_workers, **params)
+        print_all_rows(rows, format, title="Advanced gene search")
+        return
     response = client.raw_request(
-        "GET", "/api/genes/search/advanced", params=params, format=format
+        "GET", "/api/genes/search/advanced", params=params, format=api_format(format)
     )
     handle_raw_response(response, format, title="Advanced gene search")
 
@@ -108,10 +133,57 @@ def genes_get(
     format: Optional[str] = typer.Option(None, "--format", "-f"),
 ) -> None:
     client = ensure_client(ctx)
-    response = client.raw_request("GET", f"/api/genes/{locus_tag}", format=format)
+    response = client.raw_request(
+        "GET", f"/api/genes/{locus_tag}", format=api_format(format)
+    )
     handle_raw_response(response, format, title=f"Gene {locus_tag}")
 
 
+@genes_app.command("get-many")
+def genes_get_many(
+    ctx: typer.Context,
+    locus_tags: Optional[List[str]] = typer.Argument(None, help="Locus tags"),
+    from_file: Optional[Path] = typer.Option(
+        None,
+        "--from-file",
+        help="File with one locus tag per line ('-' reads stdin)",
+    ),
+    max_workers: int = typer.Option(
+        DEFAULT_GENE_WORKERS, "--max-workers", help="Concurrent requests"
+    ),
+    format: Optional[str] = typer.Option(None, "--format", "-f"),
+) -> None:
+    """Fetch many genes at once; failed locus tags are reported on stderr."""
+    tags = list(locus_tags or [])
+    if from_file is not None:
+        tags.extend(read_lines(from_file))
+    if not tags:
+        raise typer.BadParameter("Provide locus tags or --from-file")
+
+    client = ensure_client(ctx)
+    results = client.get_genes(tags, max_workers=max_workers)
+    genes = [gene for gene in results.values() if not isinstance(gene, Exception)]
+    errors = {
+        tag: str(error)
+        for tag, error in results.items()
+        if isinstance(error, Exception)
+    }
+
+    if format in JSON_OUTPUT_FORMATS:
+        print_json_payload(
+            {"data": [_normalize_row(gene) for gene in genes], "errors": errors}, format
+        )
+    elif format == "tsv":
+        print_tsv(genes)
+    else:
+        print_full_table(genes, title="Genes")
+
+    for tag, message in errors.items():
+        typer.echo(f"{tag}\t{message}", err=True)
+    if errors:
+        raise typer.Exit(code=1)
+
+
 @genes_app.command("proteomics")
 def genes_proteomics(
     ctx: typer.Context,
@@ -120,7 +192,7 @@ def genes_proteomics(
 ) -> None:
     client = ensure_client(ctx)
     response = client.raw_request(
-        "GET", f"/api/genes/{locus_tag}/proteomics", format=format
+        "GET", f"/api/genes/{locus_tag}/proteomics", format=api_format(format)
     )
     handle_raw_response(response, format, title=f"Proteomics ({locus_tag})")
 
@@ -133,7 +205,7 @@ def genes_essentiality(
 ) -> None:
     client = ensure_client(ctx)
     response = client.raw_request(
-        "GET", f"/api/genes/{locus_tag}/essentiality", format=format
+        "GET", f"/api/genes/{locus_tag}/essentiality", format=api_format(format)
     )
     handle_raw_response(response, format, title=f"Essentiality ({locus_tag})")
 
@@ -146,7 +218,7 @@ def genes_fitness(
 ) -> None:
     client = ensure_client(ctx)
     response = client.raw_request(
-        "GET", f"/api/genes/{locus_tag}/fitness", format=format
+        "GET", f"/api/genes/{locus_tag}/fitness", format=api_format(format)
     )
     handle_raw_response(response, format, title=f"Fitness ({locus_tag})")
 
@@ -159,7 +231,7 @@ def genes_mutant_growth(
 ) -> None:
     client = ensure_client(ctx)
     response = client.raw_request(
-        "GET", f"/api/genes/{locus_tag}/mutant-growth", format=format
+        "GET", f"/api/genes/{locus_tag}/mutant-growth", format=api_format(format)
     )
     handle_raw_response(response, format, title=f"Mutant growth ({locus_tag})")
 
@@ -172,7 +244,7 @@ def genes_reactions(
 ) -> None:
     client = ensure_client(ctx)
     response = client.raw_request(
-        "GET", f"/api/genes/{locus_tag}/reactions", format=format
+        "GET", f"/api/genes/{locus_tag}/reactions", format=api_format(format)
     )
     handle_raw_response(response, format, title=f"Reactions ({locus_tag})")
 
@@ -198,7 +270,7 @@ def genes_correlations(
         "GET",
         f"/api/genes/{locus_tag}/correlations",
         params=params,
-        format=format,
+        format=api_format(format),
     )
     handle_raw_response(response, format, title=f"Correlations ({locus_tag})")
 
@@ -228,7 +300,7 @@ def genes_orthologs(
         "GET",
         f"/api/genes/{locus_tag}/orthologs",
         params=params,
-        format=format,
+        format=api_format(format),
     )
     handle_raw_response(response, format, title=f"Orthologs ({locus_tag})")
 
@@ -246,7 +318,7 @@ def genes_operons(
         "GET",
         f"/api/genes/{locus_tag}/operons",
         params=params,
-        format=format,
+        format=api_format(format),
     )
     handle_raw_response(response, format, title=f"Operons ({locus_tag})")
 
@@ -276,7 +348,7 @@ def genes_autocomplete(
         }
     )
     response = client.raw_request(
-        "GET", "/api/genes/autocomplete", params=params, format=format
+        "GET", "/api/genes/autocomplete", params=params, format=api_format(format)
     )
     handle_raw_response(response, format, title="Gene autocomplete")
 
@@ -300,7 +372,7 @@ def genes_faceted_search(
         }
     )
     response = client.raw_request(
-        "GET", "/api/genes/faceted-search", params=params, format=format
+        "GET", "/api/genes/faceted-search", params=params, format=api_format(format)
     )
     handle_raw_response(response, format, title="Gene facets")
 
@@ -313,6 +385,6 @@ def genes_protein(
 ) -> None:
     client = ensure_client(ctx)
     response = client.raw_request(
-        "GET", f"/api/genes/protein/{protein_id}", format=format
+        "GET", f"/api/genes/protein/{protein_id}", format=api_format(format)
     )
     handle_raw_response(response, format, title=f"Protein {protein_id}")
@@ -7,13 +7,18 @@ from typing import List, Optional
 
 import typer  # type: ignore[import]
 
-from ..output import print_full_table, print_json, print_tsv
+from ... import models
 from ..utils import (
+    COLUMNAR_OUTPUT_FORMATS,
+    api_format,
     comma_join,
+    download_to_output,
     ensure_client,
     handle_raw_response,
     merge_params,
+    print_all_rows,
     print_paginated_result,
+    write_columnar_output,
 )
 
 genomes_app = typer.Typer(help="Genome endpoints")
@@ -26,11 +31,13 @@ def list_genomes_command(
     per_page: Optional[int] = typer.Option(None, "--per-page"),
     sort_field: Optional[str] = typer.Option(None, "--sort-field"),
     sort_order: Optional[str] = typer.Option(None, "--sort-order"),
-    format: Optional[str] = typer.Option(None, "--format", "-f", help="json|tsv"),
+    format: Optional[str] = typer.Option(
+        None, "--format", "-f", help="json|jsonl|json-compact|tsv"
+    ),
 ) -> None:
     client = ensure_client(ctx)
     result = client.list_genomes(
-        format=format or "json",
+        format=api_format(format) or "json",
         page=page,
         per_page=per_page,
         sortField=sort_field,
@@ -49,13 +56,16 @@ def search_genomes(
     sort_field: Optional[str] = typer.Option(None, "--sort-field"),
     sort_order: Optional[str] = typer.Option(None, "--sort-order"),
     format: Optional[str] = typer.Option(
-        None, "--format", "-f", help="Output format: json|tsv (default: table)"
+        None,
+        "--format",
+        "-f",
+        help="Output format: json|jsonl|json-compact|tsv (default: table)",
     ),
 ) -> None:
     client = ensure_client(ctx)
-    api_format = format or "json"  # Default to JSON for API request
+    request_format = api_format(format) or "json"  # Default to JSON for API request
     result = client.search_genomes(
-        format=api_format,
+        format=request_format,
         query=query,
         page=page,
         per_page=per_page,
@@ -64,22 +74,20 @@ def search_genomes(
         species_acronym=species_acronym,
     )
 
-    if format == "tsv":
-        print_tsv(result.items)
-    elif format == "json":
-        print_json(result.raw)
-    else:
-        # No format specified - display as table
-        print_full_table(result.items, title="Genomes")
+    print_paginated_result(result, format, title="Genomes")
 
 
 @genomes_app.command("type-strains")
 def genomes_type_strains(
     ctx: typer.Context,
-    format: Optional[str] = typer.Option(None, "--format", "-f", help="json|tsv"),
+    format: Optional[str] = typer.Option(
+        None, "--format", "-f", help="json|jsonl|json-compact|tsv"
+    ),
 ) -> None:
     client = ensure_client(ctx)
-    response = client.raw_request("GET", "/api/genomes/type-strains", format=format)
+    response = client.raw_request(
+        "GET", "/api/genomes/type-strains", format=api_format(format)
+    )
     handle_raw_response(response, format, title="Type Strains")
 
 
@@ -89,7 +97,9 @@ def genomes_autocomplete(
     query: str = typer.Option(..., "--query", "-q", help="Search term"),
     limit: Optional[int] = typer.Option(5, "--limit"),
     species_acronym: Optional[str] = typer.Option(None, "--species", "-s"),
-    format: Optional[str] = typer.Option(None, "--format", "-f", help="json|tsv"),
+    format: Optional[str] = typer.Option(
+        None, "--format", "-f", help="json|jsonl|json-compact|tsv"
+    ),
 ) -> None:
     client = ensure_client(ctx)
     params = merge_params(
@@ -100,7 +110,7 @@ def genomes_autocomplete(
         }
     )
     response = client.raw_request(
-        "GET", "/api/genomes/autocomplete", params=params, format=format
+        "GET", "/api/genomes/autocomplete", params=params, format=api_format(format)
     )
     handle_raw_response(response, format, title="Genome Autocomplete")
 
@@ -111,27 +121,34 @@ def genomes_download_tsv(
     output: Optional[Path] = typer.Option(
         None, "--output", "-o", help="Destination file (defaults to stdout)"
     ),
+    gzip_output: bool = typer.Option(False, "--gzip", help="Gzip-compress the output"),
+    resume: bool = typer.Option(
+        True, "--resume/--no-resume", help="Continue a partial download"
+    ),
 ) -> None:
     client = ensure_client(ctx)
-    response = client.raw_request("GET", "/api/genomes/download/tsv", format="tsv")
-    content = response.text
-    if output:
-        output.write_text(content)
-        typer.echo(f"Wrote {output}")
-    else:
-        typer.echo(content)
+    download_to_output(
+        client,
+        "/api/genomes/download/tsv",
+        output=output,
+        format="tsv",
+        compress=gzip_output,
+        resume=resume,
+    )
 
 
 @genomes_app.command("by-isolates")
 def genomes_by_isolates(
     ctx: typer.Context,
     isolate: List[str] = typer.Option(..., "--isolate", "-i", help="Isolate name(s)"),
-    format: Optional[str] = typer.Option(None, "--format", "-f", help="json|tsv"),
+    format: Optional[str] = typer.Option(
+        None, "--format", "-f", help="json|jsonl|json-compact|tsv"
+    ),
 ) -> None:
     client = ensure_client(ctx)
     params = {"isolates": comma_join(isolate)}
     response = client.raw_request(
-        "GET", "/api/genomes/by-isolate-names", params=params, format=format
+        "GET", "/api/genomes/by-isolate-names", params=params, format=api_format(format)
     )
     handle_raw_response(response, format, title="Genomes by isolate")
 
@@ -147,6 +164,15 @@ def genomes_genes(
     sort_field: Optional[str] = typer.Option(None, "--sort-field"),
     sort_order: Optional[str] = typer.Option(None, "--sort-order"),
     format: Optional[str] = typer.Option(None, "--format", "-f"),
+    all_pages: bool = typer.Option(
+        False, "--all", help="Follow pagination and stream every page"
+    ),
+    max_workers: Optional[int] = typer.Option(
+        None, "--max-workers", help="Prefetch pages concurrently (with --all)"
+    ),
+    output: Optional[Path] = typer.Option(
+        None, "--output", "-o", help="Output file for --format parquet|arrow"
+    ),
 ) -> None:
     client = ensure_client(ctx)
     params = merge_params(
@@ -159,11 +185,24 @@ def genomes_genes(
             "sort_order": sort_order,
         }
     )
+    if format in COLUMNAR_OUTPUT_FORMATS:
+        if all_pages:
+            rows = client.iter_genome_genes(
+                isolate_name, max_workers=max_workers, **params
+            )
+        else:
+            rows = client.get_genome_genes(isolate_name, **params).items
+        write_columnar_output(rows, format, output=output, model=models.Gene)
+        return
+    if all_pages:
+        rows = client.iter_genome_genes(isolate_name, max_workers=max_workers, **params)
+        print_all_rows(rows, format, title=f"Genes for {isolate_name}")
+        return
     response = client.raw_request(
         "GET",
         f"/api/genomes/{isolate_name}/genes",
         params=params,
-        format=format,
+        format=api_format(format),
     )
     handle_raw_response(response, format, title=f"Genes for {isolate_name}")
 
@@ -179,7 +218,7 @@ def genomes_essentiality(
     response = client.raw_request(
         "GET",
         f"/api/genomes/{isolate_name}/essentiality/{ref_name}",
-        format=format,
+        format=api_format(format),
     )
     handle_raw_response(
         response, format, title=f"Essentiality {isolate_name}:{ref_name}"
@@ -200,7 +239,7 @@ def genomes_drug_mic(
         "GET",
         f"/api/genomes/{isolate_name}/drug-mic",
         params=params,
-        format=format,
+        format=api_format(format),
     )
     handle_raw_response(response, format, title=f"Drug MIC ({isolate_name})")
 
@@ -219,7 +258,7 @@ def genomes_drug_metabolism(
         "GET",
         f"/api/genomes/{isolate_name}/drug-metabolism",
         params=params,
-        format=format,
+        format=api_format(format),
     )
     handle_raw_response(response, format, title=f"Drug metabolism ({isolate_name})")
 
@@ -234,6 +273,6 @@ def genomes_drug_data(
     response = client.raw_request(
         "GET",
         f"/api/genomes/{isolate_name}/drug-data",
-        format=format,
+        format=api_format(format),
     )
     handle_raw_response(response, format, title=f"Drug data ({isolate_name})")
@@ -6,8 +6,15 @@ from typing import List, Optional
 
 import typer  # type: ignore[import]
 
-from ..output import print_full_table, print_json, print_tsv
-from ..utils import comma_join, ensure_client, handle_raw_response, merge_params
+from ..output import print_json
+from ..utils import (
+    api_format,
+    comma_join,
+    ensure_client,
+    handle_raw_response,
+    merge_params,
+    print_all_rows,
+)
 
 species_app = typer.Typer(help="Species endpoints")
 
@@ -16,20 +23,20 @@ species_app = typer.Typer(help="Species endpoints")
 def list_species(
     ctx: typer.Context,
     format: Optional[str] = typer.Option(
-        None, "--format", "-f", help="Output format: json|tsv (default: table)"
+        None,
+        "--format",
+        "-f",
+        help="Output format: json|jsonl|json-compact|tsv (default: table)",
     ),
 ) -> None:
     client = ensure_client(ctx)
-    api_format = format or "json"  # Default to JSON for API request
-    species = client.list_species(format=api_format)
+    request_format = api_format(format) or "json"  # Default to JSON for API request
+    species = client.list_species(format=request_format)
 
-    if format == "tsv":
-        print_tsv(species)
-    elif format == "json":
+    if format == "json":
         print_json(species)
     else:
-        # No format specified - display as table
-        print_full_table(species, title="Species")
+        print_all_rows(species, format, title="Species")
 
 
 @species_app.command("genomes")
@@ -46,7 +53,9 @@ def species_genomes_list(
     per_page: Optional[int] = typer.Option(None, "--per-page"),
     sort_field: Optional[str] = typer.Option(None, "--sort-field"),
     sort_order: Optional[str] = typer.Option(None, "--sort-order"),
-    format: Optional[str] = typer.Option(None, "--format", "-f", help="json|tsv"),
+    format: Optional[str] = typer.Option(
+        None, "--format", "-f", help="json|jsonl|json-compact|tsv"
+    ),
 ) -> None:
     client = ensure_client(ctx)
     params = merge_params(
@@ -63,7 +72,7 @@ def species_genomes_list(
         "GET",
         f"/api/species/{species_acronym}/genomes",
         params=params,
-        format=format,
+        format=api_format(format),
     )
     handle_raw_response(response, format, title=f"Genomes ({species_acronym})")
 
@@ -78,7 +87,9 @@ def species_search_genomes(
     per_page: Optional[int] = typer.Option(None, "--per-page"),
     sort_field: Optional[str] = typer.Option(None, "--sort-field"),
     sort_order: Optional[str] = typer.Option(None, "--sort-order"),
-    format: Optional[str] = typer.Option(None, "--format", "-f", help="json|tsv"),
+    format: Optional[str] = typer.Option(
+        None, "--format", "-f", help="json|jsonl|json-compact|tsv"
+    ),
 ) -> None:
     client = ensure_client(ctx)
     params = merge_params(
@@ -95,6 +106,6 @@ def species_search_genomes(
         "GET",
         f"/api/species/{species_acronym}/genomes/search",
         params=params,
-        format=format,
+        format=api_format(format),
     )
     handle_raw_response(response, format, title=f"Genomes search ({species_acronym})")
@@ -6,7 +6,7 @@ from typing import Optional
 
 import typer  # type: ignore[import]
 
-from ..utils import ensure_client, handle_raw_response
+from ..utils import api_format, ensure_client, handle_raw_response
 
 system_app = typer.Typer(help="System / metadata endpoints")
 
@@ -14,20 +14,24 @@ system_app = typer.Typer(help="System / metadata endpoints")
 @system_app.command("health")
 def system_health(
     ctx: typer.Context,
-    format: Optional[str] = typer.Option(None, "--format", "-f", help="json|tsv"),
+    format: Optional[str] = typer.Option(
+        None, "--format", "-f", help="json|jsonl|json-compact|tsv"
+    ),
 ) -> None:
     client = ensure_client(ctx)
-    response = client.raw_request("GET", "/api/health", format=format)
+    response = client.raw_request("GET", "/api/health", format=api_format(format))
     handle_raw_response(response, format, title="Health Check")
 
 
 @system_app.command("features")
 def system_features(
     ctx: typer.Context,
-    format: Optional[str] = typer.Option(None, "--format", "-f", help="json|tsv"),
+    format: Optional[str] = typer.Option(
+        None, "--format", "-f", help="json|jsonl|json-compact|tsv"
+    ),
 ) -> None:
     client = ensure_client(ctx)
-    response = client.raw_request("GET", "/api/features", format=format)
+    response = client.raw_request("GET", "/api/features", format=api_format(format))
     handle_raw_response(response, format, title="Feature Flags")
 
 
@@ -37,5 +41,7 @@ def system_cog_categories(
     format: Optional[str] = typer.Option(None, "--format", "-f"),
 ) -> None:
     client = ensure_client(ctx)
-    response = client.raw_request("GET", "/api/metadata/cog-categories", format=format)
+    response = client.raw_request(
+        "GET", "/api/metadata/cog-categories", format=api_format(format)
+    )
     handle_raw_response(response, format, title="COG Categories")
@@ -6,8 +6,13 @@ from typing import Optional
 
 import typer  # type: ignore[import]
 
-from ..output import print_full_table, print_json, print_tsv
-from ..utils import ensure_client, handle_raw_response, merge_params
+from ..utils import (
+    api_format,
+    ensure_client,
+    handle_raw_response,
+    merge_params,
+    print_paginated_result,
+)
 
 drugs_app = typer.Typer(help="Drug endpoints")
 
@@ -28,13 +33,16 @@ def drug_mic_search(
     sort_by: Optional[str] = typer.Option(None, "--sort-by"),
     sort_order: Optional[str] = typer.Option(None, "--sort-order"),
     format: Optional[str] = typer.Option(
-        None, "--format", "-f", help="Output format: json|tsv (default: table)"
+        None,
+        "--format",
+        "-f",
+        help="Output format: json|jsonl|json-compact|tsv (default: table)",
     ),
 ) -> None:
     client = ensure_client(ctx)
-    api_format = format or "json"  # Default to JSON for API request
+    request_format = api_format(format) or "json"  # Default to JSON for API request
     result = client.search_drug_mic(
-        format=api_format,
+        format=request_format,
         query=query,
         drug_name=drug_name,
         drug_class=drug_class,
@@ -49,13 +57,7 @@ def drug_mic_search(
         sort_order=sort_order,
     )
 
-    if format == "tsv":
-        print_tsv(result.items)
-    elif format == "json":
-        print_json(result.raw)
-    else:
-        # No format specified - display as table
-        print_full_table(result.items, title="Drug MIC")
+    print_paginated_result(result, format, title="Drug MIC")
 
 
 @drugs_app.command("mic-by-drug")
@@ -71,7 +73,7 @@ def drug_mic_by_drug(
         "GET",
         f"/api/drugs/mic/by-drug/{drug_name}",
         params=params,
-        format=format,
+        format=api_format(format),
     )
     handle_raw_response(response, format, title=f"Drug MIC ({drug_name})")
 
@@ -113,7 +115,7 @@ def drug_metabolism_search(
         }
     )
     response = client.raw_request(
-        "GET", "/api/drugs/metabolism/search", params=params, format=format
+        "GET", "/api/drugs/metabolism/search", params=params, format=api_format(format)
     )
     handle_raw_response(response, format, title="Drug metabolism search")
 
@@ -131,7 +133,7 @@ def drug_metabolism_by_drug(
         "GET",
         f"/api/drugs/metabolism/by-drug/{drug_name}",
         params=params,
-        format=format,
+        format=api_format(format),
     )
     handle_raw_response(response, format, title=f"Drug metabolism ({drug_name})")
 
@@ -157,7 +159,7 @@ def drug_mic_by_class(
         "GET",
         f"/api/drugs/mic/by-class/{drug_class}",
         params=params,
-        format=format,
+        format=api_format(format),
     )
     handle_raw_response(response, format, title=f"Drug MIC class ({drug_class})")
 
@@ -183,6 +185,6 @@ def drug_metabolism_by_class(
         "GET",
         f"/api/drugs/metabolism/by-class/{drug_class}",
         params=params,
-        format=format,
+        format=api_format(format),
     )
     handle_raw_response(response, format, title=f"Drug metabolism class ({drug_class})")
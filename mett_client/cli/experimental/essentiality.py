@@ -6,7 +6,13 @@ from typing import List, Optional
 
 import typer  # type: ignore[import]
 
-from ..utils import comma_join, ensure_client, handle_raw_response, merge_params
+from ..utils import (
+    api_format,
+    comma_join,
+    ensure_client,
+    handle_raw_response,
+    merge_params,
+)
 
 essentiality_app = typer.Typer(help="Essentiality endpoints")
 
@@ -36,6 +42,6 @@ def essentiality_search(
         }
     )
     response = client.raw_request(
-        "GET", "/api/essentiality/search", params=params, format=format
+        "GET", "/api/essentiality/search", params=params, format=api_format(format)
     )
     handle_raw_response(response, format, title="Essentiality search")
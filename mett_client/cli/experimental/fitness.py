@@ -6,7 +6,13 @@ from typing import List, Optional
 
 import typer  # type: ignore[import]
 
-from ..utils import comma_join, ensure_client, handle_raw_response, merge_params
+from ..utils import (
+    api_format,
+    comma_join,
+    ensure_client,
+    handle_raw_response,
+    merge_params,
+)
 
 fitness_app = typer.Typer(help="Fitness endpoints")
 fitness_corr_app = typer.Typer(help="Fitness correlation endpoints")
@@ -35,7 +41,7 @@ def fitness_search(
         }
     )
     response = client.raw_request(
-        "GET", "/api/fitness/search", params=params, format=format
+        "GET", "/api/fitness/search", params=params, format=api_format(format)
     )
     handle_raw_response(response, format, title="Fitness search")
 
@@ -59,7 +65,10 @@ def fitness_correlations_search(
         }
     )
     response = client.raw_request(
-        "GET", "/api/fitness-correlations/search", params=params, format=format
+        "GET",
+        "/api/fitness-correlations/search",
+        params=params,
+        format=api_format(format),
     )
     handle_raw_response(response, format, title="Fitness correlations search")
 
@@ -81,6 +90,9 @@ def fitness_correlations_pair(
         }
     )
     response = client.raw_request(
-        "GET", "/api/fitness-correlations/correlation", params=params, format=format
+        "GET",
+        "/api/fitness-correlations/correlation",
+        params=params,
+        format=api_format(format),
     )
     handle_raw_response(response, format, title="Gene fitness correlation")
@@ -6,7 +6,13 @@ from typing import List, Optional
 
 import typer  # type: ignore[import]
 
-from ..utils import comma_join, ensure_client, handle_raw_response, merge_params
+from ..utils import (
+    api_format,
+    comma_join,
+    ensure_client,
+    handle_raw_response,
+    merge_params,
+)
 
 mutant_app = typer.Typer(help="Mutant growth endpoints")
 
@@ -38,6 +44,6 @@ def mutant_growth_search(
         }
     )
     response = client.raw_request(
-        "GET", "/api/mutant-growth/search", params=params, format=format
+        "GET", "/api/mutant-growth/search", params=params, format=api_format(format)
     )
     handle_raw_response(response, format, title="Mutant growth search")
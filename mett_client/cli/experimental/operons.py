@@ -6,7 +6,7 @@ from typing import Optional
 
 import typer  # type: ignore[import]
 
-from ..utils import ensure_client, handle_raw_response, merge_params
+from ..utils import api_format, ensure_client, handle_raw_response, merge_params
 
 operons_app = typer.Typer(help="Operon endpoints")
 
@@ -40,7 +40,7 @@ def operons_search(
         }
     )
     response = client.raw_request(
-        "GET", "/api/operons/search", params=params, format=format
+        "GET", "/api/operons/search", params=params, format=api_format(format)
     )
     handle_raw_response(response, format, title="Operon search")
 
@@ -52,7 +52,9 @@ def operons_get(
     format: Optional[str] = typer.Option(None, "--format", "-f"),
 ) -> None:
     client = ensure_client(ctx)
-    response = client.raw_request("GET", f"/api/operons/{operon_id}", format=format)
+    response = client.raw_request(
+        "GET", f"/api/operons/{operon_id}", format=api_format(format)
+    )
     handle_raw_response(response, format, title=f"Operon {operon_id}")
 
 
@@ -65,6 +67,6 @@ def operons_statistics(
     client = ensure_client(ctx)
     params = merge_params({"species_acronym": species_acronym})
     response = client.raw_request(
-        "GET", "/api/operons/statistics", params=params, format=format
+        "GET", "/api/operons/statistics", params=params, format=api_format(format)
     )
     handle_raw_response(response, format, title="Operon statistics")
@@ -6,7 +6,7 @@ from typing import Optional
 
 import typer  # type: ignore[import]
 
-from ..utils import ensure_client, handle_raw_response, merge_params
+from ..utils import api_format, ensure_client, handle_raw_response, merge_params
 
 orthologs_app = typer.Typer(help="Ortholog endpoints")
 
@@ -34,7 +34,7 @@ def orthologs_search(
         }
     )
     response = client.raw_request(
-        "GET", "/api/orthologs/search", params=params, format=format
+        "GET", "/api/orthologs/search", params=params, format=api_format(format)
     )
     handle_raw_response(response, format, title="Ortholog search")
 
@@ -52,6 +52,6 @@ def orthologs_pair(
         "locus_tag_b": locus_tag_b,
     }
     response = client.raw_request(
-        "GET", "/api/orthologs/pair", params=params, format=format
+        "GET", "/api/orthologs/pair", params=params, format=api_format(format)
     )
     handle_raw_response(response, format, title="Ortholog pair")
@@ -6,7 +6,13 @@ from typing import List, Optional
 
 import typer  # type: ignore[import]
 
-from ..utils import comma_join, ensure_client, handle_raw_response, merge_params
+from ..utils import (
+    api_format,
+    comma_join,
+    ensure_client,
+    handle_raw_response,
+    merge_params,
+)
 
 proteomics_app = typer.Typer(help="Proteomics endpoints")
 
@@ -32,6 +38,6 @@ def proteomics_search(
         }
     )
     response = client.raw_request(
-        "GET", "/api/proteomics/search", params=params, format=format
+        "GET", "/api/proteomics/search", params=params, format=api_format(format)
     )
     handle_raw_response(response, format, title="Proteomics search")
@@ -6,7 +6,13 @@ from typing import List, Optional
 
 import typer  # type: ignore[import]
 
-from ..utils import comma_join, ensure_client, handle_raw_response, merge_params
+from ..utils import (
+    api_format,
+    comma_join,
+    ensure_client,
+    handle_raw_response,
+    merge_params,
+)
 
 reactions_app = typer.Typer(help="Reaction endpoints")
 
@@ -34,6 +40,6 @@ def reactions_search(
         }
     )
     response = client.raw_request(
-        "GET", "/api/reactions/search", params=params, format=format
+        "GET", "/api/reactions/search", params=params, format=api_format(format)
     )
     handle_raw_response(response, format, title="Reaction search")
@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 import typer  # type: ignore[import]
 
-from ..utils import ensure_client, handle_raw_response, merge_params
+from ... import models
+from ..utils import (
+    COLUMNAR_OUTPUT_FORMATS,
+    api_format,
+    ensure_client,
+    handle_raw_response,
+    merge_params,
+    parse_key_value_pairs,
+    print_all_rows,
+    print_json_payload,
+    write_columnar_output,
+)
 
 ppi_app = typer.Typer(help="PPI endpoints")
 
@@ -17,7 +29,9 @@ def ppi_scores(
     format: Optional[str] = typer.Option(None, "--format", "-f"),
 ) -> None:
     client = ensure_client(ctx)
-    response = client.raw_request("GET", "/api/ppi/scores/available", format=format)
+    response = client.raw_request(
+        "GET", "/api/ppi/scores/available", format=api_format(format)
+    )
     handle_raw_response(response, format, title="PPI score types")
 
 
@@ -37,6 +51,15 @@ def ppi_interactions(
     page: Optional[int] = typer.Option(None, "--page", "-p"),
     per_page: Optional[int] = typer.Option(None, "--per-page"),
     format: Optional[str] = typer.Option(None, "--format", "-f"),
+    all_pages: bool = typer.Option(
+        False, "--all", help="Follow pagination and stream every page"
+    ),
+    max_workers: Optional[int] = typer.Option(
+        None, "--max-workers", help="Prefetch pages concurrently (with --all)"
+    ),
+    output: Optional[Path] = typer.Option(
+        None, "--output", "-o", help="Output file for --format parquet|arrow"
+    ),
 ) -> None:
     client = ensure_client(ctx)
     params = merge_params(
@@ -55,12 +78,136 @@ def ppi_interactions(
             "per_page": per_page,
         }
     )
+    if format in COLUMNAR_OUTPUT_FORMATS:
+        if all_pages:
+            rows = client.iter_ppi(max_workers=max_workers, **params)
+        else:
+            rows = client.search_ppi_page(**params).items
+        write_columnar_output(rows, format, output=output, model=models.PPIInteraction)
+        return
+    if all_pages:
+        rows = client.iter_ppi(max_workers=max_workers, **params)
+        print_all_rows(rows, format, title="PPI interactions")
+        return
     response = client.raw_request(
-        "GET", "/api/ppi/interactions", params=params, format=format
+        "GET", "/api/ppi/interactions", params=params, format=api_format(format)
     )
     handle_raw_response(response, format, title="PPI interactions")
 
 
+def _parse_conditions(pairs: Optional[List[str]]) -> Dict[str, Any]:
+    conditions: Dict[str, Any] = {}
+    parsed = parse_key_value_pairs(pairs, error_message="Expected SCORE=VALUE")
+    for name, value in parsed.items():
+        if name.startswith("has_"):
+            conditions[name] = value.lower() in {"1", "true", "yes", "on"}
+            continue
+        try:
+            conditions[name] = float(value)
+        except ValueError as exc:
+            raise typer.BadParameter(f"{name} needs a number, got {value!r}") from exc
+    return conditions
+
+
+@ppi_app.command("rank")
+def ppi_rank(
+    ctx: typer.Context,
+    species_acronym: Optional[str] = typer.Option(None, "--species", "-s"),
+    isolate_name: Optional[str] = typer.Option(None, "--isolate"),
+    weights: Optional[List[str]] = typer.Option(
+        None,
+        "--weight",
+        "-w",
+        help="SCORE=WEIGHT in the combined score (repeatable; default ds_score=1)",
+    ),
+    minimums: Optional[List[str]] = typer.Option(
+        None,
+        "--min",
+        help="Keep pairs with SCORE>=VALUE or FLAG=true|false (repeatable)",
+    ),
+    top: int = typer.Option(100, "--top", "-n", help="Number of pairs to keep"),
+    per_page: Optional[int] = typer.Option(None, "--per-page"),
+    max_workers: Optional[int] = typer.Option(
+        None, "--max-workers", help="Fetch pages concurrently"
+    ),
+    format: Optional[str] = typer.Option(None, "--format", "-f"),
+) -> None:
+    """Fetch every matching interaction and rank pairs by a weighted score."""
+    weight_map = {
+        name: float(value) for name, value in _parse_conditions(weights).items()
+    } or {"ds_score": 1.0}
+    conditions = _parse_conditions(minimums)
+    client = ensure_client(ctx)
+    params = merge_params(
+        {
+            "species_acronym": species_acronym,
+            "isolate_name": isolate_name,
+            "per_page": per_page,
+        }
+    )
+    try:
+        table = client.ppi_score_table(
+            all_pages=True, max_workers=max_workers, **params
+        )
+    except ImportError as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(code=1) from exc
+    try:
+        keep = table.mask(**conditions)
+        combined = table.combined(weight_map)
+    except KeyError as exc:
+        raise typer.BadParameter(exc.args[0]) from exc
+
+    best = table.top_k(top, combined, where=keep)
+    rows = table.to_rows(
+        best, columns=["pair_id", "protein_a", "protein_b", *weight_map]
+    )
+    for row, value in zip(rows, combined[best].tolist()):
+        row["combined_score"] = round(value, 6)
+    print_all_rows(rows, format, title="Ranked PPI interactions")
+
+
+@ppi_app.command("dump")
+def ppi_dump(
+    ctx: typer.Context,
+    species_acronym: str = typer.Option(..., "--species", "-s"),
+    output: Path = typer.Option(
+        ..., "--output", "-o", help="Directory for edges.tsv and nodes.tsv"
+    ),
+    score_type: Optional[str] = typer.Option(None, "--score-type"),
+    score_threshold: Optional[float] = typer.Option(None, "--score-threshold"),
+    per_page: Optional[int] = typer.Option(None, "--per-page"),
+    max_workers: int = typer.Option(4, "--max-workers", help="Pages in flight"),
+    resume: bool = typer.Option(
+        True, "--resume/--no-resume", help="Continue from an existing checkpoint"
+    ),
+) -> None:
+    """Dump every interaction of a species as a deduplicated edge list."""
+    client = ensure_client(ctx)
+    client.ensure_pool_size(max_workers)
+    try:
+        summary = client.dump_ppi(
+            species_acronym,
+            score_type,
+            score_threshold,
+            out=output,
+            per_page=per_page,
+            max_workers=max_workers,
+            resume=resume,
+        )
+    except ImportError as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(code=1) from exc
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    typer.echo(
+        f"{'Resumed' if summary.resumed else 'Wrote'} {output}: "
+        f"{summary.edges} edges, {summary.nodes} nodes, "
+        f"{summary.duplicates} duplicates skipped over {summary.pages} pages",
+        err=True,
+    )
+
+
 @ppi_app.command("neighbors")
 def ppi_neighbors(
     ctx: typer.Context,
@@ -78,11 +225,21 @@ def ppi_neighbors(
         }
     )
     response = client.raw_request(
-        "GET", "/api/ppi/neighbors", params=params, format=format
+        "GET", "/api/ppi/neighbors", params=params, format=api_format(format)
     )
     handle_raw_response(response, format, title="PPI neighbors")
 
 
+def _load_graph(path: Path) -> Any:
+    try:
+        from ...graph import PPIGraph
+
+        return PPIGraph.load(path)
+    except ImportError as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(code=1) from exc
+
+
 @ppi_app.command("neighborhood")
 def ppi_neighborhood(
     ctx: typer.Context,
@@ -91,7 +248,32 @@ def ppi_neighborhood(
     species_acronym: Optional[str] = typer.Option(None, "--species", "-s"),
     n: Optional[int] = typer.Option(None, "--n"),
     format: Optional[str] = typer.Option(None, "--format", "-f"),
+    graph: Optional[Path] = typer.Option(
+        None,
+        "--graph",
+        help="Answer locally from a graph saved by `ppi network --save-graph`",
+    ),
+    hops: int = typer.Option(1, "--hops", help="Neighbourhood radius (with --graph)"),
+    min_score: Optional[float] = typer.Option(
+        None, "--min-score", help="Only follow edges scoring at least this"
+    ),
 ) -> None:
+    if graph is not None:
+        if not protein_id:
+            raise typer.BadParameter("--graph lookups need --protein-id")
+        network = _load_graph(graph)
+        try:
+            reached = network.neighborhood(protein_id, hops, min_score=min_score)
+        except KeyError as exc:
+            typer.echo(exc.args[0], err=True)
+            raise typer.Exit(code=1) from exc
+        rows = [
+            {"protein_id": node, "hops": distance}
+            for node, distance in reached.items()
+            if node != protein_id
+        ]
+        print_all_rows(rows, format, title="PPI neighborhood")
+        return
     client = ensure_client(ctx)
     params = merge_params(
         {
@@ -102,7 +284,7 @@ def ppi_neighborhood(
         }
     )
     response = client.raw_request(
-        "GET", "/api/ppi/neighborhood", params=params, format=format
+        "GET", "/api/ppi/neighborhood", params=params, format=api_format(format)
     )
     handle_raw_response(response, format, title="PPI neighborhood")
 
@@ -115,8 +297,30 @@ def ppi_network(
     species_acronym: Optional[str] = typer.Option(None, "--species", "-s"),
     include_properties: Optional[bool] = typer.Option(None, "--include-properties"),
     format: Optional[str] = typer.Option(None, "--format", "-f"),
+    save_graph: Optional[Path] = typer.Option(
+        None,
+        "--save-graph",
+        help="Save the network as a local graph file (.npz) instead of printing it",
+    ),
 ) -> None:
     client = ensure_client(ctx)
+    if save_graph is not None:
+        try:
+            network = client.ppi_graph(
+                score_type,
+                score_threshold=score_threshold,
+                species_acronym=species_acronym,
+            )
+        except ImportError as exc:
+            typer.echo(str(exc), err=True)
+            raise typer.Exit(code=1) from exc
+        network.save(save_graph)
+        typer.echo(
+            f"Wrote {network.num_nodes} nodes and {network.num_edges} edges "
+            f"to {save_graph}",
+            err=True,
+        )
+        return
     params = merge_params(
         {
             "score_threshold": score_threshold,
@@ -128,7 +332,7 @@ def ppi_network(
         "GET",
         f"/api/ppi/network/{score_type}",
         params=params,
-        format=format,
+        format=api_format(format),
     )
     handle_raw_response(response, format, title=f"PPI network ({score_type})")
 
@@ -140,16 +344,61 @@ def ppi_network_properties(
     score_threshold: Optional[float] = typer.Option(None, "--score-threshold"),
     species_acronym: Optional[str] = typer.Option(None, "--species", "-s"),
     format: Optional[str] = typer.Option(None, "--format", "-f"),
+    source: str = typer.Option(
+        "server",
+        "--source",
+        help="server: ask the API; local: compute from the network download; "
+        "auto: ask the API and compute locally if it fails",
+    ),
+    graph: Optional[Path] = typer.Option(
+        None,
+        "--graph",
+        help="Compute locally from a graph saved by `ppi network --save-graph`",
+    ),
+    graph_cache: Optional[Path] = typer.Option(
+        None,
+        "--graph-cache",
+        help="Reuse (or save) the network download for local computation",
+    ),
+    timeout: Optional[float] = typer.Option(
+        None, "--timeout", help="Seconds to wait for the API with --source auto"
+    ),
 ) -> None:
+    if source not in ("server", "local", "auto"):
+        raise typer.BadParameter("--source must be server, local or auto")
+    if graph is not None:
+        payload: Any = {"data": {**_load_graph(graph).properties(), "source": "local"}}
+        print_json_payload(payload, (format or "json").lower())
+        return
     client = ensure_client(ctx)
-    params = merge_params(
-        {
-            "score_type": score_type,
-            "score_threshold": score_threshold,
-            "species_acronym": species_acronym,
-        }
-    )
-    response = client.raw_request(
-        "GET", "/api/ppi/network-properties", params=params, format=format
-    )
-    handle_raw_response(response, format, title="PPI network properties")
+    if source == "server":
+        params = merge_params(
+            {
+                "score_type": score_type,
+                "score_threshold": score_threshold,
+                "species_acronym": species_acronym,
+            }
+        )
+        response = client.raw_request(
+            "GET",
+            "/api/ppi/network-properties",
+            params=params,
+            format=api_format(format),
+        )
+        handle_raw_response(response, format, title="PPI network properties")
+        return
+    try:
+        payload = client.ppi_network_properties(
+            score_type,
+            score_threshold=score_threshold,
+            species_acronym=species_acronym,
+            source=source,
+            cache_path=graph_cache,
+            timeout=timeout,
+        )
+    except ImportError as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(code=1) from exc
+    if payload.get("message"):
+        typer.echo(payload["message"], err=True)
+    print_json_payload(payload, (format or "json").lower())
@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from pathlib import Path
+from typing import List, Optional
 
 import typer  # type: ignore[import]
 
-from ..utils import ensure_client, handle_raw_response, merge_params
+from ...client import DEFAULT_GENE_WORKERS
+from ..utils import (
+    api_format,
+    ensure_client,
+    handle_raw_response,
+    merge_params,
+    read_lines,
+)
 
 ttp_app = typer.Typer(help="Pooled TTP interaction endpoints")
 
@@ -17,7 +25,7 @@ def ttp_metadata(
     format: Optional[str] = typer.Option(None, "--format", "-f"),
 ) -> None:
     client = ensure_client(ctx)
-    response = client.raw_request("GET", "/api/ttp/metadata", format=format)
+    response = client.raw_request("GET", "/api/ttp/metadata", format=api_format(format))
     handle_raw_response(response, format, title="TTP metadata")
 
 
@@ -42,7 +50,7 @@ def ttp_search(
         }
     )
     response = client.raw_request(
-        "GET", "/api/ttp/search", params=params, format=format
+        "GET", "/api/ttp/search", params=params, format=api_format(format)
     )
     handle_raw_response(response, format, title="TTP search")
 
@@ -75,7 +83,7 @@ def ttp_gene_interactions(
         "GET",
         f"/api/ttp/gene/{locus_tag}/interactions",
         params=params,
-        format=format,
+        format=api_format(format),
     )
     handle_raw_response(response, format, title=f"TTP interactions ({locus_tag})")
 
@@ -108,7 +116,7 @@ def ttp_compound_interactions(
         "GET",
         f"/api/ttp/compound/{compound}/interactions",
         params=params,
-        format=format,
+        format=api_format(format),
     )
     handle_raw_response(response, format, title=f"TTP interactions ({compound})")
 
@@ -122,7 +130,9 @@ def ttp_hits(
 ) -> None:
     client = ensure_client(ctx)
     params = merge_params({"min_ttp_score": min_ttp_score, "max_fdr": max_fdr})
-    response = client.raw_request("GET", "/api/ttp/hits", params=params, format=format)
+    response = client.raw_request(
+        "GET", "/api/ttp/hits", params=params, format=api_format(format)
+    )
     handle_raw_response(response, format, title="TTP hits")
 
 
@@ -136,6 +146,63 @@ def ttp_pools_analysis(
     client = ensure_client(ctx)
     params = {"poolA": pool_a, "poolB": pool_b}
     response = client.raw_request(
-        "GET", "/api/ttp/pools/analysis", params=params, format=format
+        "GET", "/api/ttp/pools/analysis", params=params, format=api_format(format)
     )
     handle_raw_response(response, format, title="TTP pools analysis")
+
+
+@ttp_app.command("matrix")
+def ttp_matrix(
+    ctx: typer.Context,
+    labels: Optional[List[str]] = typer.Argument(
+        None, help="Locus tags (or compounds with --by compound)"
+    ),
+    from_file: Optional[Path] = typer.Option(
+        None,
+        "--from-file",
+        help="File with one locus tag or compound per line ('-' reads stdin)",
+    ),
+    by: str = typer.Option(
+        "gene", "--by", help="Query per gene (locus tag) or per compound"
+    ),
+    output: Path = typer.Option(
+        ..., "--output", "-o", help="Matrix file to write (.npz)"
+    ),
+    hit_calling: Optional[bool] = typer.Option(None, "--hit-calling"),
+    min_ttp_score: Optional[float] = typer.Option(None, "--min-ttp-score"),
+    max_workers: int = typer.Option(
+        DEFAULT_GENE_WORKERS, "--max-workers", help="Concurrent requests"
+    ),
+) -> None:
+    """Build a sparse gene x compound TTP matrix; failed lookups go to stderr."""
+    if by not in ("gene", "compound"):
+        raise typer.BadParameter("--by must be gene or compound")
+    values = list(labels or [])
+    if from_file is not None:
+        values.extend(read_lines(from_file))
+    if not values:
+        raise typer.BadParameter("Provide locus tags/compounds or --from-file")
+
+    client = ensure_client(ctx)
+    key = "locus_tags" if by == "gene" else "compounds"
+    try:
+        matrix = client.ttp_matrix(
+            max_workers=max_workers,
+            **{key: values},
+            **merge_params(
+                {"hit_calling": hit_calling, "min_ttp_score": min_ttp_score}
+            ),
+        )
+    except ImportError as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(code=1) from exc
+    matrix.save(output)
+    typer.echo(
+        f"Wrote {matrix.shape[0]} x {matrix.shape[1]} matrix "
+        f"({matrix.nnz} interactions, {int(matrix.hits.sum())} hits) to {output}",
+        err=True,
+    )
+    for label, error in matrix.errors.items():
+        typer.echo(f"{label}\t{error}", err=True)
+    if matrix.errors:
+        raise typer.Exit(code=1)
@@ -2,47 +2,59 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import importlib
+from typing import Dict, List, Optional, Tuple
 
+import click  # type: ignore[import]
 import typer  # type: ignore[import]
+from typer.core import TyperGroup  # type: ignore[import]
 
-from .core import genes_app, genomes_app, species_app, system_app
-from .experimental import (
-    drugs_app,
-    essentiality_app,
-    fitness_app,
-    fitness_corr_app,
-    mutant_app,
-    operons_app,
-    orthologs_app,
-    proteomics_app,
-    reactions_app,
-)
-from .interactions import ppi_app, ttp_app
-from .other import api_app, pyhmmer_app
 from .utils import _build_client
 from ..version import __version__
 
-app = typer.Typer(help="METT Data Portal CLI")
-
-# Register all sub-apps
-app.add_typer(system_app, name="system")
-app.add_typer(species_app, name="species")
-app.add_typer(genomes_app, name="genomes")
-app.add_typer(genes_app, name="genes")
-app.add_typer(drugs_app, name="drugs")
-app.add_typer(proteomics_app, name="proteomics")
-app.add_typer(essentiality_app, name="essentiality")
-app.add_typer(fitness_app, name="fitness")
-app.add_typer(fitness_corr_app, name="fitness-correlations")
-app.add_typer(mutant_app, name="mutant-growth")
-app.add_typer(reactions_app, name="reactions")
-app.add_typer(operons_app, name="operons")
-app.add_typer(orthologs_app, name="orthologs")
-app.add_typer(ttp_app, name="ttp")
-app.add_typer(ppi_app, name="ppi")
-app.add_typer(pyhmmer_app, name="pyhmmer")
-app.add_typer(api_app, name="api")
+# Sub-apps are registered by name and only imported when invoked (or when the
+# top-level help needs their descriptions), so `mett genes get ...` never loads
+# the PPI/TTP/PyHMMER command modules.
+SUBCOMMANDS: Dict[str, Tuple[str, str]] = {
+    "system": (".core.system", "system_app"),
+    "species": (".core.species", "species_app"),
+    "genomes": (".core.genomes", "genomes_app"),
+    "genes": (".core.genes", "genes_app"),
+    "drugs": (".experimental.drugs", "drugs_app"),
+    "proteomics": (".experimental.proteomics", "proteomics_app"),
+    "essentiality": (".experimental.essentiality", "essentiality_app"),
+    "fitness": (".experimental.fitness", "fitness_app"),
+    "fitness-correlations": (".experimental.fitness", "fitness_corr_app"),
+    "mutant-growth": (".experimental.mutant_growth", "mutant_app"),
+    "reactions": (".experimental.reactions", "reactions_app"),
+    "operons": (".experimental.operons", "operons_app"),
+    "orthologs": (".experimental.orthologs", "orthologs_app"),
+    "ttp": (".interactions.ttp", "ttp_app"),
+    "ppi": (".interactions.ppi", "ppi_app"),
+    "pyhmmer": (".other", "pyhmmer_app"),
+    "api": (".other", "api_app"),
+    "batch": (".batch", "batch_app"),
+}
+
+
+class LazyGroup(TyperGroup):
+    """Top-level group that imports sub-app modules on first use."""
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        eager = [name for name in super().list_commands(ctx) if name not in SUBCOMMANDS]
+        return list(SUBCOMMANDS) + eager
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in SUBCOMMANDS and cmd_name not in self.commands:
+            module_name, attr = SUBCOMMANDS[cmd_name]
+            module = importlib.import_module(module_name, __package__)
+            group = typer.main.get_group(getattr(module, attr))
+            group.name = cmd_name
+            self.add_command(group, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+app = typer.Typer(cls=LazyGroup, help="METT Data Portal CLI")
 
 
 @app.callback(invoke_without_command=True)
@@ -56,6 +68,19 @@ def main(
     verify_ssl: Optional[bool] = typer.Option(
         None, help="Set false to skip TLS verification"
     ),
+    cache: Optional[bool] = typer.Option(
+        None,
+        "--cache/--no-cache",
+        help="Enable or disable the on-disk response cache (~/.mett/cache)",
+    ),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Bypass cached responses and store fresh ones"
+    ),
+    rate_limit: Optional[float] = typer.Option(
+        None,
+        "--rate-limit",
+        help="Max requests per second across all workers (0 = unlimited)",
+    ),
     version: bool = typer.Option(
         False, "--version", "-v", help="Show version and exit"
     ),
@@ -71,6 +96,9 @@ def main(
         jwt=jwt,
         timeout=timeout,
         verify_ssl=verify_ssl,
+        cache=cache,
+        refresh=refresh,
+        rate_limit=rate_limit,
     )
 
 
@@ -9,7 +9,9 @@ from typing import Any, List, Optional
 import typer  # type: ignore[import]
 
 from .utils import (
+    api_format,
     comma_join,
+    download_to_output,
     ensure_client,
     handle_raw_response,
     merge_params,
@@ -39,7 +41,7 @@ def api_request(
     method: str = typer.Argument(..., help="HTTP method (GET, POST, etc.)"),
     path: str = typer.Argument(..., help="API path, e.g. /api/species/"),
     format: Optional[str] = typer.Option(
-        None, "--format", "-f", help="Response format: json|tsv"
+        None, "--format", "-f", help="Response format: json|jsonl|json-compact|tsv"
     ),
     query: Optional[List[str]] = typer.Option(
         None, "--query", "-q", help="Query parameter KEY=VALUE"
@@ -82,7 +84,7 @@ def api_request(
         headers=header_params,
         data=data,
         json_body=json_payload,
-        format=format,
+        format=api_format(format),
     )
 
     handle_raw_response(response, format, title=f"{method.upper()} {path}")
@@ -94,7 +96,9 @@ def pyhmmer_databases(
     format: Optional[str] = typer.Option(None, "--format", "-f"),
 ) -> None:
     client = ensure_client(ctx)
-    response = client.raw_request("GET", "/api/pyhmmer/search/databases", format=format)
+    response = client.raw_request(
+        "GET", "/api/pyhmmer/search/databases", format=api_format(format)
+    )
     handle_raw_response(response, format, title="PyHMMER databases")
 
 
@@ -105,7 +109,7 @@ def pyhmmer_mx_choices(
 ) -> None:
     client = ensure_client(ctx)
     response = client.raw_request(
-        "GET", "/api/pyhmmer/search/mx-choices", format=format
+        "GET", "/api/pyhmmer/search/mx-choices", format=api_format(format)
     )
     handle_raw_response(response, format, title="PyHMMER mx choices")
 
@@ -119,7 +123,9 @@ def pyhmmer_search(
     body_file: Optional[Path] = typer.Option(
         None, "--body-file", exists=True, readable=True, help="Path to JSON body"
     ),
-    format: Optional[str] = typer.Option("json", "--format", "-f", help="json|tsv"),
+    format: Optional[str] = typer.Option(
+        "json", "--format", "-f", help="json|jsonl|json-compact|tsv"
+    ),
 ) -> None:
     client = ensure_client(ctx)
     payload = _load_body_json(body_json, body_file)
@@ -129,7 +135,7 @@ def pyhmmer_search(
         "POST",
         "/api/pyhmmer/search",
         json_body=payload,
-        format=format,
+        format=api_format(format),
     )
     handle_raw_response(response, format, title="PyHMMER search")
 
@@ -159,7 +165,7 @@ def pyhmmer_result(
         "GET",
         f"/api/pyhmmer/result/{job_id}",
         params=params,
-        format=format,
+        format=api_format(format),
     )
     handle_raw_response(response, format, title=f"PyHMMER result ({job_id})")
 
@@ -177,7 +183,7 @@ def pyhmmer_domains(
         "GET",
         f"/api/pyhmmer/result/{job_id}/domains",
         params=params,
-        format=format,
+        format=api_format(format),
     )
     handle_raw_response(response, format, title=f"PyHMMER domains ({job_id})")
 
@@ -190,21 +196,22 @@ def pyhmmer_download(
         ..., "--download-format", help="aligned_fasta|fasta|csv|tab"
     ),
     output: Optional[Path] = typer.Option(None, "--output", "-o"),
+    gzip_output: bool = typer.Option(False, "--gzip", help="Gzip-compress the output"),
+    resume: bool = typer.Option(
+        True, "--resume/--no-resume", help="Continue a partial download"
+    ),
 ) -> None:
     client = ensure_client(ctx)
     params = {"format": download_format}
-    response = client.raw_request(
-        "GET",
+    download_to_output(
+        client,
         f"/api/pyhmmer/result/{job_id}/download",
+        output=output,
         params=params,
         format="tsv" if download_format == "tab" else None,
+        compress=gzip_output,
+        resume=resume,
     )
-    content = response.text
-    if output:
-        output.write_text(content)
-        typer.echo(f"Wrote {output}")
-    else:
-        typer.echo(content)
 
 
 @pyhmmer_app.command("debug-msa")
@@ -217,7 +224,7 @@ def pyhmmer_debug_msa(
     response = client.raw_request(
         "GET",
         f"/api/pyhmmer/result/{job_id}/debug-pyhmmer-msa",
-        format=format,
+        format=api_format(format),
     )
     handle_raw_response(response, format, title=f"PyHMMER MSA ({job_id})")
 
@@ -232,7 +239,7 @@ def pyhmmer_debug_fasta(
     response = client.raw_request(
         "GET",
         f"/api/pyhmmer/result/{job_id}/debug-fasta",
-        format=format,
+        format=api_format(format),
     )
     handle_raw_response(response, format, title=f"PyHMMER FASTA ({job_id})")
 
@@ -245,7 +252,7 @@ def pyhmmer_debug_task(
 ) -> None:
     client = ensure_client(ctx)
     response = client.raw_request(
-        "GET", f"/api/pyhmmer/debug/task/{task_id}", format=format
+        "GET", f"/api/pyhmmer/debug/task/{task_id}", format=api_format(format)
     )
     handle_raw_response(response, format, title=f"PyHMMER task ({task_id})")
 
@@ -262,6 +269,6 @@ def pyhmmer_testtask(
     client = ensure_client(ctx)
     payload = _load_body_json(body_json, body_file)
     response = client.raw_request(
-        "POST", "/api/pyhmmer/testtask", json_body=payload, format=format
+        "POST", "/api/pyhmmer/testtask", json_body=payload, format=api_format(format)
     )
     handle_raw_response(response, format, title="PyHMMER test task")
@@ -1,28 +1,63 @@
-"""CLI output helpers using Rich."""
+"""CLI output helpers using Rich.
+
+Rich is only imported when a table (or colourised JSON on a terminal) is
+actually rendered; JSON and TSV output to pipes never load it.
+"""
 
 from __future__ import annotations
 
 import csv
 import json
+import os
 import sys
-from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
+import textwrap
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain, islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from rich.console import Console  # type: ignore[import]
+
+Column = Tuple[str, callable]
 
-from rich.console import Console  # type: ignore[import]
-from rich.table import Table  # type: ignore[import]
+# Rows inspected to infer the TSV header when none is declared (about a page).
+DEFAULT_HEADER_SAMPLE = 100
 
-console = Console()
 
-Column = Tuple[str, callable]
+@lru_cache(maxsize=None)
+def get_console() -> "Console":
+    from rich.console import Console  # type: ignore[import]
+
+    return Console()
+
+
+def _table(title: str) -> Any:
+    from rich.table import Table  # type: ignore[import]
+
+    return Table(title=title)
 
 
 def print_table(
     rows: Iterable[object], columns: Sequence[Column], *, title: str
 ) -> None:
     rows = list(rows)
+    console = get_console()
     if not rows:
         console.print("No results found", style="yellow")
         return
-    table = Table(title=title)
+    table = _table(title)
     for header, _ in columns:
         table.add_column(header)
 
@@ -33,12 +68,13 @@ def print_table(
 
 def print_full_table(rows: Iterable[object], *, title: str) -> None:
     normalized = [_normalize_row(row) for row in rows]
+    console = get_console()
     if not normalized:
         console.print("No results found", style="yellow")
         return
 
     headers: List[str] = sorted({key for row in normalized for key in row.keys()})
-    table = Table(title=title)
+    table = _table(title)
     for header in headers:
         table.add_column(header)
 
@@ -48,24 +84,111 @@ def print_full_table(rows: Iterable[object], *, title: str) -> None:
 
 
 def print_json(data: object) -> None:
-    console.print_json(data=json.loads(json.dumps(data, default=str)))
+    """Pretty-print JSON; colourised via Rich only when stdout is a terminal."""
+    text = json.dumps(data, default=str, indent=2, ensure_ascii=False)
+    if sys.stdout.isatty():
+        get_console().print_json(text)
+        return
+    sys.stdout.write(text)
+    sys.stdout.write("\n")
 
 
-def print_tsv(rows: Iterable[object]) -> None:
-    """Print rows as raw TSV (tab-separated values) for piping to files."""
-    normalized = [_normalize_row(row) for row in rows]
-    if not normalized:
-        return
+def print_json_compact(data: object) -> None:
+    """Print JSON on a single line with no insignificant whitespace."""
+    with _stdout_pipe():
+        sys.stdout.write(_dumps_compact(data))
+        sys.stdout.write("\n")
 
-    headers: List[str] = sorted({key for row in normalized for key in row.keys()})
 
-    # Use csv.writer with tab delimiter for proper TSV formatting
-    writer = csv.writer(sys.stdout, delimiter="\t", lineterminator="\n")
-    writer.writerow(headers)
+def print_tsv(
+    rows: Iterable[object],
+    *,
+    headers: Optional[Sequence[str]] = None,
+    sample: int = DEFAULT_HEADER_SAMPLE,
+) -> None:
+    """Stream rows as raw TSV (tab-separated values) for piping to files.
+
+    The header is ``headers`` when given. Otherwise it is the sorted union of
+    keys over every row when ``rows`` is a sequence, or, for an iterator, the
+    fields of the first row's model; iterators of plain dicts fall back to the
+    keys of the first ``sample`` rows, and keys that only appear later are not
+    written. Rows are written as they are consumed and left to stdout's own
+    buffering (flushed once at the end), so memory stays flat and a closed
+    ``| head`` pipe stops the writer early.
+    """
+    buffered: List[Dict[str, Any]] = []
+    if headers is None and isinstance(rows, Sequence):
+        buffered = [_normalize_row(row) for row in rows]
+        rows = ()
+        headers = sorted({key for row in buffered for key in row.keys()})
+    rows = iter(rows)
+    if headers is None:
+        first = next(rows, None)
+        if first is None:
+            return
+        fields = getattr(type(first), "model_fields", None)
+        if fields:
+            buffered = [_normalize_row(first)]
+            headers = sorted(fields)
+        else:
+            sampled = chain([first], islice(rows, max(1, sample) - 1))
+            buffered = [_normalize_row(row) for row in sampled]
+            headers = sorted({key for row in buffered for key in row.keys()})
+    if not headers:
+        return
 
-    for row in normalized:
-        values = [_tsv_value(row.get(header)) for header in headers]
-        writer.writerow(values)
+    with _stdout_pipe():
+        writer = csv.writer(sys.stdout, delimiter="\t", lineterminator="\n")
+        writer.writerow(headers)
+        for row in chain(buffered, map(_normalize_row, rows)):
+            writer.writerow([_tsv_value(row.get(header)) for header in headers])
+
+
+def print_json_lines(rows: Iterable[object]) -> None:
+    """Write one compact JSON object per row as rows arrive."""
+    with _stdout_pipe():
+        for row in rows:
+            sys.stdout.write(_dumps_compact(_normalize_row(row)))
+            sys.stdout.write("\n")
+
+
+def print_json_array(rows: Iterable[object], *, indent: Optional[int] = None) -> None:
+    """Write rows as one JSON array, streaming elements as they arrive.
+
+    The array is compact by default; with ``indent`` it is laid out exactly
+    as ``json.dumps(list(rows), indent=indent)`` would.
+    """
+    with _stdout_pipe():
+        sys.stdout.write("[")
+        empty = True
+        for row in rows:
+            row = _normalize_row(row)
+            if indent is None:
+                sys.stdout.write(("" if empty else ",") + _dumps_compact(row))
+            else:
+                text = json.dumps(row, default=str, indent=indent, ensure_ascii=False)
+                sys.stdout.write("\n" if empty else ",\n")
+                sys.stdout.write(textwrap.indent(text, " " * indent))
+            empty = False
+        sys.stdout.write("]\n" if empty or indent is None else "\n]\n")
+
+
+def _dumps_compact(data: object) -> str:
+    return json.dumps(data, default=str, ensure_ascii=False, separators=(",", ":"))
+
+
+@contextmanager
+def _stdout_pipe() -> Iterator[None]:
+    """Exit quietly when the reader of stdout goes away (e.g. ``| head``)."""
+    try:
+        yield
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # Point stdout at devnull so the interpreter's final flush cannot
+        # raise again; see "Note on SIGPIPE" in the Python signal docs.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        raise SystemExit(1) from None
 
 
 def _normalize_row(row: object) -> Dict[str, Any]:
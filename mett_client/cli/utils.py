@@ -2,13 +2,28 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Sequence
+import gzip
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 import typer  # type: ignore[import]
 
-from ..client import DataPortalClient
+from ..client import DEFAULT_DOWNLOAD_CHUNK_SIZE, DataPortalClient
 from ..config import get_config
-from .output import print_full_table, print_json, print_tsv
+from .output import (
+    print_full_table,
+    print_json,
+    print_json_array,
+    print_json_compact,
+    print_json_lines,
+    print_tsv,
+)
+
+# ``--format`` values rendered client-side from a JSON response.
+JSON_OUTPUT_FORMATS = ("json", "jsonl", "json-compact")
+# Binary ``--format`` values written via :mod:`mett_client.columnar`.
+COLUMNAR_OUTPUT_FORMATS = ("parquet", "arrow")
 
 
 def _build_client(
@@ -17,6 +32,9 @@ def _build_client(
     jwt: Optional[str],
     timeout: Optional[int],
     verify_ssl: Optional[bool],
+    cache: Optional[bool] = None,
+    refresh: bool = False,
+    rate_limit: Optional[float] = None,
 ) -> DataPortalClient:
     """Build a DataPortalClient with the given configuration."""
     config = get_config()
@@ -28,6 +46,13 @@ def _build_client(
         config.timeout = timeout
     if verify_ssl is not None:
         config.verify_ssl = verify_ssl
+    if cache is not None:
+        config.cache = cache
+    if refresh and cache is not False:
+        config.cache = True
+        config.cache_refresh = True
+    if rate_limit is not None:
+        config.rate_limit = rate_limit
     return DataPortalClient(config=config)
 
 
@@ -38,6 +63,13 @@ def ensure_client(ctx: typer.Context) -> DataPortalClient:
     return ctx.obj
 
 
+def api_format(format: Optional[str]) -> Optional[str]:
+    """Map a CLI ``--format`` to the format requested from the API."""
+    if format in JSON_OUTPUT_FORMATS:
+        return "json"
+    return format
+
+
 def parse_key_value_pairs(
     pairs: Optional[Sequence[str]],
     *,
@@ -111,8 +143,8 @@ def handle_raw_response(response: Any, format: Optional[str], *, title: str) ->
         typer.echo(response.text)
         return
 
-    if (format or "").lower() == "json":
-        print_json(payload)
+    if (format or "").lower() in JSON_OUTPUT_FORMATS:
+        print_json_payload(payload, format.lower())
         return
 
     rows = extract_table_rows(payload)
@@ -122,6 +154,15 @@ def handle_raw_response(response: Any, format: Optional[str], *, title: str) ->
         print_json(payload)
 
 
+def read_lines(path: Path) -> List[str]:
+    """Read non-empty, non-comment lines from a file, or stdin for ``-``."""
+    if str(path) == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        lines = path.read_text().splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.startswith("#")]
+
+
 def comma_join(values: Optional[Sequence[str]]) -> Optional[str]:
     """Join a sequence of strings with commas."""
     if not values:
@@ -129,12 +170,152 @@ def comma_join(values: Optional[Sequence[str]]) -> Optional[str]:
     return ",".join(values)
 
 
+def print_json_payload(payload: Any, format: str) -> None:
+    """Print a decoded JSON payload as ``json``, ``jsonl`` or ``json-compact``.
+
+    ``jsonl`` writes one compact record per row of the payload (see
+    :func:`extract_table_rows`); payloads without rows become a single line.
+    """
+    if format == "jsonl":
+        rows = extract_table_rows(payload)
+        if rows is not None:
+            print_json_lines(rows)
+            return
+        print_json_compact(payload)
+        return
+    if format == "json-compact":
+        print_json_compact(payload)
+        return
+    print_json(payload)
+
+
 def print_paginated_result(result: Any, format: Optional[str], *, title: str) -> None:
     """Print a paginated result in the requested format."""
     if format == "tsv":
         print_tsv(result.items)
         return
-    if format == "json":
-        print_json(result.raw)
+    if format == "jsonl":
+        print_json_lines(result.items)
+        return
+    if format in JSON_OUTPUT_FORMATS:
+        print_json_payload(result.raw, format)
         return
     print_full_table(result.items, title=title)
+
+
+def print_all_rows(
+    rows: Iterable[Any],
+    format: Optional[str],
+    *,
+    title: str,
+    headers: Optional[Sequence[str]] = None,
+) -> None:
+    """Print rows produced by a client ``iter_*`` method.
+
+    TSV, JSON Lines (``jsonl``) and a single JSON array (``json`` indented,
+    ``json-compact`` on one line) are streamed to stdout as pages arrive; the
+    table view needs every row up front and is rendered once iteration ends.
+    """
+    if format == "tsv":
+        print_tsv(rows, headers=headers)
+        return
+    if format == "jsonl":
+        print_json_lines(rows)
+        return
+    if format == "json":
+        print_json_array(rows, indent=2)
+        return
+    if format == "json-compact":
+        print_json_array(rows)
+        return
+    print_full_table(rows, title=title)
+
+
+def write_columnar_output(
+    rows: Iterable[Any],
+    format: str,
+    *,
+    output: Optional[Path],
+    model: Optional[type] = None,
+) -> None:
+    """Write rows as Parquet or Arrow IPC to ``output`` (or a piped stdout)."""
+    from ..columnar import write_columnar
+
+    if output is None and sys.stdout.isatty():
+        raise typer.BadParameter(
+            f"--format {format} writes binary data; use --output or redirect stdout"
+        )
+    try:
+        count = write_columnar(
+            rows, output if output else sys.stdout.buffer, format, model=model
+        )
+    except ImportError as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(code=1) from exc
+    if output:
+        typer.echo(f"Wrote {count} rows to {output}", err=True)
+
+
+def download_to_output(
+    client: DataPortalClient,
+    path: str,
+    *,
+    output: Optional[Path],
+    params: Optional[Dict[str, Any]] = None,
+    format: Optional[str] = None,
+    compress: bool = False,
+    resume: bool = True,
+) -> None:
+    """Stream a download to ``output`` (atomically) or to stdout.
+
+    A progress bar is drawn on stderr when writing to a file from a terminal.
+    """
+    if output is None:
+        response = client.raw_request(
+            "GET", path, params=params, format=format, stream=True
+        )
+        with response:
+            sink = sys.stdout.buffer
+            if compress:
+                sink = gzip.GzipFile(fileobj=sink, mode="wb")
+            for chunk in response.iter_content(chunk_size=DEFAULT_DOWNLOAD_CHUNK_SIZE):
+                sink.write(chunk)
+            if compress:
+                sink.close()
+            sys.stdout.buffer.flush()
+        return
+
+    if not sys.stderr.isatty():
+        client.download(
+            path, output, params=params, format=format, resume=resume, compress=compress
+        )
+        typer.echo(f"Wrote {output}")
+        return
+
+    from rich.console import Console  # type: ignore[import]
+    from rich.progress import (  # type: ignore[import]
+        BarColumn,
+        DownloadColumn,
+        Progress,
+        TransferSpeedColumn,
+    )
+
+    with Progress(
+        "[progress.description]{task.description}",
+        BarColumn(),
+        DownloadColumn(),
+        TransferSpeedColumn(),
+        console=Console(stderr=True),
+        transient=True,
+    ) as bar:
+        task = bar.add_task(output.name, total=None)
+        client.download(
+            path,
+            output,
+            params=params,
+            format=format,
+            resume=resume,
+            compress=compress,
+            progress=lambda done, total: bar.update(task, completed=done, total=total),
+        )
+    typer.echo(f"Wrote {output}")
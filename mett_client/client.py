@@ -3,12 +3,26 @@
 from __future__ import annotations
 
 import csv
-from dataclasses import dataclass
+import functools
+import gzip
+import importlib
+import json
+import os
+import shutil
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
+    Deque,
     Dict,
     Generic,
+    Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -20,47 +34,141 @@ from typing import (
 )
 
 import requests  # type: ignore[import]
-from mett_dataportal_sdk import (
-    ApiClient as SDKApiClient,
-    Configuration as SDKConfiguration,
-)
-from mett_dataportal_sdk.api.drugs_api import DrugsApi
-from mett_dataportal_sdk.api.essentiality_api import EssentialityApi
-from mett_dataportal_sdk.api.fitness_api import FitnessApi
-from mett_dataportal_sdk.api.genes_api import GenesApi
-from mett_dataportal_sdk.api.genomes_api import GenomesApi
-from mett_dataportal_sdk.api.mutant_growth_api import MutantGrowthApi
-from mett_dataportal_sdk.api.pooled_ttp_interactions_api import PooledTTPInteractionsApi
-from mett_dataportal_sdk.api.protein_protein_interactions_api import (
-    ProteinProteinInteractionsApi,
-)
-from mett_dataportal_sdk.api.proteomics_api import ProteomicsApi
-from mett_dataportal_sdk.api.reactions_api import ReactionsApi
-from mett_dataportal_sdk.api.species_api import SpeciesApi
+
 from mett_dataportal_sdk.exceptions import ApiException
 
+from . import models
+from .cache import CachedSession, CacheInfo, LRUCache, ResponseCache
 from .config import Config, get_config
 from .exceptions import APIError, AuthenticationError
-from .request_utils import parse_tsv_response, request_json
-from .models import (
-    DrugMIC,
-    DrugMetabolism,
-    Gene,
-    Genome,
-    Pagination,
-    Species,
+from .request_utils import request_json, stream_tsv_rows
+from .transport import (
+    ClientStats,
+    RateLimitedAdapter,
+    SessionRESTClient,
+    build_rate_limiter,
+    configure_session,
 )
 from .utils import normalize_params, normalize_species_entry
 
+if TYPE_CHECKING:
+    import pandas as pd  # type: ignore[import]
+    import polars as pl  # type: ignore[import]
+    import pyarrow as pa  # type: ignore[import]
+
+    from mett_dataportal_sdk import (
+        ApiClient as SDKApiClient,
+    )
+    from mett_dataportal_sdk import (
+        Configuration as SDKConfiguration,
+    )
+
+    from .graph import PPIGraph
+    from .models import (
+        DrugMetabolism,
+        DrugMIC,
+        Gene,
+        Genome,
+        Pagination,
+        PPIInteraction,
+        Species,
+    )
+    from .ppi_dump import PPIDumpSummary
+    from .ppi_scores import PPIScoreTable
+    from .ttp_matrix import TTPMatrix
+
 T = TypeVar("T")
-ApiType = TypeVar("ApiType")
+
+DEFAULT_GENE_WORKERS = 4
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _freeze(params: Mapping[str, Any]) -> Tuple[Tuple[str, str], ...]:
+    return tuple(sorted((key, repr(value)) for key, value in params.items()))
 
 
-@dataclass
 class PaginatedResult(Generic[T]):
-    items: List[T]
-    pagination: Pagination | None
-    raw: Dict[str, Any]
+    """One page of results.
+
+    ``raw`` is the page as a plain JSON dict. When it is not passed in, it is
+    built by ``raw_factory`` on first access, so callers that only read
+    ``items`` never pay for serializing the page a second time. The built
+    dict is cached unless ``keep_raw`` is false, in which case it is rebuilt
+    on every access and the page is never held in memory twice.
+    """
+
+    __slots__ = ("items", "pagination", "keep_raw", "_raw", "_raw_factory")
+
+    def __init__(
+        self,
+        items: List[T],
+        pagination: Pagination | None,
+        raw: Optional[Dict[str, Any]] = None,
+        *,
+        raw_factory: Optional[Callable[[], Dict[str, Any]]] = None,
+        keep_raw: bool = True,
+    ) -> None:
+        self.items = items
+        self.pagination = pagination
+        self.keep_raw = keep_raw
+        self._raw = raw
+        self._raw_factory = raw_factory if raw is None else None
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        if self._raw is not None:
+            return self._raw
+        if self._raw_factory is None:
+            return {}
+        raw = self._raw_factory()
+        if self.keep_raw:
+            self._raw = raw
+            self._raw_factory = None
+        return raw
+
+    @raw.setter
+    def raw(self, value: Dict[str, Any]) -> None:
+        self._raw = value
+        self._raw_factory = None
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(items={self.items!r}, "
+            f"pagination={self.pagination!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PaginatedResult):
+            return NotImplemented
+        return (self.items, self.pagination, self.raw) == (
+            other.items,
+            other.pagination,
+            other.raw,
+        )
+
+    def _frame_rows(self) -> Tuple[List[Any], Any]:
+        # Prefer already-serialized rows in ``raw`` over dumping each item,
+        # but never build ``raw`` just for this.
+        model = type(self.items[0]) if self.items else None
+        if not hasattr(model, "model_fields"):
+            model = None
+        raw = self._raw
+        data = raw.get("data") if isinstance(raw, dict) else None
+        if isinstance(data, list) and len(data) == len(self.items):
+            return data, model
+        return list(self.items), model
+
+    def to_pandas(self) -> "pd.DataFrame":
+        """Return this page as a pandas DataFrame typed by the SDK model."""
+        from .frames import to_pandas
+
+        return to_pandas(*self._frame_rows())
+
+    def to_polars(self) -> "pl.DataFrame":
+        """Return this page as a polars DataFrame typed by the SDK model."""
+        from .frames import to_polars
+
+        return to_polars(*self._frame_rows())
 
 
 class DataPortalClient:
@@ -75,6 +183,10 @@ class DataPortalClient:
         timeout: int | None = None,
         verify_ssl: bool | None = None,
         user_agent: str | None = None,
+        memo_size: int | None = None,
+        memo_ttl: int | None = None,
+        validate: bool | None = None,
+        keep_raw: bool | None = None,
         sdk_client: SDKApiClient | None = None,
     ) -> None:
         self.config = config or get_config()
@@ -88,13 +200,27 @@ class DataPortalClient:
             self.config.verify_ssl = verify_ssl
         if user_agent:
             self.config.user_agent = user_agent
+        if memo_size is not None:
+            self.config.memo_size = memo_size
+        if memo_ttl is not None:
+            self.config.memo_ttl = memo_ttl
+        if validate is not None:
+            self.config.validate = validate
+        if keep_raw is not None:
+            self.config.keep_raw = keep_raw
 
-        configuration = self._build_sdk_configuration()
-        self._sdk_client = sdk_client or SDKApiClient(configuration=configuration)
-        # align UA with the rest of the project
-        self._sdk_client.user_agent = self.config.user_agent
-        self._apis: Dict[Type[Any], Any] = {}
+        self.stats = ClientStats()
+        self.rate_limiter = build_rate_limiter(self.config)
         self._http = self._build_http_session()
+        # The generated SDK is only imported and built on first use; commands
+        # that go through raw_request/request_json never pay for it.
+        if sdk_client is not None:
+            # align UA with the rest of the project
+            sdk_client.user_agent = self.config.user_agent
+        self._sdk_client_instance = sdk_client
+        self._sdk_lock = threading.Lock()
+        self._apis: Dict[str, Any] = {}
+        self._memo = LRUCache(self.config.memo_size, self.config.memo_ttl)
 
     # ------------------------------------------------------------------
     # Core API Methods
@@ -119,25 +245,27 @@ class DataPortalClient:
         """List all genomes. Supports format='json' (default) or format='tsv'."""
         if format == "tsv":
             return self._request_tsv_paginated(
-                "/api/genomes/", params=params, model=Genome
+                "/api/genomes/", params=params, model=models.Genome
             )
         response = self._call_api(
-            self._api(GenomesApi).dataportal_api_core_genome_endpoints_get_all_genomes,
+            self._api(
+                "GenomesApi"
+            ).dataportal_api_core_genome_endpoints_get_all_genomes,
             params=params,
         )
-        return self._to_paginated(response)
+        return self._to_paginated(response, self.config.keep_raw)
 
     def species_genomes(
         self, species_acronym: str, **params: Any
     ) -> PaginatedResult[Genome]:
         response = self._call_api(
             self._api(
-                SpeciesApi
+                "SpeciesApi"
             ).dataportal_api_core_species_endpoints_get_genomes_by_species,
             params=params,
             species_acronym=species_acronym,
         )
-        return self._to_paginated(response)
+        return self._to_paginated(response, self.config.keep_raw)
 
     def search_genomes(
         self, *, format: str = "json", **params: Any
@@ -145,7 +273,7 @@ class DataPortalClient:
         """Search genomes. Supports format='json' (default) or format='tsv'."""
         if format == "tsv":
             return self._request_tsv_paginated(
-                "/api/genomes/search", params=params, model=Genome
+                "/api/genomes/search", params=params, model=models.Genome
             )
         # Use direct HTTP request to ensure format=json is included in query string
         json_params = (params or {}).copy()
@@ -156,14 +284,17 @@ class DataPortalClient:
         # Parse paginated response
         if isinstance(payload, dict):
             data = payload.get("data", [])
-            pagination_dict = payload.get("pagination")
-            pagination = Pagination(**pagination_dict) if pagination_dict else None
+            pagination = self._pagination(payload.get("pagination"))
             raw = payload
         else:
             data = payload if isinstance(payload, list) else []
             pagination = None
             raw = {"data": data}
-        items = [Genome(**item) if isinstance(item, dict) else item for item in data]
+        if not self.config.validate:
+            return PaginatedResult(items=list(data), pagination=pagination, raw=raw)
+        items = [
+            models.Genome(**item) if isinstance(item, dict) else item for item in data
+        ]
         return PaginatedResult(items=items, pagination=pagination, raw=raw)
 
     def get_genome_genes(
@@ -171,39 +302,111 @@ class DataPortalClient:
     ) -> PaginatedResult[Gene]:
         response = self._call_api(
             self._api(
-                GenomesApi
+                "GenomesApi"
             ).dataportal_api_core_genome_endpoints_get_genes_by_genome,
             params=params,
             isolate_name=isolate_name,
         )
-        return self._to_paginated(response)
+        return self._to_paginated(response, self.config.keep_raw)
 
     def search_genes(self, **params: Any) -> PaginatedResult[Gene]:
         response = self._call_api(
             self._api(
-                GenesApi
+                "GenesApi"
             ).dataportal_api_core_gene_endpoints_search_genes_by_string,
             params=params,
         )
-        return self._to_paginated(response)
+        return self._to_paginated(response, self.config.keep_raw)
 
     def search_genes_advanced(self, **params: Any) -> PaginatedResult[Gene]:
         response = self._call_api(
             self._api(
-                GenesApi
+                "GenesApi"
             ).dataportal_api_core_gene_endpoints_search_genes_by_multiple_genomes_and_species_and_string,
             params=params,
         )
-        return self._to_paginated(response)
+        return self._to_paginated(response, self.config.keep_raw)
+
+    def iter_genomes(
+        self, *, max_workers: int | None = None, **params: Any
+    ) -> Iterator[Genome]:
+        """Yield every genome from ``list_genomes``, fetching pages lazily."""
+        return self._iter_items(self.list_genomes, params, max_workers=max_workers)
+
+    def iter_species_genomes(
+        self, species_acronym: str, *, max_workers: int | None = None, **params: Any
+    ) -> Iterator[Genome]:
+        """Yield every genome of a species, fetching pages lazily."""
+        return self._iter_items(
+            self.species_genomes,
+            params,
+            max_workers=max_workers,
+            species_acronym=species_acronym,
+        )
+
+    def iter_search_genomes(
+        self, *, max_workers: int | None = None, **params: Any
+    ) -> Iterator[Genome]:
+        """Yield every genome matching a search, fetching pages lazily."""
+        return self._iter_items(self.search_genomes, params, max_workers=max_workers)
+
+    def iter_genome_genes(
+        self, isolate_name: str, *, max_workers: int | None = None, **params: Any
+    ) -> Iterator[Gene]:
+        """Yield every gene of a genome, fetching pages lazily."""
+        return self._iter_items(
+            self.get_genome_genes,
+            params,
+            max_workers=max_workers,
+            isolate_name=isolate_name,
+        )
+
+    def iter_search_genes(
+        self, *, max_workers: int | None = None, **params: Any
+    ) -> Iterator[Gene]:
+        """Yield every gene matching a search, fetching pages lazily."""
+        return self._iter_items(self.search_genes, params, max_workers=max_workers)
+
+    def iter_search_genes_advanced(
+        self, *, max_workers: int | None = None, **params: Any
+    ) -> Iterator[Gene]:
+        """Yield every gene matching an advanced search, fetching pages lazily."""
+        return self._iter_items(
+            self.search_genes_advanced, params, max_workers=max_workers
+        )
 
     def get_gene(self, locus_tag: str) -> Gene:
-        response = self._call_api(
-            self._api(
-                GenesApi
-            ).dataportal_api_core_gene_endpoints_get_gene_by_locus_tag,
-            locus_tag=locus_tag,
+        return self._memoized(
+            ("get_gene", locus_tag),
+            lambda: self._call_api(
+                self._api(
+                    "GenesApi"
+                ).dataportal_api_core_gene_endpoints_get_gene_by_locus_tag,
+                locus_tag=locus_tag,
+            ),
         )
-        return response
+
+    def get_genes(
+        self,
+        locus_tags: Iterable[str],
+        *,
+        max_workers: int = DEFAULT_GENE_WORKERS,
+    ) -> Dict[str, Union[Gene, APIError]]:
+        """Fetch many genes, keyed by locus tag.
+
+        The API has no multi-tag gene lookup (the advanced search matches a
+        single exact ``locus_tag``), so each tag is fetched with its own
+        ``get_gene`` call, ``max_workers`` at a time. Failures are collected
+        as ``APIError`` values instead of being raised, so one bad tag never
+        aborts the run.
+        """
+        tags = list(dict.fromkeys(tag.strip() for tag in locus_tags if tag.strip()))
+        if not tags:
+            return {}
+
+        self.ensure_pool_size(max_workers)
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            return dict(zip(tags, pool.map(self._get_gene_single, tags)))
 
     # ------------------------------------------------------------------
     # Experimental API Methods
@@ -214,102 +417,141 @@ class DataPortalClient:
         """Search drug MIC data. Supports format='json' (default) or format='tsv'."""
         if format == "tsv":
             return self._request_tsv_paginated(
-                "/api/drugs/mic/search", params=params, model=DrugMIC
+                "/api/drugs/mic/search", params=params, model=models.DrugMIC
             )
         response = self._call_api(
             self._api(
-                DrugsApi
+                "DrugsApi"
             ).dataportal_api_experimental_drug_endpoints_search_drug_mic,
             params=params,
         )
-        return self._to_paginated(response)
+        return self._to_paginated(response, self.config.keep_raw)
 
     def search_drug_metabolism(self, **params: Any) -> PaginatedResult[DrugMetabolism]:
         response = self._call_api(
             self._api(
-                DrugsApi
+                "DrugsApi"
             ).dataportal_api_experimental_drug_endpoints_search_drug_metabolism,
             params=params,
         )
-        return self._to_paginated(response)
+        return self._to_paginated(response, self.config.keep_raw)
 
     def get_strain_drug_mic(
         self, isolate_name: str, **params: Any
     ) -> PaginatedResult[DrugMIC]:
         response = self._call_api(
             self._api(
-                GenomesApi
+                "GenomesApi"
             ).dataportal_api_experimental_drug_endpoints_get_strain_drug_mic,
             params=params,
             isolate_name=isolate_name,
         )
-        return self._to_paginated(response)
+        return self._to_paginated(response, self.config.keep_raw)
 
     def get_strain_drug_metabolism(
         self, isolate_name: str, **params: Any
     ) -> PaginatedResult[DrugMetabolism]:
         response = self._call_api(
             self._api(
-                GenomesApi
+                "GenomesApi"
             ).dataportal_api_experimental_drug_endpoints_get_strain_drug_metabolism,
             params=params,
             isolate_name=isolate_name,
         )
-        return self._to_paginated(response)
+        return self._to_paginated(response, self.config.keep_raw)
 
-    def get_strain_drug_data(self, isolate_name: str) -> Dict[str, Any]:
-        response = self._call_api(
-            self._api(
-                GenomesApi
-            ).dataportal_api_experimental_drug_endpoints_get_strain_drug_data,
+    def iter_search_drug_mic(
+        self, *, max_workers: int | None = None, **params: Any
+    ) -> Iterator[DrugMIC]:
+        """Yield every drug MIC record matching a search, fetching pages lazily."""
+        return self._iter_items(self.search_drug_mic, params, max_workers=max_workers)
+
+    def iter_search_drug_metabolism(
+        self, *, max_workers: int | None = None, **params: Any
+    ) -> Iterator[DrugMetabolism]:
+        """Yield every drug metabolism record matching a search."""
+        return self._iter_items(
+            self.search_drug_metabolism, params, max_workers=max_workers
+        )
+
+    def iter_strain_drug_mic(
+        self, isolate_name: str, *, max_workers: int | None = None, **params: Any
+    ) -> Iterator[DrugMIC]:
+        """Yield every drug MIC record of a strain, fetching pages lazily."""
+        return self._iter_items(
+            self.get_strain_drug_mic,
+            params,
+            max_workers=max_workers,
             isolate_name=isolate_name,
         )
-        return response.model_dump()
+
+    def iter_strain_drug_metabolism(
+        self, isolate_name: str, *, max_workers: int | None = None, **params: Any
+    ) -> Iterator[DrugMetabolism]:
+        """Yield every drug metabolism record of a strain, fetching pages lazily."""
+        return self._iter_items(
+            self.get_strain_drug_metabolism,
+            params,
+            max_workers=max_workers,
+            isolate_name=isolate_name,
+        )
+
+    def get_strain_drug_data(self, isolate_name: str) -> Dict[str, Any]:
+        response = self._memoized(
+            ("get_strain_drug_data", isolate_name),
+            lambda: self._call_api(
+                self._api(
+                    "GenomesApi"
+                ).dataportal_api_experimental_drug_endpoints_get_strain_drug_data,
+                isolate_name=isolate_name,
+            ),
+        )
+        return self._as_dict(response)
 
     def search_proteomics(self, **params: Any) -> Dict[str, Any]:
         response = self._call_api(
             self._api(
-                ProteomicsApi
+                "ProteomicsApi"
             ).dataportal_api_experimental_proteomics_endpoints_search_proteomics,
             params=params,
         )
-        return response.model_dump()
+        return self._as_dict(response)
 
     def search_essentiality(self, **params: Any) -> Dict[str, Any]:
         response = self._call_api(
             self._api(
-                EssentialityApi
+                "EssentialityApi"
             ).dataportal_api_experimental_essentiality_endpoints_search_essentiality,
             params=params,
         )
-        return response.model_dump()
+        return self._as_dict(response)
 
     def search_fitness(self, **params: Any) -> Dict[str, Any]:
         response = self._call_api(
             self._api(
-                FitnessApi
+                "FitnessApi"
             ).dataportal_api_experimental_fitness_endpoints_search_fitness,
             params=params,
         )
-        return response.model_dump()
+        return self._as_dict(response)
 
     def search_mutant_growth(self, **params: Any) -> Dict[str, Any]:
         response = self._call_api(
             self._api(
-                MutantGrowthApi
+                "MutantGrowthApi"
             ).dataportal_api_experimental_mutant_growth_endpoints_search_mutant_growth,
             params=params,
         )
-        return response.model_dump()
+        return self._as_dict(response)
 
     def search_reactions(self, **params: Any) -> Dict[str, Any]:
         response = self._call_api(
             self._api(
-                ReactionsApi
+                "ReactionsApi"
             ).dataportal_api_experimental_reactions_endpoints_search_reactions,
             params=params,
         )
-        return response.model_dump()
+        return self._as_dict(response)
 
     # ------------------------------------------------------------------
     # Interactions API Methods
@@ -317,53 +559,401 @@ class DataPortalClient:
     def search_ttp(self, **params: Any) -> Dict[str, Any]:
         response = self._call_api(
             self._api(
-                PooledTTPInteractionsApi
+                "PooledTTPInteractionsApi"
             ).dataportal_api_interactions_ttp_endpoints_search_interactions,
             params=params,
         )
-        return response.model_dump()
+        return self._as_dict(response)
 
     def get_ttp_gene_interactions(
         self, locus_tag: str, **params: Any
     ) -> Dict[str, Any]:
-        response = self._call_api(
-            self._api(
-                PooledTTPInteractionsApi
-            ).dataportal_api_interactions_ttp_endpoints_get_gene_interactions,
-            params=params,
-            locus_tag=locus_tag,
+        response = self._memoized(
+            ("get_ttp_gene_interactions", locus_tag, _freeze(params)),
+            lambda: self._call_api(
+                self._api(
+                    "PooledTTPInteractionsApi"
+                ).dataportal_api_interactions_ttp_endpoints_get_gene_interactions,
+                params=params,
+                locus_tag=locus_tag,
+            ),
         )
-        return response.model_dump()
+        return self._as_dict(response)
 
     def get_ttp_compound_interactions(
         self, compound: str, **params: Any
     ) -> Dict[str, Any]:
         response = self._call_api(
             self._api(
-                PooledTTPInteractionsApi
+                "PooledTTPInteractionsApi"
             ).dataportal_api_interactions_ttp_endpoints_get_compound_interactions,
             params=params,
             compound=compound,
         )
-        return response.model_dump()
+        return self._as_dict(response)
+
+    def ttp_matrix(
+        self,
+        *,
+        locus_tags: Optional[Iterable[str]] = None,
+        compounds: Optional[Iterable[str]] = None,
+        max_workers: int = DEFAULT_GENE_WORKERS,
+        **params: Any,
+    ) -> "TTPMatrix":
+        """Collect TTP interactions into a sparse gene x compound ``TTPMatrix``.
+
+        Pass ``locus_tags`` to query ``get_ttp_gene_interactions`` per gene or
+        ``compounds`` to query ``get_ttp_compound_interactions`` per compound;
+        ``params`` (e.g. ``hit_calling``, ``min_ttp_score``) apply to every
+        call. Calls run concurrently over ``max_workers`` threads. As with
+        :meth:`get_genes`, a failed lookup does not abort the run: its label
+        keeps an empty row or column and its ``APIError`` is recorded in
+        ``matrix.errors``.
+        """
+        from .ttp_matrix import COL_KEY, ROW_KEY, TTPMatrix, interaction_rows
+
+        if (locus_tags is None) == (compounds is None):
+            raise ValueError("Pass exactly one of locus_tags or compounds")
+        if locus_tags is not None:
+            labels, key = locus_tags, ROW_KEY
+            fetch = functools.partial(self.get_ttp_gene_interactions, **params)
+        else:
+            labels, key = compounds, COL_KEY
+            fetch = functools.partial(self.get_ttp_compound_interactions, **params)
+        labels = list(dict.fromkeys(str(label) for label in labels))
+
+        def collect(label: str) -> Union[List[Dict[str, Any]], APIError]:
+            try:
+                rows = interaction_rows(fetch(label))
+            except APIError as exc:
+                return exc
+            # Rows of a per-gene (per-compound) query may omit the queried key.
+            return [{key: label, **row} for row in rows]
+
+        interactions: List[Dict[str, Any]] = []
+        errors: Dict[str, APIError] = {}
+        self.ensure_pool_size(max_workers)
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            for label, outcome in zip(labels, pool.map(collect, labels)):
+                if isinstance(outcome, APIError):
+                    errors[label] = outcome
+                else:
+                    interactions.extend(outcome)
+        axis = {"row_ids": labels} if key == ROW_KEY else {"col_ids": labels}
+        matrix = TTPMatrix.from_interactions(interactions, **axis)
+        matrix.errors = errors
+        return matrix
 
     def search_ppi(self, **params: Any) -> Dict[str, Any]:
         response = self._call_api(
             self._api(
-                ProteinProteinInteractionsApi
+                "ProteinProteinInteractionsApi"
             ).dataportal_api_interactions_ppi_endpoints_search_ppi_interactions,
             params=params,
         )
-        return response.model_dump()
+        return self._as_dict(response)
+
+    def search_ppi_page(self, **params: Any) -> PaginatedResult[PPIInteraction]:
+        """Fetch one page of PPI interactions as a ``PaginatedResult``."""
+        response = self._call_api(
+            self._api(
+                "ProteinProteinInteractionsApi"
+            ).dataportal_api_interactions_ppi_endpoints_search_ppi_interactions,
+            params=params,
+        )
+        return self._to_paginated(response, self.config.keep_raw)
+
+    def iter_ppi(
+        self, *, max_workers: int | None = None, **params: Any
+    ) -> Iterator[PPIInteraction]:
+        """Yield every PPI interaction matching a search, fetching pages lazily."""
+        return self._iter_items(self.search_ppi_page, params, max_workers=max_workers)
 
     def get_ppi_neighbors(self, **params: Any) -> Dict[str, Any]:
         response = self._call_api(
             self._api(
-                ProteinProteinInteractionsApi
+                "ProteinProteinInteractionsApi"
             ).dataportal_api_interactions_ppi_endpoints_get_all_protein_neighbors,
             params=params,
         )
-        return response.model_dump()
+        return self._as_dict(response)
+
+    def ppi_graph(
+        self,
+        score_type: str,
+        *,
+        score_threshold: float | None = None,
+        species_acronym: str | None = None,
+        cache_path: Union[str, Path, None] = None,
+    ) -> "PPIGraph":
+        """Load the PPI network for ``score_type`` into a local ``PPIGraph``.
+
+        The network is fetched once from ``/api/ppi/network/{score_type}``;
+        neighbourhood, filtering and component queries then run in memory.
+        With ``cache_path`` the graph is read from that file when it was saved
+        for the same ``score_type``, ``score_threshold`` and
+        ``species_acronym``; otherwise it is downloaded and the file is
+        (over)written.
+        """
+        from .graph import PPIGraph
+
+        query = {
+            "score_type": score_type,
+            "score_threshold": score_threshold,
+            "species_acronym": species_acronym,
+        }
+        if cache_path is not None and Path(cache_path).exists():
+            cached = PPIGraph.load(cache_path)
+            if cached.query == query:
+                return cached
+        payload = request_json(
+            self._http,
+            self.config,
+            f"/api/ppi/network/{score_type}",
+            params=normalize_params(
+                {
+                    "score_threshold": score_threshold,
+                    "species_acronym": species_acronym,
+                }
+            ),
+        )
+        graph = PPIGraph.from_network(payload, score_key=score_type)
+        graph.query = query
+        if cache_path is not None:
+            graph.save(cache_path)
+        return graph
+
+    def ppi_network_properties(
+        self,
+        score_type: str,
+        *,
+        score_threshold: float | None = None,
+        species_acronym: str | None = None,
+        source: str = "server",
+        cache_path: Union[str, Path, None] = None,
+        timeout: float | None = None,
+    ) -> Dict[str, Any]:
+        """Summary metrics of the PPI network for ``score_type``.
+
+        ``source`` picks where they are computed: ``"server"`` calls
+        ``/api/ppi/network-properties``, ``"local"`` computes them from the
+        network download with ``PPIGraph.properties`` (reusing ``cache_path``
+        like :meth:`ppi_graph`), and ``"auto"`` asks the server first and
+        falls back to the local computation when the request fails, takes
+        longer than ``timeout`` seconds or returns no ``data`` (the reason is
+        kept in ``message``).
+        The returned ``data`` dict records the path taken under ``"source"``.
+        """
+        if source not in ("server", "local", "auto"):
+            raise ValueError("source must be 'server', 'local' or 'auto'")
+        message = None
+        if source != "local":
+            kwargs: Dict[str, Any] = {"score_type": score_type}
+            if timeout is not None:
+                kwargs["_request_timeout"] = timeout
+            try:
+                response = self._call_api(
+                    self._api(
+                        "ProteinProteinInteractionsApi"
+                    ).dataportal_api_interactions_ppi_endpoints_get_ppi_network_properties,
+                    params={
+                        "score_threshold": score_threshold,
+                        "species_acronym": species_acronym,
+                    },
+                    **kwargs,
+                )
+            except (APIError, ValueError) as exc:
+                # ValueError covers a body that fails response validation.
+                if source == "server":
+                    raise
+                message = f"Server request failed ({exc}); computed locally"
+            else:
+                payload = self._as_dict(response) if response is not None else {}
+                data = payload.get("data") or {}
+                if data or source == "server":
+                    payload["data"] = {**data, "source": "server"}
+                    return payload
+                message = "Server returned no network properties; computed locally"
+        graph = self.ppi_graph(
+            score_type,
+            score_threshold=score_threshold,
+            species_acronym=species_acronym,
+            cache_path=cache_path,
+        )
+        return {
+            "status": "success",
+            "message": message,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "data": {**graph.properties(), "source": "local"},
+        }
+
+    def ppi_score_table(
+        self,
+        *,
+        all_pages: bool = False,
+        max_workers: int | None = None,
+        **params: Any,
+    ) -> "PPIScoreTable":
+        """PPI interactions as a ``PPIScoreTable`` of NumPy score columns.
+
+        Rows are read as plain JSON (no per-row models) and packed into
+        columns as pages arrive; ``all_pages`` follows pagination, fetching
+        over ``max_workers`` threads.
+        """
+        from .ppi_scores import PPIScoreTable
+
+        fetch = functools.partial(self._raw_page, "/api/ppi/interactions")
+        if all_pages:
+            pages = self._iter_pages(fetch, params, max_workers=max_workers)
+        else:
+            pages = [fetch(**params)]
+        return PPIScoreTable.from_rows(row for page in pages for row in page.items)
+
+    def dump_ppi(
+        self,
+        species_acronym: str,
+        score_type: str | None = None,
+        score_threshold: float | None = None,
+        *,
+        out: Union[str, Path],
+        per_page: int | None = None,
+        max_workers: int | None = 4,
+        resume: bool = True,
+    ) -> "PPIDumpSummary":
+        """Dump a species' PPI interactions to an edge list and node table.
+
+        Pages of ``/api/ppi/interactions`` are fetched over ``max_workers``
+        threads and written, deduplicated on ``pair_id``, as ``edges.tsv``
+        and ``nodes.tsv`` in the ``out`` directory. A checkpoint is kept
+        after every page so an interrupted dump resumes where it stopped
+        (``resume=False`` starts over). See :mod:`mett_client.ppi_dump`.
+        """
+        from .ppi_dump import DEFAULT_DUMP_PAGE_SIZE, dump_ppi
+
+        fetch = functools.partial(self._raw_page, "/api/ppi/interactions")
+        return dump_ppi(
+            lambda params: self._iter_pages(fetch, params, max_workers=max_workers),
+            species_acronym,
+            score_type,
+            score_threshold,
+            out=out,
+            per_page=per_page or DEFAULT_DUMP_PAGE_SIZE,
+            resume=resume,
+        )
+
+    # ------------------------------------------------------------------
+    # DataFrames
+    # ------------------------------------------------------------------
+    def genomes_frame(
+        self,
+        *,
+        backend: str = "pandas",
+        all_pages: bool = False,
+        max_workers: int | None = None,
+        **params: Any,
+    ) -> Any:
+        """Genomes as a pandas (or ``backend="polars"``) DataFrame."""
+        return self._frame(
+            "/api/genomes/", "Genome", params, backend, all_pages, max_workers
+        )
+
+    def genome_genes_frame(
+        self,
+        isolate_name: str,
+        *,
+        backend: str = "pandas",
+        all_pages: bool = False,
+        max_workers: int | None = None,
+        **params: Any,
+    ) -> Any:
+        """Genes of a genome as a pandas (or polars) DataFrame."""
+        return self._frame(
+            f"/api/genomes/{isolate_name}/genes",
+            "Gene",
+            params,
+            backend,
+            all_pages,
+            max_workers,
+        )
+
+    def search_genes_frame(
+        self,
+        *,
+        backend: str = "pandas",
+        all_pages: bool = False,
+        max_workers: int | None = None,
+        **params: Any,
+    ) -> Any:
+        """Gene search results as a pandas (or polars) DataFrame."""
+        return self._frame(
+            "/api/genes/search", "Gene", params, backend, all_pages, max_workers
+        )
+
+    def ppi_frame(
+        self,
+        *,
+        backend: str = "pandas",
+        all_pages: bool = False,
+        max_workers: int | None = None,
+        **params: Any,
+    ) -> Any:
+        """PPI interactions as a pandas (or polars) DataFrame.
+
+        Score columns are ``float64`` and evidence flags boolean.
+        """
+        return self._frame(
+            "/api/ppi/interactions",
+            "PPIInteraction",
+            params,
+            backend,
+            all_pages,
+            max_workers,
+        )
+
+    # ------------------------------------------------------------------
+    # Streaming
+    # ------------------------------------------------------------------
+    def iter_tsv(
+        self,
+        endpoint: str,
+        *,
+        model: Type[T] | None = None,
+        **params: Any,
+    ) -> Iterator[Union[Dict[str, Any], T]]:
+        """Stream a TSV endpoint row by row.
+
+        Rows are parsed as the body arrives and yielded as dicts, or as
+        ``model`` instances when a model class is given. Nothing else is
+        retained, so memory stays flat for exports such as
+        ``/api/genomes/download/tsv``.
+        """
+        rows = stream_tsv_rows(self._http, self.config, endpoint, params=params)
+        if model is None:
+            yield from rows
+            return
+        for row in rows:
+            try:
+                yield model(**row)
+            except ValueError as exc:
+                raise APIError(f"Failed to parse TSV response: {exc}") from exc
+
+    def to_arrow(
+        self,
+        rows: Iterable[Any],
+        model: Type[Any] | None = None,
+        *,
+        batch_size: int | None = None,
+    ) -> "pa.Table":
+        """Collect rows, e.g. from an ``iter_*`` method, into a typed Arrow table.
+
+        Column types come from ``model`` (or the first row's SDK model), so
+        ``client.to_arrow(client.iter_genome_genes("BU_ATCC8492"))`` yields
+        integer positions and list-typed annotations. Requires ``mett[arrow]``;
+        see :mod:`mett_client.columnar` for incremental Parquet/Arrow writers.
+        """
+        from .columnar import DEFAULT_BATCH_ROWS, to_arrow
+
+        return to_arrow(rows, model, batch_size=batch_size or DEFAULT_BATCH_ROWS)
 
     # ------------------------------------------------------------------
     # Raw API Access
@@ -378,11 +968,13 @@ class DataPortalClient:
         data: Optional[Union[str, bytes]] = None,
         json_body: Optional[Any] = None,
         format: Optional[str] = None,
+        stream: bool = False,
     ) -> requests.Response:
         """Low-level helper for issuing arbitrary API requests.
 
         Used by the CLI `mett api request` command to provide coverage for endpoints
-        that do not have first-class helpers yet.
+        that do not have first-class helpers yet. With ``stream=True`` the body is
+        left unread so callers can consume it with ``iter_content``.
         """
 
         if json_body is not None and data is not None:
@@ -410,6 +1002,7 @@ class DataPortalClient:
                 headers=request_headers or None,
                 timeout=self.config.timeout,
                 verify=self.config.verify_ssl,
+                stream=stream,
             )
         except requests.RequestException as exc:
             raise APIError(str(exc)) from exc
@@ -419,28 +1012,157 @@ class DataPortalClient:
         except requests.HTTPError as exc:
             message = response.text or str(exc)
             status = response.status_code if response is not None else None
+            response.close()
             raise APIError(message, status_code=status) from exc
 
         return response
 
+    def download(
+        self,
+        path: str,
+        destination: Union[str, Path],
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        format: Optional[str] = None,
+        resume: bool = True,
+        compress: bool = False,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    ) -> Path:
+        """Stream an endpoint's body to ``destination`` in fixed-size chunks.
+
+        Data is written to ``<destination>.part`` and atomically renamed once
+        complete, so readers never see a truncated file. With ``resume=True`` an
+        existing ``.part`` file is continued with an HTTP ``Range`` request (a
+        server that ignores the range simply restarts the download). With
+        ``compress=True`` the finished file is gzip-compressed. ``progress`` is
+        called with ``(bytes_done, total_bytes_or_None)`` after every chunk.
+        """
+        destination = Path(destination)
+        part = destination.with_name(destination.name + ".part")
+        offset = part.stat().st_size if resume and part.exists() else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else None
+
+        try:
+            response = self.raw_request(
+                "GET",
+                path,
+                params=params,
+                headers=headers,
+                format=format,
+                stream=True,
+            )
+        except APIError as exc:
+            # 416: the .part file already holds the whole body
+            if not (offset and exc.status_code == 416):
+                raise
+            response = None
+
+        if response is not None:
+            with response:
+                if response.status_code != 206:
+                    offset = 0
+                length = response.headers.get("Content-Length")
+                total = offset + int(length) if length and length.isdigit() else None
+                done = offset
+                if progress is not None:
+                    progress(done, total)
+                try:
+                    with part.open("ab" if offset else "wb") as fh:
+                        for chunk in response.iter_content(chunk_size=chunk_size):
+                            fh.write(chunk)
+                            done += len(chunk)
+                            if progress is not None:
+                                progress(done, total)
+                except requests.RequestException as exc:
+                    raise APIError(f"Download interrupted: {exc}") from exc
+
+        if compress:
+            packed = destination.with_name(destination.name + ".gz.part")
+            with part.open("rb") as src, gzip.open(packed, "wb") as dst:
+                shutil.copyfileobj(src, dst, chunk_size)
+            os.replace(packed, destination)
+            part.unlink()
+        else:
+            os.replace(part, destination)
+        return destination
+
+    def ensure_pool_size(self, size: int) -> None:
+        """Grow the connection pool so ``size`` worker threads never wait on it.
+
+        The mounted adapters are resized in place, so in-flight requests and
+        idle connections are kept and ``self.config`` is left untouched.
+        """
+        for adapter in set(self._http.adapters.values()):
+            if isinstance(adapter, RateLimitedAdapter):
+                adapter.grow_pool(size)
+
+    # ------------------------------------------------------------------
+    # Memoization
+    # ------------------------------------------------------------------
+    def cache_clear(self) -> None:
+        """Drop every memoized lookup and reset the hit/miss counters."""
+        self._memo.clear()
+
+    def cache_info(self) -> CacheInfo:
+        """Return ``(hits, misses, maxsize, currsize)`` for memoized lookups."""
+        return self._memo.info()
+
+    def _memoized(self, key: Tuple[Any, ...], loader: Callable[[], T]) -> T:
+        if self._memo.maxsize <= 0:
+            return loader()
+        return self._memo.get_or_load(key, loader)
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
-    def _api(self, api_cls: Type[ApiType]) -> ApiType:
-        if api_cls not in self._apis:
-            self._apis[api_cls] = api_cls(self._sdk_client)
-        return self._apis[api_cls]
+    @property
+    def _sdk_client(self) -> SDKApiClient:
+        if self._sdk_client_instance is None:
+            with self._sdk_lock:
+                if self._sdk_client_instance is None:
+                    from mett_dataportal_sdk.api_client import ApiClient
+
+                    sdk_client = ApiClient(
+                        configuration=self._build_sdk_configuration()
+                    )
+                    # share the session's connection pool instead of a second
+                    # urllib3 one
+                    sdk_client.rest_client = SessionRESTClient(self._http, self.config)
+                    # align UA with the rest of the project
+                    sdk_client.user_agent = self.config.user_agent
+                    self._sdk_client_instance = sdk_client
+        return self._sdk_client_instance
+
+    def _api(self, name: str) -> Any:
+        """Return the (cached) generated API class ``name``, importing it lazily."""
+        api = self._apis.get(name)
+        if api is None:
+            api_cls = getattr(importlib.import_module("mett_dataportal_sdk.api"), name)
+            api = self._apis.setdefault(name, api_cls(self._sdk_client))
+        return api
 
     def _build_sdk_configuration(self) -> SDKConfiguration:
-        configuration = SDKConfiguration(host=self.config.base_url.rstrip("/"))
+        from mett_dataportal_sdk.configuration import Configuration
+
+        configuration = Configuration(host=self.config.base_url.rstrip("/"))
         configuration.verify_ssl = self.config.verify_ssl
+        configuration.connection_pool_maxsize = self.config.pool_maxsize
         token = self.config.jwt_token
         if token:
             configuration.access_token = token
         return configuration
 
     def _build_http_session(self) -> requests.Session:
-        session = requests.Session()
+        session: requests.Session
+        if self.config.cache:
+            session = CachedSession(
+                ResponseCache.from_config(self.config),
+                refresh=self.config.cache_refresh,
+            )
+        else:
+            session = requests.Session()
+        configure_session(session, self.config, self.stats, self.rate_limiter)
         session.headers.update(
             {
                 "Accept": "application/json",
@@ -465,19 +1187,58 @@ class DataPortalClient:
     ) -> T:
         normalized_params = normalize_params(params or {})
         normalized_params.update(kwargs)
-        normalized_params["_request_timeout"] = self._request_timeout
+        normalized_params.setdefault("_request_timeout", self._request_timeout)
         return self._call(func, **normalized_params)
 
     def _call(self, func: Callable[..., T], **kwargs: Any) -> T:
+        if not self.config.validate:
+            raw_func = self._raw_variant(func)
+            if raw_func is not None:
+                return self._call_raw(raw_func, **kwargs)
         try:
             return func(**kwargs)
         except ApiException as exc:
-            if exc.status in {401, 403}:
-                raise AuthenticationError(
-                    exc.body or "Authentication failed", status_code=exc.status
-                ) from exc
-            message = exc.body or exc.reason or "API request failed"
-            raise APIError(message, status_code=exc.status) from exc
+            raise self._api_error(exc.status, exc.body, exc.reason) from exc
+
+    @staticmethod
+    def _raw_variant(func: Callable[..., Any]) -> Optional[Callable[..., Any]]:
+        """Return the SDK's ``*_without_preload_content`` twin of ``func``."""
+        owner = getattr(func, "__self__", None)
+        name = getattr(func, "__name__", "")
+        return getattr(owner, f"{name}_without_preload_content", None)
+
+    def _call_raw(self, func: Callable[..., Any], **kwargs: Any) -> Any:
+        """Call an SDK ``*_without_preload_content`` method and decode its JSON.
+
+        Used when ``config.validate`` is off: the body is returned as plain
+        dicts and lists, skipping pydantic validation of every item.
+        """
+        try:
+            response = func(**kwargs)
+        except ApiException as exc:
+            raise self._api_error(exc.status, exc.body, exc.reason) from exc
+        body = response.data
+        if response.status >= 400:
+            text = body.decode("utf-8", "replace") if body else None
+            raise self._api_error(response.status, text, response.reason)
+        if not body:
+            return None
+        try:
+            return json.loads(body)
+        except ValueError as exc:
+            raise APIError(
+                f"Invalid JSON response: {exc}", status_code=response.status
+            ) from exc
+
+    @staticmethod
+    def _api_error(
+        status: Optional[int], body: Optional[str], reason: Optional[str]
+    ) -> APIError:
+        if status in {401, 403}:
+            return AuthenticationError(
+                body or "Authentication failed", status_code=status
+            )
+        return APIError(body or reason or "API request failed", status_code=status)
 
     def _request_tsv_paginated(
         self,
@@ -491,32 +1252,14 @@ class DataPortalClient:
         Note: TSV responses may not include pagination metadata.
         If pagination info is missing, pagination will be None.
         """
-        tsv_params = (params or {}).copy()
-        tsv_params["format"] = "tsv"
-
-        # Make direct HTTP request for TSV
-        url = f"{self.config.base_url.rstrip('/')}{endpoint}"
-        headers = {"Accept": "text/tab-separated-values"}
-        token = self.config.jwt_token
-        if token:
-            headers["Authorization"] = f"Bearer {token}"
-
         try:
-            resp = self._http.get(
-                url,
-                params=tsv_params,
-                headers=headers,
-                timeout=self.config.timeout,
-                verify=self.config.verify_ssl,
+            rows = list(
+                stream_tsv_rows(self._http, self.config, endpoint, params=params)
             )
-            resp.raise_for_status()
-
-            # Parse TSV
-            rows = parse_tsv_response(resp.text)
 
             # Convert to model instances if model provided
             items: List[T]
-            if model is None:
+            if model is None or not self.config.validate:
                 items = rows  # type: ignore[assignment]
             else:
                 items = [model(**row) for row in rows]
@@ -524,32 +1267,179 @@ class DataPortalClient:
             # TSV responses typically don't include pagination metadata
             # Check response headers or assume no pagination info
             pagination = None
-            raw = {
-                "data": [
-                    dict(item) if hasattr(item, "model_dump") else item
-                    for item in items
-                ]
-            }
 
-            return PaginatedResult(items=items, pagination=pagination, raw=raw)
-        except requests.exceptions.HTTPError as exc:
-            if exc.response is not None and exc.response.status_code in {401, 403}:
-                raise AuthenticationError(
-                    "Authentication failed", status_code=exc.response.status_code
-                ) from exc
-            status = exc.response.status_code if exc.response is not None else None
-            raise APIError(f"Request failed: {exc}", status_code=status) from exc
-        except requests.exceptions.RequestException as exc:
-            raise APIError(f"Request failed: {exc}") from exc
+            def raw() -> Dict[str, Any]:
+                return {
+                    "data": [
+                        dict(item) if hasattr(item, "model_dump") else item
+                        for item in items
+                    ]
+                }
+
+            return PaginatedResult(
+                items=items,
+                pagination=pagination,
+                raw_factory=raw,
+                keep_raw=self.config.keep_raw,
+            )
         except (ValueError, csv.Error) as exc:
             raise APIError(f"Failed to parse TSV response: {exc}") from exc
 
+    def _iter_pages(
+        self,
+        fetch: Callable[..., PaginatedResult[T]],
+        params: Dict[str, Any],
+        *,
+        max_workers: int | None = None,
+        **fixed: Any,
+    ) -> Iterator[PaginatedResult[T]]:
+        """Follow ``Pagination`` metadata and yield one page at a time.
+
+        Iteration starts at ``params['page']`` (default 1) and stops once the
+        server reports no further pages. With ``max_workers > 1`` the pages
+        after the first are prefetched over a bounded thread pool, keeping at
+        most ``max_workers`` requests in flight, and still yielded in order.
+        """
+        page_params = dict(params)
+        page = int(page_params.pop("page", None) or 1)
+
+        def _fetch(number: int) -> PaginatedResult[T]:
+            return fetch(**fixed, page=number, **page_params)
+
+        result = _fetch(page)
+        yield result
+        pagination = result.pagination
+        if pagination is None or not pagination.has_next:
+            return
+
+        if not max_workers or max_workers <= 1:
+            while pagination is not None and pagination.has_next:
+                page += 1
+                result = _fetch(page)
+                yield result
+                pagination = result.pagination
+            return
+
+        last_page = pagination.num_pages
+        next_page = page + 1
+        pending: Deque[Future[PaginatedResult[T]]] = deque()
+        pool = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            while next_page <= last_page or pending:
+                while next_page <= last_page and len(pending) < max_workers:
+                    pending.append(pool.submit(_fetch, next_page))
+                    next_page += 1
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=True)
+
+    def _raw_page(
+        self, endpoint: str, **params: Any
+    ) -> PaginatedResult[Dict[str, Any]]:
+        """Fetch one page as plain JSON rows, bypassing SDK model validation."""
+        payload = request_json(
+            self._http, self.config, endpoint, params=normalize_params(params)
+        )
+        return PaginatedResult(
+            items=list(payload.get("data") or []),
+            pagination=self._pagination(payload.get("pagination")),
+            raw=payload,
+        )
+
+    def _frame(
+        self,
+        endpoint: str,
+        model_name: str,
+        params: Dict[str, Any],
+        backend: str,
+        all_pages: bool,
+        max_workers: int | None,
+    ) -> Any:
+        """Build a DataFrame of one page (or every page) of ``endpoint``.
+
+        Rows stay as decoded JSON and are turned into typed columns by
+        :mod:`mett_client.frames`; with ``all_pages`` the pages are fetched
+        over ``max_workers`` threads and concatenated in order.
+        """
+        from .frames import to_frame
+
+        fetch = functools.partial(self._raw_page, endpoint)
+        if all_pages:
+            pages = self._iter_pages(fetch, params, max_workers=max_workers)
+        else:
+            pages = [fetch(**params)]
+        rows = [row for page in pages for row in page.items]
+        return to_frame(rows, getattr(models, model_name), backend=backend)
+
+    def _iter_items(
+        self,
+        fetch: Callable[..., PaginatedResult[T]],
+        params: Dict[str, Any],
+        *,
+        max_workers: int | None = None,
+        **fixed: Any,
+    ) -> Iterator[T]:
+        for result in self._iter_pages(fetch, params, max_workers=max_workers, **fixed):
+            yield from result.items
+
+    def _get_gene_single(self, locus_tag: str) -> Union[Gene, APIError]:
+        """Look up one gene, returning any failure as an ``APIError`` value."""
+        try:
+            return self._load_gene(locus_tag)
+        except APIError as exc:
+            return exc
+        except Exception as exc:
+            # e.g. a response that fails validation; one bad tag must not
+            # discard the rest of a get_genes batch.
+            error = APIError(f"Gene {locus_tag} could not be loaded: {exc}")
+            error.__cause__ = exc
+            return error
+
+    def _load_gene(self, locus_tag: str) -> Union[Gene, APIError]:
+        response = self.get_gene(locus_tag)
+        if isinstance(response, dict):
+            # Raw mode: keep the decoded JSON rather than validating it.
+            data = response.get("data", response)
+            if data is None:
+                return APIError(f"Gene {locus_tag} not found", status_code=404)
+            return data
+        data = getattr(response, "data", response)
+        if isinstance(data, dict):
+            return models.Gene.from_dict(data)
+        if data is None:
+            return APIError(f"Gene {locus_tag} not found", status_code=404)
+        return data
+
     @staticmethod
-    def _to_paginated(schema: Any) -> PaginatedResult[Any]:
+    def _as_dict(response: Any) -> Dict[str, Any]:
+        # Raw mode (``validate=False``) already hands back decoded JSON.
+        if isinstance(response, dict):
+            return response
+        return response.model_dump()
+
+    @staticmethod
+    def _pagination(value: Any) -> Optional[Pagination]:
+        """Validate a raw pagination block; page iteration reads every field."""
+        return models.Pagination.from_dict(value) if value else None
+
+    @staticmethod
+    def _to_paginated(schema: Any, keep_raw: bool = True) -> PaginatedResult[Any]:
+        if isinstance(schema, dict):
+            return PaginatedResult(
+                items=list(schema.get("data") or []),
+                pagination=DataPortalClient._pagination(schema.get("pagination")),
+                raw=schema,
+            )
         data = list(schema.data or [])
         pagination = schema.pagination if hasattr(schema, "pagination") else None
-        raw = schema.model_dump()
-        return PaginatedResult(items=data, pagination=pagination, raw=raw)
+        return PaginatedResult(
+            items=data,
+            pagination=pagination,
+            raw_factory=schema.model_dump,
+            keep_raw=keep_raw,
+        )
 
 
 __all__ = ["DataPortalClient", "PaginatedResult"]
@@ -0,0 +1,225 @@
+"""Columnar (Apache Arrow / Parquet) export of API rows.
+
+Arrow schemas are derived from the generated SDK pydantic models, so columns
+keep their types (integers, floats, booleans, lists, nested structs) instead of
+being stringified. Free-form values (``Dict[str, Any]``, ``Any``) are stored as
+JSON strings. Rows are converted in batches of ``batch_size`` as they are
+consumed, so exports from ``iter_*`` methods stream page by page and each
+batch becomes one Parquet row group.
+
+Requires the optional ``pyarrow`` dependency (``pip install mett[arrow]``).
+"""
+
+from __future__ import annotations
+
+import json
+from itertools import chain, islice
+from pathlib import Path
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    Union,
+)
+
+from pydantic import BaseModel
+
+from .utils import classify_annotation
+
+try:
+    import pyarrow as pa  # type: ignore[import]
+except ModuleNotFoundError:  # pragma: no cover
+    pa = None  # type: ignore[assignment]
+
+DEFAULT_BATCH_ROWS = 10_000
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError(
+            "Arrow/Parquet export requires pyarrow; "
+            "install it with `pip install mett[arrow]`"
+        )
+
+
+def arrow_type(annotation: Any) -> "pa.DataType":
+    """Map a pydantic field annotation to an Arrow type."""
+    _require_pyarrow()
+    kind, inner = classify_annotation(annotation)
+    if kind == "list":
+        return pa.list_(arrow_type(inner) if inner is not None else pa.string())
+    if kind == "model":
+        return pa.struct(_fields(inner))
+    scalars = {
+        "bool": pa.bool_,
+        "int": pa.int64,
+        "float": pa.float64,
+        "str": pa.string,
+        "datetime": lambda: pa.timestamp("us"),
+        "date": pa.date32,
+    }
+    return scalars.get(kind, pa.string)()
+
+
+def _fields(model: Type[BaseModel]) -> List["pa.Field"]:
+    return [
+        pa.field(field.alias or name, arrow_type(field.annotation))
+        for name, field in model.model_fields.items()
+    ]
+
+
+def schema_for(model: Type[BaseModel]) -> "pa.Schema":
+    """Return the Arrow schema for rows of an SDK model."""
+    _require_pyarrow()
+    return pa.schema(_fields(model))
+
+
+def _encode(value: Any, dtype: "pa.DataType") -> Any:
+    """Coerce ``value`` to what ``dtype`` expects (JSON for free-form strings)."""
+    if value is None:
+        return None
+    if pa.types.is_string(dtype):
+        return value if isinstance(value, str) else json.dumps(value, default=str)
+    if pa.types.is_list(dtype):
+        return [_encode(item, dtype.value_type) for item in value]
+    if pa.types.is_struct(dtype):
+        if isinstance(value, BaseModel):
+            value = value.model_dump(by_alias=True)
+        return {
+            field.name: _encode(value.get(field.name), field.type) for field in dtype
+        }
+    return value
+
+
+def _needs_encoding(dtype: "pa.DataType") -> bool:
+    return (
+        pa.types.is_string(dtype)
+        or pa.types.is_list(dtype)
+        or pa.types.is_struct(dtype)
+    )
+
+
+def _to_dict(row: Any) -> Dict[str, Any]:
+    if isinstance(row, BaseModel):
+        return row.model_dump(by_alias=True)
+    return dict(row)
+
+
+def iter_record_batches(
+    rows: Iterable[Any],
+    model: Optional[Type[BaseModel]] = None,
+    *,
+    schema: Optional["pa.Schema"] = None,
+    batch_size: int = DEFAULT_BATCH_ROWS,
+) -> Iterator["pa.RecordBatch"]:
+    """Convert rows (models or dicts) into record batches of ``batch_size`` rows.
+
+    The schema is ``schema``, else derived from ``model``, else from the type
+    of the first row when it is a pydantic model, else inferred by Arrow from
+    the first batch and kept for the rest.
+    """
+    _require_pyarrow()
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return
+    if schema is None:
+        if model is None and isinstance(first, BaseModel):
+            model = type(first)
+        if model is not None:
+            schema = schema_for(model)
+    rows = chain([first], rows)
+
+    while True:
+        chunk = [_to_dict(row) for row in islice(rows, batch_size)]
+        if not chunk:
+            return
+        if schema is None:
+            batch = pa.RecordBatch.from_pylist(chunk)
+            schema = batch.schema
+            yield batch
+            continue
+        columns = []
+        for field in schema:
+            values = [row.get(field.name) for row in chunk]
+            if _needs_encoding(field.type):
+                values = [_encode(value, field.type) for value in values]
+            columns.append(pa.array(values, type=field.type))
+        yield pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+def to_arrow(
+    rows: Iterable[Any],
+    model: Optional[Type[BaseModel]] = None,
+    *,
+    batch_size: int = DEFAULT_BATCH_ROWS,
+) -> "pa.Table":
+    """Collect rows into a typed Arrow table."""
+    _require_pyarrow()
+    batches = list(iter_record_batches(rows, model, batch_size=batch_size))
+    if not batches:
+        return schema_for(model).empty_table() if model else pa.table({})
+    return pa.Table.from_batches(batches)
+
+
+def write_columnar(
+    rows: Iterable[Any],
+    sink: Union[str, Path, BinaryIO],
+    format: str = "parquet",
+    *,
+    model: Optional[Type[BaseModel]] = None,
+    batch_size: int = DEFAULT_BATCH_ROWS,
+    compression: str = "zstd",
+) -> int:
+    """Write rows to ``sink`` as Parquet or Arrow IPC, one batch at a time.
+
+    Each batch becomes a Parquet row group. Arrow output uses the IPC file
+    format for paths and the IPC stream format for file objects (which may
+    not be seekable, e.g. stdout). Returns the number of rows written.
+    """
+    _require_pyarrow()
+    if format not in ("parquet", "arrow"):
+        raise ValueError(f"Unsupported columnar format: {format!r}")
+
+    batches = iter_record_batches(rows, model, batch_size=batch_size)
+    first = next(batches, None)
+    if first is not None:
+        schema = first.schema
+        batches = chain([first], batches)
+    elif model is not None:
+        schema = schema_for(model)
+    else:
+        return 0
+    if isinstance(sink, Path):
+        sink = str(sink)
+
+    if format == "parquet":
+        import pyarrow.parquet as pq  # type: ignore[import]
+
+        writer = pq.ParquetWriter(sink, schema, compression=compression)
+    elif isinstance(sink, str):
+        writer = pa.ipc.new_file(sink, schema)
+    else:
+        writer = pa.ipc.new_stream(sink, schema)
+
+    written = 0
+    with writer:
+        for batch in batches:
+            writer.write_batch(batch)
+            written += batch.num_rows
+    return written
+
+
+__all__ = [
+    "DEFAULT_BATCH_ROWS",
+    "arrow_type",
+    "iter_record_batches",
+    "schema_for",
+    "to_arrow",
+    "write_columnar",
+]
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 from .constants import DEFAULT_BASE_URL
 from .exceptions import ConfigurationError
@@ -19,6 +19,11 @@ except ModuleNotFoundError:  # pragma: no cover
 
 DEFAULT_TIMEOUT = 30
 CONFIG_PATH = Path.home() / ".mett" / "config.toml"
+CACHE_DIR = Path.home() / ".mett" / "cache"
+DEFAULT_CACHE_MAX_SIZE = 256 * 1024 * 1024
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_RETRY_STATUSES = (429, 502, 503, 504)
 
 
 @dataclass(slots=True)
@@ -30,6 +35,28 @@ class Config:
     timeout: int = DEFAULT_TIMEOUT
     verify_ssl: bool = True
     user_agent: str = field(default_factory=lambda: f"mett-client/{__version__}")
+    cache: bool = False
+    cache_dir: str = str(CACHE_DIR)
+    cache_max_size: int = DEFAULT_CACHE_MAX_SIZE
+    cache_ttl: int = 0
+    cache_ttls: Dict[str, int] = field(default_factory=dict)
+    cache_refresh: bool = False
+    memo_size: int = 0
+    memo_ttl: int = 0
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE
+    pool_block: bool = False
+    keep_alive: bool = True
+    retries: int = 3
+    retry_backoff: float = 0.5
+    retry_backoff_max: float = 30.0
+    retry_jitter: float = 0.5
+    retry_statuses: Tuple[int, ...] = DEFAULT_RETRY_STATUSES
+    retry_respect_retry_after: bool = True
+    rate_limit: float = 0.0
+    rate_limit_burst: int | None = None
+    validate: bool = True
+    keep_raw: bool = True
 
     @property
     def authorization_header(self) -> str | None:
@@ -61,6 +88,28 @@ def _coerce_bool(value: Any | None) -> bool | None:
     raise ConfigurationError(f"Cannot coerce value '{value}' to bool")
 
 
+def _coerce_int(value: Any, name: str) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError) as exc:
+        raise ConfigurationError(f"{name} must be an integer") from exc
+
+
+def _coerce_float(value: Any, name: str) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError) as exc:
+        raise ConfigurationError(f"{name} must be a number") from exc
+
+
+def _coerce_statuses(value: Any, name: str) -> Tuple[int, ...]:
+    if isinstance(value, str):
+        value = [part for part in value.replace(" ", "").split(",") if part]
+    if not isinstance(value, (list, tuple)):
+        raise ConfigurationError(f"{name} must be a list of status codes")
+    return tuple(_coerce_int(item, name) for item in value)
+
+
 def get_config(
     *, config_path: Path | None = None, env: Dict[str, str] | None = None
 ) -> Config:
@@ -91,7 +140,84 @@ def get_config(
         "user_agent", cfg.user_agent
     )
 
+    cache_val = _coerce_bool(env.get("METT_CACHE") or file_data.get("cache"))
+    if cache_val is not None:
+        cfg.cache = cache_val
+    cfg.cache_dir = env.get("METT_CACHE_DIR") or file_data.get(
+        "cache_dir", cfg.cache_dir
+    )
+    max_size_val = env.get("METT_CACHE_MAX_SIZE") or file_data.get("cache_max_size")
+    if max_size_val:
+        cfg.cache_max_size = _coerce_int(max_size_val, "METT_CACHE_MAX_SIZE")
+    ttl_val = env.get("METT_CACHE_TTL") or file_data.get("cache_ttl")
+    if ttl_val:
+        cfg.cache_ttl = _coerce_int(ttl_val, "METT_CACHE_TTL")
+    memo_size_val = env.get("METT_MEMO_SIZE") or file_data.get("memo_size")
+    if memo_size_val:
+        cfg.memo_size = _coerce_int(memo_size_val, "METT_MEMO_SIZE")
+    memo_ttl_val = env.get("METT_MEMO_TTL") or file_data.get("memo_ttl")
+    if memo_ttl_val:
+        cfg.memo_ttl = _coerce_int(memo_ttl_val, "METT_MEMO_TTL")
+
+    pool_conn_val = env.get("METT_POOL_CONNECTIONS") or file_data.get(
+        "pool_connections"
+    )
+    if pool_conn_val:
+        cfg.pool_connections = _coerce_int(pool_conn_val, "METT_POOL_CONNECTIONS")
+    pool_size_val = env.get("METT_POOL_MAXSIZE") or file_data.get("pool_maxsize")
+    if pool_size_val:
+        cfg.pool_maxsize = _coerce_int(pool_size_val, "METT_POOL_MAXSIZE")
+    pool_block = _coerce_bool(env.get("METT_POOL_BLOCK") or file_data.get("pool_block"))
+    if pool_block is not None:
+        cfg.pool_block = pool_block
+    keep_alive = _coerce_bool(env.get("METT_KEEP_ALIVE") or file_data.get("keep_alive"))
+    if keep_alive is not None:
+        cfg.keep_alive = keep_alive
+
+    retries_val = env.get("METT_RETRIES") or file_data.get("retries")
+    if retries_val is not None:
+        cfg.retries = _coerce_int(retries_val, "METT_RETRIES")
+    for attr, env_name in (
+        ("retry_backoff", "METT_RETRY_BACKOFF"),
+        ("retry_backoff_max", "METT_RETRY_BACKOFF_MAX"),
+        ("retry_jitter", "METT_RETRY_JITTER"),
+    ):
+        raw = env.get(env_name) or file_data.get(attr)
+        if raw is not None:
+            setattr(cfg, attr, _coerce_float(raw, env_name))
+    statuses_val = env.get("METT_RETRY_STATUSES") or file_data.get("retry_statuses")
+    if statuses_val is not None:
+        cfg.retry_statuses = _coerce_statuses(statuses_val, "METT_RETRY_STATUSES")
+    retry_after = _coerce_bool(
+        env.get("METT_RETRY_RESPECT_RETRY_AFTER")
+        or file_data.get("retry_respect_retry_after")
+    )
+    if retry_after is not None:
+        cfg.retry_respect_retry_after = retry_after
+
+    rate_val = env.get("METT_RATE_LIMIT") or file_data.get("rate_limit")
+    if rate_val is not None:
+        cfg.rate_limit = _coerce_float(rate_val, "METT_RATE_LIMIT")
+    burst_val = env.get("METT_RATE_LIMIT_BURST") or file_data.get("rate_limit_burst")
+    if burst_val is not None:
+        cfg.rate_limit_burst = _coerce_int(burst_val, "METT_RATE_LIMIT_BURST")
+
+    validate_val = _coerce_bool(env.get("METT_VALIDATE") or file_data.get("validate"))
+    if validate_val is not None:
+        cfg.validate = validate_val
+    keep_raw_val = _coerce_bool(env.get("METT_KEEP_RAW") or file_data.get("keep_raw"))
+    if keep_raw_val is not None:
+        cfg.keep_raw = keep_raw_val
+
+    ttls = file_data.get("cache_ttls") or {}
+    if not isinstance(ttls, dict):
+        raise ConfigurationError("cache_ttls must be a table of path = seconds")
+    cfg.cache_ttls = {
+        str(path): _coerce_int(seconds, f"cache_ttls.{path}")
+        for path, seconds in ttls.items()
+    }
+
     return cfg
 
 
-__all__ = ["Config", "get_config", "CONFIG_PATH"]
+__all__ = ["Config", "get_config", "CONFIG_PATH", "CACHE_DIR"]
@@ -0,0 +1,140 @@
+"""pandas and polars DataFrame adapters.
+
+Frames are built column by column from plain JSON rows (``dict``) rather than
+by dumping one pydantic model per row, and each column gets a dtype derived
+from the SDK model's field annotations: numbers become ``float64``, integers
+``int64`` (``Int64`` when values are missing), booleans ``bool`` (``boolean``
+when values are missing). Lists and nested objects are left as Python objects.
+
+pandas and polars are optional (``pip install mett[pandas]`` / ``mett[polars]``).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Optional, Type
+
+from pydantic import BaseModel
+
+from .utils import annotation_kind
+
+if TYPE_CHECKING:
+    import pandas as pd  # type: ignore[import]
+    import polars as pl  # type: ignore[import]
+
+
+def _import(backend: str) -> Any:
+    try:
+        if backend == "pandas":
+            import pandas
+
+            return pandas
+        import polars
+
+        return polars
+    except ModuleNotFoundError as exc:
+        raise ImportError(
+            f"DataFrame conversion requires {backend}; "
+            f"install it with `pip install mett[{backend}]`"
+        ) from exc
+
+
+def column_kinds(model: Type[BaseModel]) -> Dict[str, str]:
+    """Map each field (by alias) of ``model`` to its :func:`annotation_kind`."""
+    return {
+        field.alias or name: annotation_kind(field.annotation)
+        for name, field in model.model_fields.items()
+    }
+
+
+def _rows(rows: Iterable[Any]) -> List[Mapping[str, Any]]:
+    return [
+        row.model_dump(by_alias=True) if isinstance(row, BaseModel) else row
+        for row in rows
+    ]
+
+
+def _column_names(rows: List[Mapping[str, Any]], kinds: Dict[str, str]) -> List[str]:
+    names = dict.fromkeys(kinds)
+    for row in rows:
+        names.update(dict.fromkeys(row))
+    return list(names)
+
+
+def _resolve(rows: Iterable[Any], model: Optional[Type[BaseModel]]) -> tuple:
+    rows = list(rows)
+    if model is None and rows and isinstance(rows[0], BaseModel):
+        model = type(rows[0])
+    rows = _rows(rows)
+    kinds = column_kinds(model) if model is not None else {}
+    return rows, kinds, _column_names(rows, kinds)
+
+
+def _pandas_dtype(kind: Optional[str], values: List[Any]) -> Optional[str]:
+    if kind == "float":
+        return "float64"
+    if kind == "int":
+        return "Int64" if None in values else "int64"
+    if kind == "bool":
+        return "boolean" if None in values else "bool"
+    return None
+
+
+def to_pandas(
+    rows: Iterable[Any], model: Optional[Type[BaseModel]] = None
+) -> "pd.DataFrame":
+    """Build a pandas DataFrame from JSON rows typed by ``model``."""
+    pd = _import("pandas")
+    rows, kinds, names = _resolve(rows, model)
+    columns = {}
+    for name in names:
+        values = [row.get(name) for row in rows]
+        dtype = _pandas_dtype(kinds.get(name), values)
+        columns[name] = pd.Series(values, dtype=dtype)
+    return pd.DataFrame(columns)
+
+
+def to_polars(
+    rows: Iterable[Any], model: Optional[Type[BaseModel]] = None
+) -> "pl.DataFrame":
+    """Build a polars DataFrame from JSON rows typed by ``model``."""
+    pl = _import("polars")
+    dtypes = {
+        "float": pl.Float64,
+        "int": pl.Int64,
+        "bool": pl.Boolean,
+        "str": pl.Utf8,
+    }
+    rows, kinds, names = _resolve(rows, model)
+    return pl.DataFrame(
+        [
+            pl.Series(
+                name,
+                [row.get(name) for row in rows],
+                dtype=dtypes.get(kinds.get(name)),
+                strict=False,
+            )
+            for name in names
+        ]
+    )
+
+
+def to_frame(
+    rows: Iterable[Any],
+    model: Optional[Type[BaseModel]] = None,
+    *,
+    backend: str = "pandas",
+) -> Any:
+    """Dispatch to :func:`to_pandas` or :func:`to_polars`."""
+    if backend == "pandas":
+        return to_pandas(rows, model)
+    if backend == "polars":
+        return to_polars(rows, model)
+    raise ValueError(f"Unknown DataFrame backend {backend!r}; use pandas or polars")
+
+
+__all__ = [
+    "column_kinds",
+    "to_frame",
+    "to_pandas",
+    "to_polars",
+]
@@ -0,0 +1,447 @@
+"""In-memory PPI network graph backed by CSR adjacency arrays.
+
+:class:`PPIGraph` loads the ``/api/ppi/network/{score_type}`` payload once and
+keeps it as compressed sparse rows: protein ids are mapped to ``int32`` node
+numbers, ``indptr``/``indices`` hold each node's neighbours and ``scores`` the
+matching ``float32`` edge scores. Edges are undirected and stored in both
+directions. Neighbourhoods, degree and score filtering and connected components
+are computed locally with NumPy, as are the summary metrics of
+``/api/ppi/network-properties`` (:meth:`PPIGraph.properties`), and graphs
+round-trip through a compressed ``.npz`` file.
+
+Requires the optional ``numpy`` dependency (``pip install mett[numpy]``).
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+try:
+    import numpy as np  # type: ignore[import]
+except ModuleNotFoundError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+NODE_KEYS = ("id", "protein_id", "name")
+EDGE_KEYS = (("source", "target"), ("protein_a", "protein_b"), ("from", "to"))
+SCORE_KEYS = ("weight", "score", "value")
+# Upper bound on the wedges (paths of length two) checked per batch while
+# counting triangles; bounds peak memory at a few hundred MB.
+WEDGE_BATCH = 1 << 22
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "PPI graphs require numpy; install it with `pip install mett[numpy]`"
+        )
+
+
+def _first(mapping: Mapping[str, Any], keys: Sequence[str]) -> Any:
+    for key in keys:
+        value = mapping.get(key)
+        if value is not None:
+            return value
+    return None
+
+
+def _edge_score(edge: Mapping[str, Any], score_key: Optional[str]) -> float:
+    value = edge.get(score_key) if score_key else None
+    if value is None:
+        value = _first(edge, SCORE_KEYS)
+    return float("nan") if value is None else float(value)
+
+
+def _gather(indptr: "np.ndarray", rows: "np.ndarray") -> "np.ndarray":
+    """Return the CSR entry positions of every row in ``rows``, concatenated."""
+    starts = indptr[rows]
+    counts = indptr[rows + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+    return offsets + np.arange(total, dtype=np.int64)
+
+
+class PPIGraph:
+    """Undirected, weighted PPI network in CSR form.
+
+    Nodes are addressed by protein id (as returned by the API); ``node_ids[i]``
+    is the id of node ``i``. ``query`` optionally records the API parameters
+    the network was downloaded with and is kept by :meth:`save`/:meth:`load`.
+    """
+
+    __slots__ = ("node_ids", "indptr", "indices", "scores", "query", "_index")
+
+    def __init__(
+        self,
+        node_ids: Sequence[str],
+        indptr: "np.ndarray",
+        indices: "np.ndarray",
+        scores: "np.ndarray",
+        *,
+        query: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        _require_numpy()
+        self.node_ids = np.asarray(node_ids, dtype=str)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.scores = np.asarray(scores, dtype=np.float32)
+        self.query: Optional[Dict[str, Any]] = dict(query) if query else None
+        self._index: Optional[Dict[str, int]] = None
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_edges(
+        cls,
+        sources: Iterable[str],
+        targets: Iterable[str],
+        scores: Optional[Iterable[float]] = None,
+        *,
+        node_ids: Optional[Iterable[str]] = None,
+    ) -> "PPIGraph":
+        """Build a graph from parallel lists of endpoint ids and scores.
+
+        ``node_ids`` adds nodes (including isolated ones) in a fixed order
+        before any that only appear in edges. Repeated pairs keep their
+        highest score; a missing score is stored as NaN.
+        """
+        _require_numpy()
+        index: Dict[str, int] = {}
+        for node in node_ids or ():
+            index.setdefault(str(node), len(index))
+        src = np.fromiter(
+            (index.setdefault(str(node), len(index)) for node in sources),
+            dtype=np.int32,
+        )
+        dst = np.fromiter(
+            (index.setdefault(str(node), len(index)) for node in targets),
+            dtype=np.int32,
+        )
+        if len(src) != len(dst):
+            raise ValueError("sources and targets must have the same length")
+        weights = (
+            np.full(len(src), np.nan, dtype=np.float32)
+            if scores is None
+            else np.fromiter(scores, dtype=np.float32, count=len(src))
+        )
+        return cls._from_arrays(list(index), src, dst, weights)
+
+    @classmethod
+    def _from_arrays(
+        cls,
+        node_ids: List[str],
+        src: "np.ndarray",
+        dst: "np.ndarray",
+        weights: "np.ndarray",
+    ) -> "PPIGraph":
+        num_nodes = len(node_ids)
+        loops = src == dst
+        rows = np.concatenate([src, dst[~loops]]).astype(np.int64)
+        cols = np.concatenate([dst, src[~loops]]).astype(np.int64)
+        vals = np.concatenate([weights, weights[~loops]])
+
+        # Sort by (row, col, score descending) and keep the first of each pair.
+        keys = rows * max(num_nodes, 1) + cols
+        order = np.lexsort((-np.nan_to_num(vals, nan=-np.inf), keys))
+        keys, vals = keys[order], vals[order]
+        keep = np.ones(len(keys), dtype=bool)
+        keep[1:] = keys[1:] != keys[:-1]
+        keys, vals = keys[keep], vals[keep]
+        rows, cols = np.divmod(keys, max(num_nodes, 1))
+
+        indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=num_nodes), out=indptr[1:])
+        return cls(node_ids, indptr, cols, vals)
+
+    @classmethod
+    def from_network(
+        cls, payload: Mapping[str, Any], *, score_key: Optional[str] = None
+    ) -> "PPIGraph":
+        """Build a graph from a ``/api/ppi/network/{score_type}`` response.
+
+        Accepts the full response or its ``data`` object. Edge endpoints are
+        read from ``source``/``target`` (or ``protein_a``/``protein_b``) and
+        scores from ``score_key``, else ``weight``/``score``/``value``.
+        """
+        data = payload.get("data", payload)
+        if not isinstance(data, Mapping):
+            raise ValueError("Unexpected PPI network payload")
+        node_ids = [
+            node_id
+            for node_id in (_first(node, NODE_KEYS) for node in data.get("nodes") or [])
+            if node_id is not None
+        ]
+        edges = data.get("edges") or []
+        sources: List[Any] = []
+        targets: List[Any] = []
+        weights: List[float] = []
+        for edge in edges:
+            for source_key, target_key in EDGE_KEYS:
+                if source_key in edge and target_key in edge:
+                    sources.append(edge[source_key])
+                    targets.append(edge[target_key])
+                    weights.append(_edge_score(edge, score_key))
+                    break
+            else:
+                raise ValueError(f"PPI network edge has no endpoints: {edge!r}")
+        return cls.from_edges(sources, targets, weights, node_ids=node_ids)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the graph and its ``query`` to a compressed ``.npz`` file."""
+        arrays = {
+            "node_ids": self.node_ids,
+            "indptr": self.indptr,
+            "indices": self.indices,
+            "scores": self.scores,
+        }
+        if self.query is not None:
+            arrays["query"] = np.array(json.dumps(self.query, sort_keys=True))
+        with open(path, "wb") as fh:
+            np.savez_compressed(fh, **arrays)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "PPIGraph":
+        """Read a graph written by :meth:`save`."""
+        _require_numpy()
+        with np.load(path, allow_pickle=False) as arrays:
+            query = (
+                json.loads(str(arrays["query"])) if "query" in arrays.files else None
+            )
+            return cls(
+                arrays["node_ids"],
+                arrays["indptr"],
+                arrays["indices"],
+                arrays["scores"],
+                query=query,
+            )
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    @property
+    def num_nodes(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def num_edges(self) -> int:
+        """Number of undirected edges (self-interactions count once)."""
+        loops = int(np.count_nonzero(self.indices == self._rows()))
+        return (len(self.indices) - loops) // 2 + loops
+
+    def __len__(self) -> int:
+        return self.num_nodes
+
+    def __contains__(self, node: object) -> bool:
+        return node in self._lookup()
+
+    def __repr__(self) -> str:
+        return f"PPIGraph(num_nodes={self.num_nodes}, num_edges={self.num_edges})"
+
+    def _lookup(self) -> Dict[str, int]:
+        if self._index is None:
+            self._index = {str(node): i for i, node in enumerate(self.node_ids)}
+        return self._index
+
+    def index(self, node: str) -> int:
+        """Return the numeric id of ``node``; raises ``KeyError`` if unknown."""
+        try:
+            return self._lookup()[node]
+        except KeyError:
+            raise KeyError(f"Protein {node!r} is not in the network") from None
+
+    def _rows(self) -> "np.ndarray":
+        return np.repeat(
+            np.arange(self.num_nodes, dtype=np.int32), np.diff(self.indptr)
+        )
+
+    def degrees(self) -> "np.ndarray":
+        """Degree of every node, indexed like ``node_ids``."""
+        return np.diff(self.indptr)
+
+    def degree(self, node: str) -> int:
+        i = self.index(node)
+        return int(self.indptr[i + 1] - self.indptr[i])
+
+    def neighbors(self, node: str, *, min_score: Optional[float] = None) -> List[str]:
+        """Direct neighbours of ``node``, highest score first."""
+        i = self.index(node)
+        start, end = self.indptr[i], self.indptr[i + 1]
+        cols, vals = self.indices[start:end], self.scores[start:end]
+        if min_score is not None:
+            keep = vals >= min_score
+            cols, vals = cols[keep], vals[keep]
+        order = np.argsort(-np.nan_to_num(vals, nan=-np.inf), kind="stable")
+        return self.node_ids[cols[order]].tolist()
+
+    def neighborhood(
+        self, node: str, k: int = 1, *, min_score: Optional[float] = None
+    ) -> Dict[str, int]:
+        """Map every node within ``k`` hops of ``node`` to its hop distance.
+
+        Only edges scoring at least ``min_score`` are followed.
+        """
+        start = self.index(node)
+        hops = np.full(self.num_nodes, -1, dtype=np.int32)
+        hops[start] = 0
+        frontier = np.array([start], dtype=np.int64)
+        for hop in range(1, k + 1):
+            positions = _gather(self.indptr, frontier)
+            if min_score is not None:
+                positions = positions[self.scores[positions] >= min_score]
+            reached = np.unique(self.indices[positions])
+            frontier = reached[hops[reached] < 0].astype(np.int64)
+            if not len(frontier):
+                break
+            hops[frontier] = hop
+        found = np.flatnonzero(hops >= 0)
+        return dict(zip(self.node_ids[found].tolist(), hops[found].tolist()))
+
+    def filter(
+        self,
+        *,
+        min_score: Optional[float] = None,
+        min_degree: Optional[int] = None,
+    ) -> "PPIGraph":
+        """Return a new graph keeping edges scoring ``>= min_score``.
+
+        ``min_degree`` then drops nodes with fewer neighbours in the filtered
+        graph (a single pass; it does not iterate to a k-core).
+        """
+        rows = self._rows()
+        keep = np.ones(len(self.indices), dtype=bool)
+        if min_score is not None:
+            keep &= self.scores >= min_score
+        rows, cols, vals = rows[keep], self.indices[keep], self.scores[keep]
+        nodes = np.arange(self.num_nodes)
+        if min_degree is not None:
+            degree = np.bincount(rows, minlength=self.num_nodes)
+            nodes = np.flatnonzero(degree >= min_degree)
+            kept = np.zeros(self.num_nodes, dtype=bool)
+            kept[nodes] = True
+            edge_keep = kept[rows] & kept[cols]
+            rows, cols, vals = rows[edge_keep], cols[edge_keep], vals[edge_keep]
+        remap = np.full(self.num_nodes, -1, dtype=np.int64)
+        remap[nodes] = np.arange(len(nodes))
+        rows, cols = remap[rows], remap[cols]
+        indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(nodes)), out=indptr[1:])
+        return PPIGraph(self.node_ids[nodes], indptr, cols, vals)
+
+    def triangles(self) -> "np.ndarray":
+        """Number of triangles through every node, indexed like ``node_ids``.
+
+        Each edge is oriented from its lower- to its higher-degree endpoint;
+        every triangle is then found exactly once, as a pair of out-neighbours
+        of its lowest node joined by an edge. The edge test is a binary search
+        in the sorted ``row * n + col`` keys of the CSR arrays.
+        """
+        n = self.num_nodes
+        counts = np.zeros(n, dtype=np.int64)
+        rows = self._rows().astype(np.int64)
+        cols = self.indices.astype(np.int64)
+        rank = np.empty(n, dtype=np.int64)
+        rank[np.lexsort((np.arange(n), self.degrees()))] = np.arange(n)
+        forward = rank[cols] > rank[rows]
+        out_rows, out_cols = rows[forward], cols[forward]
+        if len(out_rows) < 2:
+            return counts
+        out_ptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(out_rows, minlength=n), out=out_ptr[1:])
+        keys = rows * n + cols
+
+        # Every position pairs with the later positions of its row.
+        later = out_ptr[out_rows + 1] - np.arange(len(out_rows)) - 1
+        ends = np.cumsum(later)
+        first = 0
+        while first < len(later):
+            last = max(
+                int(np.searchsorted(ends, ends[first] - later[first] + WEDGE_BATCH)),
+                first + 1,
+            )
+            batch = later[first:last]
+            total = int(batch.sum())
+            if total:
+                left = np.repeat(np.arange(first, last), batch)
+                starts = np.cumsum(batch) - batch
+                right = left + 1 + np.arange(total) - np.repeat(starts, batch)
+                u, v = out_cols[left], out_cols[right]
+                wanted = u * n + v
+                found = np.searchsorted(keys, wanted)
+                found[found == len(keys)] = 0
+                closed = keys[found] == wanted
+                for nodes in (out_rows[left[closed]], u[closed], v[closed]):
+                    counts += np.bincount(nodes, minlength=n)
+            first = last
+        return counts
+
+    def clustering(self) -> "np.ndarray":
+        """Local clustering coefficient of every node (0 below two neighbours).
+
+        Self-interactions are ignored, as are edge scores.
+        """
+        loops = np.bincount(
+            self._rows()[self.indices == self._rows()], minlength=self.num_nodes
+        )
+        degree = (self.degrees() - loops).astype(np.float64)
+        pairs = degree * (degree - 1) / 2
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(pairs > 0, self.triangles() / pairs, 0.0)
+
+    def properties(self) -> Dict[str, Any]:
+        """Summary metrics in the shape of ``/api/ppi/network-properties``.
+
+        ``degree_distribution[d]`` is the number of nodes with degree ``d``;
+        ``component_sizes`` (not reported by the server) lists connected
+        component sizes, largest first.
+        """
+        n, m = self.num_nodes, self.num_edges
+        return {
+            "num_nodes": n,
+            "num_edges": m,
+            "density": 2 * m / (n * (n - 1)) if n > 1 else 0.0,
+            "avg_clustering_coefficient": (
+                float(self.clustering().mean()) if n else 0.0
+            ),
+            "degree_distribution": np.bincount(self.degrees()).tolist(),
+            "component_sizes": (
+                np.bincount(self.component_labels()).tolist() if n else []
+            ),
+        }
+
+    def component_labels(self) -> "np.ndarray":
+        """Label every node with a component number (0 = largest component)."""
+        labels = np.arange(self.num_nodes, dtype=np.int64)
+        nonempty = np.flatnonzero(np.diff(self.indptr))
+        starts = self.indptr[nonempty]
+        while True:
+            # Take the smallest label among each node and its neighbours, then
+            # jump pointers so labels converge in few rounds.
+            updated = labels.copy()
+            if len(nonempty):
+                lowest = np.minimum.reduceat(labels[self.indices], starts)
+                updated[nonempty] = np.minimum(updated[nonempty], lowest)
+            updated = updated[updated]
+            if np.array_equal(updated, labels):
+                break
+            labels = updated
+        _, inverse, counts = np.unique(labels, return_inverse=True, return_counts=True)
+        rank = np.empty(len(counts), dtype=np.int64)
+        rank[np.argsort(-counts, kind="stable")] = np.arange(len(counts))
+        return rank[inverse]
+
+    def connected_components(self) -> List[List[str]]:
+        """Protein ids of each connected component, largest first."""
+        labels = self.component_labels()
+        order = np.argsort(labels, kind="stable")
+        bounds = np.cumsum(np.bincount(labels))[:-1]
+        return [ids.tolist() for ids in np.split(self.node_ids[order], bounds)]
+
+
+__all__ = ["PPIGraph"]
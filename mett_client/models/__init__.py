@@ -2,31 +2,46 @@
 
 from __future__ import annotations
 
-from typing import TypedDict
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, Tuple, TypedDict
 
-from mett_dataportal_sdk.models.drug_metabolism_data_schema import (
-    DrugMetabolismDataSchema,
-)
-from mett_dataportal_sdk.models.drug_mic_data_schema import DrugMICDataSchema
-from mett_dataportal_sdk.models.gene_paginated_response_schema import (
-    GenePaginatedResponseSchema,
-)
-from mett_dataportal_sdk.models.gene_response_schema import GeneResponseSchema
-from mett_dataportal_sdk.models.genome_paginated_response_schema import (
-    GenomePaginatedResponseSchema,
-)
-from mett_dataportal_sdk.models.genome_response_schema import GenomeResponseSchema
-from mett_dataportal_sdk.models.paginated_response_schema import PaginatedResponseSchema
-from mett_dataportal_sdk.models.paginated_strain_drug_metabolism_response_schema import (
-    PaginatedStrainDrugMetabolismResponseSchema,
-)
-from mett_dataportal_sdk.models.paginated_strain_drug_mic_response_schema import (
-    PaginatedStrainDrugMICResponseSchema,
-)
-from mett_dataportal_sdk.models.pagination_metadata_schema import (
-    PaginationMetadataSchema,
-)
-from mett_dataportal_sdk.models.success_response_schema import SuccessResponseSchema
+if TYPE_CHECKING:
+    from mett_dataportal_sdk.models import (
+        PaginatedStrainDrugMetabolismResponseSchema as StrainDrugMetabolismPage,
+    )
+    from mett_dataportal_sdk.models.drug_metabolism_data_schema import (
+        DrugMetabolismDataSchema as DrugMetabolism,
+    )
+    from mett_dataportal_sdk.models.drug_mic_data_schema import (
+        DrugMICDataSchema as DrugMIC,
+    )
+    from mett_dataportal_sdk.models.gene_paginated_response_schema import (
+        GenePaginatedResponseSchema as GenePage,
+    )
+    from mett_dataportal_sdk.models.gene_response_schema import (
+        GeneResponseSchema as Gene,
+    )
+    from mett_dataportal_sdk.models.genome_paginated_response_schema import (
+        GenomePaginatedResponseSchema as GenomePage,
+    )
+    from mett_dataportal_sdk.models.genome_response_schema import (
+        GenomeResponseSchema as Genome,
+    )
+    from mett_dataportal_sdk.models.paginated_response_schema import (
+        PaginatedResponseSchema as PaginatedResponse,
+    )
+    from mett_dataportal_sdk.models.paginated_strain_drug_mic_response_schema import (
+        PaginatedStrainDrugMICResponseSchema as StrainDrugMICPage,
+    )
+    from mett_dataportal_sdk.models.pagination_metadata_schema import (
+        PaginationMetadataSchema as Pagination,
+    )
+    from mett_dataportal_sdk.models.ppi_interaction_schema import (
+        PPIInteractionSchema as PPIInteraction,
+    )
+    from mett_dataportal_sdk.models.success_response_schema import (
+        SuccessResponseSchema as SuccessResponse,
+    )
 
 
 class SpeciesDict(TypedDict, total=False):
@@ -38,20 +53,46 @@ class SpeciesDict(TypedDict, total=False):
     taxonomy_id: int
 
 
-Pagination = PaginationMetadataSchema
-PaginatedResponse = PaginatedResponseSchema
-GenomePage = GenomePaginatedResponseSchema
-GenePage = GenePaginatedResponseSchema
-StrainDrugMICPage = PaginatedStrainDrugMICResponseSchema
-StrainDrugMetabolismPage = PaginatedStrainDrugMetabolismResponseSchema
-SuccessResponse = SuccessResponseSchema
-
-Genome = GenomeResponseSchema
-Gene = GeneResponseSchema
-DrugMIC = DrugMICDataSchema
-DrugMetabolism = DrugMetabolismDataSchema
 Species = SpeciesDict
 
+# Aliases resolve to generated SDK models on first access, so importing this
+# package does not build any pydantic models.
+_SDK_MODELS: Dict[str, Tuple[str, str]] = {
+    "Pagination": ("pagination_metadata_schema", "PaginationMetadataSchema"),
+    "PaginatedResponse": ("paginated_response_schema", "PaginatedResponseSchema"),
+    "GenomePage": (
+        "genome_paginated_response_schema",
+        "GenomePaginatedResponseSchema",
+    ),
+    "GenePage": ("gene_paginated_response_schema", "GenePaginatedResponseSchema"),
+    "StrainDrugMICPage": (
+        "paginated_strain_drug_mic_response_schema",
+        "PaginatedStrainDrugMICResponseSchema",
+    ),
+    "StrainDrugMetabolismPage": (
+        "paginated_strain_drug_metabolism_response_schema",
+        "PaginatedStrainDrugMetabolismResponseSchema",
+    ),
+    "SuccessResponse": ("success_response_schema", "SuccessResponseSchema"),
+    "Genome": ("genome_response_schema", "GenomeResponseSchema"),
+    "Gene": ("gene_response_schema", "GeneResponseSchema"),
+    "DrugMIC": ("drug_mic_data_schema", "DrugMICDataSchema"),
+    "DrugMetabolism": ("drug_metabolism_data_schema", "DrugMetabolismDataSchema"),
+    "PPIInteraction": ("ppi_interaction_schema", "PPIInteractionSchema"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _SDK_MODELS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(f"mett_dataportal_sdk.models.{module_name}")
+    value = getattr(module, attr)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     "Pagination",
     "PaginatedResponse",
@@ -64,5 +105,6 @@ __all__ = [
     "Gene",
     "DrugMIC",
     "DrugMetabolism",
+    "PPIInteraction",
     "Species",
 ]
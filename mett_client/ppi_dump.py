@@ -0,0 +1,328 @@
+"""Resumable species-wide PPI dumps with a deduplicated pair index.
+
+:func:`dump_ppi` pages through ``/api/ppi/interactions`` (concurrently when
+called as ``DataPortalClient.dump_ppi``) and writes two TSV files into an
+output directory:
+
+``nodes.tsv``
+    One row per protein, numbered in order of first appearance
+    (``node``, ``protein_id``, ``locus_tag``, ``uniprot_id``, ``name``).
+``edges.tsv``
+    One row per distinct ``pair_id`` (``source``, ``target``, ``pair_id``,
+    ``score``), with endpoints given as node numbers.
+
+Pairs are deduplicated with :class:`PairIdSet`, a NumPy open-addressing set of
+64-bit ``pair_id`` hashes (about 16 bytes per pair). After each page a
+``checkpoint.json`` records the next page and the byte length of both files, so
+an interrupted dump resumes where it stopped: the files are truncated to the
+checkpoint, the pair set and node index are rebuilt from them, and fetching
+continues.
+
+Requires the optional ``numpy`` dependency (``pip install mett[numpy]``).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Mapping, Optional
+
+try:
+    import numpy as np  # type: ignore[import]
+except ModuleNotFoundError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+EDGES_FILE = "edges.tsv"
+NODES_FILE = "nodes.tsv"
+CHECKPOINT_FILE = "checkpoint.json"
+EDGE_HEADER = b"source\ttarget\tpair_id\tscore\n"
+NODE_HEADER = b"node\tprotein_id\tlocus_tag\tuniprot_id\tname\n"
+DEFAULT_DUMP_PAGE_SIZE = 1000
+_FNV_OFFSET = 0xCBF29CE484222325
+_FNV_PRIME = 0x100000001B3
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "PPI dumps require numpy; install it with `pip install mett[numpy]`"
+        )
+
+
+def hash_ids(ids: Iterable[str]) -> "np.ndarray":
+    """64-bit FNV-1a hashes of ``ids``, computed a byte column at a time."""
+    raw = np.array([str(value).encode() for value in ids], dtype=bytes)
+    hashes = np.full(len(raw), _FNV_OFFSET, dtype=np.uint64)
+    if not len(raw) or not raw.itemsize:
+        return hashes
+    columns = raw.view(np.uint8).reshape(len(raw), raw.itemsize)
+    for j in range(raw.itemsize):
+        byte = columns[:, j].astype(np.uint64)
+        # Shorter ids are NUL-padded; skipping padding keeps each id's hash
+        # independent of the batch it arrives in.
+        hashes = np.where(byte != 0, (hashes ^ byte) * _FNV_PRIME, hashes)
+    # Zero marks an empty slot.
+    hashes[hashes == 0] = 1
+    return hashes
+
+
+class PairIdSet:
+    """Set of pair ids stored as 64-bit hashes in an open-addressing table.
+
+    Two distinct ids colliding on all 64 bits is possible in principle but
+    vanishingly unlikely at PPI scale (about 1e-8 for a million pairs).
+    """
+
+    __slots__ = ("_slots", "_size")
+
+    def __init__(self, capacity: int = 1024) -> None:
+        _require_numpy()
+        size = 1
+        while size < capacity * 2:
+            size *= 2
+        self._slots = np.zeros(size, dtype=np.uint64)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, pair_id: object) -> bool:
+        key = hash_ids([str(pair_id)])[0]
+        mask = len(self._slots) - 1
+        slot = int(key) & mask
+        while True:
+            current = self._slots[slot]
+            if current == key:
+                return True
+            if current == 0:
+                return False
+            slot = (slot + 1) & mask
+
+    def add_many(self, pair_ids: Iterable[str]) -> "np.ndarray":
+        """Add ids; return a mask that is True where an id was not seen before.
+
+        Repeats within ``pair_ids`` count as seen after their first position.
+        """
+        return self._add(hash_ids(pair_ids))
+
+    def _add(self, keys: "np.ndarray") -> "np.ndarray":
+        added = np.zeros(len(keys), dtype=bool)
+        if not len(keys):
+            return added
+        unique, first = np.unique(keys, return_index=True)
+        if (self._size + len(unique)) * 2 > len(self._slots):
+            self._grow(self._size + len(unique))
+
+        mask = np.uint64(len(self._slots) - 1)
+        fresh = np.zeros(len(unique), dtype=bool)
+        pending = np.arange(len(unique))
+        slots = (unique & mask).astype(np.int64)
+        while len(pending):
+            # Linear probing for the whole batch at once: keys finding
+            # themselves are duplicates, keys finding an empty slot try to
+            # claim it (one writer wins per slot), the rest move on.
+            current = self._slots[slots]
+            wanted = unique[pending]
+            done = current == wanted
+            empty = np.flatnonzero(current == 0)
+            self._slots[slots[empty]] = wanted[empty]
+            won = empty[self._slots[slots[empty]] == wanted[empty]]
+            fresh[pending[won]] = True
+            done[won] = True
+            pending = pending[~done]
+            slots = (slots[~done] + 1) & int(mask)
+        self._size += int(fresh.sum())
+        added[first[fresh]] = True
+        return added
+
+    def _grow(self, needed: int) -> None:
+        old = self._slots[self._slots != 0]
+        size = len(self._slots)
+        while size < needed * 2:
+            size *= 2
+        self._slots = np.zeros(size, dtype=np.uint64)
+        self._size = 0
+        self._add(old)
+
+
+@dataclass
+class PPIDumpSummary:
+    """Outcome of :func:`dump_ppi`."""
+
+    path: str
+    pages: int
+    edges: int
+    nodes: int
+    duplicates: int
+    complete: bool = False
+    resumed: bool = False
+
+
+def _checkpoint_query(
+    species_acronym: str,
+    score_type: Optional[str],
+    score_threshold: Optional[float],
+    per_page: int,
+) -> Dict[str, Any]:
+    return {
+        "species_acronym": species_acronym,
+        "score_type": score_type,
+        "score_threshold": score_threshold,
+        "per_page": per_page,
+    }
+
+
+def _write_checkpoint(path: Path, state: Mapping[str, Any]) -> None:
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(state, indent=2))
+    os.replace(tmp, path)
+
+
+def _field(value: Any) -> bytes:
+    if value is None:
+        return b""
+    text = str(value)
+    return text.replace("\t", " ").replace("\n", " ").encode()
+
+
+def dump_ppi(
+    fetch_pages: Callable[[Dict[str, Any]], Iterable[Any]],
+    species_acronym: str,
+    score_type: Optional[str] = None,
+    score_threshold: Optional[float] = None,
+    *,
+    out: str | os.PathLike,
+    per_page: int = DEFAULT_DUMP_PAGE_SIZE,
+    resume: bool = True,
+) -> PPIDumpSummary:
+    """Dump every PPI interaction of a species into ``out`` (a directory).
+
+    ``fetch_pages(params)`` yields the result pages (with plain dict rows) of
+    ``/api/ppi/interactions`` in order, starting at ``params["page"]``;
+    ``DataPortalClient.dump_ppi`` supplies one that prefetches concurrently.
+    """
+    _require_numpy()
+    directory = Path(out)
+    directory.mkdir(parents=True, exist_ok=True)
+    edges_path = directory / EDGES_FILE
+    nodes_path = directory / NODES_FILE
+    checkpoint_path = directory / CHECKPOINT_FILE
+    query = _checkpoint_query(species_acronym, score_type, score_threshold, per_page)
+
+    state: Dict[str, Any] = {}
+    if resume and checkpoint_path.exists():
+        state = json.loads(checkpoint_path.read_text())
+        if state.get("query") != query:
+            raise ValueError(
+                f"{directory} holds a dump of a different query; "
+                "pass resume=False to overwrite it"
+            )
+    summary = PPIDumpSummary(
+        path=str(directory),
+        pages=state.get("pages", 0),
+        edges=state.get("edges", 0),
+        nodes=0,
+        duplicates=state.get("duplicates", 0),
+        complete=state.get("complete", False),
+        resumed=bool(state),
+    )
+
+    seen = PairIdSet(max(summary.edges, 1024))
+    nodes: Dict[str, int] = {}
+    if state:
+        for path, key in ((edges_path, "edges_bytes"), (nodes_path, "nodes_bytes")):
+            if not path.exists() or state[key] > path.stat().st_size:
+                raise ValueError(
+                    f"{path} is shorter than its checkpoint; "
+                    "pass resume=False to start the dump again"
+                )
+        for path, key in ((edges_path, "edges_bytes"), (nodes_path, "nodes_bytes")):
+            with path.open("r+b") as fh:
+                fh.truncate(state[key])
+        with nodes_path.open("rb") as fh:
+            next(fh)
+            for line in fh:
+                nodes[line.split(b"\t", 2)[1].decode()] = len(nodes)
+        with edges_path.open("rb") as fh:
+            next(fh)
+            seen.add_many(line.split(b"\t", 3)[2].decode() for line in fh)
+    else:
+        # A stale checkpoint would point past the end of the fresh files.
+        checkpoint_path.unlink(missing_ok=True)
+        edges_path.write_bytes(EDGE_HEADER)
+        nodes_path.write_bytes(NODE_HEADER)
+    summary.nodes = len(nodes)
+    if state.get("next_page", 1) > state.get("num_pages", 1):
+        summary.complete = True
+    if summary.complete:
+        _write_checkpoint(checkpoint_path, {**state, "complete": True})
+        return summary
+
+    def intern(row: Mapping[str, Any], side: str, out_nodes: BinaryIO) -> int:
+        protein = str(row[f"protein_{side}"])
+        node = nodes.get(protein)
+        if node is None:
+            node = nodes[protein] = len(nodes)
+            out_nodes.write(
+                b"\t".join(
+                    [
+                        str(node).encode(),
+                        _field(protein),
+                        _field(row.get(f"protein_{side}_locus_tag")),
+                        _field(row.get(f"protein_{side}_uniprot_id")),
+                        _field(row.get(f"protein_{side}_name")),
+                    ]
+                )
+                + b"\n"
+            )
+        return node
+
+    params = {
+        "species_acronym": species_acronym,
+        "score_type": score_type,
+        "score_threshold": score_threshold,
+        "per_page": per_page,
+        "page": state.get("next_page", 1),
+    }
+    page_number = params["page"]
+    with edges_path.open("ab") as out_edges, nodes_path.open("ab") as out_nodes:
+        for page in fetch_pages(params):
+            rows = page.items
+            fresh = seen.add_many(str(row["pair_id"]) for row in rows)
+            for row, is_new in zip(rows, fresh.tolist()):
+                if not is_new:
+                    summary.duplicates += 1
+                    continue
+                source = intern(row, "a", out_nodes)
+                target = intern(row, "b", out_nodes)
+                score = row.get(score_type) if score_type else None
+                out_edges.write(
+                    b"%d\t%d\t%s\t%s\n"
+                    % (source, target, _field(row["pair_id"]), _field(score))
+                )
+                summary.edges += 1
+            summary.pages += 1
+            page_number += 1
+            out_edges.flush()
+            out_nodes.flush()
+            summary.nodes = len(nodes)
+            state = {
+                "query": query,
+                "next_page": page_number,
+                "num_pages": getattr(page.pagination, "num_pages", None) or 1,
+                "edges_bytes": out_edges.tell(),
+                "nodes_bytes": out_nodes.tell(),
+                "pages": summary.pages,
+                "edges": summary.edges,
+                "duplicates": summary.duplicates,
+            }
+            _write_checkpoint(checkpoint_path, state)
+
+    summary.complete = True
+    _write_checkpoint(checkpoint_path, {**state, "complete": True})
+    return summary
+
+
+__all__ = ["PPIDumpSummary", "PairIdSet", "dump_ppi", "hash_ids"]
@@ -0,0 +1,243 @@
+"""Columnar PPI score table for vectorized filtering and ranking.
+
+:class:`PPIScoreTable` holds PPI interactions (``/api/ppi/interactions`` rows)
+as NumPy columns: each ``*_score`` is a ``float32`` array with NaN for missing
+values, evidence flags are ``bool`` arrays and ``evidence_count`` is ``int32``.
+Threshold masks, weighted combined scores and top-k selection then run over
+whole columns instead of looping over pydantic objects.
+
+Requires the optional ``numpy`` dependency (``pip install mett[numpy]``).
+"""
+
+from __future__ import annotations
+
+import math
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+from pydantic import BaseModel
+
+try:
+    import numpy as np  # type: ignore[import]
+except ModuleNotFoundError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+SCORE_COLUMNS = (
+    "dl_score",
+    "comelt_score",
+    "perturbation_score",
+    "abundance_score",
+    "melt_score",
+    "secondary_score",
+    "bayesian_score",
+    "string_score",
+    "operon_score",
+    "ecocyc_score",
+    "tt_score",
+    "ds_score",
+)
+FLAG_COLUMNS = ("has_xlms", "has_string", "has_operon", "has_ecocyc")
+ID_COLUMNS = ("pair_id", "protein_a", "protein_b")
+DEFAULT_CHUNK_ROWS = 100_000
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "PPI score tables require numpy; install it with `pip install mett[numpy]`"
+        )
+
+
+def _as_mapping(row: Any) -> Mapping[str, Any]:
+    if isinstance(row, BaseModel):
+        return vars(row)
+    return row
+
+
+class PPIScoreTable:
+    """PPI interactions stored column-wise as NumPy arrays."""
+
+    __slots__ = ("columns",)
+
+    def __init__(self, columns: Mapping[str, "np.ndarray"]) -> None:
+        _require_numpy()
+        self.columns: Dict[str, np.ndarray] = dict(columns)
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[Any], *, chunk_size: int = DEFAULT_CHUNK_ROWS
+    ) -> "PPIScoreTable":
+        """Build a table from interaction dicts or ``PPIInteraction`` models.
+
+        Rows are consumed ``chunk_size`` at a time, so an ``iter_*`` generator
+        is never materialized as one big list.
+        """
+        _require_numpy()
+        rows = iter(rows)
+        chunks = []
+        while True:
+            chunk = [_as_mapping(row) for row in islice(rows, chunk_size)]
+            if not chunk:
+                break
+            chunks.append(cls._from_chunk(chunk))
+        return cls.concat(chunks)
+
+    @classmethod
+    def _from_chunk(cls, rows: List[Mapping[str, Any]]) -> "PPIScoreTable":
+        columns: Dict[str, np.ndarray] = {}
+        for name in ID_COLUMNS:
+            columns[name] = np.array([row.get(name) for row in rows], dtype=object)
+        for name in SCORE_COLUMNS:
+            # ``None`` becomes NaN in a float array.
+            columns[name] = np.array([row.get(name) for row in rows], dtype=np.float32)
+        for name in FLAG_COLUMNS:
+            columns[name] = np.array([bool(row.get(name)) for row in rows], dtype=bool)
+        columns["evidence_count"] = np.array(
+            [row.get("evidence_count") or 0 for row in rows], dtype=np.int32
+        )
+        return cls(columns)
+
+    @classmethod
+    def empty(cls) -> "PPIScoreTable":
+        _require_numpy()
+        columns = {name: np.empty(0, dtype=object) for name in ID_COLUMNS}
+        columns.update({name: np.empty(0, dtype=np.float32) for name in SCORE_COLUMNS})
+        columns.update({name: np.empty(0, dtype=bool) for name in FLAG_COLUMNS})
+        columns["evidence_count"] = np.empty(0, dtype=np.int32)
+        return cls(columns)
+
+    @classmethod
+    def concat(cls, tables: Sequence["PPIScoreTable"]) -> "PPIScoreTable":
+        """Stack tables row-wise."""
+        if not tables:
+            return cls.empty()
+        if len(tables) == 1:
+            return tables[0]
+        return cls(
+            {
+                name: np.concatenate([table.columns[name] for table in tables])
+                for name in tables[0].columns
+            }
+        )
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.columns["pair_id"])
+
+    def __getitem__(self, name: str) -> "np.ndarray":
+        return self.columns[name]
+
+    def __repr__(self) -> str:
+        return f"PPIScoreTable(rows={len(self)})"
+
+    def take(self, rows: Union["np.ndarray", Sequence[int]]) -> "PPIScoreTable":
+        """Return the rows selected by an index array or boolean mask."""
+        rows = np.asarray(rows)
+        return PPIScoreTable(
+            {name: column[rows] for name, column in self.columns.items()}
+        )
+
+    def to_rows(
+        self,
+        rows: Union["np.ndarray", Sequence[int], None] = None,
+        *,
+        columns: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Convert rows (all by default) back to dicts; NaN scores become None."""
+        names = list(columns or self.columns)
+        table = self if rows is None else self.take(rows)
+        values = [table.columns[name].tolist() for name in names]
+        return [
+            {
+                name: None if isinstance(value, float) and math.isnan(value) else value
+                for name, value in zip(names, record)
+            }
+            for record in zip(*values)
+        ]
+
+    # ------------------------------------------------------------------
+    # Filtering and ranking
+    # ------------------------------------------------------------------
+    def mask(self, *, how: str = "all", **conditions: Any) -> "np.ndarray":
+        """Boolean mask of rows meeting every (``how="any"``: some) condition.
+
+        Score conditions are minimums (``ds_score=0.8``) and never match NaN;
+        flag conditions require an exact value (``has_xlms=True``).
+        """
+        if how not in ("all", "any"):
+            raise ValueError("how must be 'all' or 'any'")
+        result = np.full(len(self), how == "all", dtype=bool)
+        for name, value in conditions.items():
+            if name in FLAG_COLUMNS:
+                matched = self.columns[name] == bool(value)
+            elif name in self.columns and self.columns[name].dtype.kind in "fi":
+                column = self.columns[name]
+                # Compare at the column's precision so a stored 0.7 meets 0.7.
+                matched = column >= column.dtype.type(value)
+            else:
+                raise KeyError(f"Unknown score or flag column: {name!r}")
+            if how == "all":
+                result &= matched
+            else:
+                result |= matched
+        return result
+
+    def combined(
+        self, weights: Mapping[str, float], *, renormalize: bool = True
+    ) -> "np.ndarray":
+        """Weighted combination of score columns as a ``float64`` array.
+
+        Missing scores are skipped and, with ``renormalize``, the remaining
+        weights are rescaled to sum to one, so a pair is not penalized for
+        lacking one kind of evidence; rows with no weighted scores are NaN.
+        With ``renormalize=False`` missing scores simply count as zero.
+        """
+        total = np.zeros(len(self), dtype=np.float64)
+        weight_sum = np.zeros(len(self), dtype=np.float64)
+        for name, weight in weights.items():
+            if name not in SCORE_COLUMNS:
+                raise KeyError(f"Unknown score column: {name!r}")
+            column = self.columns[name].astype(np.float64)
+            present = ~np.isnan(column)
+            total += np.where(present, column * weight, 0.0)
+            weight_sum += present * weight
+        if not renormalize:
+            return total
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(weight_sum > 0, total / weight_sum, np.nan)
+
+    def top_k(
+        self,
+        k: int,
+        by: Union[str, "np.ndarray"] = "ds_score",
+        *,
+        where: Optional["np.ndarray"] = None,
+    ) -> "np.ndarray":
+        """Row indices of the ``k`` highest values of ``by``, best first.
+
+        ``by`` is a score column name or any per-row array (for example from
+        :meth:`combined`); NaN values and rows outside ``where`` are skipped.
+        """
+        if k <= 0:
+            return np.empty(0, dtype=np.int64)
+        values = self.columns[by] if isinstance(by, str) else np.asarray(by)
+        candidates = np.flatnonzero(
+            ~np.isnan(values) & (True if where is None else where)
+        )
+        if k < len(candidates):
+            keep = np.argpartition(-values[candidates], k - 1)[:k]
+            candidates = candidates[keep]
+        order = np.argsort(-values[candidates], kind="stable")
+        return candidates[order]
+
+
+__all__ = [
+    "FLAG_COLUMNS",
+    "PPIScoreTable",
+    "SCORE_COLUMNS",
+]
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import csv
 import io
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 import requests  # type: ignore[import]
 
@@ -20,8 +20,64 @@ def parse_tsv_response(tsv_text: str) -> List[Dict[str, Any]]:
     if not tsv_text.strip():
         return []
 
-    reader = csv.DictReader(io.StringIO(tsv_text), delimiter="\t")
-    return [dict(row) for row in reader]
+    return list(iter_tsv_lines(io.StringIO(tsv_text)))
+
+
+def iter_tsv_lines(lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Yield one dict per TSV line, keyed by the header on the first line."""
+    yield from csv.DictReader(lines, delimiter="\t")
+
+
+def _raise_for_status(resp: requests.Response) -> None:
+    try:
+        resp.raise_for_status()
+    except requests.exceptions.HTTPError as exc:
+        if resp.status_code in {401, 403}:
+            raise AuthenticationError(
+                "Authentication failed", status_code=resp.status_code
+            ) from exc
+        raise APIError(f"Request failed: {exc}", status_code=resp.status_code) from exc
+
+
+def stream_tsv_rows(
+    session: requests.Session,
+    config: Config,
+    endpoint: str,
+    *,
+    params: Optional[Dict[str, Any]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Stream a TSV endpoint row by row without buffering the whole body.
+
+    The request is sent with ``stream=True`` and parsed with ``iter_lines``, so
+    memory use stays bounded by the longest line. The connection is released
+    once the generator is exhausted or closed.
+    """
+    url = f"{config.base_url.rstrip('/')}{endpoint}"
+    tsv_params = dict(params or {})
+    tsv_params.setdefault("format", "tsv")
+
+    try:
+        resp = session.get(
+            url,
+            params=tsv_params,
+            headers={"Accept": "text/tab-separated-values"},
+            timeout=config.timeout,
+            verify=config.verify_ssl,
+            stream=True,
+        )
+    except requests.exceptions.RequestException as exc:
+        raise APIError(f"Request failed: {exc}") from exc
+
+    with resp:
+        _raise_for_status(resp)
+        if resp.encoding is None:
+            resp.encoding = "utf-8"
+        try:
+            yield from iter_tsv_lines(resp.iter_lines(decode_unicode=True))
+        except requests.exceptions.RequestException as exc:
+            raise APIError(f"Request failed: {exc}") from exc
+        except csv.Error as exc:
+            raise APIError(f"Failed to parse TSV response: {exc}") from exc
 
 
 def request_json(
@@ -74,4 +130,9 @@ def request_json(
         raise APIError(f"Failed to parse TSV response: {exc}") from exc
 
 
-__all__ = ["parse_tsv_response", "request_json"]
+__all__ = [
+    "iter_tsv_lines",
+    "parse_tsv_response",
+    "request_json",
+    "stream_tsv_rows",
+]
@@ -0,0 +1,387 @@
+"""HTTP transport shared by the high-level client and the generated SDK."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import io
+import json
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+import requests  # type: ignore[import]
+import urllib3
+from requests.adapters import HTTPAdapter  # type: ignore[import]
+from urllib3.util.retry import Retry
+from mett_dataportal_sdk.exceptions import ApiException, ApiValueError
+
+from .config import Config
+
+Timeout = Optional[Union[float, Tuple[float, float]]]
+
+
+class ClientStats:
+    """Thread-safe counters describing a client's HTTP activity."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.retries = 0
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.retries = 0
+
+    def __repr__(self) -> str:
+        return f"ClientStats(retries={self.retries})"
+
+
+def backoff_delay(attempt: int, base: float, cap: float, jitter: float) -> float:
+    """Seconds to sleep before the ``attempt``-th consecutive retry (from 1)."""
+    if attempt <= 0 or base <= 0:
+        return 0
+    return min(cap, base * 2 ** (attempt - 1)) + random.uniform(0, jitter)
+
+
+class BackoffRetry(Retry):
+    """``Retry`` with capped exponential backoff, additive jitter and stats.
+
+    The n-th consecutive retry sleeps ``min(cap, base * 2 ** (n - 1))`` plus a
+    random ``[0, jitter)`` seconds, unless the server sent ``Retry-After``
+    (honoured by ``Retry`` itself when ``respect_retry_after_header`` is set).
+    Implemented here rather than via ``backoff_max``/``backoff_jitter`` so the
+    behaviour is identical on urllib3 1.26. Retries run inside urllib3, below
+    the adapter, so each one takes its own token from ``limiter`` after the
+    backoff sleep.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        backoff_cap: float = 30.0,
+        jitter: float = 0.0,
+        stats: Optional[ClientStats] = None,
+        limiter: Optional["TokenBucket"] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.backoff_cap = backoff_cap
+        self.jitter = jitter
+        self.stats = stats
+        self.limiter = limiter
+
+    def new(self, **kw: Any) -> "BackoffRetry":
+        retry = super().new(**kw)
+        retry.backoff_cap = self.backoff_cap
+        retry.jitter = self.jitter
+        retry.stats = self.stats
+        retry.limiter = self.limiter
+        return retry
+
+    def sleep(self, response: Any = None) -> None:
+        super().sleep(response)
+        if self.limiter is not None:
+            self.limiter.acquire()
+
+    def get_backoff_time(self) -> float:
+        attempts = 0
+        for entry in reversed(self.history):
+            if entry.redirect_location is not None:
+                break
+            attempts += 1
+        return backoff_delay(
+            attempts, self.backoff_factor, self.backoff_cap, self.jitter
+        )
+
+    def increment(self, *args: Any, **kwargs: Any) -> "BackoffRetry":
+        retry = super().increment(*args, **kwargs)
+        if self.stats is not None:
+            self.stats.record_retry()
+        return retry
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing ``rate`` requests/second on average.
+
+    Up to ``burst`` requests may be issued back to back after an idle period;
+    beyond that, ``acquire`` sleeps just long enough for the next token.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst if burst is not None else int(rate))
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            wait = self._take()
+            if not wait:
+                return
+            self._sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Like :meth:`acquire`, but waits with ``asyncio.sleep``."""
+        while True:
+            wait = self._take()
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+    def _take(self) -> float:
+        """Take a token and return 0, or return the seconds until one is due."""
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._updated
+            self._updated = now
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+
+def _pool_key_ignoring_maxsize(
+    key_fn: Callable[[Dict[str, Any]], Any], request_context: Dict[str, Any]
+) -> Any:
+    context = dict(request_context)
+    context.pop("maxsize", None)
+    return key_fn(context)
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """``HTTPAdapter`` that takes a token from ``limiter`` before each send."""
+
+    _grow_lock = threading.Lock()
+
+    def __init__(
+        self, *args: Any, limiter: Optional[TokenBucket] = None, **kwargs: Any
+    ):
+        self.limiter = limiter
+        super().__init__(*args, **kwargs)
+
+    def send(
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        if self.limiter is not None:
+            self.limiter.acquire()
+        return super().send(request, **kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        # Key pools without ``maxsize`` so ``grow_pool`` reuses existing pools.
+        keys = self.poolmanager.key_fn_by_scheme
+        for scheme, key_fn in list(keys.items()):
+            keys[scheme] = functools.partial(_pool_key_ignoring_maxsize, key_fn)
+
+    def grow_pool(self, maxsize: int) -> None:
+        """Raise the per-host pool size in place, keeping pooled connections.
+
+        Pools created from now on use ``maxsize``; existing pools get extra
+        empty slots, exactly as ``urllib3`` fills a new pool.
+        """
+        with self._grow_lock:
+            if maxsize <= self._pool_maxsize:
+                return
+            self._pool_maxsize = maxsize
+            self.poolmanager.connection_pool_kw["maxsize"] = maxsize
+            for key in list(self.poolmanager.pools.keys()):
+                pool = self.poolmanager.pools.get(key)
+                slots = getattr(pool, "pool", None)
+                if slots is None:
+                    continue
+                with slots.mutex:
+                    extra = maxsize - slots.maxsize
+                    if extra <= 0:
+                        continue
+                    slots.maxsize = maxsize
+                    # LIFO queue: empty slots go underneath idle connections.
+                    slots.queue[:0] = [None] * extra
+                    slots.not_empty.notify(extra)
+
+
+def build_rate_limiter(config: Config) -> Optional[TokenBucket]:
+    """Return the shared limiter for ``config``, or ``None`` when unlimited."""
+    if config.rate_limit <= 0:
+        return None
+    return TokenBucket(config.rate_limit, config.rate_limit_burst)
+
+
+def build_retry(
+    config: Config,
+    stats: Optional[ClientStats] = None,
+    limiter: Optional[TokenBucket] = None,
+) -> BackoffRetry:
+    """Create the retry policy described by ``config``."""
+    return BackoffRetry(
+        total=config.retries,
+        connect=config.retries,
+        read=config.retries,
+        status=config.retries,
+        status_forcelist=config.retry_statuses,
+        backoff_factor=config.retry_backoff,
+        backoff_cap=config.retry_backoff_max,
+        jitter=config.retry_jitter,
+        respect_retry_after_header=config.retry_respect_retry_after,
+        raise_on_status=False,
+        stats=stats,
+        limiter=limiter,
+    )
+
+
+def build_adapter(
+    config: Config,
+    stats: Optional[ClientStats] = None,
+    limiter: Optional[TokenBucket] = None,
+) -> HTTPAdapter:
+    """Create an adapter with the pool, retry and rate settings in ``config``."""
+    return RateLimitedAdapter(
+        pool_connections=config.pool_connections,
+        pool_maxsize=config.pool_maxsize,
+        pool_block=config.pool_block,
+        max_retries=build_retry(config, stats, limiter),
+        limiter=limiter,
+    )
+
+
+def configure_session(
+    session: requests.Session,
+    config: Config,
+    stats: Optional[ClientStats] = None,
+    limiter: Optional[TokenBucket] = None,
+) -> requests.Session:
+    """Mount the configured adapter and apply keep-alive settings to ``session``."""
+    adapter = build_adapter(config, stats, limiter)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not config.keep_alive:
+        session.headers["Connection"] = "close"
+    return session
+
+
+class SessionRESTResponse(io.IOBase):
+    """Adapt a ``requests.Response`` to the SDK's ``RESTResponse`` interface."""
+
+    def __init__(self, resp: requests.Response) -> None:
+        self.status = resp.status_code
+        self.reason = resp.reason
+        self.data: Optional[bytes] = None
+        self._resp = resp
+
+    @property
+    def response(self) -> urllib3.HTTPResponse:
+        """Unread ``urllib3`` response, as returned by ``*_without_preload_content``."""
+        return urllib3.HTTPResponse(
+            body=io.BytesIO(self._resp.content),
+            headers=dict(self._resp.headers),
+            status=self.status,
+            reason=self.reason,
+            preload_content=False,
+            decode_content=False,
+        )
+
+    def read(self) -> bytes:
+        if self.data is None:
+            self.data = self._resp.content
+        return self.data
+
+    def getheaders(self) -> Any:
+        return self._resp.headers
+
+    def getheader(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        return self._resp.headers.get(name, default)
+
+
+class SessionRESTClient:
+    """Drop-in replacement for the SDK's ``RESTClientObject``.
+
+    Routes generated SDK calls through the client's ``requests.Session`` so
+    both code paths share one connection pool (and any cache or adapter
+    mounted on the session) instead of each keeping its own sockets open.
+    """
+
+    def __init__(self, session: requests.Session, config: Config) -> None:
+        self.session = session
+        self.config = config
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Any = None,
+        post_params: Any = None,
+        _request_timeout: Timeout = None,
+    ) -> SessionRESTResponse:
+        method = method.upper()
+        if post_params and body:
+            raise ApiValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+        headers = dict(headers or {})
+        kwargs: Dict[str, Any] = {}
+        content_type = headers.get("Content-Type")
+        if method in {"POST", "PUT", "PATCH", "OPTIONS", "DELETE"}:
+            if post_params:
+                if content_type == "multipart/form-data":
+                    del headers["Content-Type"]
+                    kwargs["files"] = [
+                        (name, value)
+                        if isinstance(value, tuple)
+                        else (name, (None, json.dumps(value)))
+                        if isinstance(value, dict)
+                        else (name, (None, value))
+                        for name, value in post_params
+                    ]
+                else:
+                    kwargs["data"] = post_params
+            elif isinstance(body, (str, bytes)):
+                kwargs["data"] = body
+            elif body is not None:
+                kwargs["data"] = json.dumps(body)
+
+        try:
+            resp = self.session.request(
+                method,
+                url,
+                headers=headers,
+                timeout=_request_timeout or self.config.timeout,
+                verify=self.config.verify_ssl,
+                **kwargs,
+            )
+        except requests.RequestException as exc:
+            msg = "\n".join([type(exc).__name__, str(exc)])
+            raise ApiException(status=0, reason=msg) from exc
+        return SessionRESTResponse(resp)
+
+
+__all__ = [
+    "BackoffRetry",
+    "ClientStats",
+    "RateLimitedAdapter",
+    "SessionRESTClient",
+    "SessionRESTResponse",
+    "TokenBucket",
+    "backoff_delay",
+    "build_adapter",
+    "build_rate_limiter",
+    "build_retry",
+    "configure_session",
+]
@@ -0,0 +1,290 @@
+"""Sparse gene x compound matrix of pooled TTP interactions.
+
+:class:`TTPMatrix` stores ``ttp_score`` and ``hit_calling`` for every
+(locus tag, compound) pair returned by the ``/api/ttp/gene/...`` and
+``/api/ttp/compound/...`` interaction endpoints. Entries are kept in
+coordinate (COO) form, sorted by row then column, so the CSR row pointer is a
+single ``bincount`` away; ``row_ids`` and ``col_ids`` map matrix indices back to
+locus tags and compounds. Matrices round-trip through a compressed ``.npz``
+file for downstream clustering.
+
+Requires the optional ``numpy`` dependency (``pip install mett[numpy]``).
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .exceptions import APIError
+
+try:
+    import numpy as np  # type: ignore[import]
+except ModuleNotFoundError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+ROW_KEY = "locus_tag"
+COL_KEY = "compound"
+RESULT_KEYS = ("interactions", "results", "items")
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "TTP matrices require numpy; install it with `pip install mett[numpy]`"
+        )
+
+
+def interaction_rows(payload: Any) -> List[Mapping[str, Any]]:
+    """Interaction dicts of a TTP gene/compound interactions response."""
+    data = payload.get("data", payload) if isinstance(payload, Mapping) else payload
+    if isinstance(data, Mapping):
+        for key in RESULT_KEYS:
+            if isinstance(data.get(key), list):
+                return data[key]
+        return []
+    return list(data or [])
+
+
+def _as_flag(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in ("true", "1", "yes", "hit")
+    return bool(value)
+
+
+class TTPMatrix:
+    """Gene x compound TTP interactions as sorted COO arrays.
+
+    ``rows``/``cols`` are ``int32`` indices into ``row_ids`` (locus tags) and
+    ``col_ids`` (compounds); ``scores`` holds ``float32`` ``ttp_score`` values
+    (NaN when missing) and ``hits`` the ``hit_calling`` flags.
+    """
+
+    __slots__ = (
+        "row_ids",
+        "col_ids",
+        "rows",
+        "cols",
+        "scores",
+        "hits",
+        "errors",
+        "_row_index",
+        "_col_index",
+    )
+
+    def __init__(
+        self,
+        row_ids: Sequence[str],
+        col_ids: Sequence[str],
+        rows: "np.ndarray",
+        cols: "np.ndarray",
+        scores: "np.ndarray",
+        hits: "np.ndarray",
+    ) -> None:
+        _require_numpy()
+        self.row_ids = np.asarray(row_ids, dtype=str)
+        self.col_ids = np.asarray(col_ids, dtype=str)
+        self.rows = np.asarray(rows, dtype=np.int32)
+        self.cols = np.asarray(cols, dtype=np.int32)
+        self.scores = np.asarray(scores, dtype=np.float32)
+        self.hits = np.asarray(hits, dtype=bool)
+        # Labels whose interactions could not be fetched (see
+        # ``DataPortalClient.ttp_matrix``); not saved with the matrix.
+        self.errors: Dict[str, APIError] = {}
+        self._row_index: Optional[Dict[str, int]] = None
+        self._col_index: Optional[Dict[str, int]] = None
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_interactions(
+        cls,
+        interactions: Iterable[Mapping[str, Any]],
+        *,
+        row_ids: Optional[Iterable[str]] = None,
+        col_ids: Optional[Iterable[str]] = None,
+    ) -> "TTPMatrix":
+        """Build a matrix from TTP interaction dicts.
+
+        ``row_ids``/``col_ids`` fix the order of (and add empty) rows and
+        columns ahead of any labels that only appear in ``interactions``.
+        A pair reported more than once keeps its highest score and is a hit
+        if any report calls it one.
+        """
+        _require_numpy()
+        row_index: Dict[str, int] = {}
+        col_index: Dict[str, int] = {}
+        for label in row_ids or ():
+            row_index.setdefault(str(label), len(row_index))
+        for label in col_ids or ():
+            col_index.setdefault(str(label), len(col_index))
+        rows: List[int] = []
+        cols: List[int] = []
+        scores: List[float] = []
+        hits: List[bool] = []
+        for item in interactions:
+            row, col = item.get(ROW_KEY), item.get(COL_KEY)
+            if row is None or col is None:
+                raise ValueError(
+                    f"TTP interaction has no {ROW_KEY}/{COL_KEY}: {item!r}"
+                )
+            rows.append(row_index.setdefault(str(row), len(row_index)))
+            cols.append(col_index.setdefault(str(col), len(col_index)))
+            score = item.get("ttp_score")
+            scores.append(float("nan") if score is None else float(score))
+            hits.append(_as_flag(item.get("hit_calling")))
+        return cls._from_arrays(
+            list(row_index),
+            list(col_index),
+            np.array(rows, dtype=np.int64),
+            np.array(cols, dtype=np.int64),
+            np.array(scores, dtype=np.float32),
+            np.array(hits, dtype=bool),
+        )
+
+    @classmethod
+    def _from_arrays(
+        cls,
+        row_ids: List[str],
+        col_ids: List[str],
+        rows: "np.ndarray",
+        cols: "np.ndarray",
+        scores: "np.ndarray",
+        hits: "np.ndarray",
+    ) -> "TTPMatrix":
+        width = max(len(col_ids), 1)
+        keys = rows * width + cols
+        # Sort by (row, col, score descending) and keep the first of each pair.
+        order = np.lexsort((-np.nan_to_num(scores, nan=-np.inf), keys))
+        keys, scores, hits = keys[order], scores[order], hits[order]
+        first = np.ones(len(keys), dtype=bool)
+        first[1:] = keys[1:] != keys[:-1]
+        starts = np.flatnonzero(first)
+        if len(starts):
+            hits = np.logical_or.reduceat(hits, starts)
+        rows, cols = np.divmod(keys[first], width)
+        return cls(row_ids, col_ids, rows, cols, scores[first], hits)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the matrix to a compressed ``.npz`` file."""
+        with open(path, "wb") as fh:
+            np.savez_compressed(
+                fh,
+                row_ids=self.row_ids,
+                col_ids=self.col_ids,
+                rows=self.rows,
+                cols=self.cols,
+                scores=self.scores,
+                hits=self.hits,
+            )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "TTPMatrix":
+        """Read a matrix written by :meth:`save`."""
+        _require_numpy()
+        with np.load(path, allow_pickle=False) as arrays:
+            return cls(
+                arrays["row_ids"],
+                arrays["col_ids"],
+                arrays["rows"],
+                arrays["cols"],
+                arrays["scores"],
+                arrays["hits"],
+            )
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.row_ids), len(self.col_ids)
+
+    @property
+    def nnz(self) -> int:
+        """Number of stored (locus tag, compound) pairs."""
+        return len(self.rows)
+
+    def __repr__(self) -> str:
+        return f"TTPMatrix(shape={self.shape}, nnz={self.nnz})"
+
+    def row_index(self, locus_tag: str) -> int:
+        """Return the row of ``locus_tag``; raises ``KeyError`` if unknown."""
+        if self._row_index is None:
+            self._row_index = {str(tag): i for i, tag in enumerate(self.row_ids)}
+        try:
+            return self._row_index[locus_tag]
+        except KeyError:
+            raise KeyError(f"Locus tag {locus_tag!r} is not in the matrix") from None
+
+    def col_index(self, compound: str) -> int:
+        """Return the column of ``compound``; raises ``KeyError`` if unknown."""
+        if self._col_index is None:
+            self._col_index = {str(name): i for i, name in enumerate(self.col_ids)}
+        try:
+            return self._col_index[compound]
+        except KeyError:
+            raise KeyError(f"Compound {compound!r} is not in the matrix") from None
+
+    def indptr(self) -> "np.ndarray":
+        """CSR row pointer: row ``i`` holds entries ``indptr[i]:indptr[i + 1]``."""
+        indptr = np.zeros(len(self.row_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.rows, minlength=len(self.row_ids)), out=indptr[1:])
+        return indptr
+
+    def row(self, locus_tag: str) -> Dict[str, float]:
+        """Compound -> ``ttp_score`` for one locus tag."""
+        indptr = self.indptr()
+        i = self.row_index(locus_tag)
+        entries = slice(indptr[i], indptr[i + 1])
+        return dict(
+            zip(
+                self.col_ids[self.cols[entries]].tolist(),
+                self.scores[entries].tolist(),
+            )
+        )
+
+    def column(self, compound: str) -> Dict[str, float]:
+        """Locus tag -> ``ttp_score`` for one compound."""
+        entries = self.cols == self.col_index(compound)
+        return dict(
+            zip(
+                self.row_ids[self.rows[entries]].tolist(),
+                self.scores[entries].tolist(),
+            )
+        )
+
+    def hits_only(self) -> "TTPMatrix":
+        """Return a matrix keeping only the entries called as hits."""
+        keep = self.hits
+        return TTPMatrix(
+            self.row_ids,
+            self.col_ids,
+            self.rows[keep],
+            self.cols[keep],
+            self.scores[keep],
+            self.hits[keep],
+        )
+
+    def to_dense(
+        self, values: str = "ttp_score", *, fill: float = float("nan")
+    ) -> "np.ndarray":
+        """Dense ``(genes, compounds)`` array of ``"ttp_score"`` or ``"hit_calling"``.
+
+        Missing score pairs hold ``fill``; missing hit flags are ``False``.
+        """
+        if values == "hit_calling":
+            dense = np.zeros(self.shape, dtype=bool)
+            dense[self.rows, self.cols] = self.hits
+            return dense
+        if values != "ttp_score":
+            raise ValueError("values must be 'ttp_score' or 'hit_calling'")
+        dense = np.full(self.shape, fill, dtype=np.float32)
+        dense[self.rows, self.cols] = self.scores
+        return dense
+
+
+__all__ = ["TTPMatrix", "interaction_rows"]
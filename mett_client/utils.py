@@ -2,8 +2,21 @@
 
 from __future__ import annotations
 
+import datetime as dt
 import re
-from typing import Any, Dict, Optional
+import types
+from typing import (
+    Annotated,
+    Any,
+    Dict,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel
 
 from .models import Species
 
@@ -53,4 +66,58 @@ def normalize_species_entry(entry: Any) -> Species:
     }
 
 
-__all__ = ["normalize_params", "normalize_species_entry"]
+def unwrap_annotation(annotation: Any) -> Any:
+    """Strip ``Annotated`` (e.g. ``StrictStr``) and ``Optional`` wrappers."""
+    while True:
+        origin = get_origin(annotation)
+        if origin is Annotated:
+            annotation = get_args(annotation)[0]
+            continue
+        if origin is Union or origin is types.UnionType:
+            members = [a for a in get_args(annotation) if a is not type(None)]
+            if len(members) == 1:
+                annotation = members[0]
+                continue
+        return annotation
+
+
+def classify_annotation(annotation: Any) -> Tuple[str, Any]:
+    """Classify an SDK model field annotation as ``(kind, inner)``.
+
+    ``kind`` is one of bool, int, float, str, datetime, date, list, model or
+    any; ``inner`` is the element annotation for lists (``None`` when
+    unparameterized), the model class for models and the unwrapped
+    annotation otherwise. ``Union[StrictFloat, StrictInt]`` (how the
+    generator spells "number") is reported as ``float``. This is the single
+    mapping behind both the Arrow schemas and the DataFrame dtypes.
+    """
+    annotation = unwrap_annotation(annotation)
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        members = {
+            unwrap_annotation(a) for a in get_args(annotation) if a is not type(None)
+        }
+        return ("float" if members <= {int, float} else "any"), annotation
+    if origin in (list, tuple, set, frozenset):
+        args = get_args(annotation)
+        return "list", (args[0] if args else None)
+    for kind in (bool, int, float, str, dt.datetime, dt.date):
+        if annotation is kind:
+            return kind.__name__, annotation
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return "model", annotation
+    return "any", annotation
+
+
+def annotation_kind(annotation: Any) -> str:
+    """Return the ``kind`` part of :func:`classify_annotation`."""
+    return classify_annotation(annotation)[0]
+
+
+__all__ = [
+    "annotation_kind",
+    "classify_annotation",
+    "normalize_params",
+    "normalize_species_entry",
+    "unwrap_annotation",
+]
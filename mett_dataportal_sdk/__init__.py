@@ -93,182 +93,429 @@ __all__ = [
     "TTPInteractionQuerySchema",
 ]
 
-# import apis into sdk package
-from mett_dataportal_sdk.api.drugs_api import DrugsApi as DrugsApi
-from mett_dataportal_sdk.api.essentiality_api import EssentialityApi as EssentialityApi
-from mett_dataportal_sdk.api.fitness_api import FitnessApi as FitnessApi
-from mett_dataportal_sdk.api.gene_fitness_correlations_api import (
-    GeneFitnessCorrelationsApi as GeneFitnessCorrelationsApi,
-)
-from mett_dataportal_sdk.api.genes_api import GenesApi as GenesApi
-from mett_dataportal_sdk.api.genomes_api import GenomesApi as GenomesApi
-from mett_dataportal_sdk.api.mutant_growth_api import MutantGrowthApi as MutantGrowthApi
-from mett_dataportal_sdk.api.operons_api import OperonsApi as OperonsApi
-from mett_dataportal_sdk.api.orthologs_api import OrthologsApi as OrthologsApi
-from mett_dataportal_sdk.api.pooled_ttp_interactions_api import (
-    PooledTTPInteractionsApi as PooledTTPInteractionsApi,
-)
-from mett_dataportal_sdk.api.protein_protein_interactions_api import (
-    ProteinProteinInteractionsApi as ProteinProteinInteractionsApi,
-)
-from mett_dataportal_sdk.api.proteomics_api import ProteomicsApi as ProteomicsApi
-from mett_dataportal_sdk.api.py_hmmer_results_api import (
-    PyHMMERResultsApi as PyHMMERResultsApi,
-)
-from mett_dataportal_sdk.api.py_hmmer_search_api import (
-    PyHMMERSearchApi as PyHMMERSearchApi,
-)
-from mett_dataportal_sdk.api.reactions_api import ReactionsApi as ReactionsApi
-from mett_dataportal_sdk.api.species_api import SpeciesApi as SpeciesApi
+# Exports are imported lazily (see scripts/lazify-sdk-init.py).
+import importlib
+from typing import TYPE_CHECKING
 
-# import ApiClient
-from mett_dataportal_sdk.api_response import ApiResponse as ApiResponse
-from mett_dataportal_sdk.api_client import ApiClient as ApiClient
-from mett_dataportal_sdk.configuration import Configuration as Configuration
-from mett_dataportal_sdk.exceptions import OpenApiException as OpenApiException
-from mett_dataportal_sdk.exceptions import ApiTypeError as ApiTypeError
-from mett_dataportal_sdk.exceptions import ApiValueError as ApiValueError
-from mett_dataportal_sdk.exceptions import ApiKeyError as ApiKeyError
-from mett_dataportal_sdk.exceptions import ApiAttributeError as ApiAttributeError
-from mett_dataportal_sdk.exceptions import ApiException as ApiException
+if TYPE_CHECKING:
+    from mett_dataportal_sdk.api.drugs_api import DrugsApi as DrugsApi
+    from mett_dataportal_sdk.api.essentiality_api import (
+        EssentialityApi as EssentialityApi,
+    )
+    from mett_dataportal_sdk.api.fitness_api import FitnessApi as FitnessApi
+    from mett_dataportal_sdk.api.gene_fitness_correlations_api import (
+        GeneFitnessCorrelationsApi as GeneFitnessCorrelationsApi,
+    )
+    from mett_dataportal_sdk.api.genes_api import GenesApi as GenesApi
+    from mett_dataportal_sdk.api.genomes_api import GenomesApi as GenomesApi
+    from mett_dataportal_sdk.api.mutant_growth_api import (
+        MutantGrowthApi as MutantGrowthApi,
+    )
+    from mett_dataportal_sdk.api.operons_api import OperonsApi as OperonsApi
+    from mett_dataportal_sdk.api.orthologs_api import OrthologsApi as OrthologsApi
+    from mett_dataportal_sdk.api.pooled_ttp_interactions_api import (
+        PooledTTPInteractionsApi as PooledTTPInteractionsApi,
+    )
+    from mett_dataportal_sdk.api.protein_protein_interactions_api import (
+        ProteinProteinInteractionsApi as ProteinProteinInteractionsApi,
+    )
+    from mett_dataportal_sdk.api.proteomics_api import ProteomicsApi as ProteomicsApi
+    from mett_dataportal_sdk.api.py_hmmer_results_api import (
+        PyHMMERResultsApi as PyHMMERResultsApi,
+    )
+    from mett_dataportal_sdk.api.py_hmmer_search_api import (
+        PyHMMERSearchApi as PyHMMERSearchApi,
+    )
+    from mett_dataportal_sdk.api.reactions_api import ReactionsApi as ReactionsApi
+    from mett_dataportal_sdk.api.species_api import SpeciesApi as SpeciesApi
+    from mett_dataportal_sdk.api_response import ApiResponse as ApiResponse
+    from mett_dataportal_sdk.api_client import ApiClient as ApiClient
+    from mett_dataportal_sdk.configuration import Configuration as Configuration
+    from mett_dataportal_sdk.exceptions import OpenApiException as OpenApiException
+    from mett_dataportal_sdk.exceptions import ApiTypeError as ApiTypeError
+    from mett_dataportal_sdk.exceptions import ApiValueError as ApiValueError
+    from mett_dataportal_sdk.exceptions import ApiKeyError as ApiKeyError
+    from mett_dataportal_sdk.exceptions import ApiAttributeError as ApiAttributeError
+    from mett_dataportal_sdk.exceptions import ApiException as ApiException
+    from mett_dataportal_sdk.models.amr_schema import AMRSchema as AMRSchema
+    from mett_dataportal_sdk.models.contig_schema import ContigSchema as ContigSchema
+    from mett_dataportal_sdk.models.dbx_ref_schema import DBXRefSchema as DBXRefSchema
+    from mett_dataportal_sdk.models.drug_mic_data_schema import (
+        DrugMICDataSchema as DrugMICDataSchema,
+    )
+    from mett_dataportal_sdk.models.drug_mic_search_query_schema import (
+        DrugMICSearchQuerySchema as DrugMICSearchQuerySchema,
+    )
+    from mett_dataportal_sdk.models.drug_metabolism_data_schema import (
+        DrugMetabolismDataSchema as DrugMetabolismDataSchema,
+    )
+    from mett_dataportal_sdk.models.drug_metabolism_search_query_schema import (
+        DrugMetabolismSearchQuerySchema as DrugMetabolismSearchQuerySchema,
+    )
+    from mett_dataportal_sdk.models.essentiality_search_query_schema import (
+        EssentialitySearchQuerySchema as EssentialitySearchQuerySchema,
+    )
+    from mett_dataportal_sdk.models.fitness_search_query_schema import (
+        FitnessSearchQuerySchema as FitnessSearchQuerySchema,
+    )
+    from mett_dataportal_sdk.models.gene_advanced_search_query_schema import (
+        GeneAdvancedSearchQuerySchema as GeneAdvancedSearchQuerySchema,
+    )
+    from mett_dataportal_sdk.models.gene_paginated_response_schema import (
+        GenePaginatedResponseSchema as GenePaginatedResponseSchema,
+    )
+    from mett_dataportal_sdk.models.gene_response_schema import (
+        GeneResponseSchema as GeneResponseSchema,
+    )
+    from mett_dataportal_sdk.models.gene_search_query_schema import (
+        GeneSearchQuerySchema as GeneSearchQuerySchema,
+    )
+    from mett_dataportal_sdk.models.genes_by_genome_query_schema import (
+        GenesByGenomeQuerySchema as GenesByGenomeQuerySchema,
+    )
+    from mett_dataportal_sdk.models.genome_paginated_response_schema import (
+        GenomePaginatedResponseSchema as GenomePaginatedResponseSchema,
+    )
+    from mett_dataportal_sdk.models.genome_response_schema import (
+        GenomeResponseSchema as GenomeResponseSchema,
+    )
+    from mett_dataportal_sdk.models.genome_search_query_schema import (
+        GenomeSearchQuerySchema as GenomeSearchQuerySchema,
+    )
+    from mett_dataportal_sdk.models.genomes_by_isolate_names_query_schema import (
+        GenomesByIsolateNamesQuerySchema as GenomesByIsolateNamesQuerySchema,
+    )
+    from mett_dataportal_sdk.models.get_all_genes_query_schema import (
+        GetAllGenesQuerySchema as GetAllGenesQuerySchema,
+    )
+    from mett_dataportal_sdk.models.get_all_genomes_query_schema import (
+        GetAllGenomesQuerySchema as GetAllGenomesQuerySchema,
+    )
+    from mett_dataportal_sdk.models.mutant_growth_search_query_schema import (
+        MutantGrowthSearchQuerySchema as MutantGrowthSearchQuerySchema,
+    )
+    from mett_dataportal_sdk.models.ppi_all_neighbors_response_schema import (
+        PPIAllNeighborsResponseSchema as PPIAllNeighborsResponseSchema,
+    )
+    from mett_dataportal_sdk.models.ppi_all_neighbors_schema import (
+        PPIAllNeighborsSchema as PPIAllNeighborsSchema,
+    )
+    from mett_dataportal_sdk.models.ppi_interaction_schema import (
+        PPIInteractionSchema as PPIInteractionSchema,
+    )
+    from mett_dataportal_sdk.models.ppi_neighbors_query_schema import (
+        PPINeighborsQuerySchema as PPINeighborsQuerySchema,
+    )
+    from mett_dataportal_sdk.models.ppi_network_properties_query_schema import (
+        PPINetworkPropertiesQuerySchema as PPINetworkPropertiesQuerySchema,
+    )
+    from mett_dataportal_sdk.models.ppi_network_properties_response_schema import (
+        PPINetworkPropertiesResponseSchema as PPINetworkPropertiesResponseSchema,
+    )
+    from mett_dataportal_sdk.models.ppi_network_properties_schema import (
+        PPINetworkPropertiesSchema as PPINetworkPropertiesSchema,
+    )
+    from mett_dataportal_sdk.models.ppi_network_query_schema import (
+        PPINetworkQuerySchema as PPINetworkQuerySchema,
+    )
+    from mett_dataportal_sdk.models.ppi_network_response_schema import (
+        PPINetworkResponseSchema as PPINetworkResponseSchema,
+    )
+    from mett_dataportal_sdk.models.ppi_network_schema import (
+        PPINetworkSchema as PPINetworkSchema,
+    )
+    from mett_dataportal_sdk.models.ppi_score_types_response_schema import (
+        PPIScoreTypesResponseSchema as PPIScoreTypesResponseSchema,
+    )
+    from mett_dataportal_sdk.models.ppi_search_query_schema import (
+        PPISearchQuerySchema as PPISearchQuerySchema,
+    )
+    from mett_dataportal_sdk.models.ppi_search_response_schema import (
+        PPISearchResponseSchema as PPISearchResponseSchema,
+    )
+    from mett_dataportal_sdk.models.paginated_response_schema import (
+        PaginatedResponseSchema as PaginatedResponseSchema,
+    )
+    from mett_dataportal_sdk.models.paginated_strain_drug_mic_response_schema import (
+        PaginatedStrainDrugMICResponseSchema as PaginatedStrainDrugMICResponseSchema,
+    )
+    from mett_dataportal_sdk.models.paginated_strain_drug_metabolism_response_schema import (
+        PaginatedStrainDrugMetabolismResponseSchema as PaginatedStrainDrugMetabolismResponseSchema,
+    )
+    from mett_dataportal_sdk.models.pagination_metadata_schema import (
+        PaginationMetadataSchema as PaginationMetadataSchema,
+    )
+    from mett_dataportal_sdk.models.proteomics_search_query_schema import (
+        ProteomicsSearchQuerySchema as ProteomicsSearchQuerySchema,
+    )
+    from mett_dataportal_sdk.models.reactions_search_query_schema import (
+        ReactionsSearchQuerySchema as ReactionsSearchQuerySchema,
+    )
+    from mett_dataportal_sdk.models.response_status import (
+        ResponseStatus as ResponseStatus,
+    )
+    from mett_dataportal_sdk.models.result_query_schema import (
+        ResultQuerySchema as ResultQuerySchema,
+    )
+    from mett_dataportal_sdk.models.search_request_schema import (
+        SearchRequestSchema as SearchRequestSchema,
+    )
+    from mett_dataportal_sdk.models.species_genome_search_query_schema import (
+        SpeciesGenomeSearchQuerySchema as SpeciesGenomeSearchQuerySchema,
+    )
+    from mett_dataportal_sdk.models.strain_drug_data_response_schema import (
+        StrainDrugDataResponseSchema as StrainDrugDataResponseSchema,
+    )
+    from mett_dataportal_sdk.models.success_response_schema import (
+        SuccessResponseSchema as SuccessResponseSchema,
+    )
+    from mett_dataportal_sdk.models.ttp_compound_interactions_query_schema import (
+        TTPCompoundInteractionsQuerySchema as TTPCompoundInteractionsQuerySchema,
+    )
+    from mett_dataportal_sdk.models.ttp_gene_interactions_query_schema import (
+        TTPGeneInteractionsQuerySchema as TTPGeneInteractionsQuerySchema,
+    )
+    from mett_dataportal_sdk.models.ttp_interaction_query_schema import (
+        TTPInteractionQuerySchema as TTPInteractionQuerySchema,
+    )
 
-# import models into sdk package
-from mett_dataportal_sdk.models.amr_schema import AMRSchema as AMRSchema
-from mett_dataportal_sdk.models.contig_schema import ContigSchema as ContigSchema
-from mett_dataportal_sdk.models.dbx_ref_schema import DBXRefSchema as DBXRefSchema
-from mett_dataportal_sdk.models.drug_mic_data_schema import (
-    DrugMICDataSchema as DrugMICDataSchema,
-)
-from mett_dataportal_sdk.models.drug_mic_search_query_schema import (
-    DrugMICSearchQuerySchema as DrugMICSearchQuerySchema,
-)
-from mett_dataportal_sdk.models.drug_metabolism_data_schema import (
-    DrugMetabolismDataSchema as DrugMetabolismDataSchema,
-)
-from mett_dataportal_sdk.models.drug_metabolism_search_query_schema import (
-    DrugMetabolismSearchQuerySchema as DrugMetabolismSearchQuerySchema,
-)
-from mett_dataportal_sdk.models.essentiality_search_query_schema import (
-    EssentialitySearchQuerySchema as EssentialitySearchQuerySchema,
-)
-from mett_dataportal_sdk.models.fitness_search_query_schema import (
-    FitnessSearchQuerySchema as FitnessSearchQuerySchema,
-)
-from mett_dataportal_sdk.models.gene_advanced_search_query_schema import (
-    GeneAdvancedSearchQuerySchema as GeneAdvancedSearchQuerySchema,
-)
-from mett_dataportal_sdk.models.gene_paginated_response_schema import (
-    GenePaginatedResponseSchema as GenePaginatedResponseSchema,
-)
-from mett_dataportal_sdk.models.gene_response_schema import (
-    GeneResponseSchema as GeneResponseSchema,
-)
-from mett_dataportal_sdk.models.gene_search_query_schema import (
-    GeneSearchQuerySchema as GeneSearchQuerySchema,
-)
-from mett_dataportal_sdk.models.genes_by_genome_query_schema import (
-    GenesByGenomeQuerySchema as GenesByGenomeQuerySchema,
-)
-from mett_dataportal_sdk.models.genome_paginated_response_schema import (
-    GenomePaginatedResponseSchema as GenomePaginatedResponseSchema,
-)
-from mett_dataportal_sdk.models.genome_response_schema import (
-    GenomeResponseSchema as GenomeResponseSchema,
-)
-from mett_dataportal_sdk.models.genome_search_query_schema import (
-    GenomeSearchQuerySchema as GenomeSearchQuerySchema,
-)
-from mett_dataportal_sdk.models.genomes_by_isolate_names_query_schema import (
-    GenomesByIsolateNamesQuerySchema as GenomesByIsolateNamesQuerySchema,
-)
-from mett_dataportal_sdk.models.get_all_genes_query_schema import (
-    GetAllGenesQuerySchema as GetAllGenesQuerySchema,
-)
-from mett_dataportal_sdk.models.get_all_genomes_query_schema import (
-    GetAllGenomesQuerySchema as GetAllGenomesQuerySchema,
-)
-from mett_dataportal_sdk.models.mutant_growth_search_query_schema import (
-    MutantGrowthSearchQuerySchema as MutantGrowthSearchQuerySchema,
-)
-from mett_dataportal_sdk.models.ppi_all_neighbors_response_schema import (
-    PPIAllNeighborsResponseSchema as PPIAllNeighborsResponseSchema,
-)
-from mett_dataportal_sdk.models.ppi_all_neighbors_schema import (
-    PPIAllNeighborsSchema as PPIAllNeighborsSchema,
-)
-from mett_dataportal_sdk.models.ppi_interaction_schema import (
-    PPIInteractionSchema as PPIInteractionSchema,
-)
-from mett_dataportal_sdk.models.ppi_neighbors_query_schema import (
-    PPINeighborsQuerySchema as PPINeighborsQuerySchema,
-)
-from mett_dataportal_sdk.models.ppi_network_properties_query_schema import (
-    PPINetworkPropertiesQuerySchema as PPINetworkPropertiesQuerySchema,
-)
-from mett_dataportal_sdk.models.ppi_network_properties_response_schema import (
-    PPINetworkPropertiesResponseSchema as PPINetworkPropertiesResponseSchema,
-)
-from mett_dataportal_sdk.models.ppi_network_properties_schema import (
-    PPINetworkPropertiesSchema as PPINetworkPropertiesSchema,
-)
-from mett_dataportal_sdk.models.ppi_network_query_schema import (
-    PPINetworkQuerySchema as PPINetworkQuerySchema,
-)
-from mett_dataportal_sdk.models.ppi_network_response_schema import (
-    PPINetworkResponseSchema as PPINetworkResponseSchema,
-)
-from mett_dataportal_sdk.models.ppi_network_schema import (
-    PPINetworkSchema as PPINetworkSchema,
-)
-from mett_dataportal_sdk.models.ppi_score_types_response_schema import (
-    PPIScoreTypesResponseSchema as PPIScoreTypesResponseSchema,
-)
-from mett_dataportal_sdk.models.ppi_search_query_schema import (
-    PPISearchQuerySchema as PPISearchQuerySchema,
-)
-from mett_dataportal_sdk.models.ppi_search_response_schema import (
-    PPISearchResponseSchema as PPISearchResponseSchema,
-)
-from mett_dataportal_sdk.models.paginated_response_schema import (
-    PaginatedResponseSchema as PaginatedResponseSchema,
-)
-from mett_dataportal_sdk.models.paginated_strain_drug_mic_response_schema import (
-    PaginatedStrainDrugMICResponseSchema as PaginatedStrainDrugMICResponseSchema,
-)
-from mett_dataportal_sdk.models.paginated_strain_drug_metabolism_response_schema import (
-    PaginatedStrainDrugMetabolismResponseSchema as PaginatedStrainDrugMetabolismResponseSchema,
-)
-from mett_dataportal_sdk.models.pagination_metadata_schema import (
-    PaginationMetadataSchema as PaginationMetadataSchema,
-)
-from mett_dataportal_sdk.models.proteomics_search_query_schema import (
-    ProteomicsSearchQuerySchema as ProteomicsSearchQuerySchema,
-)
-from mett_dataportal_sdk.models.reactions_search_query_schema import (
-    ReactionsSearchQuerySchema as ReactionsSearchQuerySchema,
-)
-from mett_dataportal_sdk.models.response_status import ResponseStatus as ResponseStatus
-from mett_dataportal_sdk.models.result_query_schema import (
-    ResultQuerySchema as ResultQuerySchema,
-)
-from mett_dataportal_sdk.models.search_request_schema import (
-    SearchRequestSchema as SearchRequestSchema,
-)
-from mett_dataportal_sdk.models.species_genome_search_query_schema import (
-    SpeciesGenomeSearchQuerySchema as SpeciesGenomeSearchQuerySchema,
-)
-from mett_dataportal_sdk.models.strain_drug_data_response_schema import (
-    StrainDrugDataResponseSchema as StrainDrugDataResponseSchema,
-)
-from mett_dataportal_sdk.models.success_response_schema import (
-    SuccessResponseSchema as SuccessResponseSchema,
-)
-from mett_dataportal_sdk.models.ttp_compound_interactions_query_schema import (
-    TTPCompoundInteractionsQuerySchema as TTPCompoundInteractionsQuerySchema,
-)
-from mett_dataportal_sdk.models.ttp_gene_interactions_query_schema import (
-    TTPGeneInteractionsQuerySchema as TTPGeneInteractionsQuerySchema,
-)
-from mett_dataportal_sdk.models.ttp_interaction_query_schema import (
-    TTPInteractionQuerySchema as TTPInteractionQuerySchema,
-)
+_LAZY_IMPORTS = {
+    "DrugsApi": ("mett_dataportal_sdk.api.drugs_api", "DrugsApi"),
+    "EssentialityApi": ("mett_dataportal_sdk.api.essentiality_api", "EssentialityApi"),
+    "FitnessApi": ("mett_dataportal_sdk.api.fitness_api", "FitnessApi"),
+    "GeneFitnessCorrelationsApi": (
+        "mett_dataportal_sdk.api.gene_fitness_correlations_api",
+        "GeneFitnessCorrelationsApi",
+    ),
+    "GenesApi": ("mett_dataportal_sdk.api.genes_api", "GenesApi"),
+    "GenomesApi": ("mett_dataportal_sdk.api.genomes_api", "GenomesApi"),
+    "MutantGrowthApi": ("mett_dataportal_sdk.api.mutant_growth_api", "MutantGrowthApi"),
+    "OperonsApi": ("mett_dataportal_sdk.api.operons_api", "OperonsApi"),
+    "OrthologsApi": ("mett_dataportal_sdk.api.orthologs_api", "OrthologsApi"),
+    "PooledTTPInteractionsApi": (
+        "mett_dataportal_sdk.api.pooled_ttp_interactions_api",
+        "PooledTTPInteractionsApi",
+    ),
+    "ProteinProteinInteractionsApi": (
+        "mett_dataportal_sdk.api.protein_protein_interactions_api",
+        "ProteinProteinInteractionsApi",
+    ),
+    "ProteomicsApi": ("mett_dataportal_sdk.api.proteomics_api", "ProteomicsApi"),
+    "PyHMMERResultsApi": (
+        "mett_dataportal_sdk.api.py_hmmer_results_api",
+        "PyHMMERResultsApi",
+    ),
+    "PyHMMERSearchApi": (
+        "mett_dataportal_sdk.api.py_hmmer_search_api",
+        "PyHMMERSearchApi",
+    ),
+    "ReactionsApi": ("mett_dataportal_sdk.api.reactions_api", "ReactionsApi"),
+    "SpeciesApi": ("mett_dataportal_sdk.api.species_api", "SpeciesApi"),
+    "ApiResponse": ("mett_dataportal_sdk.api_response", "ApiResponse"),
+    "ApiClient": ("mett_dataportal_sdk.api_client", "ApiClient"),
+    "Configuration": ("mett_dataportal_sdk.configuration", "Configuration"),
+    "OpenApiException": ("mett_dataportal_sdk.exceptions", "OpenApiException"),
+    "ApiTypeError": ("mett_dataportal_sdk.exceptions", "ApiTypeError"),
+    "ApiValueError": ("mett_dataportal_sdk.exceptions", "ApiValueError"),
+    "ApiKeyError": ("mett_dataportal_sdk.exceptions", "ApiKeyError"),
+    "ApiAttributeError": ("mett_dataportal_sdk.exceptions", "ApiAttributeError"),
+    "ApiException": ("mett_dataportal_sdk.exceptions", "ApiException"),
+    "AMRSchema": ("mett_dataportal_sdk.models.amr_schema", "AMRSchema"),
+    "ContigSchema": ("mett_dataportal_sdk.models.contig_schema", "ContigSchema"),
+    "DBXRefSchema": ("mett_dataportal_sdk.models.dbx_ref_schema", "DBXRefSchema"),
+    "DrugMICDataSchema": (
+        "mett_dataportal_sdk.models.drug_mic_data_schema",
+        "DrugMICDataSchema",
+    ),
+    "DrugMICSearchQuerySchema": (
+        "mett_dataportal_sdk.models.drug_mic_search_query_schema",
+        "DrugMICSearchQuerySchema",
+    ),
+    "DrugMetabolismDataSchema": (
+        "mett_dataportal_sdk.models.drug_metabolism_data_schema",
+        "DrugMetabolismDataSchema",
+    ),
+    "DrugMetabolismSearchQuerySchema": (
+        "mett_dataportal_sdk.models.drug_metabolism_search_query_schema",
+        "DrugMetabolismSearchQuerySchema",
+    ),
+    "EssentialitySearchQuerySchema": (
+        "mett_dataportal_sdk.models.essentiality_search_query_schema",
+        "EssentialitySearchQuerySchema",
+    ),
+    "FitnessSearchQuerySchema": (
+        "mett_dataportal_sdk.models.fitness_search_query_schema",
+        "FitnessSearchQuerySchema",
+    ),
+    "GeneAdvancedSearchQuerySchema": (
+        "mett_dataportal_sdk.models.gene_advanced_search_query_schema",
+        "GeneAdvancedSearchQuerySchema",
+    ),
+    "GenePaginatedResponseSchema": (
+        "mett_dataportal_sdk.models.gene_paginated_response_schema",
+        "GenePaginatedResponseSchema",
+    ),
+    "GeneResponseSchema": (
+        "mett_dataportal_sdk.models.gene_response_schema",
+        "GeneResponseSchema",
+    ),
+    "GeneSearchQuerySchema": (
+        "mett_dataportal_sdk.models.gene_search_query_schema",
+        "GeneSearchQuerySchema",
+    ),
+    "GenesByGenomeQuerySchema": (
+        "mett_dataportal_sdk.models.genes_by_genome_query_schema",
+        "GenesByGenomeQuerySchema",
+    ),
+    "GenomePaginatedResponseSchema": (
+        "mett_dataportal_sdk.models.genome_paginated_response_schema",
+        "GenomePaginatedResponseSchema",
+    ),
+    "GenomeResponseSchema": (
+        "mett_dataportal_sdk.models.genome_response_schema",
+        "GenomeResponseSchema",
+    ),
+    "GenomeSearchQuerySchema": (
+        "mett_dataportal_sdk.models.genome_search_query_schema",
+        "GenomeSearchQuerySchema",
+    ),
+    "GenomesByIsolateNamesQuerySchema": (
+        "mett_dataportal_sdk.models.genomes_by_isolate_names_query_schema",
+        "GenomesByIsolateNamesQuerySchema",
+    ),
+    "GetAllGenesQuerySchema": (
+        "mett_dataportal_sdk.models.get_all_genes_query_schema",
+        "GetAllGenesQuerySchema",
+    ),
+    "GetAllGenomesQuerySchema": (
+        "mett_dataportal_sdk.models.get_all_genomes_query_schema",
+        "GetAllGenomesQuerySchema",
+    ),
+    "MutantGrowthSearchQuerySchema": (
+        "mett_dataportal_sdk.models.mutant_growth_search_query_schema",
+        "MutantGrowthSearchQuerySchema",
+    ),
+    "PPIAllNeighborsResponseSchema": (
+        "mett_dataportal_sdk.models.ppi_all_neighbors_response_schema",
+        "PPIAllNeighborsResponseSchema",
+    ),
+    "PPIAllNeighborsSchema": (
+        "mett_dataportal_sdk.models.ppi_all_neighbors_schema",
+        "PPIAllNeighborsSchema",
+    ),
+    "PPIInteractionSchema": (
+        "mett_dataportal_sdk.models.ppi_interaction_schema",
+        "PPIInteractionSchema",
+    ),
+    "PPINeighborsQuerySchema": (
+        "mett_dataportal_sdk.models.ppi_neighbors_query_schema",
+        "PPINeighborsQuerySchema",
+    ),
+    "PPINetworkPropertiesQuerySchema": (
+        "mett_dataportal_sdk.models.ppi_network_properties_query_schema",
+        "PPINetworkPropertiesQuerySchema",
+    ),
+    "PPINetworkPropertiesResponseSchema": (
+        "mett_dataportal_sdk.models.ppi_network_properties_response_schema",
+        "PPINetworkPropertiesResponseSchema",
+    ),
+    "PPINetworkPropertiesSchema": (
+        "mett_dataportal_sdk.models.ppi_network_properties_schema",
+        "PPINetworkPropertiesSchema",
+    ),
+    "PPINetworkQuerySchema": (
+        "mett_dataportal_sdk.models.ppi_network_query_schema",
+        "PPINetworkQuerySchema",
+    ),
+    "PPINetworkResponseSchema": (
+        "mett_dataportal_sdk.models.ppi_network_response_schema",
+        "PPINetworkResponseSchema",
+    ),
+    "PPINetworkSchema": (
+        "mett_dataportal_sdk.models.ppi_network_schema",
+        "PPINetworkSchema",
+    ),
+    "PPIScoreTypesResponseSchema": (
+        "mett_dataportal_sdk.models.ppi_score_types_response_schema",
+        "PPIScoreTypesResponseSchema",
+    ),
+    "PPISearchQuerySchema": (
+        "mett_dataportal_sdk.models.ppi_search_query_schema",
+        "PPISearchQuerySchema",
+    ),
+    "PPISearchResponseSchema": (
+        "mett_dataportal_sdk.models.ppi_search_response_schema",
+        "PPISearchResponseSchema",
+    ),
+    "PaginatedResponseSchema": (
+        "mett_dataportal_sdk.models.paginated_response_schema",
+        "PaginatedResponseSchema",
+    ),
+    "PaginatedStrainDrugMICResponseSchema": (
+        "mett_dataportal_sdk.models.paginated_strain_drug_mic_response_schema",
+        "PaginatedStrainDrugMICResponseSchema",
+    ),
+    "PaginatedStrainDrugMetabolismResponseSchema": (
+        "mett_dataportal_sdk.models.paginated_strain_drug_metabolism_response_schema",
+        "PaginatedStrainDrugMetabolismResponseSchema",
+    ),
+    "PaginationMetadataSchema": (
+        "mett_dataportal_sdk.models.pagination_metadata_schema",
+        "PaginationMetadataSchema",
+    ),
+    "ProteomicsSearchQuerySchema": (
+        "mett_dataportal_sdk.models.proteomics_search_query_schema",
+        "ProteomicsSearchQuerySchema",
+    ),
+    "ReactionsSearchQuerySchema": (
+        "mett_dataportal_sdk.models.reactions_search_query_schema",
+        "ReactionsSearchQuerySchema",
+    ),
+    "ResponseStatus": ("mett_dataportal_sdk.models.response_status", "ResponseStatus"),
+    "ResultQuerySchema": (
+        "mett_dataportal_sdk.models.result_query_schema",
+        "ResultQuerySchema",
+    ),
+    "SearchRequestSchema": (
+        "mett_dataportal_sdk.models.search_request_schema",
+        "SearchRequestSchema",
+    ),
+    "SpeciesGenomeSearchQuerySchema": (
+        "mett_dataportal_sdk.models.species_genome_search_query_schema",
+        "SpeciesGenomeSearchQuerySchema",
+    ),
+    "StrainDrugDataResponseSchema": (
+        "mett_dataportal_sdk.models.strain_drug_data_response_schema",
+        "StrainDrugDataResponseSchema",
+    ),
+    "SuccessResponseSchema": (
+        "mett_dataportal_sdk.models.success_response_schema",
+        "SuccessResponseSchema",
+    ),
+    "TTPCompoundInteractionsQuerySchema": (
+        "mett_dataportal_sdk.models.ttp_compound_interactions_query_schema",
+        "TTPCompoundInteractionsQuerySchema",
+    ),
+    "TTPGeneInteractionsQuerySchema": (
+        "mett_dataportal_sdk.models.ttp_gene_interactions_query_schema",
+        "TTPGeneInteractionsQuerySchema",
+    ),
+    "TTPInteractionQuerySchema": (
+        "mett_dataportal_sdk.models.ttp_interaction_query_schema",
+        "TTPInteractionQuerySchema",
+    ),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -1,23 +1,77 @@
 # flake8: noqa
 
-# import apis into api package
-from mett_dataportal_sdk.api.drugs_api import DrugsApi
-from mett_dataportal_sdk.api.essentiality_api import EssentialityApi
-from mett_dataportal_sdk.api.fitness_api import FitnessApi
-from mett_dataportal_sdk.api.gene_fitness_correlations_api import (
-    GeneFitnessCorrelationsApi,
-)
-from mett_dataportal_sdk.api.genes_api import GenesApi
-from mett_dataportal_sdk.api.genomes_api import GenomesApi
-from mett_dataportal_sdk.api.mutant_growth_api import MutantGrowthApi
-from mett_dataportal_sdk.api.operons_api import OperonsApi
-from mett_dataportal_sdk.api.orthologs_api import OrthologsApi
-from mett_dataportal_sdk.api.pooled_ttp_interactions_api import PooledTTPInteractionsApi
-from mett_dataportal_sdk.api.protein_protein_interactions_api import (
-    ProteinProteinInteractionsApi,
-)
-from mett_dataportal_sdk.api.proteomics_api import ProteomicsApi
-from mett_dataportal_sdk.api.py_hmmer_results_api import PyHMMERResultsApi
-from mett_dataportal_sdk.api.py_hmmer_search_api import PyHMMERSearchApi
-from mett_dataportal_sdk.api.reactions_api import ReactionsApi
-from mett_dataportal_sdk.api.species_api import SpeciesApi
+# Exports are imported lazily (see scripts/lazify-sdk-init.py).
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from mett_dataportal_sdk.api.drugs_api import DrugsApi
+    from mett_dataportal_sdk.api.essentiality_api import EssentialityApi
+    from mett_dataportal_sdk.api.fitness_api import FitnessApi
+    from mett_dataportal_sdk.api.gene_fitness_correlations_api import (
+        GeneFitnessCorrelationsApi,
+    )
+    from mett_dataportal_sdk.api.genes_api import GenesApi
+    from mett_dataportal_sdk.api.genomes_api import GenomesApi
+    from mett_dataportal_sdk.api.mutant_growth_api import MutantGrowthApi
+    from mett_dataportal_sdk.api.operons_api import OperonsApi
+    from mett_dataportal_sdk.api.orthologs_api import OrthologsApi
+    from mett_dataportal_sdk.api.pooled_ttp_interactions_api import (
+        PooledTTPInteractionsApi,
+    )
+    from mett_dataportal_sdk.api.protein_protein_interactions_api import (
+        ProteinProteinInteractionsApi,
+    )
+    from mett_dataportal_sdk.api.proteomics_api import ProteomicsApi
+    from mett_dataportal_sdk.api.py_hmmer_results_api import PyHMMERResultsApi
+    from mett_dataportal_sdk.api.py_hmmer_search_api import PyHMMERSearchApi
+    from mett_dataportal_sdk.api.reactions_api import ReactionsApi
+    from mett_dataportal_sdk.api.species_api import SpeciesApi
+
+_LAZY_IMPORTS = {
+    "DrugsApi": ("mett_dataportal_sdk.api.drugs_api", "DrugsApi"),
+    "EssentialityApi": ("mett_dataportal_sdk.api.essentiality_api", "EssentialityApi"),
+    "FitnessApi": ("mett_dataportal_sdk.api.fitness_api", "FitnessApi"),
+    "GeneFitnessCorrelationsApi": (
+        "mett_dataportal_sdk.api.gene_fitness_correlations_api",
+        "GeneFitnessCorrelationsApi",
+    ),
+    "GenesApi": ("mett_dataportal_sdk.api.genes_api", "GenesApi"),
+    "GenomesApi": ("mett_dataportal_sdk.api.genomes_api", "GenomesApi"),
+    "MutantGrowthApi": ("mett_dataportal_sdk.api.mutant_growth_api", "MutantGrowthApi"),
+    "OperonsApi": ("mett_dataportal_sdk.api.operons_api", "OperonsApi"),
+    "OrthologsApi": ("mett_dataportal_sdk.api.orthologs_api", "OrthologsApi"),
+    "PooledTTPInteractionsApi": (
+        "mett_dataportal_sdk.api.pooled_ttp_interactions_api",
+        "PooledTTPInteractionsApi",
+    ),
+    "ProteinProteinInteractionsApi": (
+        "mett_dataportal_sdk.api.protein_protein_interactions_api",
+        "ProteinProteinInteractionsApi",
+    ),
+    "ProteomicsApi": ("mett_dataportal_sdk.api.proteomics_api", "ProteomicsApi"),
+    "PyHMMERResultsApi": (
+        "mett_dataportal_sdk.api.py_hmmer_results_api",
+        "PyHMMERResultsApi",
+    ),
+    "PyHMMERSearchApi": (
+        "mett_dataportal_sdk.api.py_hmmer_search_api",
+        "PyHMMERSearchApi",
+    ),
+    "ReactionsApi": ("mett_dataportal_sdk.api.reactions_api", "ReactionsApi"),
+    "SpeciesApi": ("mett_dataportal_sdk.api.species_api", "SpeciesApi"),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
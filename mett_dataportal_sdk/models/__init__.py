@@ -12,115 +12,330 @@ Generated by OpenAPI Generator (https://openapi-generator.tech)
 Do not edit the class manually.
 """  # noqa: E501
 
-# import models into model package
-from mett_dataportal_sdk.models.amr_schema import AMRSchema
-from mett_dataportal_sdk.models.contig_schema import ContigSchema
-from mett_dataportal_sdk.models.dbx_ref_schema import DBXRefSchema
-from mett_dataportal_sdk.models.drug_mic_data_schema import DrugMICDataSchema
-from mett_dataportal_sdk.models.drug_mic_search_query_schema import (
-    DrugMICSearchQuerySchema,
-)
-from mett_dataportal_sdk.models.drug_metabolism_data_schema import (
-    DrugMetabolismDataSchema,
-)
-from mett_dataportal_sdk.models.drug_metabolism_search_query_schema import (
-    DrugMetabolismSearchQuerySchema,
-)
-from mett_dataportal_sdk.models.essentiality_search_query_schema import (
-    EssentialitySearchQuerySchema,
-)
-from mett_dataportal_sdk.models.fitness_search_query_schema import (
-    FitnessSearchQuerySchema,
-)
-from mett_dataportal_sdk.models.gene_advanced_search_query_schema import (
-    GeneAdvancedSearchQuerySchema,
-)
-from mett_dataportal_sdk.models.gene_paginated_response_schema import (
-    GenePaginatedResponseSchema,
-)
-from mett_dataportal_sdk.models.gene_response_schema import GeneResponseSchema
-from mett_dataportal_sdk.models.gene_search_query_schema import GeneSearchQuerySchema
-from mett_dataportal_sdk.models.genes_by_genome_query_schema import (
-    GenesByGenomeQuerySchema,
-)
-from mett_dataportal_sdk.models.genome_paginated_response_schema import (
-    GenomePaginatedResponseSchema,
-)
-from mett_dataportal_sdk.models.genome_response_schema import GenomeResponseSchema
-from mett_dataportal_sdk.models.genome_search_query_schema import (
-    GenomeSearchQuerySchema,
-)
-from mett_dataportal_sdk.models.genomes_by_isolate_names_query_schema import (
-    GenomesByIsolateNamesQuerySchema,
-)
-from mett_dataportal_sdk.models.get_all_genes_query_schema import GetAllGenesQuerySchema
-from mett_dataportal_sdk.models.get_all_genomes_query_schema import (
-    GetAllGenomesQuerySchema,
-)
-from mett_dataportal_sdk.models.mutant_growth_search_query_schema import (
-    MutantGrowthSearchQuerySchema,
-)
-from mett_dataportal_sdk.models.ppi_all_neighbors_response_schema import (
-    PPIAllNeighborsResponseSchema,
-)
-from mett_dataportal_sdk.models.ppi_all_neighbors_schema import PPIAllNeighborsSchema
-from mett_dataportal_sdk.models.ppi_interaction_schema import PPIInteractionSchema
-from mett_dataportal_sdk.models.ppi_neighbors_query_schema import (
-    PPINeighborsQuerySchema,
-)
-from mett_dataportal_sdk.models.ppi_network_properties_query_schema import (
-    PPINetworkPropertiesQuerySchema,
-)
-from mett_dataportal_sdk.models.ppi_network_properties_response_schema import (
-    PPINetworkPropertiesResponseSchema,
-)
-from mett_dataportal_sdk.models.ppi_network_properties_schema import (
-    PPINetworkPropertiesSchema,
-)
-from mett_dataportal_sdk.models.ppi_network_query_schema import PPINetworkQuerySchema
-from mett_dataportal_sdk.models.ppi_network_response_schema import (
-    PPINetworkResponseSchema,
-)
-from mett_dataportal_sdk.models.ppi_network_schema import PPINetworkSchema
-from mett_dataportal_sdk.models.ppi_score_types_response_schema import (
-    PPIScoreTypesResponseSchema,
-)
-from mett_dataportal_sdk.models.ppi_search_query_schema import PPISearchQuerySchema
-from mett_dataportal_sdk.models.ppi_search_response_schema import (
-    PPISearchResponseSchema,
-)
-from mett_dataportal_sdk.models.paginated_response_schema import PaginatedResponseSchema
-from mett_dataportal_sdk.models.paginated_strain_drug_mic_response_schema import (
-    PaginatedStrainDrugMICResponseSchema,
-)
-from mett_dataportal_sdk.models.paginated_strain_drug_metabolism_response_schema import (
-    PaginatedStrainDrugMetabolismResponseSchema,
-)
-from mett_dataportal_sdk.models.pagination_metadata_schema import (
-    PaginationMetadataSchema,
-)
-from mett_dataportal_sdk.models.proteomics_search_query_schema import (
-    ProteomicsSearchQuerySchema,
-)
-from mett_dataportal_sdk.models.reactions_search_query_schema import (
-    ReactionsSearchQuerySchema,
-)
-from mett_dataportal_sdk.models.response_status import ResponseStatus
-from mett_dataportal_sdk.models.result_query_schema import ResultQuerySchema
-from mett_dataportal_sdk.models.search_request_schema import SearchRequestSchema
-from mett_dataportal_sdk.models.species_genome_search_query_schema import (
-    SpeciesGenomeSearchQuerySchema,
-)
-from mett_dataportal_sdk.models.strain_drug_data_response_schema import (
-    StrainDrugDataResponseSchema,
-)
-from mett_dataportal_sdk.models.success_response_schema import SuccessResponseSchema
-from mett_dataportal_sdk.models.ttp_compound_interactions_query_schema import (
-    TTPCompoundInteractionsQuerySchema,
-)
-from mett_dataportal_sdk.models.ttp_gene_interactions_query_schema import (
-    TTPGeneInteractionsQuerySchema,
-)
-from mett_dataportal_sdk.models.ttp_interaction_query_schema import (
-    TTPInteractionQuerySchema,
-)
+# Exports are imported lazily (see scripts/lazify-sdk-init.py).
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from mett_dataportal_sdk.models.amr_schema import AMRSchema
+    from mett_dataportal_sdk.models.contig_schema import ContigSchema
+    from mett_dataportal_sdk.models.dbx_ref_schema import DBXRefSchema
+    from mett_dataportal_sdk.models.drug_mic_data_schema import DrugMICDataSchema
+    from mett_dataportal_sdk.models.drug_mic_search_query_schema import (
+        DrugMICSearchQuerySchema,
+    )
+    from mett_dataportal_sdk.models.drug_metabolism_data_schema import (
+        DrugMetabolismDataSchema,
+    )
+    from mett_dataportal_sdk.models.drug_metabolism_search_query_schema import (
+        DrugMetabolismSearchQuerySchema,
+    )
+    from mett_dataportal_sdk.models.essentiality_search_query_schema import (
+        EssentialitySearchQuerySchema,
+    )
+    from mett_dataportal_sdk.models.fitness_search_query_schema import (
+        FitnessSearchQuerySchema,
+    )
+    from mett_dataportal_sdk.models.gene_advanced_search_query_schema import (
+        GeneAdvancedSearchQuerySchema,
+    )
+    from mett_dataportal_sdk.models.gene_paginated_response_schema import (
+        GenePaginatedResponseSchema,
+    )
+    from mett_dataportal_sdk.models.gene_response_schema import GeneResponseSchema
+    from mett_dataportal_sdk.models.gene_search_query_schema import (
+        GeneSearchQuerySchema,
+    )
+    from mett_dataportal_sdk.models.genes_by_genome_query_schema import (
+        GenesByGenomeQuerySchema,
+    )
+    from mett_dataportal_sdk.models.genome_paginated_response_schema import (
+        GenomePaginatedResponseSchema,
+    )
+    from mett_dataportal_sdk.models.genome_response_schema import GenomeResponseSchema
+    from mett_dataportal_sdk.models.genome_search_query_schema import (
+        GenomeSearchQuerySchema,
+    )
+    from mett_dataportal_sdk.models.genomes_by_isolate_names_query_schema import (
+        GenomesByIsolateNamesQuerySchema,
+    )
+    from mett_dataportal_sdk.models.get_all_genes_query_schema import (
+        GetAllGenesQuerySchema,
+    )
+    from mett_dataportal_sdk.models.get_all_genomes_query_schema import (
+        GetAllGenomesQuerySchema,
+    )
+    from mett_dataportal_sdk.models.mutant_growth_search_query_schema import (
+        MutantGrowthSearchQuerySchema,
+    )
+    from mett_dataportal_sdk.models.ppi_all_neighbors_response_schema import (
+        PPIAllNeighborsResponseSchema,
+    )
+    from mett_dataportal_sdk.models.ppi_all_neighbors_schema import (
+        PPIAllNeighborsSchema,
+    )
+    from mett_dataportal_sdk.models.ppi_interaction_schema import PPIInteractionSchema
+    from mett_dataportal_sdk.models.ppi_neighbors_query_schema import (
+        PPINeighborsQuerySchema,
+    )
+    from mett_dataportal_sdk.models.ppi_network_properties_query_schema import (
+        PPINetworkPropertiesQuerySchema,
+    )
+    from mett_dataportal_sdk.models.ppi_network_properties_response_schema import (
+        PPINetworkPropertiesResponseSchema,
+    )
+    from mett_dataportal_sdk.models.ppi_network_properties_schema import (
+        PPINetworkPropertiesSchema,
+    )
+    from mett_dataportal_sdk.models.ppi_network_query_schema import (
+        PPINetworkQuerySchema,
+    )
+    from mett_dataportal_sdk.models.ppi_network_response_schema import (
+        PPINetworkResponseSchema,
+    )
+    from mett_dataportal_sdk.models.ppi_network_schema import PPINetworkSchema
+    from mett_dataportal_sdk.models.ppi_score_types_response_schema import (
+        PPIScoreTypesResponseSchema,
+    )
+    from mett_dataportal_sdk.models.ppi_search_query_schema import PPISearchQuerySchema
+    from mett_dataportal_sdk.models.ppi_search_response_schema import (
+        PPISearchResponseSchema,
+    )
+    from mett_dataportal_sdk.models.paginated_response_schema import (
+        PaginatedResponseSchema,
+    )
+    from mett_dataportal_sdk.models.paginated_strain_drug_mic_response_schema import (
+        PaginatedStrainDrugMICResponseSchema,
+    )
+    from mett_dataportal_sdk.models.paginated_strain_drug_metabolism_response_schema import (
+        PaginatedStrainDrugMetabolismResponseSchema,
+    )
+    from mett_dataportal_sdk.models.pagination_metadata_schema import (
+        PaginationMetadataSchema,
+    )
+    from mett_dataportal_sdk.models.proteomics_search_query_schema import (
+        ProteomicsSearchQuerySchema,
+    )
+    from mett_dataportal_sdk.models.reactions_search_query_schema import (
+        ReactionsSearchQuerySchema,
+    )
+    from mett_dataportal_sdk.models.response_status import ResponseStatus
+    from mett_dataportal_sdk.models.result_query_schema import ResultQuerySchema
+    from mett_dataportal_sdk.models.search_request_schema import SearchRequestSchema
+    from mett_dataportal_sdk.models.species_genome_search_query_schema import (
+        SpeciesGenomeSearchQuerySchema,
+    )
+    from mett_dataportal_sdk.models.strain_drug_data_response_schema import (
+        StrainDrugDataResponseSchema,
+    )
+    from mett_dataportal_sdk.models.success_response_schema import SuccessResponseSchema
+    from mett_dataportal_sdk.models.ttp_compound_interactions_query_schema import (
+        TTPCompoundInteractionsQuerySchema,
+    )
+    from mett_dataportal_sdk.models.ttp_gene_interactions_query_schema import (
+        TTPGeneInteractionsQuerySchema,
+    )
+    from mett_dataportal_sdk.models.ttp_interaction_query_schema import (
+        TTPInteractionQuerySchema,
+    )
+
+_LAZY_IMPORTS = {
+    "AMRSchema": ("mett_dataportal_sdk.models.amr_schema", "AMRSchema"),
+    "ContigSchema": ("mett_dataportal_sdk.models.contig_schema", "ContigSchema"),
+    "DBXRefSchema": ("mett_dataportal_sdk.models.dbx_ref_schema", "DBXRefSchema"),
+    "DrugMICDataSchema": (
+        "mett_dataportal_sdk.models.drug_mic_data_schema",
+        "DrugMICDataSchema",
+    ),
+    "DrugMICSearchQuerySchema": (
+        "mett_dataportal_sdk.models.drug_mic_search_query_schema",
+        "DrugMICSearchQuerySchema",
+    ),
+    "DrugMetabolismDataSchema": (
+        "mett_dataportal_sdk.models.drug_metabolism_data_schema",
+        "DrugMetabolismDataSchema",
+    ),
+    "DrugMetabolismSearchQuerySchema": (
+        "mett_dataportal_sdk.models.drug_metabolism_search_query_schema",
+        "DrugMetabolismSearchQuerySchema",
+    ),
+    "EssentialitySearchQuerySchema": (
+        "mett_dataportal_sdk.models.essentiality_search_query_schema",
+        "EssentialitySearchQuerySchema",
+    ),
+    "FitnessSearchQuerySchema": (
+        "mett_dataportal_sdk.models.fitness_search_query_schema",
+        "FitnessSearchQuerySchema",
+    ),
+    "GeneAdvancedSearchQuerySchema": (
+        "mett_dataportal_sdk.models.gene_advanced_search_query_schema",
+        "GeneAdvancedSearchQuerySchema",
+    ),
+    "GenePaginatedResponseSchema": (
+        "mett_dataportal_sdk.models.gene_paginated_response_schema",
+        "GenePaginatedResponseSchema",
+    ),
+    "GeneResponseSchema": (
+        "mett_dataportal_sdk.models.gene_response_schema",
+        "GeneResponseSchema",
+    ),
+    "GeneSearchQuerySchema": (
+        "mett_dataportal_sdk.models.gene_search_query_schema",
+        "GeneSearchQuerySchema",
+    ),
+    "GenesByGenomeQuerySchema": (
+        "mett_dataportal_sdk.models.genes_by_genome_query_schema",
+        "GenesByGenomeQuerySchema",
+    ),
+    "GenomePaginatedResponseSchema": (
+        "mett_dataportal_sdk.models.genome_paginated_response_schema",
+        "GenomePaginatedResponseSchema",
+    ),
+    "GenomeResponseSchema": (
+        "mett_dataportal_sdk.models.genome_response_schema",
+        "GenomeResponseSchema",
+    ),
+    "GenomeSearchQuerySchema": (
+        "mett_dataportal_sdk.models.genome_search_query_schema",
+        "GenomeSearchQuerySchema",
+    ),
+    "GenomesByIsolateNamesQuerySchema": (
+        "mett_dataportal_sdk.models.genomes_by_isolate_names_query_schema",
+        "GenomesByIsolateNamesQuerySchema",
+    ),
+    "GetAllGenesQuerySchema": (
+        "mett_dataportal_sdk.models.get_all_genes_query_schema",
+        "GetAllGenesQuerySchema",
+    ),
+    "GetAllGenomesQuerySchema": (
+        "mett_dataportal_sdk.models.get_all_genomes_query_schema",
+        "GetAllGenomesQuerySchema",
+    ),
+    "MutantGrowthSearchQuerySchema": (
+        "mett_dataportal_sdk.models.mutant_growth_search_query_schema",
+        "MutantGrowthSearchQuerySchema",
+    ),
+    "PPIAllNeighborsResponseSchema": (
+        "mett_dataportal_sdk.models.ppi_all_neighbors_response_schema",
+        "PPIAllNeighborsResponseSchema",
+    ),
+    "PPIAllNeighborsSchema": (
+        "mett_dataportal_sdk.models.ppi_all_neighbors_schema",
+        "PPIAllNeighborsSchema",
+    ),
+    "PPIInteractionSchema": (
+        "mett_dataportal_sdk.models.ppi_interaction_schema",
+        "PPIInteractionSchema",
+    ),
+    "PPINeighborsQuerySchema": (
+        "mett_dataportal_sdk.models.ppi_neighbors_query_schema",
+        "PPINeighborsQuerySchema",
+    ),
+    "PPINetworkPropertiesQuerySchema": (
+        "mett_dataportal_sdk.models.ppi_network_properties_query_schema",
+        "PPINetworkPropertiesQuerySchema",
+    ),
+    "PPINetworkPropertiesResponseSchema": (
+        "mett_dataportal_sdk.models.ppi_network_properties_response_schema",
+        "PPINetworkPropertiesResponseSchema",
+    ),
+    "PPINetworkPropertiesSchema": (
+        "mett_dataportal_sdk.models.ppi_network_properties_schema",
+        "PPINetworkPropertiesSchema",
+    ),
+    "PPINetworkQuerySchema": (
+        "mett_dataportal_sdk.models.ppi_network_query_schema",
+        "PPINetworkQuerySchema",
+    ),
+    "PPINetworkResponseSchema": (
+        "mett_dataportal_sdk.models.ppi_network_response_schema",
+        "PPINetworkResponseSchema",
+    ),
+    "PPINetworkSchema": (
+        "mett_dataportal_sdk.models.ppi_network_schema",
+        "PPINetworkSchema",
+    ),
+    "PPIScoreTypesResponseSchema": (
+        "mett_dataportal_sdk.models.ppi_score_types_response_schema",
+        "PPIScoreTypesResponseSchema",
+    ),
+    "PPISearchQuerySchema": (
+        "mett_dataportal_sdk.models.ppi_search_query_schema",
+        "PPISearchQuerySchema",
+    ),
+    "PPISearchResponseSchema": (
+        "mett_dataportal_sdk.models.ppi_search_response_schema",
+        "PPISearchResponseSchema",
+    ),
+    "PaginatedResponseSchema": (
+        "mett_dataportal_sdk.models.paginated_response_schema",
+        "PaginatedResponseSchema",
+    ),
+    "PaginatedStrainDrugMICResponseSchema": (
+        "mett_dataportal_sdk.models.paginated_strain_drug_mic_response_schema",
+        "PaginatedStrainDrugMICResponseSchema",
+    ),
+    "PaginatedStrainDrugMetabolismResponseSchema": (
+        "mett_dataportal_sdk.models.paginated_strain_drug_metabolism_response_schema",
+        "PaginatedStrainDrugMetabolismResponseSchema",
+    ),
+    "PaginationMetadataSchema": (
+        "mett_dataportal_sdk.models.pagination_metadata_schema",
+        "PaginationMetadataSchema",
+    ),
+    "ProteomicsSearchQuerySchema": (
+        "mett_dataportal_sdk.models.proteomics_search_query_schema",
+        "ProteomicsSearchQuerySchema",
+    ),
+    "ReactionsSearchQuerySchema": (
+        "mett_dataportal_sdk.models.reactions_search_query_schema",
+        "ReactionsSearchQuerySchema",
+    ),
+    "ResponseStatus": ("mett_dataportal_sdk.models.response_status", "ResponseStatus"),
+    "ResultQuerySchema": (
+        "mett_dataportal_sdk.models.result_query_schema",
+        "ResultQuerySchema",
+    ),
+    "SearchRequestSchema": (
+        "mett_dataportal_sdk.models.search_request_schema",
+        "SearchRequestSchema",
+    ),
+    "SpeciesGenomeSearchQuerySchema": (
+        "mett_dataportal_sdk.models.species_genome_search_query_schema",
+        "SpeciesGenomeSearchQuerySchema",
+    ),
+    "StrainDrugDataResponseSchema": (
+        "mett_dataportal_sdk.models.strain_drug_data_response_schema",
+        "StrainDrugDataResponseSchema",
+    ),
+    "SuccessResponseSchema": (
+        "mett_dataportal_sdk.models.success_response_schema",
+        "SuccessResponseSchema",
+    ),
+    "TTPCompoundInteractionsQuerySchema": (
+        "mett_dataportal_sdk.models.ttp_compound_interactions_query_schema",
+        "TTPCompoundInteractionsQuerySchema",
+    ),
+    "TTPGeneInteractionsQuerySchema": (
+        "mett_dataportal_sdk.models.ttp_gene_interactions_query_schema",
+        "TTPGeneInteractionsQuerySchema",
+    ),
+    "TTPInteractionQuerySchema": (
+        "mett_dataportal_sdk.models.ttp_interaction_query_schema",
+        "TTPInteractionQuerySchema",
+    ),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Compare server-side and local PPI network property computation.
+
+Times ``PPIGraph.properties`` (degree distribution, clustering, component
+sizes) on a synthetic scale-free-ish network, or on a graph saved by
+``mett ppi network --save-graph`` when ``--graph`` is given. With ``--server``
+it also times ``DataPortalClient.ppi_network_properties`` against the
+configured API, once with ``source="server"`` and once with
+``source="local"`` (network download plus local computation).
+
+Usage::
+
+    python scripts/bench-network-properties.py [--nodes N] [--edges M]
+    python scripts/bench-network-properties.py --graph bu_ds.npz
+    python scripts/bench-network-properties.py --server --score-type ds_score \\
+        --species BU --score-threshold 0.8
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np  # type: ignore[import]
+
+from mett_client import DataPortalClient
+from mett_client.graph import PPIGraph
+
+
+def synthetic_graph(nodes: int, edges: int, seed: int = 0) -> PPIGraph:
+    """Random graph whose endpoints follow a heavy-tailed degree profile."""
+    rng = np.random.default_rng(seed)
+    weights = 1.0 / np.arange(1, nodes + 1) ** 0.8
+    weights /= weights.sum()
+    src = rng.choice(nodes, size=edges, p=weights).astype(np.int32)
+    dst = rng.choice(nodes, size=edges, p=weights).astype(np.int32)
+    scores = rng.random(edges, dtype=np.float32)
+    node_ids = [f"P{i:06d}" for i in range(nodes)]
+    return PPIGraph._from_arrays(node_ids, src, dst, scores)
+
+
+def timed(label: str, func):  # type: ignore[no-untyped-def]
+    started = time.perf_counter()
+    result = func()
+    print(f"{label:<28} {(time.perf_counter() - started) * 1000:10.1f} ms")
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=5000)
+    parser.add_argument("--edges", type=int, default=200_000)
+    parser.add_argument("--graph", help="Graph saved with `ppi network --save-graph`")
+    parser.add_argument("--server", action="store_true", help="Also time the API")
+    parser.add_argument("--score-type", default="ds_score")
+    parser.add_argument("--species")
+    parser.add_argument("--score-threshold", type=float)
+    args = parser.parse_args()
+
+    if args.graph:
+        graph = timed("load graph", lambda: PPIGraph.load(args.graph))
+    else:
+        graph = timed(
+            "build synthetic graph", lambda: synthetic_graph(args.nodes, args.edges)
+        )
+    print(graph)
+    triangles = timed("triangles", graph.triangles)
+    timed("clustering", graph.clustering)
+    timed("component labels", graph.component_labels)
+    props = timed("properties (all metrics)", graph.properties)
+    print(
+        f"triangles={int(triangles.sum()) // 3} "
+        f"avg_clustering={props['avg_clustering_coefficient']:.4f} "
+        f"components={len(props['component_sizes'])}"
+    )
+
+    if args.server:
+        client = DataPortalClient()
+        query = {
+            "score_threshold": args.score_threshold,
+            "species_acronym": args.species,
+        }
+        for source in ("server", "local"):
+            timed(
+                f"client source={source}",
+                lambda: client.ppi_network_properties(
+                    args.score_type, source=source, **query
+                ),
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Compare per-page CPU time of validated and raw (``validate=False``) responses.
+
+Serves a synthetic 1000-row gene page from an in-memory transport adapter and
+fetches it repeatedly through ``DataPortalClient.get_genome_genes``, once with
+the default pydantic validation and once in raw mode. No network is involved,
+so the numbers isolate client-side decoding cost.
+
+Usage: ``python scripts/bench-raw-mode.py [ROWS] [ROUNDS]``
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+
+import requests  # type: ignore[import]
+from requests.adapters import BaseAdapter  # type: ignore[import]
+
+from mett_client import Config, DataPortalClient
+
+
+def gene(n: int) -> dict:
+    return {
+        "locus_tag": f"BU_ATCC8492_{n:05d}",
+        "gene_name": f"gene{n}",
+        "alias": [f"alias{n}"],
+        "product": "hypothetical protein",
+        "product_source": "Prokka",
+        "start_position": n * 1000,
+        "end_position": n * 1000 + 900,
+        "seq_id": "contig_1",
+        "isolate_name": "BU_ATCC8492",
+        "species_scientific_name": "Phocaeicola vulgatus",
+        "species_acronym": "BU",
+        "uniprot_id": f"A0A{n:06d}",
+        "essentiality": "not_essential",
+        "cog_funcats": ["S"],
+        "cog_id": ["COG0001"],
+        "kegg": ["K00001"],
+        "pfam": ["PF00001"],
+        "interpro": ["IPR000001"],
+        "ec_number": "1.1.1.1",
+        "dbxref": [{"db": "UniProt", "ref": f"A0A{n:06d}"}],
+        "ontology_terms": [{"id": "GO:0008150", "label": "biological_process"}],
+        "has_amr_info": False,
+        "has_proteomics": True,
+        "has_fitness": False,
+        "has_mutant_growth": False,
+        "has_reactions": False,
+        "feature_type": "CDS",
+    }
+
+
+class PageAdapter(BaseAdapter):
+    def __init__(self, body: bytes) -> None:
+        super().__init__()
+        self.body = body
+
+    def send(self, request, **kwargs):  # type: ignore[override]
+        response = requests.Response()
+        response.status_code = 200
+        response.url = request.url
+        response.headers["Content-Type"] = "application/json"
+        response._content = self.body
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def per_page_ms(body: bytes, rounds: int, *, validate: bool) -> float:
+    client = DataPortalClient(
+        config=Config(base_url="https://bench"), validate=validate
+    )
+    client._http.mount("https://", PageAdapter(body))
+    client.get_genome_genes("BU_ATCC8492")  # warm up: build the SDK and models
+    started = time.process_time()
+    for _ in range(rounds):
+        client.get_genome_genes("BU_ATCC8492")
+    return (time.process_time() - started) / rounds * 1000
+
+
+def main() -> int:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    body = json.dumps(
+        {
+            "timestamp": "2024-01-01T00:00:00Z",
+            "data": [gene(n) for n in range(rows)],
+            "pagination": {
+                "page_number": 1,
+                "num_pages": 1,
+                "has_previous": False,
+                "has_next": False,
+                "total_results": rows,
+                "per_page": rows,
+            },
+        }
+    ).encode()
+
+    validated = per_page_ms(body, rounds, validate=True)
+    raw = per_page_ms(body, rounds, validate=False)
+    print(f"{rows} genes/page, {rounds} rounds, {len(body) / 1024:.0f} KiB/page")
+    print(f"validated: {validated:8.2f} ms CPU/page")
+    print(f"raw:       {raw:8.2f} ms CPU/page ({validated / raw:.1f}x faster)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -57,3 +57,6 @@ rm -rf "${ROOT_DIR}/${PACKAGE_NAME}" "${ROOT_DIR}/.openapi-generator"
 mv "${OUTPUT_DIR}/${PACKAGE_NAME}" "${ROOT_DIR}/${PACKAGE_NAME}"
 mv "${OUTPUT_DIR}/.openapi-generator" "${ROOT_DIR}/.openapi-generator"
 rm -rf "${OUTPUT_DIR}"
+
+# Keep `import mett_dataportal_sdk` cheap: load APIs and models on first use.
+python3 "${ROOT_DIR}/scripts/lazify-sdk-init.py" "${ROOT_DIR}/${PACKAGE_NAME}"
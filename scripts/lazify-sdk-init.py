@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Rewrite the generated SDK ``__init__`` modules to import their exports lazily.
+
+openapi-generator emits package ``__init__`` files that eagerly import every API
+class and model, which makes ``import mett_dataportal_sdk`` (and therefore the
+``mett`` CLI) pay for building hundreds of pydantic models up front. This script
+replaces those imports with a module-level ``__getattr__`` that imports each
+name on first access. The original imports are kept under ``TYPE_CHECKING`` so
+type checkers and IDEs still see them.
+
+Run after ``scripts/generate-sdk.sh`` (which calls it automatically). The
+rewrite is idempotent.
+"""
+
+from __future__ import annotations
+
+import ast
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = ROOT / "mett_dataportal_sdk"
+TARGETS = ("__init__.py", "api/__init__.py", "models/__init__.py")
+MARKER = "# Exports are imported lazily (see scripts/lazify-sdk-init.py)."
+
+TEMPLATE = """{marker}
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+{type_checking}
+
+_LAZY_IMPORTS = {{
+{mapping}
+}}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+"""
+
+
+def lazify(path: Path) -> bool:
+    source = path.read_text()
+    if MARKER in source:
+        return False
+
+    lines = source.splitlines()
+    tree = ast.parse(source)
+    mapping = {}
+    statements = []
+    drop = set()
+    for node in tree.body:
+        if not (
+            isinstance(node, ast.ImportFrom)
+            and node.module
+            and node.module.startswith("mett_dataportal_sdk")
+        ):
+            continue
+        for alias in node.names:
+            mapping[alias.asname or alias.name] = (node.module, alias.name)
+        statements.append("\n".join(lines[node.lineno - 1 : node.end_lineno]))
+        drop.update(range(node.lineno - 1, node.end_lineno))
+
+    if not mapping:
+        return False
+
+    first = min(drop)
+    kept_before = lines[:first]
+    kept_after = [
+        line
+        for i, line in enumerate(lines[first:], start=first)
+        if i not in drop and not line.startswith("# import ")
+    ]
+    block = TEMPLATE.format(
+        marker=MARKER,
+        type_checking="\n".join(
+            "    " + line for stmt in statements for line in stmt.splitlines()
+        ),
+        mapping="\n".join(
+            f'    "{name}": ("{module}", "{attr}"),'
+            for name, (module, attr) in mapping.items()
+        ),
+    )
+    while kept_before and kept_before[-1].startswith("# import "):
+        kept_before.pop()
+    rewritten = "\n".join(kept_before + [block.rstrip("\n")] + kept_after)
+    path.write_text(rewritten.rstrip("\n") + "\n")
+    return True
+
+
+def main() -> int:
+    package = Path(sys.argv[1]) if len(sys.argv) > 1 else PACKAGE
+    for target in TARGETS:
+        path = package / target
+        if lazify(path):
+            print(f"Lazified {path.relative_to(package.parent)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
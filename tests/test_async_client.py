@@ -0,0 +1,196 @@
+"""Tests for AsyncDataPortalClient using an in-process httpx transport."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Dict, List
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from mett_client import AsyncDataPortalClient, Config
+from mett_client.exceptions import APIError
+
+
+def _gene_page(page: int, num_pages: int, per_page: int = 2) -> Dict[str, Any]:
+    start = (page - 1) * per_page
+    return {
+        "status": "success",
+        "timestamp": "2024-01-01T00:00:00Z",
+        "data": [
+            {"locus_tag": f"BU_ATCC8492_{n:05d}", "isolate_name": "BU_ATCC8492"}
+            for n in range(start, start + per_page)
+        ],
+        "pagination": {
+            "page_number": page,
+            "num_pages": num_pages,
+            "has_previous": page > 1,
+            "has_next": page < num_pages,
+            "total_results": num_pages * per_page,
+            "per_page": per_page,
+        },
+    }
+
+
+def _client(handler, *, config: Any = None, **kwargs: Any) -> AsyncDataPortalClient:
+    transport = httpx.MockTransport(handler)
+    return AsyncDataPortalClient(
+        config=config or Config(base_url="http://portal.test", retry_backoff=0),
+        http_client=httpx.AsyncClient(transport=transport),
+        **kwargs,
+    )
+
+
+def test_get_genome_genes_uses_sdk_serialization() -> None:
+    seen: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json=_gene_page(1, 1))
+
+    async def run():
+        async with _client(handler) as client:
+            return await client.get_genome_genes("BU_ATCC8492", per_page=2)
+
+    result = asyncio.run(run())
+
+    assert [gene.locus_tag for gene in result.items] == [
+        "BU_ATCC8492_00000",
+        "BU_ATCC8492_00001",
+    ]
+    assert result.pagination.num_pages == 1
+    assert seen[0].url.path == "/api/genomes/BU_ATCC8492/genes"
+    assert seen[0].url.params["per_page"] == "2"
+
+
+def test_iter_genome_genes_prefetches_in_order() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", "1"))
+        return httpx.Response(200, json=_gene_page(page, 5))
+
+    async def run():
+        async with _client(handler) as client:
+            return [
+                gene.locus_tag
+                async for gene in client.iter_genome_genes(
+                    "BU_ATCC8492", per_page=2, max_workers=3
+                )
+            ]
+
+    tags = asyncio.run(run())
+
+    assert tags == [f"BU_ATCC8492_{n:05d}" for n in range(10)]
+
+
+def test_per_host_concurrency_is_capped() -> None:
+    active = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return httpx.Response(200, json={"ok": True})
+
+    async def run():
+        async with _client(handler, max_per_host=2) as client:
+            await asyncio.gather(
+                *(client.raw_request("GET", "/api/health") for _ in range(8))
+            )
+
+    asyncio.run(run())
+
+    assert peak == 2
+
+
+def test_error_status_raises_api_error() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503, content=json.dumps({"detail": "down"}))
+
+    async def run():
+        async with _client(handler) as client:
+            await client.search_genes(query="dnaA")
+
+    with pytest.raises(APIError) as excinfo:
+        asyncio.run(run())
+    assert excinfo.value.status_code == 503
+
+
+def test_transient_errors_are_retried() -> None:
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise httpx.ConnectError("refused", request=request)
+        if calls == 2:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200, json=_gene_page(1, 1))
+
+    async def run():
+        async with _client(handler) as client:
+            result = await client.get_genome_genes("BU_ATCC8492")
+            return result, client.stats.retries
+
+    result, retries = asyncio.run(run())
+
+    assert calls == 3
+    assert retries == 2
+    assert len(result.items) == 2
+
+
+def test_post_is_not_retried_on_status() -> None:
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(503)
+
+    async def run():
+        async with _client(handler) as client:
+            await client.raw_request("POST", "/api/pyhmmer/search", json_body={})
+
+    with pytest.raises(APIError):
+        asyncio.run(run())
+    assert calls == 1
+
+
+def test_rate_limit_spaces_requests() -> None:
+    config = Config(base_url="http://portal.test", rate_limit=50, rate_limit_burst=1)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"ok": True})
+
+    async def run():
+        async with _client(handler, config=config) as client:
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            for _ in range(4):
+                await client.raw_request("GET", "/api/health")
+            return loop.time() - started
+
+    # one token up front, then one every 20 ms
+    assert asyncio.run(run()) >= 0.05
+
+
+def test_raw_mode_returns_decoded_json() -> None:
+    page = _gene_page(1, 1)
+    page["data"][0]["start_position"] = "not-an-int"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=page)
+
+    async def run():
+        async with _client(handler, validate=False) as client:
+            return await client.get_genome_genes("BU_ATCC8492")
+
+    result = asyncio.run(run())
+
+    assert result.items == page["data"]
+    assert result.pagination.has_next is False
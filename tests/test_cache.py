@@ -0,0 +1,155 @@
+"""Tests for the on-disk HTTP response cache."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import List
+
+import requests  # type: ignore[import]
+from requests.adapters import BaseAdapter  # type: ignore[import]
+
+from mett_client import Config, DataPortalClient
+from mett_client.cache import CachedSession, ResponseCache
+from mett_client.config import get_config
+
+BASE = "https://example.org"
+
+
+class FakeAdapter(BaseAdapter):
+    """Serve canned JSON bodies and record the requests that reached the wire."""
+
+    def __init__(self, etag: str | None = None) -> None:
+        super().__init__()
+        self.etag = etag
+        self.requests: List[requests.PreparedRequest] = []
+
+    def send(self, request, **kwargs):  # type: ignore[override]
+        self.requests.append(request)
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        if self.etag and request.headers.get("If-None-Match") == self.etag:
+            response.status_code = 304
+            response._content = b""
+            return response
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        if self.etag:
+            response.headers["ETag"] = self.etag
+        response._content = json.dumps({"n": len(self.requests)}).encode()
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def _session(tmp_path, *, refresh: bool = False, **kwargs) -> tuple:
+    cache = ResponseCache(tmp_path, max_bytes=kwargs.pop("max_bytes", 10_000), **kwargs)
+    session = CachedSession(cache, refresh=refresh)
+    adapter = FakeAdapter()
+    session.mount("https://", adapter)
+    return session, adapter
+
+
+def test_key_normalizes_param_order_and_none() -> None:
+    a = ResponseCache.key("get", f"{BASE}/api/x?b=2", {"a": 1, "c": None})
+    b = ResponseCache.key("GET", f"{BASE}/api/x", [("a", "1"), ("b", "2")])
+    assert a == b
+    assert a != ResponseCache.key("GET", f"{BASE}/api/x", {"a": 1}, "text/csv")
+
+
+def test_reference_endpoint_served_from_cache(tmp_path) -> None:
+    session, adapter = _session(tmp_path)
+
+    first = session.get(f"{BASE}/api/species/", params={"format": "json"})
+    second = session.get(f"{BASE}/api/species/", params={"format": "json"})
+
+    assert first.json() == second.json() == {"n": 1}
+    assert len(adapter.requests) == 1
+    assert getattr(second, "from_cache", False)
+
+
+def test_default_ttl_zero_skips_other_endpoints(tmp_path) -> None:
+    session, adapter = _session(tmp_path)
+
+    session.get(f"{BASE}/api/genomes/")
+    session.get(f"{BASE}/api/genomes/")
+
+    assert len(adapter.requests) == 2
+    assert not list(tmp_path.glob("*.body"))
+
+
+def test_endpoint_ttls_match_exact_paths_unless_starred() -> None:
+    cache = ResponseCache(Path("unused"), max_bytes=1, endpoint_ttls={"/api/x/*": 5})
+
+    assert cache.ttl_for(f"{BASE}/api/species/") > 0
+    assert cache.ttl_for(f"{BASE}/api/species/BU/genomes") == 0
+    assert cache.ttl_for(f"{BASE}/api/x/1") == 5
+    assert cache.ttl_for(f"{BASE}/api/x") == 0
+
+
+def test_endpoint_ttls_are_relative_to_base_url() -> None:
+    config = Config(base_url="https://example.org/portal/", cache_dir="unused")
+    cache = ResponseCache.from_config(config)
+
+    assert cache.ttl_for("https://example.org/portal/api/species/") > 0
+    assert cache.ttl_for("https://example.org/portal/api/species/BU/genomes") == 0
+
+
+def test_refresh_goes_to_network_and_updates_entry(tmp_path) -> None:
+    session, _ = _session(tmp_path)
+    session.get(f"{BASE}/api/species/")
+
+    refreshing, adapter = _session(tmp_path, refresh=True)
+    assert refreshing.get(f"{BASE}/api/species/").json() == {"n": 1}
+    assert len(adapter.requests) == 1
+
+
+def test_stale_entry_revalidated_with_etag(tmp_path) -> None:
+    cache = ResponseCache(tmp_path, max_bytes=10_000, endpoint_ttls={"/api/x": 60})
+    session = CachedSession(cache)
+    adapter = FakeAdapter(etag='"v1"')
+    session.mount("https://", adapter)
+
+    session.get(f"{BASE}/api/x")
+    key = ResponseCache.key("GET", f"{BASE}/api/x", None, "*/*")
+    meta_path = tmp_path / f"{key}.json"
+    meta = json.loads(meta_path.read_text())
+    meta["stored_at"] -= 120
+    meta_path.write_text(json.dumps(meta))
+
+    response = session.get(f"{BASE}/api/x")
+
+    assert response.status_code == 200
+    assert response.json() == {"n": 1}
+    assert adapter.requests[-1].headers["If-None-Match"] == '"v1"'
+    assert cache.get(key).fresh
+
+
+def test_size_cap_evicts_least_recently_used(tmp_path) -> None:
+    session, _ = _session(tmp_path, max_bytes=20, endpoint_ttls={"/api/*": 60})
+    for n in range(5):
+        session.get(f"{BASE}/api/item/{n}")
+
+    bodies = list(tmp_path.glob("*.body"))
+    assert sum(path.stat().st_size for path in bodies) <= 20
+    assert 0 < len(bodies) < 5
+
+
+def test_client_uses_cached_session_when_enabled(tmp_path) -> None:
+    client = DataPortalClient(config=Config(cache=True, cache_dir=str(tmp_path)))
+    assert isinstance(client._http, CachedSession)
+    assert not isinstance(DataPortalClient(config=Config())._http, CachedSession)
+
+
+def test_get_config_reads_cache_settings(tmp_path) -> None:
+    path = tmp_path / "config.toml"
+    path.write_text('cache = true\ncache_ttl = 30\n[cache_ttls]\n"/api/genes/" = 600\n')
+
+    cfg = get_config(config_path=path, env={"METT_CACHE_DIR": str(tmp_path)})
+
+    assert cfg.cache is True
+    assert cfg.cache_ttl == 30
+    assert cfg.cache_ttls == {"/api/genes/": 600}
+    assert cfg.cache_dir == str(tmp_path)
@@ -46,6 +46,10 @@ class DummyResult:
         self.items = payload
         self.raw = {"data": payload}
 
+    def __iter__(self):
+        # Lets DummyResult stand in for the iter_* generators too.
+        return iter(self.items)
+
 
 class DummyClient:
     """Generic stand‑in for DataPortalClient.
@@ -111,3 +115,32 @@ def test_api_request_generic(monkeypatch) -> None:
     args = ["api", "request", "GET", "/api/species/", "--format", "json"]
     result = runner.invoke(cli_cmd, args)
     assert result.exit_code == 0
+
+
+def test_api_request_jsonl_and_compact(monkeypatch) -> None:
+    """Generic CLI: mett api request GET /api/health --format jsonl|json-compact"""
+    _patch_dummy_client(monkeypatch)
+    for fmt in ("jsonl", "json-compact"):
+        args = ["api", "request", "GET", "/api/health", "--format", fmt]
+        result = runner.invoke(cli_cmd, args)
+        assert result.exit_code == 0
+        assert result.output == '{"ok":true}\n'
+
+
+def test_genomes_list_jsonl(monkeypatch) -> None:
+    """Friendly CLI: mett genomes list --format jsonl"""
+    _patch_dummy_client(monkeypatch)
+    result = runner.invoke(cli_cmd, ["genomes", "list", "--format", "jsonl"])
+    assert result.exit_code == 0
+    assert result.output == '{"ok":true}\n'
+
+
+def test_handle_raw_response_jsonl_rows(capsys) -> None:
+    from mett_client.cli.utils import api_format, handle_raw_response
+
+    payload = {"data": [{"a": 1}, {"a": 2}], "pagination": {"page": 1}}
+    handle_raw_response(DummyResponse(payload), "jsonl", title="rows")
+
+    assert capsys.readouterr().out.splitlines() == ['{"a":1}', '{"a":2}']
+    assert api_format("jsonl") == api_format("json-compact") == "json"
+    assert api_format("tsv") == "tsv"
@@ -0,0 +1,146 @@
+"""Tests for `mett batch run`."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, List
+
+from typer.testing import CliRunner
+
+from mett_client import APIError
+from mett_client.cli import main as main_module
+from mett_client.cli.batch import run_batch
+
+runner = CliRunner()
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.calls: List[tuple] = []
+        self.lock = threading.Lock()
+        self.pool_size = 0
+
+    def ensure_pool_size(self, size: int) -> None:
+        self.pool_size = size
+
+    def raw_request(self, method: str, path: str, **kwargs: Any):
+        with self.lock:
+            self.calls.append((method, path, kwargs.get("params")))
+        if path.endswith("/missing"):
+            raise APIError("Not found", status_code=404)
+        # later lines finish first so completion order differs from input order
+        time.sleep(0.02 if path.endswith("/slow") else 0)
+        return SimpleNamespace(status_code=200, json=lambda: {"path": path}, text="")
+
+
+def _invoke(monkeypatch, tmp_path, manifest: str, *args: str, suffix=".jsonl"):
+    client = FakeClient()
+    monkeypatch.setattr(main_module, "_build_client", lambda **_: client)
+    path = tmp_path / f"manifest{suffix}"
+    path.write_text(manifest)
+    result = runner.invoke(main_module.app, ["batch", "run", str(path), *args])
+    records = [json.loads(line) for line in result.stdout.splitlines() if line]
+    return result, records, client
+
+
+def test_batch_run_jsonl_in_input_order(monkeypatch, tmp_path) -> None:
+    manifest = "\n".join(
+        [
+            json.dumps({"path": "/api/genes/slow", "id": "a"}),
+            json.dumps(
+                {"method": "get", "path": "/api/genes/BU_1", "params": {"x": 1}}
+            ),
+            "not json",
+            json.dumps({"path": "/api/genes/missing"}),
+        ]
+    )
+
+    result, records, client = _invoke(monkeypatch, tmp_path, manifest, "-c", "4")
+
+    assert result.exit_code == 1
+    assert [r["line"] for r in records] == [1, 2, 3, 4]
+    assert records[0]["id"] == "a"
+    assert records[1]["data"] == {"path": "/api/genes/BU_1"}
+    assert records[1]["status"] == 200
+    assert records[2]["error"].startswith("Invalid JSON")
+    assert records[3]["status"] == 404
+    assert ("GET", "/api/genes/BU_1", {"x": 1}) in client.calls
+    assert client.pool_size == 4
+    assert "requests=4 ok=2 errors=2" in result.stderr
+
+
+def test_batch_run_tsv_completion_order(monkeypatch, tmp_path) -> None:
+    manifest = "method\tpath\tparams\nGET\t/api/x/slow\t\nGET\t/api/y\ta=1&b=2&b=3\n"
+
+    result, records, client = _invoke(
+        monkeypatch, tmp_path, manifest, "--order", "completion", suffix=".tsv"
+    )
+
+    assert result.exit_code == 0
+    assert [r["path"] for r in records] == ["/api/y", "/api/x/slow"]
+    assert ("GET", "/api/y", {"a": "1", "b": ["2", "3"]}) in client.calls
+
+
+def test_batch_run_rejects_missing_manifest(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(main_module, "_build_client", lambda **_: FakeClient())
+
+    result = runner.invoke(
+        main_module.app, ["batch", "run", str(tmp_path / "missing.jsonl")]
+    )
+
+    assert result.exit_code == 2
+    assert "is not a file" in result.output
+    assert not isinstance(result.exception, FileNotFoundError)
+
+
+def test_run_batch_bounds_in_flight_requests() -> None:
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    class Client:
+        def raw_request(self, method, path, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.001)
+            with lock:
+                in_flight -= 1
+            return SimpleNamespace(status_code=200, json=lambda: {}, text="")
+
+    entries = ({"line": n, "path": f"/api/{n}"} for n in range(1, 51))
+    records = list(run_batch(Client(), entries, concurrency=3))
+
+    assert [r["line"] for r in records] == list(range(1, 51))
+    assert peak <= 3
+
+
+def test_batch_run_reports_bad_entries_per_line(monkeypatch, tmp_path) -> None:
+    manifest = "\n".join(
+        [
+            json.dumps({"path": 123}),
+            json.dumps({}),
+            json.dumps({"path": "/api/genes/BU_1", "params": "not-a-mapping"}),
+            json.dumps({"path": "/api/genes/BU_2"}),
+        ]
+    )
+
+    def _raw_request(self, method, path, **kwargs):
+        if kwargs.get("params") == "not-a-mapping":
+            raise AttributeError("'str' object has no attribute 'items'")
+        return SimpleNamespace(status_code=200, json=lambda: {"path": path}, text="")
+
+    monkeypatch.setattr(FakeClient, "raw_request", _raw_request)
+    result, records, _ = _invoke(monkeypatch, tmp_path, manifest)
+
+    assert result.exit_code == 1
+    assert [r["line"] for r in records] == [1, 2, 3, 4]
+    assert records[0]["error"] == "'path' must be a string"
+    assert records[1]["error"] == "Missing 'path'"
+    assert records[2]["error"].startswith("AttributeError")
+    assert records[2]["status"] is None
+    assert records[3]["data"] == {"path": "/api/genes/BU_2"}
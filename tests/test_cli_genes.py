@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+
 from click.testing import CliRunner
 from typer.main import get_command
 
@@ -87,3 +89,61 @@ def test_genes_search_advanced_locus_tag(monkeypatch) -> None:
         ],
     )
     assert result.exit_code == 0
+
+
+def test_genes_search_advanced_all_pages(monkeypatch) -> None:
+    """Friendly CLI: mett genes search-advanced --species BU --all --format json"""
+    _patch_dummy_client(monkeypatch)
+    result = runner.invoke(
+        cli_cmd,
+        ["genes", "search-advanced", "--species", "BU", "--all", "--format", "json"],
+    )
+    assert result.exit_code == 0
+    assert json.loads(result.output) == [{"ok": True}]
+    assert result.output == json.dumps([{"ok": True}], indent=2) + "\n"
+
+
+def test_genes_get_many_from_file(monkeypatch, tmp_path) -> None:
+    """Friendly CLI: mett genes get-many --from-file tags.txt --format tsv"""
+    from mett_client import APIError
+
+    from .test_cli import DummyClient
+
+    def _get_genes(self, tags, **_kwargs):
+        return {
+            tag: APIError("Not found") if tag == "BU_MISSING" else {"locus_tag": tag}
+            for tag in tags
+        }
+
+    monkeypatch.setattr(DummyClient, "get_genes", _get_genes, raising=False)
+    _patch_dummy_client(monkeypatch)
+    tags_file = tmp_path / "tags.txt"
+    tags_file.write_text("# header\nBU_ATCC8492_00001\n\nBU_MISSING\n")
+
+    result = runner.invoke(
+        cli_cmd, ["genes", "get-many", "--from-file", str(tags_file), "-f", "tsv"]
+    )
+
+    assert result.exit_code == 1
+    assert "BU_ATCC8492_00001" in result.stdout
+    assert "BU_MISSING\tNot found" in result.stderr
+
+
+def test_genes_get_many_json_raw_mode(monkeypatch) -> None:
+    """Friendly CLI: mett genes get-many BU_1 BU_2 -f json (validate=False rows)"""
+    from .test_cli import DummyClient
+
+    def _get_genes(self, tags, **_kwargs):
+        return {tag: {"locus_tag": tag} for tag in tags}
+
+    monkeypatch.setattr(DummyClient, "get_genes", _get_genes, raising=False)
+    _patch_dummy_client(monkeypatch)
+
+    result = runner.invoke(cli_cmd, ["genes", "get-many", "BU_1", "BU_2", "-f", "json"])
+
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)
+    assert payload == {
+        "data": [{"locus_tag": "BU_1"}, {"locus_tag": "BU_2"}],
+        "errors": {},
+    }
@@ -79,3 +79,13 @@ def test_genomes_by_isolates(monkeypatch) -> None:
     ]
     result = runner.invoke(cli_cmd, args)
     assert result.exit_code == 0
+
+
+def test_genomes_genes_all_pages_tsv(monkeypatch) -> None:
+    """Friendly CLI: mett genomes genes BU_ATCC8492 --all --format tsv"""
+    _patch_dummy_client(monkeypatch)
+    result = runner.invoke(
+        cli_cmd, ["genomes", "genes", "BU_ATCC8492", "--all", "--format", "tsv"]
+    )
+    assert result.exit_code == 0
+    assert result.output.splitlines() == ["ok", "True"]
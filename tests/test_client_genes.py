@@ -0,0 +1,88 @@
+"""Tests for DataPortalClient.get_genes bulk lookups."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, List
+
+from mett_client import APIError, Config, DataPortalClient
+from mett_client.client import PaginatedResult
+from mett_client.models import Gene
+
+KNOWN = {f"BU_{n:05d}" for n in range(10)}
+
+
+def _client(monkeypatch):
+    client = DataPortalClient(config=Config())
+    search_calls: List[str] = []
+    single_calls: List[str] = []
+
+    def _search(**params: Any) -> PaginatedResult:
+        # Per openapi.json, ``locus_tag`` is a single exact tag.
+        search_calls.append(params["locus_tag"])
+        tag = params["locus_tag"]
+        items = [Gene(locus_tag=tag)] if tag in KNOWN else []
+        return PaginatedResult(items=items, pagination=None, raw={})
+
+    def _get_gene(locus_tag: str):
+        single_calls.append(locus_tag)
+        if locus_tag not in KNOWN:
+            raise APIError("Not found", status_code=404)
+        return SimpleNamespace(data={"locus_tag": locus_tag})
+
+    monkeypatch.setattr(client, "search_genes_advanced", _search)
+    monkeypatch.setattr(client, "get_gene", _get_gene)
+    return client, search_calls, single_calls
+
+
+def test_get_genes_collects_errors_in_input_order(monkeypatch) -> None:
+    client, search_calls, single_calls = _client(monkeypatch)
+    tags = ["BU_00001", "BU_00002", "BU_MISSING", "BU_00003", "BU_00001"]
+
+    results = client.get_genes(tags, max_workers=2)
+
+    assert list(results) == ["BU_00001", "BU_00002", "BU_MISSING", "BU_00003"]
+    assert results["BU_00002"].locus_tag == "BU_00002"
+    assert isinstance(results["BU_MISSING"], APIError)
+    assert results["BU_MISSING"].status_code == 404
+    assert sorted(single_calls) == ["BU_00001", "BU_00002", "BU_00003", "BU_MISSING"]
+    assert search_calls == []
+
+
+def test_get_genes_skips_blank_tags(monkeypatch) -> None:
+    client, _, single_calls = _client(monkeypatch)
+
+    assert client.get_genes(["", "  "]) == {}
+    assert single_calls == []
+
+
+def test_get_genes_grows_pool_to_worker_count(monkeypatch) -> None:
+    client, _, _ = _client(monkeypatch)
+    configured = client.config.pool_maxsize
+    adapter = client._http.get_adapter("https://example.org")
+    workers = configured + 8
+
+    client.get_genes(["BU_00001"], max_workers=workers)
+
+    assert client._http.get_adapter("https://example.org") is adapter
+    assert adapter._pool_maxsize == workers
+    assert client.config.pool_maxsize == configured
+
+
+def test_get_genes_reports_invalid_gene_per_tag(monkeypatch) -> None:
+    client, _, _ = _client(monkeypatch)
+    fetch = client.get_gene
+
+    def _get_gene(locus_tag: str):
+        if locus_tag == "BU_00002":
+            bad = {"locus_tag": "BU_00002", "start_position": "x"}
+            return SimpleNamespace(data=bad)
+        return fetch(locus_tag)
+
+    monkeypatch.setattr(client, "get_gene", _get_gene)
+
+    results = client.get_genes(["BU_00001", "BU_00002"])
+
+    assert results["BU_00001"].locus_tag == "BU_00001"
+    assert isinstance(results["BU_00002"], APIError)
+    assert "BU_00002" in str(results["BU_00002"])
@@ -0,0 +1,88 @@
+"""Tests for DataPortalClient in-process memoization."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any, List
+
+from mett_client import Config, DataPortalClient
+from mett_client.cache import LRUCache
+
+
+def _client(monkeypatch, **kwargs: Any):
+    client = DataPortalClient(config=Config(), **kwargs)
+    calls: List[Any] = []
+
+    def _call_api(func, *, params=None, **call_kwargs):
+        calls.append((params, call_kwargs))
+        data = dict(call_kwargs, **(params or {}))
+        return SimpleNamespace(data=data, model_dump=lambda: {"data": dict(data)})
+
+    monkeypatch.setattr(client, "_call_api", _call_api)
+    return client, calls
+
+
+def test_memo_disabled_by_default(monkeypatch) -> None:
+    client, calls = _client(monkeypatch)
+
+    client.get_gene("BU_0001")
+    client.get_gene("BU_0001")
+
+    assert len(calls) == 2
+    assert client.cache_info().currsize == 0
+
+
+def test_memoizes_lookups_and_reports_stats(monkeypatch) -> None:
+    client, calls = _client(monkeypatch, memo_size=8)
+
+    first = client.get_gene("BU_0001")
+    assert client.get_gene("BU_0001") is first
+    client.get_strain_drug_data("BU_ATCC8492")
+    client.get_strain_drug_data("BU_ATCC8492")
+    client.get_ttp_gene_interactions("BU_0001", poolA="x")
+    client.get_ttp_gene_interactions("BU_0001", poolA="y")
+
+    assert len(calls) == 4
+    info = client.cache_info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (2, 4, 8, 4)
+
+    client.cache_clear()
+    client.get_gene("BU_0001")
+    assert len(calls) == 5
+
+
+def test_memoized_dicts_are_not_shared(monkeypatch) -> None:
+    client, _ = _client(monkeypatch, memo_size=8)
+
+    client.get_strain_drug_data("BU_ATCC8492")["data"]["mutated"] = True
+
+    assert "mutated" not in client.get_strain_drug_data("BU_ATCC8492")["data"]
+
+
+def test_lru_cache_evicts_oldest_and_expires(monkeypatch) -> None:
+    cache = LRUCache(maxsize=2)
+    for key in ("a", "b", "a", "c"):
+        cache.get_or_load(key, lambda key=key: key.upper())
+    assert cache.info().currsize == 2
+    assert cache.get_or_load("b", lambda: "reloaded") == "reloaded"
+
+    clock = iter([0.0, 0.0, 10.0, 10.0])
+    monkeypatch.setattr("mett_client.cache.time.monotonic", lambda: next(clock))
+    expiring = LRUCache(maxsize=2, ttl=5)
+    expiring.get_or_load("k", lambda: 1)
+    assert expiring.get_or_load("k", lambda: 2) == 2
+
+
+def test_lru_cache_is_thread_safe() -> None:
+    cache = LRUCache(maxsize=16)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(
+            pool.map(lambda n: cache.get_or_load(n % 32, lambda: n % 32), range(2000))
+        )
+
+    assert results == [n % 32 for n in range(2000)]
+    info = cache.info()
+    assert info.hits + info.misses == 2000
+    assert info.currsize <= 16
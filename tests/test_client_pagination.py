@@ -0,0 +1,132 @@
+"""Tests for the auto-paginating iter_* helpers on DataPortalClient."""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, List
+
+from mett_client import Config, DataPortalClient
+from mett_client.client import PaginatedResult
+from mett_client.models import Pagination
+
+
+def _fake_pages(total_items: int, per_page: int, calls: List[Dict[str, Any]]):
+    num_pages = max(1, -(-total_items // per_page))
+
+    def _fetch(isolate_name: str, *, page: int = 1, **params: Any) -> PaginatedResult:
+        calls.append({"isolate_name": isolate_name, "page": page, **params})
+        start = (page - 1) * per_page
+        items = list(range(start, min(start + per_page, total_items)))
+        pagination = Pagination(
+            page_number=page,
+            num_pages=num_pages,
+            has_previous=page > 1,
+            has_next=page < num_pages,
+            total_results=total_items,
+            per_page=per_page,
+        )
+        return PaginatedResult(items=items, pagination=pagination, raw={})
+
+    return _fetch
+
+
+def test_iter_genome_genes_follows_pagination(monkeypatch) -> None:
+    client = DataPortalClient(config=Config())
+    calls: List[Dict[str, Any]] = []
+    monkeypatch.setattr(client, "get_genome_genes", _fake_pages(25, 10, calls))
+
+    items = list(client.iter_genome_genes("BU_ATCC8492", per_page=10))
+
+    assert items == list(range(25))
+    assert [call["page"] for call in calls] == [1, 2, 3]
+    assert all(call["per_page"] == 10 for call in calls)
+    assert all(call["isolate_name"] == "BU_ATCC8492" for call in calls)
+
+
+def test_iter_genome_genes_is_lazy(monkeypatch) -> None:
+    client = DataPortalClient(config=Config())
+    calls: List[Dict[str, Any]] = []
+    monkeypatch.setattr(client, "get_genome_genes", _fake_pages(25, 10, calls))
+
+    iterator = client.iter_genome_genes("BU_ATCC8492", per_page=10)
+    assert calls == []
+    assert next(iterator) == 0
+    assert [call["page"] for call in calls] == [1]
+
+
+def test_iter_genome_genes_starts_from_requested_page(monkeypatch) -> None:
+    client = DataPortalClient(config=Config())
+    calls: List[Dict[str, Any]] = []
+    monkeypatch.setattr(client, "get_genome_genes", _fake_pages(25, 10, calls))
+
+    items = list(client.iter_genome_genes("BU_ATCC8492", page=2, per_page=10))
+
+    assert items == list(range(10, 25))
+    assert [call["page"] for call in calls] == [2, 3]
+
+
+def test_iter_genome_genes_prefetch_preserves_order(monkeypatch) -> None:
+    client = DataPortalClient(config=Config())
+    calls: List[Dict[str, Any]] = []
+    fetch = _fake_pages(95, 10, calls)
+
+    def _slow_fetch(isolate_name: str, *, page: int = 1, **params: Any):
+        # Later pages finish first so out-of-order completion is exercised.
+        time.sleep(0.002 * (12 - page))
+        return fetch(isolate_name, page=page, **params)
+
+    monkeypatch.setattr(client, "get_genome_genes", _slow_fetch)
+
+    items = list(client.iter_genome_genes("BU_ATCC8492", per_page=10, max_workers=4))
+
+    assert items == list(range(95))
+    assert sorted(call["page"] for call in calls) == list(range(1, 11))
+
+
+def test_iter_pages_prefetch_window_is_bounded(monkeypatch) -> None:
+    client = DataPortalClient(config=Config())
+    calls: List[Dict[str, Any]] = []
+    monkeypatch.setattr(client, "get_genome_genes", _fake_pages(1000, 10, calls))
+
+    pages = client._iter_pages(
+        client.get_genome_genes,
+        {"per_page": 10},
+        max_workers=3,
+        isolate_name="BU_ATCC8492",
+    )
+    next(pages)
+    next(pages)
+    pages.close()
+
+    # First page, plus at most one refill beyond the initial window of three.
+    assert len(calls) <= 1 + 3 + 1
+
+
+class _CountingSchema:
+    def __init__(self) -> None:
+        self.data = [1, 2]
+        self.pagination = None
+        self.dumps = 0
+
+    def model_dump(self) -> Dict[str, Any]:
+        self.dumps += 1
+        return {"data": list(self.data)}
+
+
+def test_paginated_raw_is_built_lazily_and_cached() -> None:
+    schema = _CountingSchema()
+    result = DataPortalClient._to_paginated(schema)
+
+    assert result.items == [1, 2]
+    assert schema.dumps == 0
+    assert result.raw == {"data": [1, 2]}
+    assert result.raw is result.raw
+    assert schema.dumps == 1
+
+
+def test_paginated_raw_not_kept_when_keep_raw_false() -> None:
+    schema = _CountingSchema()
+    result = DataPortalClient._to_paginated(schema, keep_raw=False)
+
+    assert result.raw == result.raw == {"data": [1, 2]}
+    assert schema.dumps == 2
@@ -0,0 +1,123 @@
+"""Tests for Arrow/Parquet export."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+from click.testing import CliRunner
+from typer.main import get_command
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from mett_client import DataPortalClient, models
+from mett_client.cli import main as main_module
+from mett_client.columnar import (
+    iter_record_batches,
+    schema_for,
+    write_columnar,
+)
+
+runner = CliRunner()
+cli_cmd = get_command(main_module.app)
+
+
+def _genes(n: int):
+    for i in range(n):
+        yield models.Gene(
+            locus_tag=f"BU_{i}",
+            start_position=i,
+            alias=["a", "b"],
+            has_fitness=bool(i % 2),
+            ontology_terms=[{"id": "GO:1"}],
+            dbxref=[{"db": "UniProt", "ref": "P1"}],
+        )
+
+
+def test_schema_types_follow_sdk_models() -> None:
+    genes = schema_for(models.Gene)
+    assert genes.field("start_position").type == pa.int64()
+    assert genes.field("has_fitness").type == pa.bool_()
+    assert genes.field("alias").type == pa.list_(pa.string())
+    assert pa.types.is_struct(genes.field("dbxref").type.value_type)
+    # free-form dicts are kept as JSON strings
+    assert genes.field("ontology_terms").type == pa.list_(pa.string())
+
+    ppi = schema_for(models.PPIInteraction)
+    assert ppi.field("dl_score").type == pa.float64()
+    assert ppi.field("evidence_count").type == pa.int64()
+
+
+def test_record_batches_are_typed_and_bounded() -> None:
+    batches = list(iter_record_batches(_genes(25), batch_size=10))
+
+    assert [b.num_rows for b in batches] == [10, 10, 5]
+    row = pa.Table.from_batches(batches).slice(1, 1).to_pylist()[0]
+    assert row["start_position"] == 1
+    assert row["ontology_terms"] == ['{"id": "GO:1"}']
+    assert row["dbxref"] == [{"db": "UniProt", "ref": "P1"}]
+
+
+def test_dict_rows_use_declared_model() -> None:
+    rows = [{"pair_id": "a", "protein_a": "x", "protein_b": "y", "dl_score": 1}]
+    table = DataPortalClient().to_arrow(rows, models.PPIInteraction)
+
+    assert table.schema.field("dl_score").type == pa.float64()
+    assert table.column("dl_score").to_pylist() == [1.0]
+    assert table.column("melt_score").null_count == 1
+
+
+def test_write_parquet_row_groups(tmp_path) -> None:
+    path = tmp_path / "genes.parquet"
+
+    assert write_columnar(_genes(25), path, "parquet", batch_size=10) == 25
+
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_row_groups == 3
+    assert parquet.schema_arrow.field("start_position").type == pa.int64()
+
+
+def test_write_arrow_stream_and_empty_input() -> None:
+    sink = io.BytesIO()
+    assert write_columnar(_genes(3), sink, "arrow") == 3
+    table = pa.ipc.open_stream(sink.getvalue()).read_all()
+    assert table.column("locus_tag").to_pylist() == ["BU_0", "BU_1", "BU_2"]
+
+    assert write_columnar(iter(()), io.BytesIO(), "parquet") == 0
+
+
+def test_cli_genomes_genes_parquet(monkeypatch, tmp_path) -> None:
+    class Client:
+        def iter_genome_genes(self, isolate_name, **params):
+            return _genes(5)
+
+    monkeypatch.setattr(main_module, "_build_client", lambda **_: Client())
+    path = tmp_path / "genes.parquet"
+    args = ["genomes", "genes", "BU_X", "--all", "-f", "parquet", "-o", str(path)]
+
+    result = runner.invoke(cli_cmd, args)
+
+    assert result.exit_code == 0, result.output
+    assert pq.read_table(path).num_rows == 5
+
+
+def test_arrow_schema_and_frame_kinds_share_one_classifier() -> None:
+    from mett_client.frames import column_kinds
+
+    arrow = {
+        "bool": pa.bool_(),
+        "int": pa.int64(),
+        "float": pa.float64(),
+        "str": pa.string(),
+    }
+    for model in (models.Gene, models.PPIInteraction):
+        schema = schema_for(model)
+        for name, kind in column_kinds(model).items():
+            dtype = schema.field(name).type
+            if kind in arrow:
+                assert dtype == arrow[kind], name
+            elif kind == "list":
+                assert pa.types.is_list(dtype), name
+            elif kind == "model":
+                assert pa.types.is_struct(dtype), name
@@ -0,0 +1,128 @@
+"""Tests for chunked streaming downloads."""
+
+from __future__ import annotations
+
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Iterator, List
+
+import pytest
+from typer.testing import CliRunner
+
+from mett_client import Config, DataPortalClient
+from mett_client.cli import main as main_module
+
+PAYLOAD = b"".join(b"BU_%05d\tgenome\n" % n for n in range(20000))
+
+
+@pytest.fixture
+def server() -> Iterator[tuple]:
+    state = {"ranges": True, "seen": []}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            header = self.headers.get("Range")
+            state["seen"].append(header)
+            body, status = PAYLOAD, 200
+            if header and state["ranges"]:
+                start = int(header.split("=")[1].rstrip("-"))
+                if start >= len(PAYLOAD):
+                    self.send_response(416)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                body, status = PAYLOAD[start:], 206
+            self.send_response(status)
+            self.send_header("Content-Type", "text/tab-separated-values")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    httpd = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_port}", state
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def _client(base_url: str) -> DataPortalClient:
+    return DataPortalClient(config=Config(base_url=base_url, retries=0))
+
+
+def test_download_writes_in_chunks_and_reports_progress(server, tmp_path) -> None:
+    base_url, _ = server
+    seen: List[tuple] = []
+
+    path = _client(base_url).download(
+        "/api/genomes/download/tsv",
+        tmp_path / "genomes.tsv",
+        chunk_size=4096,
+        progress=lambda done, total: seen.append((done, total)),
+    )
+
+    assert path.read_bytes() == PAYLOAD
+    assert not (tmp_path / "genomes.tsv.part").exists()
+    assert len(seen) > 2
+    assert seen[-1] == (len(PAYLOAD), len(PAYLOAD))
+
+
+def test_download_resumes_partial_file(server, tmp_path) -> None:
+    base_url, state = server
+    (tmp_path / "out.tsv.part").write_bytes(PAYLOAD[:1000])
+
+    _client(base_url).download("/x", tmp_path / "out.tsv")
+
+    assert state["seen"] == ["bytes=1000-"]
+    assert (tmp_path / "out.tsv").read_bytes() == PAYLOAD
+
+
+def test_download_restarts_when_range_ignored(server, tmp_path) -> None:
+    base_url, state = server
+    state["ranges"] = False
+    (tmp_path / "out.tsv.part").write_bytes(b"stale")
+
+    _client(base_url).download("/x", tmp_path / "out.tsv")
+
+    assert (tmp_path / "out.tsv").read_bytes() == PAYLOAD
+
+
+def test_download_completed_part_and_gzip(server, tmp_path) -> None:
+    base_url, _ = server
+    (tmp_path / "out.tsv.gz.part").write_bytes(PAYLOAD)
+
+    _client(base_url).download("/x", tmp_path / "out.tsv.gz", compress=True)
+
+    assert gzip.decompress((tmp_path / "out.tsv.gz").read_bytes()) == PAYLOAD
+
+
+def test_cli_genomes_download_to_file(server, tmp_path, monkeypatch) -> None:
+    base_url, _ = server
+    monkeypatch.setattr(main_module, "_build_client", lambda **_: _client(base_url))
+    output = tmp_path / "genomes.tsv"
+
+    result = CliRunner().invoke(
+        main_module.app, ["genomes", "download", "--output", str(output)]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert output.read_bytes() == PAYLOAD
+
+
+def test_cli_pyhmmer_download_to_stdout(server, monkeypatch) -> None:
+    base_url, state = server
+    monkeypatch.setattr(main_module, "_build_client", lambda **_: _client(base_url))
+
+    result = CliRunner().invoke(
+        main_module.app,
+        ["pyhmmer", "download", "job-1", "--download-format", "tab"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout_bytes == PAYLOAD
@@ -0,0 +1,120 @@
+"""Tests for the pandas/polars DataFrame adapters."""
+
+from __future__ import annotations
+
+import json
+from typing import List
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import requests  # type: ignore[import]
+from requests.adapters import BaseAdapter  # type: ignore[import]
+
+from mett_client import Config, DataPortalClient, models
+from mett_client.client import PaginatedResult
+
+BASE = "https://example.org"
+NUM_PAGES = 3
+
+
+def _interaction(n: int) -> dict:
+    return {
+        "pair_id": f"p{n}",
+        "protein_a": "A",
+        "protein_b": f"B{n}",
+        "participants": ["A", f"B{n}"],
+        "dl_score": n,
+        "melt_score": None,
+        "has_xlms": n % 2 == 0,
+        "evidence_count": n,
+    }
+
+
+class PagedAdapter(BaseAdapter):
+    """Serve three pages of PPI interactions."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.pages: List[int] = []
+
+    def send(self, request, **kwargs):  # type: ignore[override]
+        page = int(parse_qs(urlsplit(request.url).query).get("page", ["1"])[0])
+        self.pages.append(page)
+        body = {
+            "data": [_interaction(page * 10 + i) for i in range(2)],
+            "pagination": {
+                "page_number": page,
+                "num_pages": NUM_PAGES,
+                "has_previous": page > 1,
+                "has_next": page < NUM_PAGES,
+                "total_results": NUM_PAGES * 2,
+                "per_page": 2,
+            },
+        }
+        response = requests.Response()
+        response.status_code = 200
+        response.url = request.url
+        response.request = request
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps(body).encode()
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def _client() -> tuple:
+    client = DataPortalClient(config=Config(base_url=BASE))
+    adapter = PagedAdapter()
+    client._http.mount("https://", adapter)
+    return client, adapter
+
+
+def test_ppi_frame_pandas_dtypes() -> None:
+    pytest.importorskip("pandas")
+    client, adapter = _client()
+
+    frame = client.ppi_frame(species_acronym="BU")
+
+    assert adapter.pages == [1]
+    assert list(frame["pair_id"]) == ["p10", "p11"]
+    assert frame["dl_score"].dtype == "float64"
+    assert frame["melt_score"].isna().all()
+    assert frame["has_xlms"].dtype == "bool"
+    assert frame["evidence_count"].dtype == "int64"
+    # fields absent from every row are still typed columns
+    assert frame["string_score"].dtype == "float64"
+
+
+def test_ppi_frame_all_pages_concurrently() -> None:
+    pytest.importorskip("pandas")
+    client, adapter = _client()
+
+    frame = client.ppi_frame(all_pages=True, max_workers=3)
+
+    assert sorted(adapter.pages) == [1, 2, 3]
+    assert list(frame["evidence_count"]) == [10, 11, 20, 21, 30, 31]
+
+
+def test_ppi_frame_polars() -> None:
+    pl = pytest.importorskip("polars")
+    client, _ = _client()
+
+    frame = client.ppi_frame(backend="polars", all_pages=True)
+
+    assert frame.height == 6
+    assert frame.schema["dl_score"] == pl.Float64
+    assert frame.schema["has_xlms"] == pl.Boolean
+    assert frame.schema["evidence_count"] == pl.Int64
+
+
+def test_paginated_result_to_pandas_uses_raw_rows() -> None:
+    pytest.importorskip("pandas")
+    rows = [_interaction(1), dict(_interaction(2), has_xlms=None)]
+    items = [models.PPIInteraction.from_dict(row) for row in rows]
+    result = PaginatedResult(items=items, pagination=None, raw={"data": rows})
+
+    frame = result.to_pandas()
+
+    assert frame["has_xlms"].dtype == "boolean"
+    assert frame["dl_score"].tolist() == [1.0, 2.0]
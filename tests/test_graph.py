@@ -0,0 +1,244 @@
+"""Tests for the local CSR PPI network graph."""
+
+from __future__ import annotations
+
+import json
+from typing import List, Optional
+
+import pytest
+import requests  # type: ignore[import]
+from requests.adapters import BaseAdapter  # type: ignore[import]
+from typer.testing import CliRunner
+
+from mett_client import APIError, Config, DataPortalClient
+from mett_client.cli import main as main_module
+
+np = pytest.importorskip("numpy")
+
+from mett_client.graph import PPIGraph
+
+NETWORK = {
+    "timestamp": "2024-01-01T00:00:00Z",
+    "data": {
+        "nodes": [{"id": p} for p in ("A", "B", "C", "D", "E", "F")],
+        "edges": [
+            {"source": "A", "target": "B", "weight": 0.9},
+            {"source": "B", "target": "C", "weight": 0.5},
+            {"source": "C", "target": "D", "weight": 0.95},
+            {"source": "B", "target": "A", "weight": 0.7},
+            {"source": "E", "target": "E", "weight": 1.0},
+        ],
+        "properties": {},
+    },
+}
+
+
+class NetworkAdapter(BaseAdapter):
+    """Serve NETWORK; the network-properties endpoint fails with a 500.
+
+    Pass ``properties`` to have that endpoint answer 200 with it instead.
+    """
+
+    def __init__(self, properties: Optional[dict] = None) -> None:
+        super().__init__()
+        self.urls: List[str] = []
+        self.properties = properties
+
+    def send(self, request, **kwargs):  # type: ignore[override]
+        self.urls.append(request.url)
+        response = requests.Response()
+        response.url = request.url
+        response.headers["Content-Type"] = "application/json"
+        if "/network-properties" in request.url and self.properties is not None:
+            response.status_code = 200
+            response._content = json.dumps(self.properties).encode()
+        elif "/network-properties" in request.url:
+            response.status_code = 500
+            response._content = b'{"detail": "timed out"}'
+        else:
+            response.status_code = 200
+            response._content = json.dumps(NETWORK).encode()
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def test_graph_from_network_builds_undirected_csr() -> None:
+    graph = PPIGraph.from_network(NETWORK)
+
+    assert graph.num_nodes == 6
+    assert graph.num_edges == 4
+    assert graph.indices.dtype == np.int32
+    assert graph.scores.dtype == np.float32
+    assert graph.neighbors("B") == ["A", "C"]
+    assert graph.degree("F") == 0
+    # Duplicate pair keeps its best score.
+    assert graph.scores[graph.indptr[0]] == pytest.approx(0.9)
+
+
+def test_graph_neighborhood_filter_and_components() -> None:
+    graph = PPIGraph.from_network(NETWORK)
+
+    assert graph.neighborhood("A", 2) == {"A": 0, "B": 1, "C": 2}
+    assert graph.neighborhood("A", 3, min_score=0.6) == {"A": 0, "B": 1}
+    assert graph.connected_components() == [["A", "B", "C", "D"], ["E"], ["F"]]
+
+    strong = graph.filter(min_score=0.6, min_degree=1)
+    assert sorted(strong.node_ids.tolist()) == ["A", "B", "C", "D", "E"]
+    assert strong.num_edges == 3
+    with pytest.raises(KeyError):
+        graph.neighbors("Z")
+
+
+def test_graph_round_trips_through_npz(tmp_path) -> None:
+    graph = PPIGraph.from_network(NETWORK)
+    path = tmp_path / "network.npz"
+    graph.save(path)
+
+    loaded = PPIGraph.load(path)
+
+    assert loaded.node_ids.tolist() == graph.node_ids.tolist()
+    assert np.array_equal(loaded.indptr, graph.indptr)
+    assert np.array_equal(loaded.scores, graph.scores)
+
+
+def test_graph_properties_match_brute_force() -> None:
+    graph = PPIGraph.from_edges(
+        ["A", "B", "A", "C", "E"], ["B", "C", "C", "D", "E"], node_ids="ABCDEF"
+    )
+
+    assert graph.triangles().tolist() == [1, 1, 1, 0, 0, 0]
+    assert graph.clustering() == pytest.approx([1, 1, 1 / 3, 0, 0, 0])
+    assert graph.properties() == {
+        "num_nodes": 6,
+        "num_edges": 5,
+        "density": pytest.approx(1 / 3),
+        "avg_clustering_coefficient": pytest.approx((2 + 1 / 3) / 6),
+        "degree_distribution": [1, 2, 2, 1],
+        "component_sizes": [4, 1, 1],
+    }
+
+
+def test_client_network_properties_falls_back_to_local(tmp_path) -> None:
+    client = DataPortalClient(config=Config(base_url="https://example.org"))
+    adapter = NetworkAdapter()
+    client._http.mount("https://", adapter)
+
+    with pytest.raises(APIError):
+        client.ppi_network_properties("ds_score")
+    payload = client.ppi_network_properties(
+        "ds_score", source="auto", cache_path=tmp_path / "ds.npz"
+    )
+
+    assert "computed locally" in payload["message"]
+    assert payload["data"]["source"] == "local"
+    assert payload["data"]["num_edges"] == 4
+    assert payload["data"]["component_sizes"] == [4, 1, 1]
+    local = client.ppi_network_properties(
+        "ds_score", source="local", cache_path=tmp_path / "ds.npz"
+    )
+    assert local["data"] == payload["data"]
+    assert sum("/network-properties" in url for url in adapter.urls) == 2
+
+
+def test_client_ppi_graph_fetches_once_with_cache_path(tmp_path) -> None:
+    client = DataPortalClient(config=Config(base_url="https://example.org"))
+    adapter = NetworkAdapter()
+    client._http.mount("https://", adapter)
+    cache = tmp_path / "ds.npz"
+
+    first = client.ppi_graph("ds_score", species_acronym="BU", cache_path=cache)
+    second = client.ppi_graph("ds_score", species_acronym="BU", cache_path=cache)
+
+    assert len(adapter.urls) == 1
+    assert "/api/ppi/network/ds_score?species_acronym=BU" in adapter.urls[0]
+    assert second.num_edges == first.num_edges == 4
+
+
+def test_cli_neighborhood_answers_from_saved_graph(tmp_path) -> None:
+    path = tmp_path / "network.npz"
+    PPIGraph.from_network(NETWORK).save(path)
+
+    result = CliRunner().invoke(
+        main_module.app,
+        [
+            "ppi",
+            "neighborhood",
+            "--protein-id",
+            "A",
+            "--graph",
+            str(path),
+            "--hops",
+            "2",
+            "--format",
+            "jsonl",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    rows = [json.loads(line) for line in result.output.splitlines()]
+    assert rows == [{"protein_id": "B", "hops": 1}, {"protein_id": "C", "hops": 2}]
+
+
+def test_cli_network_properties_from_saved_graph(tmp_path) -> None:
+    path = tmp_path / "network.npz"
+    PPIGraph.from_network(NETWORK).save(path)
+
+    result = CliRunner().invoke(
+        main_module.app,
+        ["ppi", "network-properties", "--score-type", "ds_score", "--graph", str(path)],
+    )
+
+    assert result.exit_code == 0, result.output
+    data = json.loads(result.output)["data"]
+    assert data["num_nodes"] == 6 and data["degree_distribution"] == [1, 3, 2]
+
+
+def test_client_ppi_graph_refetches_cache_of_other_query(tmp_path) -> None:
+    client = DataPortalClient(config=Config(base_url="https://example.org"))
+    adapter = NetworkAdapter()
+    client._http.mount("https://", adapter)
+    cache = tmp_path / "ds.npz"
+    PPIGraph.from_network(NETWORK).save(cache)
+
+    graph = client.ppi_graph("ds_score", species_acronym="BU", cache_path=cache)
+    client.ppi_graph("ds_score", species_acronym="BU", cache_path=cache)
+    client.ppi_graph("ds_score", species_acronym="BV", cache_path=cache)
+
+    assert len(adapter.urls) == 2
+    assert "species_acronym=BV" in adapter.urls[1]
+    assert PPIGraph.load(cache).query == {
+        "score_type": "ds_score",
+        "score_threshold": None,
+        "species_acronym": "BV",
+    }
+    assert graph.query["species_acronym"] == "BU"
+
+
+@pytest.mark.parametrize("properties", [{"data": None}, {"status": "success"}])
+def test_client_network_properties_falls_back_on_empty_data(properties) -> None:
+    client = DataPortalClient(
+        config=Config(base_url="https://example.org"), validate=False
+    )
+    client._http.mount("https://", NetworkAdapter(properties))
+
+    server = client.ppi_network_properties("ds_score")
+    auto = client.ppi_network_properties("ds_score", source="auto")
+
+    assert server["data"] == {"source": "server"}
+    assert auto["data"]["source"] == "local"
+    assert auto["data"]["num_edges"] == 4
+    assert "no network properties" in auto["message"]
+
+
+def test_client_network_properties_falls_back_on_invalid_body() -> None:
+    client = DataPortalClient(config=Config(base_url="https://example.org"))
+    client._http.mount("https://", NetworkAdapter({"data": None}))
+
+    with pytest.raises(ValueError):
+        client.ppi_network_properties("ds_score")
+    auto = client.ppi_network_properties("ds_score", source="auto")
+
+    assert auto["data"]["source"] == "local"
+    assert "computed locally" in auto["message"]
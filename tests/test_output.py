@@ -0,0 +1,99 @@
+"""Tests for the streaming CLI writers."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from typing import Iterator, Optional
+
+from mett_client.cli.output import print_json_array, print_json_lines, print_tsv
+
+
+def _rows(n: int) -> Iterator[dict]:
+    for i in range(n):
+        yield {"locus_tag": f"BU_{i}", "start": i}
+
+
+def test_print_tsv_sequence_header_is_union_of_all_rows(capsys) -> None:
+    rows = [{"b": 1}, {"a": 2}, {"a": 3, "c": 4}]
+    print_tsv(rows, sample=2)
+    assert capsys.readouterr().out.splitlines() == [
+        "a\tb\tc",
+        "\t1\t",
+        "2\t\t",
+        "3\t\t4",
+    ]
+
+
+def test_print_tsv_infers_iterator_header_from_sample(capsys) -> None:
+    rows = iter([{"b": 1}, {"a": 2}, {"a": 3, "c": 4}])
+    print_tsv(rows, sample=2)
+    assert capsys.readouterr().out.splitlines() == ["a\tb", "\t1", "2\t", "3\t"]
+
+
+def test_print_tsv_iterator_header_from_model_fields(capsys) -> None:
+    from pydantic import BaseModel
+
+    class Row(BaseModel):
+        locus_tag: str
+        product: Optional[str] = None
+
+    rows = iter([Row(locus_tag="BU_1"), Row(locus_tag="BU_2", product="x")])
+    print_tsv(rows, sample=1)
+    assert capsys.readouterr().out.splitlines() == [
+        "locus_tag\tproduct",
+        "BU_1\t",
+        "BU_2\tx",
+    ]
+
+
+def test_print_tsv_declared_header_streams_lazily(capsys) -> None:
+    seen = []
+
+    def rows() -> Iterator[dict]:
+        for row in _rows(3):
+            # the previous line (header or row) is on stdout before the next pull
+            seen.append(capsys.readouterr().out)
+            yield row
+
+    print_tsv(rows(), headers=["locus_tag", "start"])
+    seen.append(capsys.readouterr().out)
+    assert seen == ["locus_tag\tstart\n", "BU_0\t0\n", "BU_1\t1\n", "BU_2\t2\n"]
+
+
+def test_print_tsv_empty_writes_nothing(capsys) -> None:
+    print_tsv(iter(()))
+    assert capsys.readouterr().out == ""
+
+
+def test_print_json_lines(capsys) -> None:
+    print_json_lines(_rows(2))
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line) for line in lines] == list(_rows(2))
+    assert lines[0] == '{"locus_tag":"BU_0","start":0}'
+
+
+def test_print_json_array_matches_json_dumps(capsys) -> None:
+    for indent in (None, 2):
+        for n in (0, 1, 3):
+            print_json_array(_rows(n), indent=indent)
+            expected = json.dumps(list(_rows(n)), indent=indent)
+            if indent is None:
+                expected = json.dumps(list(_rows(n)), separators=(",", ":"))
+            assert capsys.readouterr().out == expected + "\n"
+
+
+def test_print_tsv_stops_quietly_on_closed_pipe() -> None:
+    code = (
+        "from mett_client.cli.output import print_tsv\n"
+        "print_tsv({'n': i} for i in range(10**7))\n"
+    )
+    producer = subprocess.Popen(
+        [sys.executable, "-c", code], stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    assert producer.stdout.readline() == b"n\n"
+    producer.stdout.close()
+    _, stderr = producer.communicate(timeout=60)
+    assert b"Traceback" not in stderr
+    assert producer.returncode == 1
@@ -0,0 +1,178 @@
+"""Tests for the resumable PPI dump and its pair-id hash set."""
+
+from __future__ import annotations
+
+import json
+from typing import List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import requests  # type: ignore[import]
+from requests.adapters import BaseAdapter  # type: ignore[import]
+
+from mett_client import APIError, Config, DataPortalClient
+
+np = pytest.importorskip("numpy")
+
+from mett_client.ppi_dump import PairIdSet
+
+# Four pages of two rows; pair p2 repeats on page 2 and p5 on page 4.
+PAGES = [
+    [("p1", "A", "B"), ("p2", "A", "C")],
+    [("p2", "A", "C"), ("p3", "B", "C")],
+    [("p4", "C", "D"), ("p5", "D", "D")],
+    [("p5", "D", "D"), ("p6", "E", "A")],
+]
+
+
+class DumpAdapter(BaseAdapter):
+    def __init__(self, fail_on: Optional[int] = None) -> None:
+        super().__init__()
+        self.fail_on = fail_on
+        self.pages: List[int] = []
+
+    def send(self, request, **kwargs):  # type: ignore[override]
+        query = parse_qs(urlsplit(request.url).query)
+        page = int(query.get("page", ["1"])[0])
+        if page == self.fail_on:
+            raise requests.ConnectionError("connection reset")
+        self.pages.append(page)
+        rows = [
+            {
+                "pair_id": pair_id,
+                "protein_a": a,
+                "protein_b": b,
+                "protein_a_locus_tag": f"BU_{a}",
+                "protein_b_locus_tag": f"BU_{b}",
+                "ds_score": 0.5 + len(pair_id) / 10,
+            }
+            for pair_id, a, b in PAGES[page - 1]
+        ]
+        payload = {
+            "timestamp": "2024-01-01T00:00:00Z",
+            "data": rows,
+            "pagination": {
+                "page_number": page,
+                "num_pages": len(PAGES),
+                "has_previous": page > 1,
+                "has_next": page < len(PAGES),
+                "total_results": 8,
+                "per_page": 2,
+            },
+        }
+        response = requests.Response()
+        response.status_code = 200
+        response.url = request.url
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps(payload).encode()
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def _client(adapter: DumpAdapter) -> DataPortalClient:
+    client = DataPortalClient(config=Config(base_url="https://example.org"))
+    client._http.mount("https://", adapter)
+    return client
+
+
+def _edges(path) -> List[List[str]]:
+    return [line.split("\t") for line in (path / "edges.tsv").read_text().splitlines()]
+
+
+def test_pair_id_set_dedupes_within_and_across_batches() -> None:
+    seen = PairIdSet(capacity=4)
+
+    assert seen.add_many(["a", "b", "a"]).tolist() == [True, True, False]
+    assert seen.add_many(["b", "c"]).tolist() == [False, True]
+    fresh = seen.add_many(f"pair{i}" for i in range(5000))
+    assert fresh.all()
+    assert len(seen) == 5003
+    assert "pair4999" in seen and "missing" not in seen
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_dump_ppi_writes_deduplicated_edges_and_nodes(tmp_path, max_workers) -> None:
+    client = _client(DumpAdapter())
+
+    summary = client.dump_ppi(
+        "BU", "ds_score", out=tmp_path, per_page=2, max_workers=max_workers
+    )
+
+    assert (summary.pages, summary.edges, summary.nodes) == (4, 6, 5)
+    assert summary.duplicates == 2 and summary.complete
+    edges = _edges(tmp_path)
+    assert edges[0] == ["source", "target", "pair_id", "score"]
+    assert [row[2] for row in edges[1:]] == ["p1", "p2", "p3", "p4", "p5", "p6"]
+    assert edges[1][:2] == ["0", "1"] and edges[6][:2] == ["4", "0"]
+    nodes = (tmp_path / "nodes.tsv").read_text().splitlines()
+    assert nodes[1] == "0\tA\tBU_A\t\t"
+    assert len(nodes) == 6
+
+
+def test_dump_ppi_resumes_after_interruption(tmp_path) -> None:
+    with pytest.raises(APIError):
+        _client(DumpAdapter(fail_on=3)).dump_ppi(
+            "BU", "ds_score", out=tmp_path, per_page=2, max_workers=1
+        )
+    checkpoint = json.loads((tmp_path / "checkpoint.json").read_text())
+    assert checkpoint["next_page"] == 3
+
+    adapter = DumpAdapter()
+    summary = _client(adapter).dump_ppi(
+        "BU", "ds_score", out=tmp_path, per_page=2, max_workers=1
+    )
+
+    assert adapter.pages == [3, 4]
+    assert summary.resumed and summary.complete
+    assert (summary.edges, summary.nodes, summary.duplicates) == (6, 5, 2)
+    assert [row[2] for row in _edges(tmp_path)[1:]] == [
+        "p1",
+        "p2",
+        "p3",
+        "p4",
+        "p5",
+        "p6",
+    ]
+
+    again = DumpAdapter()
+    _client(again).dump_ppi("BU", "ds_score", out=tmp_path, per_page=2)
+    assert again.pages == []
+
+
+def test_dump_ppi_refuses_to_resume_a_different_query(tmp_path) -> None:
+    client = _client(DumpAdapter())
+    client.dump_ppi("BU", out=tmp_path, per_page=2)
+
+    with pytest.raises(ValueError):
+        client.dump_ppi("PV", out=tmp_path, per_page=2)
+
+
+def test_dump_ppi_fresh_run_interrupted_then_resumed(tmp_path) -> None:
+    _client(DumpAdapter()).dump_ppi("BU", "ds_score", out=tmp_path, per_page=2)
+
+    with pytest.raises(APIError):
+        _client(DumpAdapter(fail_on=1)).dump_ppi(
+            "BU", "ds_score", out=tmp_path, per_page=2, resume=False
+        )
+    assert not (tmp_path / "checkpoint.json").exists()
+
+    adapter = DumpAdapter()
+    summary = _client(adapter).dump_ppi("BU", "ds_score", out=tmp_path, per_page=2)
+
+    assert sorted(adapter.pages) == [1, 2, 3, 4]
+    assert not summary.resumed
+    assert b"\0" not in (tmp_path / "edges.tsv").read_bytes()
+    assert [row[2] for row in _edges(tmp_path)[1:]] == [f"p{n}" for n in range(1, 7)]
+
+
+def test_dump_ppi_rejects_checkpoint_past_end_of_files(tmp_path) -> None:
+    with pytest.raises(APIError):
+        _client(DumpAdapter(fail_on=3)).dump_ppi(
+            "BU", "ds_score", out=tmp_path, per_page=2, max_workers=1
+        )
+    (tmp_path / "edges.tsv").write_bytes(b"source\ttarget\tpair_id\tscore\n")
+
+    with pytest.raises(ValueError, match="shorter than its checkpoint"):
+        _client(DumpAdapter()).dump_ppi("BU", "ds_score", out=tmp_path, per_page=2)
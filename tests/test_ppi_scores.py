@@ -0,0 +1,168 @@
+"""Tests for the NumPy-backed PPI score table."""
+
+from __future__ import annotations
+
+import json
+from typing import List
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import requests  # type: ignore[import]
+from requests.adapters import BaseAdapter  # type: ignore[import]
+from typer.testing import CliRunner
+
+from mett_client import Config, DataPortalClient, models
+from mett_client.cli import main as main_module
+
+np = pytest.importorskip("numpy")
+
+from mett_client.ppi_scores import PPIScoreTable
+
+ROWS = [
+    {
+        "pair_id": "p1",
+        "protein_a": "A",
+        "protein_b": "B",
+        "participants": ["A", "B"],
+        "ds_score": 0.9,
+        "string_score": 0.2,
+        "has_xlms": True,
+    },
+    {
+        "pair_id": "p2",
+        "protein_a": "A",
+        "protein_b": "C",
+        "participants": ["A", "C"],
+        "ds_score": 0.7,
+        "string_score": None,
+    },
+    {
+        "pair_id": "p3",
+        "protein_a": "B",
+        "protein_b": "C",
+        "participants": ["B", "C"],
+        "ds_score": None,
+        "string_score": 1.0,
+        "evidence_count": 3,
+    },
+]
+
+
+class InteractionPagesAdapter(BaseAdapter):
+    """Serve ROWS one interaction per page."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.pages: List[int] = []
+
+    def send(self, request, **kwargs):  # type: ignore[override]
+        page = int(parse_qs(urlsplit(request.url).query).get("page", ["1"])[0])
+        self.pages.append(page)
+        payload = {
+            "timestamp": "2024-01-01T00:00:00Z",
+            "data": [ROWS[page - 1]],
+            "pagination": {
+                "page_number": page,
+                "num_pages": len(ROWS),
+                "has_previous": page > 1,
+                "has_next": page < len(ROWS),
+                "total_results": len(ROWS),
+                "per_page": 1,
+            },
+        }
+        response = requests.Response()
+        response.status_code = 200
+        response.url = request.url
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps(payload).encode()
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def _client() -> DataPortalClient:
+    client = DataPortalClient(config=Config(base_url="https://example.org"))
+    client._http.mount("https://", InteractionPagesAdapter())
+    return client
+
+
+def test_table_columns_use_nan_for_missing_scores() -> None:
+    table = PPIScoreTable.from_rows(ROWS, chunk_size=2)
+
+    assert len(table) == 3
+    assert table["ds_score"].dtype == np.float32
+    assert np.isnan(table["ds_score"][2])
+    assert table["has_xlms"].tolist() == [True, False, False]
+    assert table["evidence_count"].tolist() == [0, 0, 3]
+    assert table.to_rows([1], columns=["pair_id", "string_score"]) == [
+        {"pair_id": "p2", "string_score": None}
+    ]
+
+
+def test_table_accepts_sdk_models() -> None:
+    table = PPIScoreTable.from_rows(models.PPIInteraction.from_dict(r) for r in ROWS)
+
+    assert table["pair_id"].tolist() == ["p1", "p2", "p3"]
+    assert table["string_score"][2] == pytest.approx(1.0)
+
+
+def test_mask_combined_and_top_k() -> None:
+    table = PPIScoreTable.from_rows(ROWS)
+
+    assert table.mask(ds_score=0.7).tolist() == [True, True, False]
+    assert table.mask(ds_score=0.8, has_xlms=True).tolist() == [True, False, False]
+    assert table.mask(how="any", ds_score=0.8, string_score=0.5).tolist() == [
+        True,
+        False,
+        True,
+    ]
+
+    combined = table.combined({"ds_score": 3, "string_score": 1})
+    assert combined == pytest.approx([(2.7 + 0.2) / 4, 0.7, 1.0])
+    assert table.combined({"ds_score": 1}, renormalize=False)[2] == 0.0
+
+    assert table.top_k(2, combined).tolist() == [2, 0]
+    assert table.top_k(5, "ds_score").tolist() == [0, 1]
+    assert table.top_k(1, combined, where=table.mask(ds_score=0.5)).tolist() == [0]
+    with pytest.raises(KeyError):
+        table.mask(bogus=1)
+
+
+def test_client_ppi_score_table_reads_every_page() -> None:
+    table = _client().ppi_score_table(all_pages=True, species_acronym="BU")
+
+    assert table["pair_id"].tolist() == ["p1", "p2", "p3"]
+
+
+def test_cli_rank_prints_top_pairs(monkeypatch) -> None:
+    monkeypatch.setattr(main_module, "_build_client", lambda **_: _client())
+
+    result = CliRunner().invoke(
+        main_module.app,
+        [
+            "ppi",
+            "rank",
+            "--species",
+            "BU",
+            "-w",
+            "ds_score=1",
+            "--min",
+            "ds_score=0.5",
+            "--top",
+            "1",
+            "--format",
+            "jsonl",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert [json.loads(line) for line in result.output.splitlines()] == [
+        {
+            "pair_id": "p1",
+            "protein_a": "A",
+            "protein_b": "B",
+            "ds_score": pytest.approx(0.9),
+            "combined_score": pytest.approx(0.9),
+        }
+    ]
@@ -0,0 +1,116 @@
+"""Tests for raw mode (``validate=False``): SDK responses returned as plain JSON."""
+
+from __future__ import annotations
+
+import json
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import requests  # type: ignore[import]
+from requests.adapters import BaseAdapter  # type: ignore[import]
+
+from mett_client import APIError, AuthenticationError, Config, DataPortalClient
+from mett_client.config import get_config
+
+BASE = "https://example.org"
+NUM_PAGES = 2
+
+
+def _gene(n: int) -> dict:
+    return {"locus_tag": f"BU_{n:05d}", "start_position": "not-an-int"}
+
+
+class GenePagesAdapter(BaseAdapter):
+    """Serve gene pages (deliberately off-schema) or a fixed error status."""
+
+    def __init__(self, status: int = 200) -> None:
+        super().__init__()
+        self.status = status
+
+    def send(self, request, **kwargs):  # type: ignore[override]
+        page = int(parse_qs(urlsplit(request.url).query).get("page", ["1"])[0])
+        payload = {
+            "timestamp": "2024-01-01T00:00:00Z",
+            "data": [_gene(page * 10 + i) for i in range(2)],
+            "pagination": {
+                "page_number": page,
+                "num_pages": NUM_PAGES,
+                "has_previous": page > 1,
+                "has_next": page < NUM_PAGES,
+                "total_results": 2 * NUM_PAGES,
+                "per_page": 2,
+            },
+        }
+        response = requests.Response()
+        response.status_code = self.status
+        response.reason = "Unauthorized" if self.status == 401 else "OK"
+        response.url = request.url
+        response.headers["Content-Type"] = "application/json"
+        response._content = (
+            json.dumps(payload).encode() if self.status == 200 else b"denied"
+        )
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def _client(status: int = 200, **kwargs) -> DataPortalClient:
+    client = DataPortalClient(config=Config(base_url=BASE), **kwargs)
+    client._http.mount("https://", GenePagesAdapter(status))
+    return client
+
+
+def test_raw_mode_returns_decoded_json_without_validation() -> None:
+    client = _client(validate=False)
+
+    result = client.get_genome_genes("BU_ATCC8492")
+
+    assert result.items == [_gene(10), _gene(11)]
+    assert result.raw["timestamp"] == "2024-01-01T00:00:00Z"
+    assert result.pagination.has_next is True
+
+
+def test_validated_mode_rejects_off_schema_rows() -> None:
+    client = _client()
+
+    with pytest.raises(ValueError):
+        client.get_genome_genes("BU_ATCC8492")
+
+
+def test_raw_mode_iterates_every_page() -> None:
+    client = _client(validate=False)
+
+    tags = [gene["locus_tag"] for gene in client.iter_genome_genes("BU_ATCC8492")]
+
+    assert tags == ["BU_00010", "BU_00011", "BU_00020", "BU_00021"]
+
+
+def test_raw_mode_search_genomes_returns_plain_dicts() -> None:
+    client = _client(validate=False)
+
+    result = client.search_genomes(query="BU")
+
+    assert result.items == [_gene(10), _gene(11)]
+    assert result.pagination.num_pages == NUM_PAGES
+
+
+def test_raw_mode_rejects_incomplete_pagination() -> None:
+    with pytest.raises(ValueError):
+        DataPortalClient._to_paginated({"data": [], "pagination": {"has_next": True}})
+
+
+def test_raw_mode_maps_http_errors() -> None:
+    client = _client(status=401, validate=False)
+
+    with pytest.raises(AuthenticationError) as excinfo:
+        client.get_genome_genes("BU_ATCC8492")
+
+    assert excinfo.value.status_code == 401
+    assert isinstance(excinfo.value, APIError)
+
+
+def test_get_config_reads_validate(tmp_path) -> None:
+    cfg = get_config(config_path=tmp_path / "missing.toml", env={"METT_VALIDATE": "0"})
+    assert cfg.validate is False
+    assert get_config(config_path=tmp_path / "missing.toml", env={"X": "1"}).validate
@@ -0,0 +1,114 @@
+"""Tests for the retry policy mounted on the client session."""
+
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Iterator, List
+
+import pytest
+from urllib3.util.retry import RequestHistory
+
+from mett_client import APIError, Config, DataPortalClient
+from mett_client.config import get_config
+from mett_client.transport import BackoffRetry
+
+
+@pytest.fixture
+def flaky_server() -> Iterator[tuple]:
+    """Serve ``failures`` 503 responses (with Retry-After: 0) before a 200."""
+    state = {"failures": 2, "hits": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            state["hits"] += 1
+            if state["failures"] > 0:
+                state["failures"] -= 1
+                self.send_response(503)
+                self.send_header("Retry-After", "0")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            body = json.dumps({"ok": True}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}", state
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _client(base_url: str, **overrides) -> DataPortalClient:
+    config = Config(base_url=base_url, retry_backoff=0, retry_jitter=0, **overrides)
+    return DataPortalClient(config=config)
+
+
+def test_raw_request_retries_and_counts(flaky_server) -> None:
+    base_url, state = flaky_server
+    client = _client(base_url)
+
+    response = client.raw_request("GET", "/api/anything")
+
+    assert response.json() == {"ok": True}
+    assert state["hits"] == 3
+    assert client.stats.retries == 2
+
+
+def test_exhausted_retries_raise_api_error_with_status(flaky_server) -> None:
+    base_url, state = flaky_server
+    state["failures"] = 10
+    client = _client(base_url, retries=1)
+
+    with pytest.raises(APIError) as excinfo:
+        client.raw_request("GET", "/api/anything")
+
+    assert excinfo.value.status_code == 503
+    assert state["hits"] == 2
+    assert client.stats.retries == 1
+
+
+def test_each_retry_takes_a_rate_limit_token(flaky_server, monkeypatch) -> None:
+    base_url, state = flaky_server
+    client = _client(base_url, rate_limit=100)
+    acquired: List[int] = []
+    monkeypatch.setattr(client.rate_limiter, "acquire", lambda: acquired.append(1))
+
+    client.raw_request("GET", "/api/anything")
+
+    assert state["hits"] == 3
+    assert len(acquired) == 3
+
+
+def test_backoff_is_exponential_and_capped() -> None:
+    retry = BackoffRetry(total=10, backoff_factor=1, backoff_cap=5)
+    delays: List[float] = []
+    for _ in range(5):
+        retry = retry.new(
+            history=retry.history + (RequestHistory("GET", "/", None, 503, None),)
+        )
+        delays.append(retry.get_backoff_time())
+
+    assert delays == [1, 2, 4, 5, 5]
+
+
+def test_get_config_reads_retry_settings(tmp_path) -> None:
+    path = tmp_path / "config.toml"
+    path.write_text("retries = 5\nretry_statuses = [429, 503]\n")
+
+    cfg = get_config(config_path=path, env={"METT_RETRY_BACKOFF": "0.25"})
+
+    assert cfg.retries == 5
+    assert cfg.retry_statuses == (429, 503)
+    assert cfg.retry_backoff == 0.25
@@ -0,0 +1,107 @@
+"""Startup regression tests: the CLI must not import the generated SDK eagerly."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+SCRIPT = """
+import json, sys
+{setup}
+print(json.dumps(sorted(m for m in sys.modules if m.startswith("mett_dataportal_sdk"))))
+"""
+
+
+def _sdk_modules_after(setup: str) -> list:
+    result = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(setup=setup)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_cli_import_does_not_load_sdk_apis_or_models() -> None:
+    loaded = _sdk_modules_after("import mett_client.cli.main")
+
+    assert not [m for m in loaded if m.startswith("mett_dataportal_sdk.api")]
+    assert not [m for m in loaded if m.startswith("mett_dataportal_sdk.models")]
+
+
+def test_client_construction_defers_sdk() -> None:
+    loaded = _sdk_modules_after(
+        "from mett_client import DataPortalClient, Config\n"
+        "DataPortalClient(config=Config())"
+    )
+
+    assert "mett_dataportal_sdk.api_client" not in loaded
+    assert not [m for m in loaded if m.startswith("mett_dataportal_sdk.models")]
+
+
+def test_async_client_import_defers_sdk() -> None:
+    loaded = _sdk_modules_after("import mett_client.async_client")
+
+    assert "mett_dataportal_sdk.api_client" not in loaded
+    assert not [m for m in loaded if m.startswith("mett_dataportal_sdk.api")]
+    assert not [m for m in loaded if m.startswith("mett_dataportal_sdk.models")]
+
+
+def test_sdk_api_loads_only_the_module_it_needs() -> None:
+    loaded = _sdk_modules_after(
+        "from mett_client import DataPortalClient, Config\n"
+        "DataPortalClient(config=Config())._api('SpeciesApi')"
+    )
+
+    assert "mett_dataportal_sdk.api.species_api" in loaded
+    assert "mett_dataportal_sdk.api.genes_api" not in loaded
+
+
+def test_lazy_exports_still_resolve() -> None:
+    import mett_dataportal_sdk
+    from mett_client import models
+
+    assert mett_dataportal_sdk.GenesApi.__name__ == "GenesApi"
+    assert models.Gene is mett_dataportal_sdk.GeneResponseSchema
+    assert "GenesApi" in dir(mett_dataportal_sdk)
+
+
+def test_json_command_skips_rich_and_unrelated_subapps() -> None:
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            """
+import json, sys
+from types import SimpleNamespace
+from mett_client.cli import main
+
+class Client:
+    def raw_request(self, method, path, **kwargs):
+        return SimpleNamespace(
+            headers={"Content-Type": "application/json"},
+            json=lambda: {"data": {"locus_tag": path.rsplit("/", 1)[-1]}},
+            text="",
+        )
+
+main._build_client = lambda **_: Client()
+try:
+    main.app(["genes", "get", "BU_0001", "-f", "json"])
+except SystemExit:
+    pass
+print(json.dumps(sorted(sys.modules)))
+""",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    *output, modules_line = result.stdout.strip().splitlines()
+    loaded = json.loads(modules_line)
+
+    assert json.loads("\n".join(output)) == {"data": {"locus_tag": "BU_0001"}}
+    assert "mett_client.cli.core.genes" in loaded
+    assert not [m for m in loaded if m == "rich" or m.startswith("rich.")]
+    for module in ("interactions.ppi", "interactions.ttp", "other"):
+        assert f"mett_client.cli.{module}" not in loaded
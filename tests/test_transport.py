@@ -0,0 +1,175 @@
+"""Tests for the shared requests/SDK transport."""
+
+from __future__ import annotations
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pytest
+import requests  # type: ignore[import]
+from requests.adapters import BaseAdapter, HTTPAdapter  # type: ignore[import]
+
+from mett_client import APIError, Config, DataPortalClient
+from mett_client.config import get_config
+from mett_client.transport import SessionRESTClient, TokenBucket, build_adapter
+
+
+class RecordingAdapter(BaseAdapter):
+    def __init__(self, payload=None, exc: Exception | None = None) -> None:
+        super().__init__()
+        self.payload = payload
+        self.exc = exc
+        self.requests: List[requests.PreparedRequest] = []
+
+    def send(self, request, **kwargs):  # type: ignore[override]
+        self.requests.append(request)
+        if self.exc is not None:
+            raise self.exc
+        response = requests.Response()
+        response.status_code = 200
+        response.url = request.url
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps(self.payload).encode()
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def test_sdk_calls_go_through_client_session() -> None:
+    client = DataPortalClient(config=Config(base_url="https://example.org"))
+    adapter = RecordingAdapter(
+        {"timestamp": "2024-01-01T00:00:00Z", "data": {"locus_tag": "BU_0001"}}
+    )
+    client._http.mount("https://", adapter)
+
+    response = client.get_gene("BU_0001")
+
+    assert isinstance(client._sdk_client.rest_client, SessionRESTClient)
+    assert response.data == {"locus_tag": "BU_0001"}
+    assert len(adapter.requests) == 1
+    assert adapter.requests[0].url.startswith("https://example.org/api/genes/")
+
+
+def test_connection_errors_surface_as_api_error() -> None:
+    client = DataPortalClient(config=Config(base_url="https://example.org"))
+    client._http.mount(
+        "https://", RecordingAdapter(exc=requests.ConnectionError("refused"))
+    )
+
+    with pytest.raises(APIError):
+        client.get_gene("BU_0001")
+
+
+def test_pool_settings_applied_to_session_adapter() -> None:
+    config = Config(pool_connections=3, pool_maxsize=7, pool_block=True)
+    client = DataPortalClient(config=config)
+
+    adapter = client._http.get_adapter("https://example.org")
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 7
+    assert adapter.poolmanager.connection_pool_kw["block"] is True
+    assert client._http.get_adapter("http://example.org") is adapter
+
+
+def test_keep_alive_disabled_sends_connection_close() -> None:
+    client = DataPortalClient(config=Config(keep_alive=False))
+    assert client._http.headers["Connection"] == "close"
+
+
+def test_get_config_reads_pool_settings(tmp_path) -> None:
+    cfg = get_config(
+        config_path=tmp_path / "missing.toml",
+        env={"METT_POOL_MAXSIZE": "32", "METT_KEEP_ALIVE": "false"},
+    )
+    assert cfg.pool_maxsize == 32
+    assert cfg.keep_alive is False
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: List[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_allows_burst_then_paces() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(rate=4, burst=2, clock=clock, sleep=clock.sleep)
+
+    for _ in range(4):
+        bucket.acquire()
+
+    assert clock.sleeps == [0.25, 0.25]
+
+
+def test_token_bucket_is_shared_across_threads() -> None:
+    bucket = TokenBucket(rate=200, burst=1)
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda _: bucket.acquire(), range(20)))
+
+    assert time.monotonic() - start >= 19 / 200 * 0.9
+
+
+def test_rate_limit_applies_to_sdk_and_raw_paths(monkeypatch) -> None:
+    client = DataPortalClient(
+        config=Config(base_url="https://example.org", rate_limit=5)
+    )
+    acquired: List[int] = []
+    monkeypatch.setattr(client.rate_limiter, "acquire", lambda: acquired.append(1))
+    adapter = client._http.get_adapter("https://example.org")
+    monkeypatch.setattr(
+        HTTPAdapter,
+        "send",
+        lambda self, request, **kwargs: RecordingAdapter(
+            {"timestamp": "t", "data": {}}
+        ).send(request),
+    )
+
+    client.get_gene("BU_0001")
+    client.raw_request("GET", "/api/species/")
+
+    assert adapter.limiter is client.rate_limiter
+    assert len(acquired) == 2
+
+
+def test_cli_rate_limit_option_sets_config(monkeypatch) -> None:
+    from typer.testing import CliRunner
+
+    from mett_client.cli import main as main_module
+
+    captured = {}
+
+    def _build_client(**kwargs):
+        captured.update(kwargs)
+        return object()
+
+    monkeypatch.setattr(main_module, "_build_client", _build_client)
+
+    CliRunner().invoke(main_module.app, ["--rate-limit", "2.5", "species", "--help"])
+
+    assert captured["rate_limit"] == 2.5
+
+
+def test_grow_pool_keeps_existing_pool_and_connections() -> None:
+    adapter = build_adapter(Config(pool_maxsize=2))
+    pool = adapter.poolmanager.connection_from_url("https://example.org")
+    idle = pool.ConnectionCls(pool.host)
+    pool.pool.get_nowait()
+    pool.pool.put_nowait(idle)
+
+    adapter.grow_pool(5)
+
+    assert adapter.poolmanager.connection_from_url("https://example.org") is pool
+    assert pool.pool.maxsize == 5 and pool.pool.qsize() == 5
+    assert pool.pool.get_nowait() is idle
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 5
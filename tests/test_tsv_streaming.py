@@ -0,0 +1,80 @@
+"""Tests for streaming TSV parsing."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+import requests  # type: ignore[import]
+from requests.adapters import BaseAdapter  # type: ignore[import]
+
+from mett_client import APIError, AuthenticationError, Config, DataPortalClient
+from mett_client.models import Gene
+from mett_client.request_utils import iter_tsv_lines
+
+BODY = "isolate_name\tassembly_name\n" + "".join(
+    f"BU_{n}\tasm_{n}\n" for n in range(5000)
+)
+
+
+class StreamingAdapter(BaseAdapter):
+    def __init__(self, body: str, status: int = 200) -> None:
+        super().__init__()
+        self.raw = io.BytesIO(body.encode())
+        self.status = status
+        self.requests = []
+
+    def send(self, request, **kwargs):  # type: ignore[override]
+        self.requests.append((request, kwargs))
+        response = requests.Response()
+        response.status_code = self.status
+        response.url = request.url
+        response.raw = self.raw
+        response.headers["Content-Type"] = "text/tab-separated-values"
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def _client(adapter: StreamingAdapter) -> DataPortalClient:
+    client = DataPortalClient(config=Config(base_url="https://example.org"))
+    client._http.mount("https://", adapter)
+    return client
+
+
+def test_iter_tsv_lines_parses_header_and_rows() -> None:
+    rows = list(iter_tsv_lines(["a\tb", "1\t2", "", "3\t4"]))
+    assert rows == [{"a": "1", "b": "2"}, {"a": "3", "b": "4"}]
+
+
+def test_iter_tsv_streams_incrementally() -> None:
+    adapter = StreamingAdapter(BODY)
+    client = _client(adapter)
+
+    rows = client.iter_tsv("/api/genomes/download/tsv")
+    first = next(rows)
+
+    assert first == {"isolate_name": "BU_0", "assembly_name": "asm_0"}
+    assert adapter.raw.tell() < len(BODY)
+    assert adapter.requests[0][1]["stream"] is True
+    assert sum(1 for _ in rows) == 4999
+
+
+def test_iter_tsv_builds_models() -> None:
+    body = "locus_tag\tgene_name\n" + "".join(f"BU_{n}\tg{n}\n" for n in range(50))
+    client = _client(StreamingAdapter(body))
+
+    genes = list(client.iter_tsv("/api/genes/search", model=Gene))
+
+    assert len(genes) == 50
+    assert isinstance(genes[0], Gene)
+    assert genes[-1].locus_tag == "BU_49"
+
+
+def test_iter_tsv_maps_http_errors() -> None:
+    with pytest.raises(AuthenticationError):
+        next(_client(StreamingAdapter("", status=401)).iter_tsv("/api/x"))
+    with pytest.raises(APIError) as excinfo:
+        next(_client(StreamingAdapter("", status=500)).iter_tsv("/api/x"))
+    assert excinfo.value.status_code == 500
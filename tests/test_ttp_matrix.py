@@ -0,0 +1,150 @@
+"""Tests for the sparse TTP gene x compound matrix."""
+
+from __future__ import annotations
+
+import json
+from typing import List
+from urllib.parse import unquote, urlsplit
+
+import pytest
+import requests  # type: ignore[import]
+from requests.adapters import BaseAdapter  # type: ignore[import]
+from typer.testing import CliRunner
+
+from mett_client import Config, DataPortalClient
+from mett_client.cli import main as main_module
+
+np = pytest.importorskip("numpy")
+
+from mett_client.ttp_matrix import TTPMatrix
+
+INTERACTIONS = [
+    {
+        "locus_tag": "BU_1",
+        "compound": "inositol",
+        "ttp_score": 2.5,
+        "hit_calling": True,
+    },
+    {
+        "locus_tag": "BU_1",
+        "compound": "lactose",
+        "ttp_score": 0.4,
+        "hit_calling": False,
+    },
+    {
+        "locus_tag": "BU_2",
+        "compound": "inositol",
+        "ttp_score": -1.2,
+        "hit_calling": False,
+    },
+    {"locus_tag": "BU_3", "compound": "lactose", "ttp_score": 3.1, "hit_calling": True},
+]
+
+
+class TTPAdapter(BaseAdapter):
+    """Serve per-gene and per-compound interactions; unknown labels are 404s."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.paths: List[str] = []
+
+    def send(self, request, **kwargs):  # type: ignore[override]
+        path = unquote(urlsplit(request.url).path)
+        self.paths.append(path)
+        *_, kind, label, _ = path.split("/")
+        key = "locus_tag" if kind == "gene" else "compound"
+        rows = [dict(row) for row in INTERACTIONS if row[key] == label]
+        for row in rows:
+            # Per-gene rows do not repeat the queried locus tag.
+            row.pop(key)
+        response = requests.Response()
+        response.url = request.url
+        response.headers["Content-Type"] = "application/json"
+        if rows:
+            response.status_code = 200
+            response._content = json.dumps(
+                {"timestamp": "2024-01-01T00:00:00Z", "data": rows}
+            ).encode()
+        else:
+            response.status_code = 404
+            response._content = b'{"detail": "not found"}'
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def _client() -> DataPortalClient:
+    client = DataPortalClient(config=Config(base_url="https://example.org"))
+    client._http.mount("https://", TTPAdapter())
+    return client
+
+
+def test_matrix_from_interactions_is_sorted_coo() -> None:
+    matrix = TTPMatrix.from_interactions(
+        INTERACTIONS[::-1]
+        + [{"locus_tag": "BU_1", "compound": "inositol", "ttp_score": 1.0}],
+        row_ids=["BU_1", "BU_2", "BU_3", "BU_4"],
+    )
+
+    assert matrix.shape == (4, 2) and matrix.nnz == 4
+    assert matrix.rows.tolist() == [0, 0, 1, 2]
+    assert matrix.col_ids.tolist() == ["lactose", "inositol"]
+    assert matrix.indptr().tolist() == [0, 2, 3, 4, 4]
+    # The duplicate pair keeps its best score and stays a hit.
+    assert matrix.row("BU_1") == {"lactose": pytest.approx(0.4), "inositol": 2.5}
+    assert matrix.column("lactose") == {
+        "BU_1": pytest.approx(0.4),
+        "BU_3": pytest.approx(3.1),
+    }
+    assert matrix.to_dense("hit_calling")[:, 1].tolist() == [True, False, False, False]
+    assert np.isnan(matrix.to_dense()[3]).all()
+    assert matrix.hits_only().nnz == 2
+
+
+def test_matrix_round_trips_through_npz(tmp_path) -> None:
+    matrix = TTPMatrix.from_interactions(INTERACTIONS)
+    path = tmp_path / "ttp.npz"
+    matrix.save(path)
+
+    loaded = TTPMatrix.load(path)
+
+    assert loaded.row_ids.tolist() == matrix.row_ids.tolist()
+    assert loaded.col_ids.tolist() == matrix.col_ids.tolist()
+    assert np.array_equal(loaded.scores, matrix.scores)
+    assert np.array_equal(loaded.hits, matrix.hits)
+    assert loaded.col_index("lactose") == 1
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_client_ttp_matrix_collects_genes_concurrently(max_workers) -> None:
+    matrix = _client().ttp_matrix(
+        locus_tags=["BU_3", "BU_1", "BU_9", "BU_2"], max_workers=max_workers
+    )
+
+    assert matrix.row_ids.tolist() == ["BU_3", "BU_1", "BU_9", "BU_2"]
+    assert matrix.shape == (4, 2) and matrix.nnz == 4
+    assert list(matrix.errors) == ["BU_9"]
+    assert matrix.row("BU_3") == {"lactose": pytest.approx(3.1)}
+
+
+def test_client_ttp_matrix_by_compound() -> None:
+    matrix = _client().ttp_matrix(compounds=["lactose"])
+
+    assert matrix.col_ids.tolist() == ["lactose"]
+    assert matrix.row_ids.tolist() == ["BU_1", "BU_3"]
+    with pytest.raises(ValueError):
+        _client().ttp_matrix()
+
+
+def test_cli_matrix_writes_npz(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(main_module, "_build_client", lambda **_: _client())
+    path = tmp_path / "ttp.npz"
+
+    result = CliRunner().invoke(
+        main_module.app,
+        ["ttp", "matrix", "BU_1", "BU_2", "--output", str(path)],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert TTPMatrix.load(path).shape == (2, 2)